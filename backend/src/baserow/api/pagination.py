@@ -1,8 +1,75 @@
+from functools import partial
+
+from django.core.paginator import EmptyPage
+from django.core.paginator import Page as DjangoPage
+from django.core.paginator import PageNotAnInteger
+from django.core.paginator import Paginator as DjangoPaginator
+from django.utils.functional import cached_property
+
 from rest_framework.exceptions import APIException, NotFound
+from rest_framework.pagination import (
+    LimitOffsetPagination as RestFrameworkLimitOffsetPagination,
+)
 from rest_framework.pagination import (
     PageNumberPagination as RestFrameworkPageNumberPagination,
 )
 from rest_framework.status import HTTP_400_BAD_REQUEST
+from rest_framework.utils.urls import replace_query_param
+
+
+class UncountedPage(DjangoPage):
+    def __init__(self, object_list, number, paginator, has_next):
+        super().__init__(object_list, number, paginator)
+        self._has_next = has_next
+
+    def has_next(self):
+        return self._has_next
+
+
+class UncountedPaginator(DjangoPaginator):
+    """
+    A paginator that doesn't need to know the total number of objects to paginate.
+    One extra object is fetched to figure out whether there is a next page. The
+    `count` is computed by the `count_function`, which is called with the object
+    list and can return an estimate or `None`.
+    """
+
+    def __init__(self, object_list, per_page, count_function, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count_function = count_function
+
+    @cached_property
+    def count(self):
+        return self.count_function(self.object_list)
+
+    @property
+    def num_pages(self):
+        # The total number of pages isn't known. Django REST framework only uses
+        # this to decide whether the page controls must be rendered, which they're
+        # not because the pagination class disables the template.
+        return 1
+
+    def validate_number(self, number):
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger("That page number is not an integer")
+        if number < 1:
+            raise EmptyPage("That page number is less than 1")
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        objects = list(self.object_list[bottom : bottom + self.per_page + 1])
+        if not objects and number > 1:
+            raise EmptyPage("That page contains no results")
+        return UncountedPage(
+            objects[: self.per_page],
+            number,
+            self,
+            has_next=len(objects) > self.per_page,
+        )
 
 
 class PageNumberPagination(RestFrameworkPageNumberPagination):
@@ -11,10 +78,27 @@ class PageNumberPagination(RestFrameworkPageNumberPagination):
     page_size = 100
     page_size_query_param = "size"
 
-    def __init__(self, limit_page_size=None, *args, **kwargs):
+    def __init__(self, limit_page_size=None, count_function=None, *args, **kwargs):
+        """
+        :param limit_page_size: The maximum page size that can be requested.
+        :param count_function: If provided, the pages are determined without
+            counting all the objects, and this function is called with the queryset
+            to compute the `count` of the response instead. It can return an
+            estimate or `None`.
+        """
+
         self.limit_page_size = limit_page_size
         super().__init__(*args, **kwargs)
 
+        if count_function is not None:
+            self.django_paginator_class = partial(
+                UncountedPaginator, count_function=count_function
+            )
+            # The total number of pages isn't known, so the last page can't be
+            # requested and the page controls can't be rendered.
+            self.last_page_strings = ()
+            self.template = None
+
     def get_page_size(self, request):
         page_size = super().get_page_size(request)
 
@@ -39,3 +123,48 @@ class PageNumberPagination(RestFrameworkPageNumberPagination):
             exception = APIException({"error": "ERROR_INVALID_PAGE", "detail": str(e)})
             exception.status_code = HTTP_400_BAD_REQUEST
             raise exception
+
+
+class LimitOffsetPagination(RestFrameworkLimitOffsetPagination):
+    def __init__(self, count_function=None, *args, **kwargs):
+        """
+        :param count_function: If provided, the next link is determined by fetching
+            one extra object instead of counting all the objects, and this function
+            is called with the queryset to compute the `count` of the response. It
+            can return an estimate or `None`.
+        """
+
+        super().__init__(*args, **kwargs)
+        self.count_function = count_function
+        self.has_next = False
+
+        if count_function is not None:
+            self.template = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.count_function is None:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.limit = self.get_limit(request)
+        if self.limit is None:
+            return None
+
+        self.offset = self.get_offset(request)
+        self.request = request
+        objects = list(queryset[self.offset : self.offset + self.limit + 1])
+        self.has_next = len(objects) > self.limit
+        self.count = self.count_function(queryset)
+        return objects[: self.limit]
+
+    def get_next_link(self):
+        if self.count_function is None:
+            return super().get_next_link()
+
+        if not self.has_next:
+            return None
+
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.limit_query_param, self.limit)
+        return replace_query_param(
+            url, self.offset_query_param, self.offset + self.limit
+        )
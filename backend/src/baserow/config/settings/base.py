@@ -165,6 +165,7 @@ BASEROW_ROLE_USAGE_QUEUE = os.getenv("BASEROW_GROUP_STORAGE_USAGE_QUEUE", "expor
 CELERY_BROKER_URL = REDIS_URL
 CELERY_TASK_ROUTES = {
     "baserow.contrib.database.export.tasks.run_export_job": {"queue": "export"},
+    "baserow.contrib.database.export.tasks.run_export_shard": {"queue": "export"},
     "baserow.contrib.database.export.tasks.clean_up_old_jobs": {"queue": "export"},
     "baserow.core.trash.tasks.mark_old_trash_for_permanent_deletion": {
         "queue": "export"
@@ -794,6 +795,54 @@ FROM_EMAIL = os.getenv("FROM_EMAIL", "no-reply@localhost")
 RESET_PASSWORD_TOKEN_MAX_AGE = 60 * 60 * 48  # 48 hours
 
 ROW_PAGE_SIZE_LIMIT = int(os.getenv("BASEROW_ROW_PAGE_SIZE_LIMIT", 200))
+# When the rows are counted with the `approximate` count mode, unfiltered tables
+# with at least this many rows are counted using the planner estimate. All other
+# counts are computed exactly and cached for the provided number of seconds.
+BASEROW_APPROXIMATE_ROW_COUNT_THRESHOLD = int(
+    os.getenv("BASEROW_APPROXIMATE_ROW_COUNT_THRESHOLD", 10000)
+)
+BASEROW_APPROXIMATE_ROW_COUNT_CACHE_TIMEOUT = int(
+    os.getenv("BASEROW_APPROXIMATE_ROW_COUNT_CACHE_TIMEOUT", 30)
+)
+# The aggregations of the views of the same table that are requested within this
+# number of milliseconds are computed together in a single query. A request only
+# waits for this window if the cache supports locks and the aggregations of another
+# view of the same table have been requested.
+BASEROW_VIEW_AGGREGATIONS_COALESCING_WINDOW_MS = int(
+    os.getenv("BASEROW_VIEW_AGGREGATIONS_COALESCING_WINDOW_MS", 20)
+)
+# The unique count, median and decile footer aggregations of tables with at least
+# this many rows are estimated based on samples instead of computed exactly. Set to
+# 0 to always compute them exactly.
+BASEROW_APPROXIMATE_AGGREGATIONS_ROW_COUNT_THRESHOLD = int(
+    os.getenv("BASEROW_APPROXIMATE_AGGREGATIONS_ROW_COUNT_THRESHOLD", 0)
+)
+# File imports into an existing table of at least this many rows are streamed from
+# the data file and imported chunk by chunk, instead of being loaded in memory. Set
+# to 0 to never stream the imports.
+BASEROW_FILE_IMPORT_STREAMING_ROW_THRESHOLD = int(
+    os.getenv("BASEROW_FILE_IMPORT_STREAMING_ROW_THRESHOLD", 0)
+)
+# Streamed file imports commit the imported rows chunk by chunk, so that a failed
+# import job continues after the last committed chunk when it's run again.
+BASEROW_FILE_IMPORT_RESUMABLE = str_to_bool(
+    os.getenv("BASEROW_FILE_IMPORT_RESUMABLE", "false")
+)
+# The number of times a resumable file import job that has failed or has been
+# interrupted is run again, before it's marked as failed.
+BASEROW_FILE_IMPORT_MAX_RESUMES = int(os.getenv("BASEROW_FILE_IMPORT_MAX_RESUMES", 3))
+# The number of seconds the updates of the fields depending on the rows of a table
+# with eventual dependency updates are delayed, so that the row updates made in the
+# meantime are applied together.
+BASEROW_PENDING_DEPENDENCY_UPDATES_DELAY = int(
+    os.getenv("BASEROW_PENDING_DEPENDENCY_UPDATES_DELAY", 2)
+)
+# The pending dependency updates that haven't been applied in time, for example
+# because the task applying them has failed, are scheduled again by this periodic
+# task.
+BASEROW_PENDING_DEPENDENCY_UPDATES_SWEEP_CRONTAB = get_crontab_from_env(
+    "BASEROW_PENDING_DEPENDENCY_UPDATES_SWEEP_CRONTAB", default_crontab="* * * * *"
+)
 BATCH_ROWS_SIZE_LIMIT = int(
     os.getenv("BATCH_ROWS_SIZE_LIMIT", 200)
 )  # How many rows can be modified at once.
@@ -828,6 +877,13 @@ BASEROW_FILE_UPLOAD_SIZE_LIMIT_MB = int(
 EXPORT_FILES_DIRECTORY = "export_files"
 EXPORT_CLEANUP_INTERVAL_MINUTES = 5
 EXPORT_FILE_EXPIRE_MINUTES = 60
+# Large exports of rows in their default order can be split into at most this many
+# shards, which are exported in parallel by celery tasks on the export queue. Every
+# shard contains at least the minimum number of rows.
+BASEROW_EXPORT_MAX_SHARDS = int(os.getenv("BASEROW_EXPORT_MAX_SHARDS", 1))
+BASEROW_EXPORT_MIN_ROWS_PER_SHARD = int(
+    os.getenv("BASEROW_EXPORT_MIN_ROWS_PER_SHARD", 100000)
+)
 
 
 MIDNIGHT_CRONTAB_STR = "0 0 * * *"
@@ -1149,6 +1205,16 @@ BASEROW_SYNC_TEMPLATES_TIME_LIMIT = int(
 APPEND_SLASH = False
 
 BASEROW_DISABLE_MODEL_CACHE = bool(os.getenv("BASEROW_DISABLE_MODEL_CACHE", ""))
+# The maximum number of generated table model classes that every worker process keeps
+# in memory. Setting it to 0 disables the in process model class cache.
+BASEROW_GENERATED_MODEL_CLASS_CACHE_SIZE = int(
+    os.getenv("BASEROW_GENERATED_MODEL_CLASS_CACHE_SIZE", 128)
+)
+# The maximum number of parsed formula expressions that every worker process keeps in
+# memory. Setting it to 0 disables the in process formula expression cache.
+BASEROW_FORMULA_EXPRESSION_CACHE_SIZE = int(
+    os.getenv("BASEROW_FORMULA_EXPRESSION_CACHE_SIZE", 1024)
+)
 BASEROW_NOWAIT_FOR_LOCKS = not bool(
     os.getenv("BASEROW_WAIT_INSTEAD_OF_409_CONFLICT_ERROR", False)
 )
@@ -1179,6 +1245,14 @@ USE_PG_FULLTEXT_SEARCH = str_to_bool(
 PG_SEARCH_CONFIG = os.getenv("BASEROW_PG_SEARCH_CONFIG", "simple")
 AUTO_VACUUM_AFTER_SEARCH_UPDATE = str_to_bool(os.getenv("BASEROW_AUTO_VACUUM", "true"))
 TSV_UPDATE_CHUNK_SIZE = int(os.getenv("BASEROW_TSV_UPDATE_CHUNK_SIZE", "2000"))
+# Full tsvector updates of tables with at least twice this number of rows are split
+# into ranges which are updated by up to the max number of workers in parallel.
+TSV_UPDATE_MAX_PARALLEL_RANGES = int(
+    os.getenv("BASEROW_TSV_UPDATE_MAX_PARALLEL_RANGES", "1")
+)
+TSV_UPDATE_MIN_ROWS_PER_RANGE = int(
+    os.getenv("BASEROW_TSV_UPDATE_MIN_ROWS_PER_RANGE", "100000")
+)
 
 POSTHOG_PROJECT_API_KEY = os.getenv("POSTHOG_PROJECT_API_KEY", "")
 POSTHOG_HOST = os.getenv("POSTHOG_HOST", "")
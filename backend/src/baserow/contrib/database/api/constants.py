@@ -3,6 +3,7 @@
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiParameter
 
+from baserow.contrib.database.rows.constants import RowCountModes
 from baserow.contrib.database.search.handler import SearchModes
 
 PUBLIC_PLACEHOLDER_ENTITY_ID = 0
@@ -16,6 +17,37 @@ SEARCH_MODE_API_PARAM = OpenApiParameter(
         f"If the default `{SearchModes.MODE_FT_WITH_COUNT}` is used, then Postgres "
         f"full-text search is used. If `{SearchModes.MODE_COMPAT}` is "
         "provided then the search term will be exactly searched for including "
-        "whitespace on each cell. This is the Baserow legacy search behaviour."
+        "whitespace on each cell. This is the Baserow legacy search behaviour. "
+        f"If `{SearchModes.MODE_FT_RANKED}` is provided then Postgres full-text "
+        "search is used, the rows are ordered by how well they match the search "
+        "term and they are not counted, in which case `count` is `null`. This is "
+        "the fastest way to find the best matching rows in a large table."
+    ),
+)
+COUNT_MODE_API_PARAM = OpenApiParameter(
+    name="count_mode",
+    location=OpenApiParameter.QUERY,
+    type=OpenApiTypes.STR,
+    description=(
+        "Determines how the `count` in the response is computed. The default "
+        f"`{RowCountModes.MODE_EXACT.value}` counts all the matching rows. "
+        f"`{RowCountModes.MODE_APPROXIMATE.value}` uses an estimate for large "
+        "unfiltered tables and otherwise an exact count that can be cached for a "
+        f"few seconds. `{RowCountModes.MODE_NONE.value}` doesn't count the rows, "
+        "in which case `count` is `null`. With the last two modes the `next` link "
+        "is determined without counting the rows, which is much faster for large "
+        "tables."
+    ),
+)
+LINK_ROW_LIMIT_API_PARAM = OpenApiParameter(
+    name="link_row_limit",
+    location=OpenApiParameter.QUERY,
+    type=OpenApiTypes.INT,
+    description=(
+        "If provided, at most this number of related rows is returned for every "
+        "link row cell, ordered by the default order of the related table. Every "
+        "row then also contains a `link_row_counts` object containing the total "
+        "number of related rows per link row field. This keeps the response small "
+        "when cells are related to a lot of rows."
     ),
 )
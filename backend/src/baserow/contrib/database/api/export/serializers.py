@@ -5,6 +5,9 @@ from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import extend_schema_field
 from rest_framework import fields, serializers
 
+from baserow.contrib.database.export.compression import (
+    get_supported_export_compressions,
+)
 from baserow.contrib.database.export.handler import ExportHandler
 from baserow.contrib.database.export.models import ExportJob
 from baserow.contrib.database.export.registries import table_exporter_registry
@@ -133,6 +136,42 @@ class BaseExporterOptionsSerializer(serializers.Serializer):
         default="utf-8",
         help_text="The character set to use when creating the export file.",
     )
+    export_compression = fields.ChoiceField(
+        choices=lazy(get_supported_export_compressions, list)(),
+        required=False,
+        allow_null=True,
+        help_text="Optional: Compresses the export file on the fly. `zstd` is only "
+        "available if the optional zstandard package is installed.",
+    )
+    export_changes_since = fields.DateTimeField(
+        required=False,
+        allow_null=True,
+        help_text="Optional: Only export the rows that have been created, updated or "
+        "trashed since this date. An additional `deleted` column indicates which "
+        "rows have been trashed or don't match the view filters anymore, of which "
+        "only the id is exported. Rows that have been permanently deleted from the "
+        "trash since then are not included.",
+    )
+    export_changes_since_job_id = fields.IntegerField(
+        min_value=0,
+        required=False,
+        allow_null=True,
+        help_text="Optional: Only export the rows that have been created, updated or "
+        "trashed since the provided previous export job of the table was created. "
+        "Rows that have been permanently deleted from the trash since then are not "
+        "included.",
+    )
+
+    def validate(self, data):
+        if (
+            data.get("export_changes_since") is not None
+            and data.get("export_changes_since_job_id") is not None
+        ):
+            raise serializers.ValidationError(
+                "Only one of export_changes_since and export_changes_since_job_id "
+                "can be provided."
+            )
+        return data
 
 
 class CsvExporterOptionsSerializer(BaseExporterOptionsSerializer):
@@ -98,7 +98,11 @@ class ExportTableView(APIView):
                 ]
             ),
             404: get_error_schema(
-                ["ERROR_TABLE_DOES_NOT_EXIST", "ERROR_VIEW_DOES_NOT_EXIST"]
+                [
+                    "ERROR_TABLE_DOES_NOT_EXIST",
+                    "ERROR_VIEW_DOES_NOT_EXIST",
+                    "ERROR_EXPORT_JOB_DOES_NOT_EXIST",
+                ]
             ),
         },
     )
@@ -110,6 +114,7 @@ class ExportTableView(APIView):
             ViewDoesNotExist: ERROR_VIEW_DOES_NOT_EXIST,
             TableOnlyExportUnsupported: ERROR_TABLE_ONLY_EXPORT_UNSUPPORTED,
             ViewNotInTable: ERROR_VIEW_NOT_IN_TABLE,
+            ExportJobDoesNotExistException: ERROR_EXPORT_JOB_DOES_NOT_EXIST,
         }
     )
     def post(self, request, table_id):
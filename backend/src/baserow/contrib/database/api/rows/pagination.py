@@ -0,0 +1,145 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections import OrderedDict
+from decimal import Decimal, InvalidOperation
+from functools import partial
+from typing import Callable, Optional, Tuple
+
+from django.db.models import Q, QuerySet
+
+from rest_framework.exceptions import APIException
+from rest_framework.pagination import BasePagination, _positive_int
+from rest_framework.response import Response
+from rest_framework.status import HTTP_400_BAD_REQUEST
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from baserow.contrib.database.rows.constants import RowCountModes
+from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.search.handler import SearchModes
+
+DEFAULT_ROW_ORDER_FIELD_NAMES = ["order", "id"]
+
+
+def _raise_bad_request(error: str, detail: str):
+    exception = APIException({"error": error, "detail": detail})
+    exception.status_code = HTTP_400_BAD_REQUEST
+    raise exception
+
+
+def get_row_count_function(
+    count_mode: str,
+    search_mode: Optional[str] = None,
+) -> Optional[Callable[[QuerySet], Optional[int]]]:
+    """
+    Returns the function that must be passed into the `count_function` of the
+    paginators to count the rows using the provided count mode, or `None` if the
+    paginator can count the rows exactly by itself.
+
+    :param count_mode: The requested row count mode.
+    :param search_mode: The search mode of the search that has been applied to the
+        rows, if any. The rows of a ranked search are never counted, so that only
+        the best matching page of rows has to be found.
+    """
+
+    if search_mode == SearchModes.MODE_FT_RANKED:
+        count_mode = RowCountModes.MODE_NONE
+
+    if count_mode == RowCountModes.MODE_EXACT:
+        return None
+
+    return partial(RowHandler().count_rows, count_mode=count_mode)
+
+
+class RowKeysetPagination(BasePagination):
+    """
+    Paginates table rows by seeking on the `(order, id)` index instead of using an
+    OFFSET. The response contains an opaque cursor pointing to the next page and
+    doesn't contain the total count, so every page costs roughly the same, no matter
+    how deep into the table it is.
+    """
+
+    cursor_query_param = "cursor"
+    page_size = 100
+    page_size_query_param = "size"
+
+    def __init__(self, limit_page_size=None):
+        self.limit_page_size = limit_page_size
+        self.base_url = None
+        self.next_position = None
+
+    def get_page_size(self, request) -> int:
+        try:
+            page_size = _positive_int(
+                request.query_params[self.page_size_query_param], strict=True
+            )
+        except (KeyError, ValueError):
+            page_size = self.page_size
+
+        if self.limit_page_size and page_size > self.limit_page_size:
+            _raise_bad_request(
+                "ERROR_PAGE_SIZE_LIMIT",
+                f"The page size is limited to {self.limit_page_size}.",
+            )
+
+        return page_size
+
+    def encode_cursor(self, position: Tuple[Decimal, int]) -> str:
+        order, row_id = position
+        return urlsafe_b64encode(json.dumps([str(order), row_id]).encode()).decode()
+
+    def decode_cursor(self, request) -> Optional[Tuple[Decimal, int]]:
+        encoded = request.query_params.get(self.cursor_query_param)
+
+        # An empty cursor requests the first page.
+        if not encoded:
+            return None
+
+        try:
+            order, row_id = json.loads(urlsafe_b64decode(encoded.encode()))
+            return Decimal(order), int(row_id)
+        except (TypeError, ValueError, InvalidOperation):
+            _raise_bad_request(
+                "ERROR_INVALID_CURSOR", "The provided cursor is invalid."
+            )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if not queryset.has_default_order():
+            _raise_bad_request(
+                "ERROR_CURSOR_PAGINATION_ORDER_NOT_SUPPORTED",
+                "Cursor pagination is only supported when the rows are ordered by "
+                "their default order.",
+            )
+
+        page_size = self.get_page_size(request)
+        position = self.decode_cursor(request)
+        self.base_url = request.build_absolute_uri()
+
+        queryset = queryset.order_by(*DEFAULT_ROW_ORDER_FIELD_NAMES)
+        if position is not None:
+            order, row_id = position
+            # The redundant `order__gte` condition makes sure that the database can
+            # do a range scan on the `(order, id)` index.
+            queryset = queryset.filter(order__gte=order).filter(
+                Q(order__gt=order) | Q(order=order, id__gt=row_id)
+            )
+
+        rows = list(queryset[: page_size + 1])
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            self.next_position = (rows[-1].order, rows[-1].id)
+
+        return rows
+
+    def get_next_link(self) -> Optional[str]:
+        if self.next_position is None:
+            return None
+
+        url = remove_query_param(self.base_url, "page")
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(self.next_position)
+        )
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict([("next", self.get_next_link()), ("results", data)])
+        )
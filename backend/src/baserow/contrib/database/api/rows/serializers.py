@@ -9,7 +9,12 @@ from rest_framework import serializers
 
 from baserow.api.search.serializers import SearchQueryParamSerializer
 from baserow.api.utils import get_serializer_class
+from baserow.contrib.database.fields.models import LinkRowField
 from baserow.contrib.database.fields.registries import field_type_registry
+from baserow.contrib.database.rows.constants import (
+    ALL_ROW_COUNT_MODES,
+    RowCountModes,
+)
 from baserow.contrib.database.rows.models import RowHistory
 from baserow.contrib.database.rows.registries import row_metadata_registry
 
@@ -23,6 +28,33 @@ class RowSerializer(serializers.ModelSerializer):
         extra_kwargs = {"id": {"read_only": True}, "order": {"read_only": True}}
 
 
+class LinkRowCountsField(serializers.Field):
+    """
+    Serializes the total number of related rows of every link row field, as set by
+    the `limit_link_row_prefetches` method of the queryset, to a dict where the key
+    is the name of the field in the response.
+    """
+
+    def __init__(self, names: Dict[str, str], **kwargs):
+        """
+        :param names: A dict mapping the model field name of the link row fields to
+            their name in the response.
+        """
+
+        self.names = names
+        kwargs["source"] = "*"
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, row):
+        counts = getattr(row, "_prefetched_objects_counts", {})
+        return {
+            name: counts[model_field_name]
+            for model_field_name, name in self.names.items()
+            if model_field_name in counts
+        }
+
+
 def serialize_rows_for_response(rows, model, user_field_names=False, many=True):
     return get_row_serializer_class(
         model,
@@ -42,6 +74,7 @@ def get_row_serializer_class(
     field_kwargs=None,
     include_id=False,
     required_fields=None,
+    include_link_row_counts=False,
 ):
     """
     Generates a Django rest framework model serializer based on the available fields
@@ -76,6 +109,11 @@ def get_row_serializer_class(
     :param required_fields: List of field names that should be present even when
         performing partial validation.
     :type required_fields: list[str]
+    :param include_link_row_counts: Whether the generated serializer should contain
+        a `link_row_counts` field containing the total number of related rows of
+        every link row field. This only works if the rows are fetched using
+        `limit_link_row_prefetches`.
+    :type include_link_row_counts: bool
     :return: The generated serializer.
     :rtype: ModelSerializer
     """
@@ -86,6 +124,7 @@ def get_row_serializer_class(
     field_objects = model._field_objects
     field_names = []
     field_overrides = {}
+    link_row_names = {}
 
     for field in field_objects.values():
         field_id_matches = field_ids is None or (field["field"].id in field_ids)
@@ -116,10 +155,17 @@ def get_row_serializer_class(
             field_overrides[name] = serializer
             field_names.append(name)
 
+            if isinstance(field["field"], LinkRowField):
+                link_row_names[field["name"]] = name
+
     if include_id:
         field_names.append("id")
         field_overrides["id"] = serializers.IntegerField()
 
+    if include_link_row_counts:
+        field_names.append("link_row_counts")
+        field_overrides["link_row_counts"] = LinkRowCountsField(link_row_names)
+
     return get_serializer_class(
         model,
         field_names,
@@ -346,7 +392,23 @@ class BatchCreateRowsQueryParamsSerializer(serializers.Serializer):
     before = serializers.IntegerField(required=False)
 
 
-class ListRowsQueryParamsSerializer(SearchQueryParamSerializer):
+class CountModeQueryParamSerializer(serializers.Serializer):
+    count_mode = serializers.ChoiceField(
+        required=False,
+        default=RowCountModes.MODE_EXACT.value,
+        choices=ALL_ROW_COUNT_MODES,
+    )
+
+
+class LinkRowLimitQueryParamSerializer(serializers.Serializer):
+    link_row_limit = serializers.IntegerField(required=False, min_value=1)
+
+
+class ListRowsQueryParamsSerializer(
+    SearchQueryParamSerializer,
+    CountModeQueryParamSerializer,
+    LinkRowLimitQueryParamSerializer,
+):
     user_field_names = serializers.BooleanField(required=False, default=False)
     order_by = serializers.CharField(required=False)
     include = serializers.CharField(required=False)
@@ -104,8 +104,13 @@ from baserow.core.exceptions import UserNotInWorkspace
 from baserow.core.handler import CoreHandler
 from baserow.core.trash.exceptions import CannotDeleteAlreadyDeletedItem
 
-from ..constants import SEARCH_MODE_API_PARAM
+from ..constants import (
+    COUNT_MODE_API_PARAM,
+    LINK_ROW_LIMIT_API_PARAM,
+    SEARCH_MODE_API_PARAM,
+)
 from .example_serializers import example_pagination_row_serializer_class
+from .pagination import RowKeysetPagination, get_row_count_function
 from .schemas import row_names_response_schema
 from .serializers import (
     BatchCreateRowsQueryParamsSerializer,
@@ -147,6 +152,20 @@ class RowsView(APIView):
                 type=OpenApiTypes.INT,
                 description="Defines how many rows should be returned per page.",
             ),
+            OpenApiParameter(
+                name="cursor",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.STR,
+                description=(
+                    "If provided, the rows are paginated by cursor instead of by page "
+                    "number. An empty value returns the first page, after which the "
+                    "`next` URL of the response contains the cursor of the next page. "
+                    "Cursor pagination doesn't count the rows, which makes it faster "
+                    "for large tables, and the `page` parameter is ignored. It only "
+                    "works when the rows are returned in their default order, so it "
+                    "can't be combined with `order_by` or a view that has sortings."
+                ),
+            ),
             OpenApiParameter(
                 name="search",
                 location=OpenApiParameter.QUERY,
@@ -277,13 +296,16 @@ class RowsView(APIView):
                 description="Includes all the filters and sorts of the provided view.",
             ),
             SEARCH_MODE_API_PARAM,
+            COUNT_MODE_API_PARAM,
+            LINK_ROW_LIMIT_API_PARAM,
         ],
         tags=["Database table rows"],
         operation_id="list_database_table_rows",
         description=(
             "Lists all the rows of the table related to the provided parameter if the "
             "user has access to the related database's workspace. The response is "
-            "paginated by a page/size style. It is also possible to provide an "
+            "paginated by a page/size style, or by cursor if the `cursor` parameter is "
+            "provided. It is also possible to provide an "
             "optional search query, only rows where the data matches the search query "
             "are going to be returned then. The properties of the returned rows "
             "depends on which fields the table has. For a complete overview of fields "
@@ -302,6 +324,8 @@ class RowsView(APIView):
                     "ERROR_REQUEST_BODY_VALIDATION",
                     "ERROR_PAGE_SIZE_LIMIT",
                     "ERROR_INVALID_PAGE",
+                    "ERROR_INVALID_CURSOR",
+                    "ERROR_CURSOR_PAGINATION_ORDER_NOT_SUPPORTED",
                     "ERROR_ORDER_BY_FIELD_NOT_FOUND",
                     "ERROR_ORDER_BY_FIELD_NOT_POSSIBLE",
                     "ERROR_FILTER_FIELD_NOT_FOUND",
@@ -358,6 +382,7 @@ class RowsView(APIView):
         exclude = query_params.get("exclude")
         user_field_names = query_params.get("user_field_names")
         view_id = query_params.get("view_id")
+        link_row_limit = query_params.get("link_row_limit")
         fields = get_include_exclude_fields(
             table, include, exclude, user_field_names=user_field_names
         )
@@ -367,6 +392,8 @@ class RowsView(APIView):
             field_ids=[] if fields else None,
         )
         queryset = model.objects.all().enhance_by_fields()
+        if link_row_limit is not None:
+            queryset = queryset.limit_link_row_prefetches(link_row_limit)
 
         if view_id:
             view_handler = ViewHandler()
@@ -415,10 +442,24 @@ class RowsView(APIView):
                 filter_object, filter_type, user_field_names=user_field_names
             )
 
-        paginator = PageNumberPagination(limit_page_size=settings.ROW_PAGE_SIZE_LIMIT)
+        if "cursor" in request.GET:
+            paginator = RowKeysetPagination(
+                limit_page_size=settings.ROW_PAGE_SIZE_LIMIT
+            )
+        else:
+            paginator = PageNumberPagination(
+                limit_page_size=settings.ROW_PAGE_SIZE_LIMIT,
+                count_function=get_row_count_function(
+                    query_params["count_mode"], search_mode if search else None
+                ),
+            )
         page = paginator.paginate_queryset(queryset, request, self)
         serializer_class = get_row_serializer_class(
-            model, RowSerializer, is_response=True, user_field_names=user_field_names
+            model,
+            RowSerializer,
+            is_response=True,
+            user_field_names=user_field_names,
+            include_link_row_counts=link_row_limit is not None,
         )
         serializer = serializer_class(page, many=True)
 
@@ -2,7 +2,6 @@ from decimal import Decimal
 
 from drf_spectacular.openapi import OpenApiParameter, OpenApiTypes
 from drf_spectacular.utils import extend_schema
-from rest_framework.pagination import LimitOffsetPagination
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
@@ -15,11 +14,15 @@ from baserow.api.decorators import (
     validate_query_parameters,
 )
 from baserow.api.errors import ERROR_USER_NOT_IN_GROUP
-from baserow.api.pagination import PageNumberPagination
+from baserow.api.pagination import LimitOffsetPagination, PageNumberPagination
 from baserow.api.schemas import get_error_schema
 from baserow.api.search.serializers import SearchQueryParamSerializer
 from baserow.api.serializers import get_example_pagination_serializer_class
-from baserow.contrib.database.api.constants import SEARCH_MODE_API_PARAM
+from baserow.contrib.database.api.constants import (
+    COUNT_MODE_API_PARAM,
+    LINK_ROW_LIMIT_API_PARAM,
+    SEARCH_MODE_API_PARAM,
+)
 from baserow.contrib.database.api.fields.errors import (
     ERROR_FIELD_DOES_NOT_EXIST,
     ERROR_FIELD_NOT_IN_TABLE,
@@ -27,6 +30,7 @@ from baserow.contrib.database.api.fields.errors import (
     ERROR_ORDER_BY_FIELD_NOT_FOUND,
     ERROR_ORDER_BY_FIELD_NOT_POSSIBLE,
 )
+from baserow.contrib.database.api.rows.pagination import get_row_count_function
 from baserow.contrib.database.api.rows.serializers import (
     RowSerializer,
     get_example_row_metadata_field_serializer,
@@ -42,6 +46,7 @@ from baserow.contrib.database.api.views.errors import (
 )
 from baserow.contrib.database.api.views.grid.serializers import (
     GridViewFieldOptionsSerializer,
+    ListGridViewRowsQueryParamsSerializer,
 )
 from baserow.contrib.database.api.views.serializers import (
     FieldOptionsField,
@@ -62,6 +67,7 @@ from baserow.contrib.database.fields.field_filters import (
 )
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.fields.utils import get_field_id_from_field_key
+from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.rows.registries import row_metadata_registry
 from baserow.contrib.database.table.operations import ListRowsDatabaseTableOperationType
 from baserow.contrib.database.views.exceptions import (
@@ -194,6 +200,8 @@ class GridViewView(APIView):
                 ),
             ),
             SEARCH_MODE_API_PARAM,
+            COUNT_MODE_API_PARAM,
+            LINK_ROW_LIMIT_API_PARAM,
         ],
         tags=["Database table grid view"],
         operation_id="list_database_table_grid_view_rows",
@@ -241,7 +249,9 @@ class GridViewView(APIView):
         }
     )
     @allowed_includes("field_options", "row_metadata")
-    @validate_query_parameters(SearchQueryParamSerializer, return_validated=True)
+    @validate_query_parameters(
+        ListGridViewRowsQueryParamsSerializer, return_validated=True
+    )
     def get(self, request, view_id, field_options, row_metadata, query_params):
         """
         Lists all the rows of a grid view, paginated either by a page or offset/limit.
@@ -285,14 +295,25 @@ class GridViewView(APIView):
             search_mode=query_params.get("search_mode"),
             model=model,
         )
+        link_row_limit = query_params.get("link_row_limit")
+        if link_row_limit is not None:
+            queryset = queryset.limit_link_row_prefetches(link_row_limit)
+
+        count_mode = query_params.get("count_mode")
+        count_function = get_row_count_function(
+            count_mode,
+            query_params.get("search_mode") if query_params.get("search") else None,
+        )
 
         if "count" in request.GET:
-            return Response({"count": queryset.count()})
+            return Response(
+                {"count": RowHandler().count_rows(queryset, count_mode=count_mode)}
+            )
 
         if LimitOffsetPagination.limit_query_param in request.GET:
-            paginator = LimitOffsetPagination()
+            paginator = LimitOffsetPagination(count_function=count_function)
         else:
-            paginator = PageNumberPagination()
+            paginator = PageNumberPagination(count_function=count_function)
 
         page = paginator.paginate_queryset(queryset, request, self)
         serializer_class = get_row_serializer_class(
@@ -300,6 +321,7 @@ class GridViewView(APIView):
             RowSerializer,
             is_response=True,
             field_ids=field_ids,
+            include_link_row_counts=link_row_limit is not None,
         )
         serializer = serializer_class(page, many=True)
 
@@ -775,6 +797,8 @@ class PublicGridViewRowsView(APIView):
                 ),
             ),
             SEARCH_MODE_API_PARAM,
+            COUNT_MODE_API_PARAM,
+            LINK_ROW_LIMIT_API_PARAM,
         ],
         tags=["Database table grid view"],
         operation_id="public_list_database_table_grid_view_rows",
@@ -832,7 +856,9 @@ class PublicGridViewRowsView(APIView):
         }
     )
     @allowed_includes("field_options")
-    @validate_query_parameters(SearchQueryParamSerializer, return_validated=True)
+    @validate_query_parameters(
+        ListGridViewRowsQueryParamsSerializer, return_validated=True
+    )
     def get(
         self, request: Request, slug: str, field_options: bool, query_params
     ) -> Response:
@@ -895,17 +921,32 @@ class PublicGridViewRowsView(APIView):
             api_filters=api_filters,
         )
 
+        link_row_limit = query_params.get("link_row_limit")
+        if link_row_limit is not None:
+            queryset = queryset.limit_link_row_prefetches(link_row_limit)
+
+        count_mode = query_params.get("count_mode")
+        count_function = get_row_count_function(
+            count_mode, search_mode if search else None
+        )
+
         if count:
-            return Response({"count": queryset.count()})
+            return Response(
+                {"count": RowHandler().count_rows(queryset, count_mode=count_mode)}
+            )
 
         if LimitOffsetPagination.limit_query_param in request.GET:
-            paginator = LimitOffsetPagination()
+            paginator = LimitOffsetPagination(count_function=count_function)
         else:
-            paginator = PageNumberPagination()
+            paginator = PageNumberPagination(count_function=count_function)
 
         page = paginator.paginate_queryset(queryset, request, self)
         serializer_class = get_row_serializer_class(
-            model, RowSerializer, is_response=True, field_ids=field_ids
+            model,
+            RowSerializer,
+            is_response=True,
+            field_ids=field_ids,
+            include_link_row_counts=link_row_limit is not None,
         )
         serializer = serializer_class(page, many=True)
         response = paginator.get_paginated_response(serializer.data)
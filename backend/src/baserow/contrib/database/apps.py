@@ -396,6 +396,9 @@ class DatabaseConfig(AppConfig):
         view_filter_type_registry.register(UserIsNotViewFilterType())
 
         from .views.view_aggregations import (
+            ApproximateDecileViewAggregationType,
+            ApproximateMedianViewAggregationType,
+            ApproximateUniqueCountViewAggregationType,
             AverageViewAggregationType,
             DecileViewAggregationType,
             EmptyCountViewAggregationType,
@@ -412,12 +415,17 @@ class DatabaseConfig(AppConfig):
         view_aggregation_type_registry.register(EmptyCountViewAggregationType())
         view_aggregation_type_registry.register(NotEmptyCountViewAggregationType())
         view_aggregation_type_registry.register(UniqueCountViewAggregationType())
+        view_aggregation_type_registry.register(
+            ApproximateUniqueCountViewAggregationType()
+        )
         view_aggregation_type_registry.register(MinViewAggregationType())
         view_aggregation_type_registry.register(MaxViewAggregationType())
         view_aggregation_type_registry.register(SumViewAggregationType())
         view_aggregation_type_registry.register(AverageViewAggregationType())
         view_aggregation_type_registry.register(MedianViewAggregationType())
         view_aggregation_type_registry.register(DecileViewAggregationType())
+        view_aggregation_type_registry.register(ApproximateMedianViewAggregationType())
+        view_aggregation_type_registry.register(ApproximateDecileViewAggregationType())
         view_aggregation_type_registry.register(VarianceViewAggregationType())
         view_aggregation_type_registry.register(StdDevViewAggregationType())
 
@@ -443,6 +451,13 @@ class DatabaseConfig(AppConfig):
 
         table_exporter_registry.register(CsvTableExporter())
 
+        from .export.table_exporters.parquet_table_exporter import (
+            ParquetTableExporter,
+        )
+
+        if ParquetTableExporter.is_available():
+            table_exporter_registry.register(ParquetTableExporter())
+
         from .trash.trash_types import (
             FieldTrashableItemType,
             RowsTrashableItemType,
@@ -477,6 +492,11 @@ class DatabaseConfig(AppConfig):
         webhook_event_type_registry.register(RowsDeletedEventType())
         webhook_event_type_registry.register(RowDeletedEventType())
 
+        from .rows.registries import row_metadata_registry
+        from .rows.row_metadata_types import PendingDependencyUpdatesMetadataType
+
+        row_metadata_registry.register(PendingDependencyUpdatesMetadataType())
+
         from .airtable.airtable_column_types import (
             CheckboxAirtableColumnType,
             CountAirtableColumnType,
@@ -1,5 +1,5 @@
 from django.contrib.postgres.fields import ArrayField
-from django.db.models import Aggregate, FloatField
+from django.db.models import Aggregate, FloatField, Func, IntegerField
 
 # Adapted from https://github.com/rtidatascience/django-postgres-stats
 
@@ -61,3 +61,80 @@ class Percentile(Aggregate):
             return ArrayField(FloatField())
         else:
             return FloatField()
+
+
+class DistinctCountEstimate(Func):
+    """
+    Estimates the number of distinct values of an expression based on the distinct
+    count of the rows of which the hash of the value falls in one out of
+    `sampling_factor` buckets. Because every distinct value is either always or never
+    sampled, multiplying it by the sampling factor is an unbiased estimate of the
+    number of distinct values with a relative standard error of about
+    `sqrt(sampling_factor / distinct values)`.
+
+    If the sample contains fewer than `min_value_sample_count` values, the estimate
+    is too inaccurate and the exact distinct count is returned instead. It's
+    compiled as a scalar subquery over the same rows, so that PostgreSQL only
+    computes it when it's needed.
+
+    Note that all the rows are still scanned to compute the sample, so the estimate
+    doesn't reduce the I/O, it only reduces the number of values that have to be
+    sorted to count the distinct ones.
+    """
+
+    def __init__(
+        self,
+        value_sample_count,
+        exact_count,
+        sampling_factor: int,
+        min_value_sample_count: int,
+        **extra,
+    ):
+        super().__init__(
+            value_sample_count, exact_count, output_field=IntegerField(), **extra
+        )
+        self.sampling_factor = sampling_factor
+        self.min_value_sample_count = min_value_sample_count
+
+    def _compile_exact_count_subquery(self, compiler, connection):
+        exact_count_sql, exact_count_params = compiler.compile(
+            self.source_expressions[1]
+        )
+
+        # The aggregate query is wrapped in a subquery by Django if the queryset
+        # has been annotated, in which case the aggregates refer to its columns.
+        inner_query = getattr(compiler.query, "inner_query", None)
+        if inner_query is not None:
+            inner_sql, inner_params = inner_query.get_compiler(compiler.using).as_sql(
+                with_col_aliases=True
+            )
+            sql = f"(SELECT {exact_count_sql} FROM ({inner_sql}) subquery)"
+            return sql, [*exact_count_params, *inner_params]
+
+        from_sql, from_params = compiler.get_from_clause()
+        where_sql, where_params = compiler.compile(compiler.query.where)
+        sql = f"(SELECT {exact_count_sql} FROM {' '.join(from_sql)}"
+        if where_sql:
+            sql += f" WHERE {where_sql}"
+        sql += ")"
+        return sql, [*exact_count_params, *from_params, *where_params]
+
+    def as_sql(self, compiler, connection, **extra_context):
+        value_sample_sql, value_sample_params = compiler.compile(
+            self.source_expressions[0]
+        )
+        exact_count_sql, exact_count_params = self._compile_exact_count_subquery(
+            compiler, connection
+        )
+        sql = (
+            f"CASE WHEN {value_sample_sql} >= %s THEN {value_sample_sql} * %s "
+            f"ELSE {exact_count_sql} END"
+        )
+        params = [
+            *value_sample_params,
+            self.min_value_sample_count,
+            *value_sample_params,
+            self.sampling_factor,
+            *exact_count_params,
+        ]
+        return sql, params
@@ -0,0 +1,75 @@
+import gzip
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, List, Optional
+
+EXPORT_COMPRESSION_GZIP = "gzip"
+EXPORT_COMPRESSION_ZSTD = "zstd"
+
+EXPORT_COMPRESSION_FILE_EXTENSIONS = {
+    EXPORT_COMPRESSION_GZIP: ".gz",
+    EXPORT_COMPRESSION_ZSTD: ".zst",
+}
+
+
+def _import_zstandard():
+    try:
+        import zstandard
+
+        return zstandard
+    except ImportError:
+        return None
+
+
+def get_supported_export_compressions() -> List[str]:
+    """
+    Returns the compressions that can be used for export files. Gzip is always
+    supported, zstd only if the optional `zstandard` package is installed.
+    """
+
+    compressions = [EXPORT_COMPRESSION_GZIP]
+    if _import_zstandard() is not None:
+        compressions.append(EXPORT_COMPRESSION_ZSTD)
+    return compressions
+
+
+def get_export_compression_file_extension(compression: Optional[str]) -> str:
+    """
+    Returns the extension that must be added to the file extension of the exporter
+    when the export file is compressed with the provided compression.
+    """
+
+    if compression is None:
+        return ""
+    return EXPORT_COMPRESSION_FILE_EXTENSIONS[compression]
+
+
+@contextmanager
+def open_compressed_stream(
+    file: BinaryIO, compression: Optional[str]
+) -> Iterator[BinaryIO]:
+    """
+    Wraps the provided file in a stream which compresses everything written to it on
+    the fly, so that no uncompressed copy of the export is stored. The stream is
+    flushed and closed when the context exits, but the file itself is left open.
+
+    :param file: The binary file to write the compressed data to.
+    :param compression: The compression to use, or None to write to the file as is.
+    :raises ValueError: If the compression is not supported.
+    :return: The stream to write the uncompressed data to.
+    """
+
+    if compression is None:
+        yield file
+        return
+
+    if compression == EXPORT_COMPRESSION_GZIP:
+        stream = gzip.GzipFile(fileobj=file, mode="wb")
+    elif compression == EXPORT_COMPRESSION_ZSTD and _import_zstandard() is not None:
+        stream = _import_zstandard().ZstdCompressor().stream_writer(file, closefd=False)
+    else:
+        raise ValueError(f"The export compression {compression} is not supported.")
+
+    try:
+        yield stream
+    finally:
+        stream.close()
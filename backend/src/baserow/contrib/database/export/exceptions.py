@@ -2,6 +2,10 @@ class ExportJobCanceledException(Exception):
     pass
 
 
+class ExportShardFailedException(Exception):
+    pass
+
+
 class TableOnlyExportUnsupported(Exception):
     pass
 
@@ -1,16 +1,48 @@
 import abc
+import shutil
+import tempfile
 import time
-from typing import Any, Callable
-
+from datetime import datetime
+from os.path import join
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
 from django.core.paginator import Paginator
-from django.db.models import QuerySet
+from django.db import DEFAULT_DB_ALIAS, connection, connections
+from django.db.models import (
+    BooleanField,
+    Case,
+    Q,
+    QuerySet,
+    Value,
+    When,
+    prefetch_related_objects,
+)
+from django.db.transaction import Atomic
+from django.utils.functional import cached_property
 
 import unicodecsv as csv
+from psycopg2 import sql
 
-from baserow.contrib.database.export.exceptions import ExportJobCanceledException
+from baserow.contrib.database.export.exceptions import (
+    ExportJobCanceledException,
+    ExportShardFailedException,
+)
+from baserow.contrib.database.export.tasks import EXPORT_TIME_LIMIT
 from baserow.contrib.database.table.models import FieldObject
+from baserow.contrib.database.trash.models import TrashedRows
+from baserow.contrib.database.trash.trash_types import (
+    RowsTrashableItemType,
+    RowTrashableItemType,
+)
 from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.registries import view_type_registry
+from baserow.core.db import IsolationLevel, transaction_atomic
+from baserow.core.models import TrashEntry
+from baserow.core.utils import grouper
 
 
 class FileWriter(abc.ABC):
@@ -46,6 +78,7 @@ class FileWriter(abc.ABC):
         self,
         queryset: QuerySet,
         write_row: Callable[[Any, bool], None],
+        serialize_chunk: Optional[Callable[[List[Any]], List[Any]]] = None,
     ):
         """
         A specialized method which knows how to write an entire queryset to the file
@@ -53,6 +86,10 @@ class FileWriter(abc.ABC):
         :param queryset: The queryset to write to the file.
         :param write_row: A callable function which takes each row from the queryset in
             turn and writes to the file.
+        :param serialize_chunk: An optional callable function which takes a list of
+            rows from the queryset and returns a list with a serialized value for
+            every row. If provided, the serialized values are passed into write_row
+            instead of the rows themselves.
         """
 
     def get_csv_dict_writer(self, headers, **kwargs):
@@ -79,7 +116,7 @@ class PaginatedExportJobFileWriter(FileWriter):
     def write(self, value: str, encoding="utf-8"):
         self._file.write(value.encode(encoding))
 
-    def write_rows(self, queryset, write_row):
+    def write_rows(self, queryset, write_row, serialize_chunk=None):
         """
         Writes the queryset to the file using the provided write_row callback.
         Every EXPORT_JOB_UPDATE_FREQUENCY_SECONDS will check if the job has been
@@ -91,13 +128,19 @@ class PaginatedExportJobFileWriter(FileWriter):
         :param queryset: The queryset to write to the file.
         :param write_row: A callable function which takes each row from the queryset in
             turn and writes to the file.
+        :param serialize_chunk: An optional callable function which is called with
+            every page of rows. The values it returns are passed into write_row
+            instead of the rows.
         """
 
         self.last_check = time.perf_counter()
         paginator = Paginator(queryset.all(), 2000)
         i = 0
         for page in paginator.page_range:
-            for row in paginator.page(page).object_list:
+            rows = paginator.page(page).object_list
+            if serialize_chunk is not None:
+                rows = serialize_chunk(list(rows))
+            for row in rows:
                 i = i + 1
                 is_last_row = i == paginator.count
                 write_row(row, is_last_row)
@@ -128,10 +171,504 @@ class PaginatedExportJobFileWriter(FileWriter):
             if self.job.is_cancelled_or_expired():
                 raise ExportJobCanceledException()
             else:
-                self.job.progress_percentage = current_row / total_rows * 100
+                # The rows can change while they're being exported, so the number
+                # of rows written can end up higher than the count.
+                self.job.progress_percentage = (
+                    min(current_row / total_rows, 1) * 100 if total_rows else 100
+                )
                 self.job.save()
 
 
+class StreamingExportJobFileWriter(PaginatedExportJobFileWriter):
+    """
+    Streams the rows of querysets from a server-side cursor instead of paginating
+    them, because every page of the paginator is an OFFSET query which gets slower
+    the further the export gets into the table. The prefetches and multi field
+    prefetches of the queryset are done per chunk of rows. Only the progress of the
+    job depends on the upfront count, the last row is detected while iterating.
+    """
+
+    CHUNK_SIZE = 2000
+
+    def write_rows(self, queryset, write_row, serialize_chunk=None):
+        """
+        Writes the queryset to the file using the provided write_row callback, while
+        checking if the job has been cancelled and updating its progress like the
+        `PaginatedExportJobFileWriter` does.
+
+        :param queryset: The queryset to write to the file.
+        :param write_row: A callable function which takes each row from the queryset in
+            turn and writes to the file.
+        :param serialize_chunk: An optional callable function which is called with
+            every chunk of rows. The values it returns are passed into write_row
+            instead of the rows.
+        """
+
+        self.last_check = time.perf_counter()
+        self._stream_rows(queryset, write_row, serialize_chunk, queryset.count())
+
+    def _stream_rows(self, queryset, write_row, serialize_chunk, total_rows):
+        i = 0
+        for row, is_last_row in self._iterate_rows(queryset, serialize_chunk):
+            i = i + 1
+            write_row(row, is_last_row)
+            # Passing the same current and total row for the last row makes sure
+            # that the final progress is stored, even if the count was off.
+            self._check_and_update_job(i, i if is_last_row else total_rows)
+
+    def _iterate_rows(
+        self, queryset, serialize_chunk=None
+    ) -> Iterator[Tuple[Any, bool]]:
+        """
+        Iterates over the rows of the queryset in chunks using a server-side cursor.
+
+        :param queryset: The queryset to iterate over.
+        :param serialize_chunk: An optional callable function which is called with
+            every prefetched chunk of rows and returns the values to yield instead.
+        :return: A generator of tuples containing the row and whether it's the last
+            row of the queryset.
+        """
+
+        prefetch_lookups = queryset._prefetch_related_lookups
+        multi_field_prefetches = queryset.get_multi_field_prefetches()
+        rows = queryset.prefetch_related(None).iterator(chunk_size=self.CHUNK_SIZE)
+
+        previous_row = None
+        for chunk in grouper(self.CHUNK_SIZE, rows):
+            chunk = list(chunk)
+            if prefetch_lookups:
+                prefetch_related_objects(chunk, *prefetch_lookups)
+            for multi_field_prefetch in multi_field_prefetches:
+                multi_field_prefetch(queryset, chunk)
+            if serialize_chunk is not None:
+                chunk = serialize_chunk(chunk)
+
+            for row in chunk:
+                # It's only known whether a row is the last one when the next row
+                # has been fetched.
+                if previous_row is not None:
+                    yield previous_row, False
+                previous_row = row
+
+        if previous_row is not None:
+            yield previous_row, True
+
+
+class ShardedFile:
+    """
+    Wraps the file that's exported to, so that the rows of a shard can be written to
+    a part file instead. Without a file, everything that isn't written to a part file
+    is discarded, which is how a shard task only writes the rows of its shard.
+    """
+
+    def __init__(self, file=None):
+        self._file = file
+        self._part_file = None
+
+    def set_part_file(self, part_file):
+        self._part_file = part_file
+
+    def write(self, value):
+        file = self._part_file if self._part_file is not None else self._file
+        if file is None:
+            return len(value)
+        return file.write(value)
+
+    def __getattr__(self, name):
+        return getattr(self._file, name)
+
+
+# The claim of a shard expires after this number of seconds, unless it's renewed by
+# whoever exports the shard after every page of rows. A shard of which the claim has
+# expired can be claimed again, because whoever claimed it was lost.
+EXPORT_SHARD_CLAIM_TIMEOUT_SECONDS = 60
+
+
+class ExportShard(NamedTuple):
+    """
+    A keyset range of the rows of a sharded export, ordered by `(order, id)`.
+    """
+
+    index: int
+    # The `(order, id)` position of the first row of the shard, None for the first
+    # shard.
+    start: Optional[Tuple[str, int]]
+    # The `(order, id)` position of the first row of the next shard, None for the
+    # last shard.
+    end: Optional[Tuple[str, int]]
+
+    @classmethod
+    def from_task_argument(cls, shard: List[Any]) -> "ExportShard":
+        index, start, end = shard
+        return cls(index, tuple(start) if start else None, tuple(end) if end else None)
+
+    @property
+    def is_last(self) -> bool:
+        return self.end is None
+
+    def filter(self, queryset: QuerySet) -> QuerySet:
+        if self.start is not None:
+            order, row_id = self.start
+            queryset = queryset.filter(
+                Q(order__gt=order) | Q(order=order, id__gte=row_id)
+            )
+        if self.end is not None:
+            order, row_id = self.end
+            queryset = queryset.filter(
+                Q(order__lt=order) | Q(order=order, id__lt=row_id)
+            )
+        return queryset
+
+    def get_cache_key(self, snapshot_id: str, name: str) -> str:
+        # The snapshot is unique per export, so the keys of the shards of a previous
+        # attempt of the same job are never used.
+        return f"export_shard_{snapshot_id}_{self.index}_{name}"
+
+    def claim(self, snapshot_id: str) -> bool:
+        """
+        Claims the shard for either a shard task or the export job itself, so that
+        it's exported once. The claim expires unless it's renewed with `renew_claim`.
+        """
+
+        return cache.add(
+            self.get_cache_key(snapshot_id, "claimed"),
+            True,
+            timeout=EXPORT_SHARD_CLAIM_TIMEOUT_SECONDS,
+        )
+
+    def renew_claim(self, snapshot_id: str):
+        cache.touch(
+            self.get_cache_key(snapshot_id, "claimed"),
+            timeout=EXPORT_SHARD_CLAIM_TIMEOUT_SECONDS,
+        )
+
+    def is_claimed(self, snapshot_id: str) -> bool:
+        return cache.get(self.get_cache_key(snapshot_id, "claimed")) is not None
+
+    def finish(self, snapshot_id: str, error: Optional[str] = None):
+        """
+        Marks the shard as done, or as failed with the provided error. The shard
+        stays claimed until the export has timed out, so that it's never exported
+        again.
+        """
+
+        cache.set_many(
+            {
+                self.get_cache_key(snapshot_id, "claimed"): True,
+                self.get_cache_key(
+                    snapshot_id, "done" if error is None else "failed"
+                ): (True if error is None else error),
+            },
+            timeout=EXPORT_TIME_LIMIT,
+        )
+
+    def get_part_file_path(self, job) -> str:
+        return join(
+            settings.EXPORT_FILES_DIRECTORY,
+            f"{job.exported_file_name}.{self.index}.part",
+        )
+
+
+def get_rows_written_cache_key(job_id: int) -> str:
+    return f"export_job_{job_id}_rows_written"
+
+
+def export_snapshot_transaction(snapshot_id: str) -> Atomic:
+    """
+    Starts a transaction that sees the rows of the exported snapshot, so that all
+    the shards of a sharded export see the same rows.
+    """
+
+    return transaction_atomic(
+        isolation_level=IsolationLevel.REPEATABLE_READ,
+        first_sql_to_run_in_transaction_with_args=(
+            sql.SQL("SET TRANSACTION SNAPSHOT {0}"),
+            [sql.Literal(snapshot_id)],
+        ),
+    )
+
+
+class ShardedExportJobFileWriter(StreamingExportJobFileWriter):
+    """
+    Splits large querysets that are ordered by the default `(order, id)` order into
+    keyset shards, which are exported in parallel into part files that are
+    concatenated in order afterwards. The export job exports the first shard itself,
+    while the other shards are exported by a chain of celery tasks, where every task
+    queues the next one as long as there are unclaimed shards left, so that they're
+    spread over the free workers. The export job exports the shards that no task has
+    claimed, or of which the task was lost, itself once it's done with the first
+    shard, so that it never waits on shards that no worker is exporting. Every shard
+    reads its rows in transactions importing a snapshot exported when the export
+    starts, so that the shards see the same rows, like a single transaction would.
+    Other querysets are streamed by the export job alone.
+    """
+
+    SHARD_POLL_INTERVAL_SECONDS = 0.5
+
+    def __init__(self, file, job, max_shards: int, min_rows_per_shard: int):
+        super().__init__(ShardedFile(file), job)
+        self.max_shards = max_shards
+        self.min_rows_per_shard = min_rows_per_shard
+        self._total_rows = 0
+
+    def write_rows(self, queryset, write_row, serialize_chunk=None):
+        """
+        Writes the queryset to the file using the provided write_row callback, in
+        parallel shards if the queryset is large enough. The progress of all the
+        shards is combined into the progress of the job.
+
+        :param queryset: The queryset to write to the file.
+        :param write_row: A callable function which takes each row from the queryset in
+            turn and writes to the file. When the queryset is sharded, it's also
+            called by the shard tasks, which call `write_to_file` of the same
+            serializer with an `ExportShardFileWriter`.
+        :param serialize_chunk: An optional callable function which is called with
+            every chunk of rows. The values it returns are passed into write_row
+            instead of the rows.
+        """
+
+        self.last_check = time.perf_counter()
+        total_rows = queryset.count()
+        shard_count = min(
+            self.max_shards, total_rows // max(self.min_rows_per_shard, 1)
+        )
+
+        if shard_count < 2 or not queryset.has_default_order():
+            self._stream_rows(queryset, write_row, serialize_chunk, total_rows)
+            return
+
+        from baserow.contrib.database.export.tasks import run_export_shard
+
+        queryset = queryset.order_by("order", "id")
+        self._total_rows = total_rows
+        # The snapshot is kept by a transaction that stays open on a separate
+        # connection until all the shards have been exported. While it's open,
+        # postgres can't vacuum the rows that were deleted or updated after the
+        # snapshot in any table, which is the price of letting the shards see the
+        # same rows.
+        snapshot_connection = connections.create_connection(DEFAULT_DB_ALIAS)
+        shards = []
+        part_files = {}
+        snapshot_id = None
+        try:
+            snapshot_id = self._export_snapshot(snapshot_connection)
+            with export_snapshot_transaction(snapshot_id):
+                shards = self._get_shards(queryset, total_rows, shard_count)
+
+            cache.set(
+                get_rows_written_cache_key(self.job.id), 0, timeout=EXPORT_TIME_LIMIT
+            )
+            if len(shards) > 1:
+                run_export_shard.delay(self.job.id, shards[1:], snapshot_id)
+
+            self._write_or_wait_for_shards(
+                queryset, shards, snapshot_id, write_row, serialize_chunk, part_files
+            )
+
+            for shard in shards:
+                if shard.index in part_files:
+                    part_file = part_files[shard.index]
+                    part_file.seek(0)
+                    shutil.copyfileobj(part_file, self._file)
+                else:
+                    with default_storage.open(
+                        shard.get_part_file_path(self.job), "rb"
+                    ) as part_file:
+                        shutil.copyfileobj(part_file, self._file)
+            self._check_and_update_job(total_rows, total_rows)
+        finally:
+            snapshot_connection.close()
+            for part_file in part_files.values():
+                part_file.close()
+            for shard in shards:
+                part_file_path = shard.get_part_file_path(self.job)
+                if default_storage.exists(part_file_path):
+                    default_storage.delete(part_file_path)
+
+    def _export_snapshot(self, snapshot_connection) -> str:
+        """
+        Starts a transaction on the provided connection and exports its snapshot, so
+        that it can be imported by the transactions of the shards. The snapshot can
+        be imported as long as the transaction is open, which is until the connection
+        is closed.
+        """
+
+        snapshot_connection.set_autocommit(False)
+        with snapshot_connection.cursor() as cursor:
+            cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ")
+            cursor.execute("SELECT pg_export_snapshot()")
+            return cursor.fetchone()[0]
+
+    def _get_shards(self, queryset, total_rows, shard_count) -> List[ExportShard]:
+        """
+        Splits the queryset into roughly equally sized shards, by looking up the
+        `(order, id)` positions of the first rows of the shards in a single pass over
+        the rows.
+        """
+
+        rows_per_shard = -(-total_rows // shard_count)
+        positions = (
+            queryset.clear_multi_field_prefetch()
+            .prefetch_related(None)
+            .values_list("order", "id")
+        )
+        positions_sql, positions_params = positions.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                SELECT "order", "id" FROM (
+                    SELECT
+                        "order",
+                        "id",
+                        row_number() OVER (ORDER BY "order", "id") AS row_number
+                    FROM ({positions_sql}) AS positions
+                ) AS numbered_positions
+                WHERE row_number > 1 AND (row_number - 1) %% %s = 0
+                ORDER BY row_number
+                """,  # nosec b608
+                [*positions_params, rows_per_shard],
+            )
+            # The order is a decimal, which must be serializable as a task argument.
+            shard_starts = [(str(order), row_id) for order, row_id in cursor]
+
+        starts = [None] + shard_starts
+        ends = shard_starts + [None]
+        return [
+            ExportShard(index, start, end)
+            for index, (start, end) in enumerate(zip(starts, ends))
+        ]
+
+    def _write_or_wait_for_shards(
+        self, queryset, shards, snapshot_id, write_row, serialize_chunk, part_files
+    ):
+        """
+        Writes the shards that haven't been claimed by a shard task, or of which the
+        claim has expired because the task was lost, into temporary part files, and
+        waits until the shard tasks have written the other shards, while updating
+        the progress of the job. Raises if a shard task has failed.
+        """
+
+        pending_shards = list(shards)
+        while pending_shards:
+            for shard in list(pending_shards):
+                error = cache.get(shard.get_cache_key(snapshot_id, "failed"))
+                if error is not None:
+                    raise ExportShardFailedException(error)
+
+                if cache.get(shard.get_cache_key(snapshot_id, "done")):
+                    pending_shards.remove(shard)
+                elif shard.claim(snapshot_id):
+                    part_files[shard.index] = tempfile.TemporaryFile()
+                    self._file.set_part_file(part_files[shard.index])
+                    try:
+                        self._write_shard(
+                            queryset, shard, snapshot_id, write_row, serialize_chunk
+                        )
+                    finally:
+                        self._file.set_part_file(None)
+                    pending_shards.remove(shard)
+
+            if pending_shards:
+                rows_written = cache.get(get_rows_written_cache_key(self.job.id), 0)
+                self._check_and_update_job(
+                    min(rows_written, self._total_rows - 1), self._total_rows
+                )
+                time.sleep(self.SHARD_POLL_INTERVAL_SECONDS)
+
+    def _write_shard(self, queryset, shard, snapshot_id, write_row, serialize_chunk):
+        """
+        Writes the rows of a single shard page by page. Every page is read and
+        written in its own transaction importing the exported snapshot, so that the
+        progress and the cancellation of the job can be checked in between.
+        """
+
+        queryset = shard.filter(queryset)
+        last_position = None
+        while True:
+            page = queryset
+            if last_position is not None:
+                order, row_id = last_position
+                page = page.filter(Q(order__gt=order) | Q(order=order, id__gt=row_id))
+
+            with export_snapshot_transaction(snapshot_id):
+                # One more row is fetched to know whether the page contains the last
+                # row of the shard.
+                rows = list(page[: self.CHUNK_SIZE + 1])
+                has_next_page = len(rows) > self.CHUNK_SIZE
+                rows = rows[: self.CHUNK_SIZE]
+                if not rows:
+                    return
+
+                last_position = (rows[-1].order, rows[-1].id)
+                values = serialize_chunk(rows) if serialize_chunk is not None else rows
+                for index, value in enumerate(values):
+                    is_last_row = not has_next_page and index == len(values) - 1
+                    write_row(value, shard.is_last and is_last_row)
+
+            shard.renew_claim(snapshot_id)
+            self._shard_page_written(len(rows))
+            if not has_next_page:
+                return
+
+    def _shard_page_written(self, row_count):
+        rows_written = cache.incr(get_rows_written_cache_key(self.job.id), row_count)
+        # A shard of which the task was lost is written again, so the rows written
+        # can be counted twice.
+        self._check_and_update_job(
+            min(rows_written, self._total_rows), self._total_rows
+        )
+
+
+class ExportShardFileWriter(ShardedExportJobFileWriter):
+    """
+    Used by the shard tasks of a sharded export to write the rows of a single
+    shard to a part file in the storage. The serializer writes the whole file to it,
+    but everything except the rows of the shard is discarded, because the export
+    job writes it.
+    """
+
+    def __init__(self, job, shard: ExportShard, snapshot_id: str):
+        super().__init__(None, job, max_shards=1, min_rows_per_shard=0)
+        self.shard = shard
+        self.snapshot_id = snapshot_id
+
+    def write_rows(self, queryset, write_row, serialize_chunk=None):
+        self.last_check = time.perf_counter()
+        path = self.shard.get_part_file_path(self.job)
+        try:
+            default_storage.save(path, ContentFile(b""))
+            with default_storage.open(path, "wb") as part_file:
+                self._file.set_part_file(part_file)
+                try:
+                    self._write_shard(
+                        queryset.order_by("order", "id"),
+                        self.shard,
+                        self.snapshot_id,
+                        write_row,
+                        serialize_chunk,
+                    )
+                finally:
+                    self._file.set_part_file(None)
+        except ExportJobCanceledException:
+            default_storage.delete(path)
+            raise
+        except Exception as e:
+            default_storage.delete(path)
+            self.shard.finish(self.snapshot_id, error=str(e))
+            raise
+
+        self.shard.finish(self.snapshot_id)
+
+    def _shard_page_written(self, row_count):
+        cache.incr(get_rows_written_cache_key(self.job.id), row_count)
+        current_time = time.perf_counter()
+        if current_time - self.last_check > self.EXPORT_JOB_UPDATE_FREQUENCY_SECONDS:
+            self.last_check = current_time
+            self.job.refresh_from_db()
+            if self.job.is_cancelled_or_expired():
+                raise ExportJobCanceledException()
+
+
 class QuerysetSerializer(abc.ABC):
     """
     A class knows how to serialize a given queryset and the fields of said queryset to
@@ -139,12 +676,17 @@ class QuerysetSerializer(abc.ABC):
     """
 
     can_handle_rich_value = False
+    # Whether the rows can be written by multiple shard tasks at the same time, into
+    # parts of the file which are concatenated afterwards.
+    can_write_rows_in_parallel = True
 
     def __init__(self, queryset, ordered_field_objects):
         self.queryset = queryset
+        self.include_deleted_column = False
+        self.field_objects = list(ordered_field_objects)
         self.field_serializers = [lambda row: ("id", "id", row.id)]
 
-        for field_object in ordered_field_objects:
+        for field_object in self.field_objects:
             self.field_serializers.append(self._get_field_serializer(field_object))
 
     @abc.abstractmethod
@@ -185,6 +727,82 @@ class QuerysetSerializer(abc.ABC):
         qs = ViewHandler().get_queryset(view, model=model)
         return cls(qs, fields)
 
+    def limit_to_changes_since(self, since: datetime):
+        """
+        Limits the rows to export to the rows that have been created, updated or
+        restored since the provided date, and the rows that have been trashed since
+        then. An additional `deleted` column indicates which rows must be removed
+        from the previous exports, which are the trashed rows and the changed rows
+        that don't match the filters of the view anymore. Only the id of those rows
+        is exported, their other values are empty. The rows are exported in their
+        default order.
+
+        Rows that have been permanently deleted, and rows of which only a value that
+        depends on another row has changed, are not included.
+
+        :param since: The rows changed after this date will be exported.
+        """
+
+        model = self.queryset.model
+        matching_rows = self.queryset.filter(updated_on__gte=since).values("id")
+        trashed_row_ids = self._get_row_ids_trashed_since(model.baserow_table, since)
+
+        self.queryset = (
+            model.objects_and_trash.filter(
+                Q(updated_on__gte=since, trashed=False)
+                | Q(id__in=trashed_row_ids, trashed=True)
+            )
+            .annotate(
+                deleted=Case(
+                    When(id__in=matching_rows, then=Value(False)),
+                    default=Value(True),
+                    output_field=BooleanField(),
+                )
+            )
+            .enhance_by_fields()
+            .order_by("order", "id")
+        )
+        self.include_deleted_column = True
+        self.field_serializers.append(lambda row: ("deleted", "deleted", row.deleted))
+
+    @staticmethod
+    def _get_row_ids_trashed_since(table, since: datetime) -> List[int]:
+        trash_entries = TrashEntry.objects.filter(
+            parent_trash_item_id=table.id, trashed_at__gte=since
+        )
+        row_ids = list(
+            trash_entries.filter(trash_item_type=RowTrashableItemType.type).values_list(
+                "trash_item_id", flat=True
+            )
+        )
+
+        # Rows that have been trashed in bulk are tracked in one `TrashedRows` entry.
+        trashed_rows = TrashedRows.objects.filter(
+            table=table,
+            id__in=trash_entries.filter(
+                trash_item_type=RowsTrashableItemType.type
+            ).values("trash_item_id"),
+        )
+        for trashed_row_ids in trashed_rows.values_list("row_ids", flat=True):
+            row_ids.extend(trashed_row_ids)
+
+        return row_ids
+
+    def get_export_value(self, row, name: str) -> Any:
+        """
+        Returns the internal value of the field with the provided database column name
+        to export for the row. This is None for the rows that are exported as deleted,
+        because they must not reveal values that are outside the view anymore.
+
+        :param row: The row to get the value from.
+        :param name: The database column name of the field.
+        :return: The internal value of the field, or None if the row is deleted.
+        """
+
+        if self.include_deleted_column and row.deleted:
+            return None
+        return getattr(row, name)
+
     def _get_field_serializer(self, field_object: FieldObject) -> Callable[[Any], Any]:
         """
         An internal standard method which generates a serializer function for a given
@@ -199,7 +817,7 @@ class QuerysetSerializer(abc.ABC):
         """
 
         def serializer_func(row):
-            value = getattr(row, field_object["name"])
+            value = self.get_export_value(row, field_object["name"])
 
             if value is None:
                 result = ""
@@ -215,3 +833,41 @@ class QuerysetSerializer(abc.ABC):
             )
 
         return serializer_func
+
+    @cached_property
+    def column_serializers(self) -> List[Tuple[str, Callable[[List[Any]], List[Any]]]]:
+        return [
+            (
+                field_object["name"],
+                field_object["type"].get_export_column_serializer(
+                    field_object, rich_value=self.can_handle_rich_value
+                ),
+            )
+            for field_object in self.field_objects
+        ]
+
+    def serialize_chunk(self, rows: List[Any]) -> List[Dict[str, Any]]:
+        """
+        Converts a chunk of rows to export values column by column, using the export
+        column serializers of the field types. This can be passed into the
+        `serialize_chunk` of `FileWriter.write_rows`, and gives the same values as
+        the field serializers, without calling the field type for every cell.
+
+        :param rows: The rows to serialize.
+        :return: A dict for every row containing the export values keyed by the
+            database column name of the field.
+        """
+
+        names = ["id"]
+        columns = [[row.id for row in rows]]
+        for name, column_serializer in self.column_serializers:
+            names.append(name)
+            columns.append(
+                column_serializer([self.get_export_value(row, name) for row in rows])
+            )
+
+        if self.include_deleted_column:
+            names.append("deleted")
+            columns.append([row.deleted for row in rows])
+
+        return [dict(zip(names, values)) for values in zip(*columns)]
@@ -1,13 +1,15 @@
 import uuid
+from datetime import datetime
 from io import BytesIO
 from os.path import join
-from typing import Any, BinaryIO, Dict, Optional
+from typing import Any, BinaryIO, Dict, Optional, Tuple
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.files.storage import default_storage
 from django.db import transaction
 from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 
 from loguru import logger
 
@@ -28,12 +30,22 @@ from baserow.contrib.database.views.models import View
 from baserow.contrib.database.views.registries import view_type_registry
 from baserow.core.handler import CoreHandler
 
+from .compression import (
+    get_export_compression_file_extension,
+    open_compressed_stream,
+)
 from .exceptions import (
     ExportJobCanceledException,
+    ExportJobDoesNotExistException,
     TableOnlyExportUnsupported,
     ViewUnsupportedForExporterType,
 )
-from .file_writer import PaginatedExportJobFileWriter
+from .file_writer import (
+    ExportShard,
+    ExportShardFileWriter,
+    QuerysetSerializer,
+    ShardedExportJobFileWriter,
+)
 from .registries import TableExporter, table_exporter_registry
 
 User = get_user_model()
@@ -81,12 +93,19 @@ class ExportHandler:
         :param view: An optional view of the table to export instead of the table
             itself.
         :param export_options: A dict containing exporter_type and the relevant options
-            for that type.
+            for that type. It can contain either an `export_changes_since` date or
+            an `export_changes_since_job_id` to only export the rows that have
+            changed since then.
         :raises ViewNotInTable: If the view does not belong to the table.
+        :raises ExportJobDoesNotExistException: If the export job provided as
+            `export_changes_since_job_id` does not exist.
         :return: The created export job.
         """
 
         exporter_type = export_options.pop("exporter_type")
+        export_changes_since = _get_export_changes_since(user, table, export_options)
+        if export_changes_since is not None:
+            export_options["export_changes_since"] = export_changes_since.isoformat()
         exporter = table_exporter_registry.get(exporter_type)
         exporter.before_job_create(user, table, view, export_options)
 
@@ -145,6 +164,23 @@ class ExportHandler:
             _mark_job_as_failed(job, e)
             raise e
 
+    @staticmethod
+    def run_export_shard(job: ExportJob, shard: ExportShard, snapshot_id: str):
+        """
+        Writes the rows of a single shard of a sharded export job to a part file in
+        the storage, which is concatenated with the other parts by the export job.
+
+        :param job: The export job the shard belongs to.
+        :param shard: The shard of the rows to write.
+        :param snapshot_id: The id of the snapshot exported by the export job, so
+            that the shard sees the same rows as the other shards.
+        """
+
+        serializer, export_options = _get_queryset_serializer_and_options(job)
+        serializer.write_to_file(
+            ExportShardFileWriter(job, shard, snapshot_id), **export_options
+        )
+
     @staticmethod
     def export_file_path(exported_file_name) -> str:
         """
@@ -205,6 +241,41 @@ def _raise_if_invalid_view_or_table_for_exporter(
             raise ViewUnsupportedForExporterType()
 
 
+def _get_export_changes_since(
+    user: User, table: Table, export_options: Dict[str, Any]
+) -> Optional[datetime]:
+    """
+    Pops the options that indicate since when the changed rows must be exported from
+    the export options, and returns that date. If a previous export job is provided,
+    the rows changed since that job was created are exported. Rows which changed
+    while that job was running are then exported again, instead of being missed.
+
+    :param user: The user who the export job is being run for.
+    :param table: The table on which the job is being run.
+    :param export_options: The options of the export job.
+    :raises ExportJobDoesNotExistException: If the previous export job does not
+        exist, or if it belongs to another user or table.
+    :return: The date since when the changed rows must be exported, or None if all
+        the rows must be exported.
+    """
+
+    export_changes_since = export_options.pop("export_changes_since", None)
+    previous_job_id = export_options.pop("export_changes_since_job_id", None)
+
+    if previous_job_id is not None:
+        try:
+            previous_job = ExportJob.objects.get(
+                id=previous_job_id, user=user, table=table
+            )
+        except ExportJob.DoesNotExist:
+            raise ExportJobDoesNotExistException(
+                f"The export job {previous_job_id} does not exist."
+            )
+        export_changes_since = previous_job.created_at
+
+    return export_changes_since
+
+
 def _cancel_unfinished_jobs(user):
     """
     Will cancel any in progress jobs by setting their state to cancelled. Any
@@ -273,8 +344,12 @@ def _open_file_and_run_export(job: ExportJob) -> ExportJob:
     """
 
     exporter: TableExporter = table_exporter_registry.get(job.exporter_type)
+    export_options = dict(job.export_options)
+    export_compression = export_options.pop("export_compression", None)
+
     exported_file_name = _generate_random_file_name_with_extension(
         exporter.file_extension
+        + get_export_compression_file_extension(export_compression)
     )
     storage_location = ExportHandler.export_file_path(exported_file_name)
     # Store the file name before we even start exporting so if the export fails
@@ -286,20 +361,52 @@ def _open_file_and_run_export(job: ExportJob) -> ExportJob:
     # TODO: refactor to use the jobs systems
     _register_action(job)
 
-    with _create_storage_dir_if_missing_and_open(storage_location) as file:
-        queryset_serializer_class = exporter.queryset_serializer_class
-        if job.view is None:
-            serializer = queryset_serializer_class.for_table(job.table)
-        else:
-            serializer = queryset_serializer_class.for_view(job.view)
-
+    with _create_storage_dir_if_missing_and_open(
+        storage_location
+    ) as file, open_compressed_stream(file, export_compression) as output:
+        serializer, export_options = _get_queryset_serializer_and_options(job)
         serializer.write_to_file(
-            PaginatedExportJobFileWriter(file, job), **job.export_options
+            ShardedExportJobFileWriter(
+                output,
+                job,
+                max_shards=(
+                    settings.BASEROW_EXPORT_MAX_SHARDS
+                    if serializer.can_write_rows_in_parallel
+                    else 1
+                ),
+                min_rows_per_shard=settings.BASEROW_EXPORT_MIN_ROWS_PER_SHARD,
+            ),
+            **export_options,
         )
 
     return job
 
 
+def _get_queryset_serializer_and_options(
+    job: ExportJob,
+) -> Tuple[QuerysetSerializer, Dict[str, Any]]:
+    """
+    Returns the queryset serializer of the rows exported by the job, and the options
+    to pass into its `write_to_file` method.
+    """
+
+    exporter: TableExporter = table_exporter_registry.get(job.exporter_type)
+    export_options = dict(job.export_options)
+    export_changes_since = export_options.pop("export_changes_since", None)
+    export_options.pop("export_compression", None)
+
+    queryset_serializer_class = exporter.queryset_serializer_class
+    if job.view is None:
+        serializer = queryset_serializer_class.for_table(job.table)
+    else:
+        serializer = queryset_serializer_class.for_view(job.view)
+
+    if export_changes_since is not None:
+        serializer.limit_to_changes_since(parse_datetime(export_changes_since))
+
+    return serializer, export_options
+
+
 def _generate_random_file_name_with_extension(file_extension):
     return str(uuid.uuid4()) + file_extension
 
@@ -46,6 +46,10 @@ class CsvQuerysetSerializer(QuerysetSerializer):
             field_display_name = field_object["field"].name
             self.headers[field_database_name] = field_display_name
 
+    def limit_to_changes_since(self, since):
+        super().limit_to_changes_since(since)
+        self.headers["deleted"] = "deleted"
+
     def write_to_file(
         self,
         file_writer: FileWriter,
@@ -79,12 +83,14 @@ class CsvQuerysetSerializer(QuerysetSerializer):
         if csv_include_header:
             csv_dict_writer.writerow(self.headers)
 
-        def write_row(row, _):
-            data = {}
-            for field_serializer in self.field_serializers:
-                field_database_name, _, field_human_value = field_serializer(row)
-                data[field_database_name] = escape_csv_cell(str(field_human_value))
-
-            csv_dict_writer.writerow(data)
+        def write_row(serialized_row, _):
+            csv_dict_writer.writerow(
+                {
+                    field_database_name: escape_csv_cell(str(field_human_value))
+                    for field_database_name, field_human_value in serialized_row.items()
+                }
+            )
 
-        file_writer.write_rows(self.queryset, write_row)
+        file_writer.write_rows(
+            self.queryset, write_row, serialize_chunk=self.serialize_chunk
+        )
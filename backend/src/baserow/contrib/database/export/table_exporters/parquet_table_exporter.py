@@ -0,0 +1,192 @@
+from functools import partial
+from typing import Any, Callable, List, Tuple, Type
+
+from baserow.contrib.database.api.export.serializers import (
+    BaseExporterOptionsSerializer,
+)
+from baserow.contrib.database.export.file_writer import FileWriter, QuerysetSerializer
+from baserow.contrib.database.export.registries import TableExporter
+from baserow.contrib.database.fields.field_export_columns import (
+    TypedExportColumn,
+    TypedExportColumnTypes,
+)
+from baserow.contrib.database.table.models import FieldObject
+from baserow.contrib.database.views.view_types import GridViewType
+from baserow.core.utils import find_unused_name
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+ParquetColumn = Tuple["pa.DataType", Callable[[List[Any]], List[Any]]]
+
+
+class ParquetTableExporter(TableExporter):
+    """
+    Exports tables and grid views to an Apache Parquet file. This exporter is only
+    available if the optional pyarrow package is installed.
+    """
+
+    type = "parquet"
+
+    @staticmethod
+    def is_available() -> bool:
+        return pa is not None
+
+    @property
+    def option_serializer_class(self) -> Type[BaseExporterOptionsSerializer]:
+        return BaseExporterOptionsSerializer
+
+    @property
+    def can_export_table(self) -> bool:
+        return True
+
+    @property
+    def supported_views(self) -> List[str]:
+        return [GridViewType.type]
+
+    @property
+    def file_extension(self) -> str:
+        return ".parquet"
+
+    @property
+    def queryset_serializer_class(self):
+        return ParquetQuerysetSerializer
+
+
+class FileWriterStream:
+    """
+    A minimal writable binary stream which pyarrow can write to, that writes to the
+    file writer. It keeps track of its own position because the export file can be
+    a compressed stream which doesn't know its position.
+    """
+
+    closed = False
+
+    def __init__(self, file_writer: FileWriter):
+        self._file_writer = file_writer
+        self._position = 0
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._file_writer.write_bytes(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def writable(self) -> bool:
+        return True
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class ParquetQuerysetSerializer(QuerysetSerializer):
+    """
+    Writes the rows to a Parquet file in row groups of ROW_GROUP_SIZE rows. The
+    fields of which the field type returns a typed export column, like number,
+    boolean, date and single select fields, are written as typed columns, the
+    categories like the single select labels using dictionary encoding. All the
+    other fields are written as strings containing the same values as the CSV
+    export.
+    """
+
+    ROW_GROUP_SIZE = 10000
+    # The rows are written in row groups, which can't be done from multiple threads.
+    can_write_rows_in_parallel = False
+
+    def write_to_file(self, file_writer: FileWriter, export_charset=None):
+        """
+        Writes the queryset to the provided file writer as a Parquet file.
+
+        :param file_writer: The file writer to use to do the writing.
+        :param export_charset: Ignored, the strings in Parquet files are always utf-8.
+        """
+
+        field_names = [
+            field_object["field"].name for field_object in self.field_objects
+        ]
+        # The generated columns are renamed if a field has the same name, because
+        # the column names of a Parquet file must be unique.
+        names = [find_unused_name(["id"], field_names, suffix="_{0}"), *field_names]
+        columns = [(pa.int64(), lambda values: values)] + [
+            self._get_parquet_column(field_object)
+            for field_object in self.field_objects
+        ]
+        if self.include_deleted_column:
+            names.append(find_unused_name(["deleted"], field_names, suffix="_{0}"))
+            columns.append((pa.bool_(), lambda values: values))
+
+        schema = pa.schema(
+            [(name, data_type) for name, (data_type, _) in zip(names, columns)]
+        )
+        value_getters = (
+            [lambda row: row.id]
+            + [
+                partial(self.get_export_value, name=field_object["name"])
+                for field_object in self.field_objects
+            ]
+            + ([lambda row: row.deleted] if self.include_deleted_column else [])
+        )
+
+        rows = []
+
+        def write_row_group():
+            arrays = [
+                pa.array(convert([get_value(row) for row in rows]), data_type)
+                for get_value, (data_type, convert) in zip(value_getters, columns)
+            ]
+            writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+            rows.clear()
+
+        def write_row(row, _):
+            rows.append(row)
+            if len(rows) >= self.ROW_GROUP_SIZE:
+                write_row_group()
+
+        writer = pq.ParquetWriter(
+            pa.PythonFile(FileWriterStream(file_writer), mode="w"), schema
+        )
+        try:
+            file_writer.write_rows(self.queryset, write_row)
+            if rows:
+                write_row_group()
+        finally:
+            writer.close()
+
+    def _get_parquet_column(self, field_object: FieldObject) -> ParquetColumn:
+        """
+        Returns the Parquet data type of the field and a function which converts a
+        list of the field's internal values to values of that type.
+        """
+
+        typed_column = field_object["type"].get_typed_export_column(field_object)
+        if typed_column is not None:
+            return self._get_parquet_type(typed_column), typed_column.convert
+
+        serialize_column = field_object["type"].get_export_column_serializer(
+            field_object
+        )
+        return pa.string(), lambda values: [
+            None if value is None else str(export_value)
+            for value, export_value in zip(values, serialize_column(values))
+        ]
+
+    def _get_parquet_type(self, typed_column: TypedExportColumn) -> "pa.DataType":
+        if typed_column.type == TypedExportColumnTypes.DECIMAL:
+            return pa.decimal256(typed_column.max_digits, typed_column.decimal_places)
+
+        return {
+            TypedExportColumnTypes.INTEGER: pa.int64(),
+            TypedExportColumnTypes.BOOLEAN: pa.bool_(),
+            TypedExportColumnTypes.DATE: pa.date32(),
+            TypedExportColumnTypes.TIMESTAMP: pa.timestamp("us", tz="UTC"),
+            TypedExportColumnTypes.CATEGORY: pa.dictionary(pa.int32(), pa.string()),
+        }[typed_column.type]
@@ -27,6 +27,39 @@ def run_export_job(self, job_id):
     ExportHandler.run_export_job(job)
 
 
+# noinspection PyUnusedLocal
+@app.task(
+    bind=True,
+    soft_time_limit=EXPORT_SOFT_TIME_LIMIT,
+    time_limit=EXPORT_TIME_LIMIT,
+)
+def run_export_shard(self, job_id, shards, snapshot_id):
+    """
+    Exports a shard of a large export in parallel with the export job, see
+    ShardedExportJobFileWriter. The first of the provided shards that hasn't been
+    claimed yet, for example by the export job itself, is exported. Another task is
+    queued first if there are still unclaimed shards left, so that the shards are
+    spread over the free workers, while at most one task without a shard to export
+    is waiting in the queue.
+    """
+
+    from baserow.contrib.database.export.file_writer import ExportShard
+    from baserow.contrib.database.export.handler import ExportHandler
+    from baserow.contrib.database.export.models import ExportJob
+
+    shards = [ExportShard.from_task_argument(shard) for shard in shards]
+    shard = next((shard for shard in shards if shard.claim(snapshot_id)), None)
+    if shard is None:
+        return
+
+    remaining_shards = shards[shards.index(shard) + 1 :]
+    if any(not other.is_claimed(snapshot_id) for other in remaining_shards):
+        run_export_shard.delay(job_id, remaining_shards, snapshot_id)
+
+    job = ExportJob.objects.get(id=job_id)
+    ExportHandler.run_export_shard(job, shard, snapshot_id)
+
+
 # noinspection PyUnusedLocal
 @app.task(
     bind=True,
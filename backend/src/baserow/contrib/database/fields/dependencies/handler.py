@@ -1,8 +1,9 @@
-from typing import Iterable, List, Optional, Tuple
+from typing import Iterable, List, Optional, Set, Tuple
 
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.contrib.contenttypes.models import ContentType
+from django.db import connection
 from django.db.models import Q
 
 from baserow.contrib.database.fields.dependencies.dependency_rebuilder import (
@@ -260,6 +261,58 @@ class FieldDependencyHandler:
 
         return result
 
+    @classmethod
+    def get_all_dependency_table_ids(cls, table_id: int) -> Set[int]:
+        """
+        Returns the ids of the tables containing the fields that the fields of the
+        provided table depend on recursively, including the tables linked by the link
+        row fields they depend on. The values of the fields of the provided table can
+        only change when the rows of those tables change.
+
+        :param table_id: The table of which the dependencies must be found.
+        :return: The ids of the tables the table depends on.
+        """
+
+        query_parameters = {
+            "max_depth": settings.MAX_FIELD_REFERENCE_DEPTH,
+            "table_id": table_id,
+        }
+        relationship_table = FieldDependency._meta.db_table
+        linkrowfield_table = LinkRowField._meta.db_table
+        field_table = Field._meta.db_table
+
+        raw_query = f"""
+            WITH RECURSIVE traverse(id, depth) AS (
+                SELECT first.dependency_id, 1
+                FROM {relationship_table} AS first
+                INNER JOIN {field_table} AS dependant
+                    ON first.dependant_id = dependant.id
+                WHERE
+                    dependant.table_id = %(table_id)s
+                    AND first.dependency_id IS NOT NULL
+                UNION
+                SELECT {relationship_table}.dependency_id, traverse.depth + 1
+                FROM traverse
+                INNER JOIN {relationship_table}
+                    ON {relationship_table}.dependant_id = traverse.id
+                WHERE
+                    {relationship_table}.dependency_id IS NOT NULL
+                    AND traverse.depth < %(max_depth)s
+            )
+            SELECT field.table_id
+            FROM traverse
+            INNER JOIN {field_table} AS field ON traverse.id = field.id
+            UNION
+            SELECT linkrowfield.link_row_table_id
+            FROM traverse
+            INNER JOIN {linkrowfield_table} AS linkrowfield
+                ON traverse.id = linkrowfield.field_ptr_id
+        """  # nosec b608
+
+        with connection.cursor() as cursor:
+            cursor.execute(raw_query, query_parameters)
+            return {row[0] for row in cursor.fetchall() if row[0] is not None}
+
     @classmethod
     def get_dependant_fields_with_type(
         cls,
@@ -49,3 +49,36 @@ class FieldDependency(models.Model):
         """
 
         return f"{self.dependant_id}__{self._dependency_postfix()}"
+
+
+class PendingDependencyUpdate(models.Model):
+    """
+    A PendingDependencyUpdate represents a row of which the value of a field has
+    changed, while the fields depending on it in other tables have not been updated
+    yet, because the table has the eventual dependency updates enabled. The pending
+    updates of a table are coalesced when they're applied in the background.
+    """
+
+    table = models.ForeignKey(
+        "database.Table",
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    field = models.ForeignKey(
+        "database.Field",
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    row_id = models.PositiveIntegerField()
+    connection_removed = models.BooleanField(
+        default=False,
+        help_text="Indicates whether the row is a row of the table linked by the "
+        "link row field that has lost its connection with an updated row.",
+    )
+    created_on = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["table", "row_id"]),
+            models.Index(fields=["table", "field", "row_id"]),
+        ]
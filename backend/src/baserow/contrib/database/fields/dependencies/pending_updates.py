@@ -0,0 +1,284 @@
+from collections import defaultdict
+from datetime import timedelta
+from typing import Dict, Iterable, List, Set
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from baserow.contrib.database.fields.dependencies.handler import (
+    FieldDependencyHandler,
+)
+from baserow.contrib.database.fields.dependencies.models import (
+    PendingDependencyUpdate,
+)
+from baserow.contrib.database.fields.dependencies.update_collector import (
+    FieldUpdateCollector,
+)
+from baserow.contrib.database.fields.field_cache import FieldCache
+from baserow.contrib.database.search.handler import SearchHandler
+from baserow.contrib.database.table.models import Table
+
+PENDING_DEPENDENCY_UPDATES_SCHEDULED_CACHE_KEY = "pending_dependency_updates"
+
+
+def get_pending_dependency_updates_scheduled_cache_key(table_id: int) -> str:
+    return f"{PENDING_DEPENDENCY_UPDATES_SCHEDULED_CACHE_KEY}:{table_id}"
+
+
+class PendingDependencyUpdateHandler:
+    @classmethod
+    def add_pending_updates(
+        cls,
+        table: Table,
+        field_ids: Iterable[int],
+        row_ids: Iterable[int],
+        deleted_m2m_rels_per_link_field: Dict[int, Set[int]],
+    ):
+        """
+        Stores that the fields depending on the provided fields of the provided rows
+        must still be updated, and schedules the update in the background. The rows
+        that have lost their connection via a link row field are stored as well,
+        so that the fields depending on them are also updated.
+
+        :param table: The table of the updated rows.
+        :param field_ids: The ids of the updated fields.
+        :param row_ids: The ids of the updated rows.
+        :param deleted_m2m_rels_per_link_field: The ids of the rows per link row
+            field of the table that have had their connection removed.
+        """
+
+        pending_updates = [
+            PendingDependencyUpdate(table_id=table.id, field_id=field_id, row_id=row_id)
+            for field_id in field_ids
+            for row_id in row_ids
+        ]
+        pending_updates += [
+            PendingDependencyUpdate(
+                table_id=table.id,
+                field_id=field_id,
+                row_id=row_id,
+                connection_removed=True,
+            )
+            for field_id, deleted_row_ids in deleted_m2m_rels_per_link_field.items()
+            for row_id in deleted_row_ids
+        ]
+
+        PendingDependencyUpdate.objects.bulk_create(pending_updates)
+        transaction.on_commit(lambda: cls.schedule_pending_updates(table.id))
+
+    @classmethod
+    def schedule_pending_updates(cls, table_id: int):
+        """
+        Schedules the task applying the pending updates of the table, unless it has
+        already been scheduled. The task is delayed, so that the updates made in the
+        meantime are applied together.
+        """
+
+        from baserow.contrib.database.fields.tasks import (
+            apply_pending_dependency_updates,
+        )
+
+        delay = settings.BASEROW_PENDING_DEPENDENCY_UPDATES_DELAY
+        if cache.add(
+            get_pending_dependency_updates_scheduled_cache_key(table_id),
+            True,
+            timeout=delay + 60,
+        ):
+            apply_pending_dependency_updates.apply_async((table_id,), countdown=delay)
+
+    @classmethod
+    def schedule_stale_pending_updates(cls) -> List[int]:
+        """
+        Schedules the task applying the pending updates of every table that still
+        has pending updates older than the delay, for example because the task
+        applying them has failed. The tables of which a task is still scheduled are
+        skipped, because the key preventing the task to be scheduled twice still
+        exists.
+
+        :return: The ids of the tables of which the pending updates are stale.
+        """
+
+        stale_before = timezone.now() - timedelta(
+            seconds=settings.BASEROW_PENDING_DEPENDENCY_UPDATES_DELAY
+        )
+        table_ids = list(
+            PendingDependencyUpdate.objects.filter(created_on__lt=stale_before)
+            .order_by("table_id")
+            .values_list("table_id", flat=True)
+            .distinct()
+        )
+        for table_id in table_ids:
+            cls.schedule_pending_updates(table_id)
+        return table_ids
+
+    @classmethod
+    def apply_pending_updates(cls, table_id: int) -> List[int]:
+        """
+        Updates the fields depending on the pending updates of the table. The pending
+        updates of all the rows and fields are coalesced, so that the update
+        statements are executed once for all of them. Only the pending updates that
+        existed when the task started are removed, the ones added in the meantime
+        are applied by the next task.
+
+        :param table_id: The id of the table of which the pending updates must be
+            applied.
+        :return: The ids of the rows of which the pending updates have been applied.
+        """
+
+        with transaction.atomic():
+            row_ids = cls._apply_pending_updates(table_id)
+
+        # The key is only removed once the updates have been committed. If the task
+        # fails, the key expires and the pending updates are scheduled again by the
+        # `schedule_stale_pending_updates` periodic task. The updates added while the
+        # task was running couldn't schedule a task, so it's done here.
+        cache.delete(get_pending_dependency_updates_scheduled_cache_key(table_id))
+        if PendingDependencyUpdate.objects.filter(table_id=table_id).exists():
+            cls.schedule_pending_updates(table_id)
+
+        return row_ids
+
+    @classmethod
+    def _apply_pending_updates(cls, table_id: int) -> List[int]:
+        from baserow.contrib.database.views.handler import ViewHandler
+
+        pending_updates = list(
+            PendingDependencyUpdate.objects.filter(table_id=table_id)
+            .select_for_update(skip_locked=True)
+            .values_list("id", "field_id", "row_id", "connection_removed")
+        )
+        if not pending_updates:
+            return []
+
+        field_ids = set()
+        row_ids = set()
+        deleted_m2m_rels_per_link_field = defaultdict(set)
+        for _, field_id, row_id, connection_removed in pending_updates:
+            field_ids.add(field_id)
+            if connection_removed:
+                deleted_m2m_rels_per_link_field[field_id].add(row_id)
+            else:
+                row_ids.add(row_id)
+        row_ids = sorted(row_ids)
+
+        table = Table.objects_and_trash.get(id=table_id)
+        field_cache = FieldCache()
+        model = field_cache.get_model(table)
+        rows = list(model.objects_and_trash.filter(id__in=row_ids))
+
+        update_collector = FieldUpdateCollector(
+            table,
+            starting_row_ids=row_ids,
+            deleted_m2m_rels_per_link_field=deleted_m2m_rels_per_link_field,
+        )
+        dependant_fields = []
+        for (
+            dependant_field,
+            dependant_field_type,
+            path_to_starting_table,
+        ) in FieldDependencyHandler.get_all_dependent_fields_with_type(
+            table_id, field_ids, field_cache, associated_relations_changed=True
+        ):
+            dependant_fields.append(dependant_field)
+            dependant_field_type.row_of_dependency_updated(
+                dependant_field,
+                rows,
+                update_collector,
+                field_cache,
+                path_to_starting_table,
+            )
+        update_collector.apply_updates_and_get_updated_fields(field_cache)
+
+        ViewHandler().field_value_updated(dependant_fields)
+        SearchHandler.field_value_updated_or_created(table)
+        update_collector.send_force_refresh_signals_for_all_updated_tables()
+
+        PendingDependencyUpdate.objects.filter(
+            id__in=[pending_update[0] for pending_update in pending_updates]
+        ).delete()
+
+        return row_ids
+
+    @classmethod
+    def get_row_ids_with_stale_dependant_fields(
+        cls, table: Table, row_ids: List[int]
+    ) -> Set[int]:
+        """
+        Returns the ids of the provided rows of which the value of a field still has
+        to be updated, because it depends on a pending update of a linked row. Those
+        are the rows connected to the updated rows via the link row fields, and not
+        the updated rows themselves, because the dependant fields of their own table
+        are updated right away.
+
+        :param table: The table of the rows.
+        :param row_ids: The ids of the rows to check.
+        :return: The ids of the provided rows of which a dependant field is stale.
+        """
+
+        if not row_ids or not PendingDependencyUpdate.objects.exists():
+            return set()
+
+        # Only the pending updates of the tables that the table depends on can make
+        # its rows stale.
+        dependency_table_ids = FieldDependencyHandler.get_all_dependency_table_ids(
+            table.id
+        )
+        pending_field_ids_per_table = defaultdict(set)
+        for table_id, field_id in (
+            PendingDependencyUpdate.objects.filter(table_id__in=dependency_table_ids)
+            .order_by()
+            .values_list("table_id", "field_id")
+            .distinct()
+        ):
+            pending_field_ids_per_table[table_id].add(field_id)
+
+        if not pending_field_ids_per_table:
+            return set()
+
+        field_cache = FieldCache()
+        model = field_cache.get_model(table)
+        stale_row_ids = set()
+        for source_table_id, field_ids in pending_field_ids_per_table.items():
+            for field_id in field_ids:
+                pending_updates = PendingDependencyUpdate.objects.filter(
+                    table_id=source_table_id, field_id=field_id
+                )
+                paths = {
+                    tuple(path_to_starting_table)
+                    for (
+                        dependant_field,
+                        _,
+                        path_to_starting_table,
+                    ) in FieldDependencyHandler.get_all_dependent_fields_with_type(
+                        source_table_id,
+                        [field_id],
+                        field_cache,
+                        associated_relations_changed=True,
+                    )
+                    if dependant_field.table_id == table.id and path_to_starting_table
+                }
+                for path in paths:
+                    # The path starts with the link row field of the table directly
+                    # depending on the updated rows, so it's followed in reverse to
+                    # get from the rows of this table to the updated rows.
+                    lookup = "__".join(field.db_column for field in reversed(path))
+                    stale_row_ids.update(
+                        model.objects_and_trash.filter(
+                            id__in=row_ids,
+                            **{
+                                f"{lookup}__in": pending_updates.filter(
+                                    connection_removed=False
+                                ).values("row_id")
+                            },
+                        ).values_list("id", flat=True)
+                    )
+                    if len(path) == 1 and path[0].link_row_related_field_id == field_id:
+                        stale_row_ids.update(
+                            pending_updates.filter(
+                                connection_removed=True, row_id__in=row_ids
+                            ).values_list("row_id", flat=True)
+                        )
+
+        return stale_row_ids
@@ -1,7 +1,7 @@
 from collections import defaultdict
-from typing import Dict, List, NamedTuple, Optional, Set, Tuple, cast
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple, Union, cast
 
-from django.db.models import Expression, Q, Value
+from django.db.models import Expression, QuerySet, Value
 
 from baserow.contrib.database.fields.field_cache import FieldCache
 from baserow.contrib.database.fields.models import Field, LinkRowField
@@ -22,6 +22,7 @@ class PathBasedUpdateStatementCollector:
         table: Table,
         connection_here: Optional[LinkRowField],
         connection_is_broken: bool,
+        mark_rows_as_needing_background_update: bool = True,
     ):
         """
         Collects updates statements for a particular table and then can execute them
@@ -31,6 +32,8 @@ class PathBasedUpdateStatementCollector:
         :param table: The table this collector is holding updates for.
         :param connection_here: The link row field that was used to connect this
             collector to its parent collector, if it has one.
+        :param mark_rows_as_needing_background_update: Whether the updated rows of
+            this table must be marked with `needs_background_update`.
         """
 
         self.update_statements: Dict[str, Expression] = {}
@@ -38,6 +41,9 @@ class PathBasedUpdateStatementCollector:
         self.sub_paths: Dict[str, PathBasedUpdateStatementCollector] = {}
         self.connection_here: Optional[LinkRowField] = connection_here
         self.connection_is_broken = connection_is_broken
+        self.mark_rows_as_needing_background_update = (
+            mark_rows_as_needing_background_update
+        )
 
     def add_update_statement(
         self,
@@ -77,7 +83,10 @@ class PathBasedUpdateStatementCollector:
                     self.update_statements[field.db_column] = (
                         update_statement if update_statement != Value(None) else None
                     )
-                if self.table.needs_background_update_column_added:
+                if (
+                    self.table.needs_background_update_column_added
+                    and self.mark_rows_as_needing_background_update
+                ):
                     self.update_statements[
                         ROW_NEEDS_BACKGROUND_UPDATE_COLUMN_NAME
                     ] = Value(True)
@@ -118,115 +127,210 @@ class PathBasedUpdateStatementCollector:
             collector = self.sub_paths[broken_name]
         return collector
 
+    def get_tables(self) -> Dict[int, Table]:
+        """
+        Returns all the tables this collector and its sub path collectors hold updates
+        for, keyed by table id.
+        """
+
+        tables = {self.table.id: self.table}
+        for sub_path in self.sub_paths.values():
+            tables.update(sub_path.get_tables())
+        return tables
+
     def execute_all(
         self,
         field_cache: FieldCache,
         starting_row_ids: StartingRowIdsType = None,
-        path_to_starting_table: StartingRowIdsType = None,
         deleted_m2m_rels_per_link_field: Optional[Dict[int, Set[int]]] = None,
+        row_counts_per_hop: Optional[List["HopRowCount"]] = None,
+    ) -> int:
+        """
+        Executes the update statements of this collector and of all its sub path
+        collectors. If starting row ids are provided, the ids of the rows that must
+        be updated are first materialized for every hop that leads to other hops, by
+        following the link row relations of the previous hop's rows, so that every
+        update statement is keyed on the ids of the affected rows instead of joining
+        back to the starting rows via the whole path of link row fields. The last
+        hops of the paths select their ids in a subquery of the update instead.
+
+        :param field_cache: The field cache used to get the models of the tables.
+        :param starting_row_ids: The ids of the rows in the starting table, or None
+            if entire columns must be updated.
+        :param deleted_m2m_rels_per_link_field: The ids of the rows per link row
+            field of the starting table that have had their connection removed.
+        :param row_counts_per_hop: If provided, a HopRowCount is appended for every
+            hop.
+        :return: The number of updated rows.
+        """
+
+        return self._execute_hop(
+            field_cache,
+            starting_row_ids,
+            starting_row_ids,
+            deleted_m2m_rels_per_link_field,
+            [],
+            row_counts_per_hop,
+        )
+
+    def _execute_hop(
+        self,
+        field_cache: FieldCache,
+        starting_row_ids: StartingRowIdsType,
+        previous_hop_row_ids: StartingRowIdsType,
+        deleted_m2m_rels_per_link_field: Optional[Dict[int, Set[int]]],
+        path_to_starting_table: List[LinkRowField],
+        row_counts_per_hop: Optional[List["HopRowCount"]],
     ) -> int:
-        updated_rows = 0
-        path_to_starting_table = path_to_starting_table or []
         if self.connection_here is not None:
             path_to_starting_table = [self.connection_here] + path_to_starting_table
-        updated_rows += self._execute_pending_update_statements(
+
+        row_ids = self._get_row_ids_to_update(
             field_cache,
-            path_to_starting_table,
-            starting_row_ids,
+            previous_hop_row_ids,
             deleted_m2m_rels_per_link_field,
+            path_to_starting_table,
+        )
+        updated_rows = self._execute_pending_update_statements(
+            field_cache, starting_row_ids, row_ids
         )
+        if row_counts_per_hop is not None:
+            row_counts_per_hop.append(
+                HopRowCount(
+                    self.table.id,
+                    tuple(link_field.id for link_field in path_to_starting_table),
+                    len(row_ids) if isinstance(row_ids, list) else None,
+                    updated_rows,
+                )
+            )
 
         for sub_path in self.sub_paths.values():
-            updated_rows += sub_path.execute_all(
-                starting_row_ids=starting_row_ids,
-                path_to_starting_table=path_to_starting_table,
-                field_cache=field_cache,
-                deleted_m2m_rels_per_link_field=deleted_m2m_rels_per_link_field,
+            updated_rows += sub_path._execute_hop(
+                field_cache,
+                starting_row_ids,
+                row_ids,
+                deleted_m2m_rels_per_link_field,
+                path_to_starting_table,
+                row_counts_per_hop,
             )
         return updated_rows
 
-    def _execute_pending_update_statements(
+    def _get_row_ids_to_update(
         self,
         field_cache: FieldCache,
-        path_to_starting_table: List[LinkRowField],
-        starting_row_ids: StartingRowIdsType,
+        previous_hop_row_ids: StartingRowIdsType,
         deleted_m2m_rels_per_link_field: Optional[Dict[int, Set[int]]],
-    ) -> int:
-        model = field_cache.get_model(self.table)
-        qs = model.objects_and_trash
+        path_to_starting_table: List[LinkRowField],
+    ) -> Union[List[int], QuerySet, None]:
+        """
+        Returns the ids of the rows of this collector's table that are connected to
+        the rows of the previous hop, or None if all the rows must be updated. The
+        ids are selected from the through table of the link row field connecting
+        the two tables, so that the tables themselves don't have to be joined.
+        They're only fetched if they're needed by the next hops, otherwise the
+        query selecting them is returned.
+        """
+
         # If the connection is broken back to the starting table then there is no
         # way to join back to these starting rows. So we just update all cells.
-        if starting_row_ids is not None and not self.connection_is_broken:
-            if len(path_to_starting_table) == 0:
-                path_to_starting_table_id_column = "id"
-            else:
-                path_to_starting_table_id_column = (
-                    "__".join([p.db_column for p in path_to_starting_table]) + "__id"
-                )
-            path_to_starting_table_id_column += "__in"
+        if previous_hop_row_ids is None or self.connection_is_broken:
+            return None
 
-            filter_for_rows_connected_to_starting_row = Q(
-                **{path_to_starting_table_id_column: starting_row_ids}
-            ) | self._include_rows_connected_to_deleted_m2m_relationships(
-                deleted_m2m_rels_per_link_field,
-                path_to_starting_table,
-            )
+        if self.connection_here is None:
+            return sorted(set(previous_hop_row_ids))
+
+        deleted_m2m_row_ids = self._get_rows_connected_to_deleted_m2m_relationships(
+            deleted_m2m_rels_per_link_field, path_to_starting_table
+        )
+        row_ids = set(deleted_m2m_row_ids)
+        if previous_hop_row_ids:
+            model = field_cache.get_model(self.table)
+            m2m_field = model._meta.get_field(self.connection_here.db_column)
+            through_model = m2m_field.remote_field.through
+            row_column = through_model._meta.get_field(
+                m2m_field.m2m_field_name()
+            ).attname
+            related_row_column = through_model._meta.get_field(
+                m2m_field.m2m_reverse_field_name()
+            ).attname
+            connected_row_ids = through_model.objects.filter(
+                **{f"{related_row_column}__in": previous_hop_row_ids}
+            ).values_list(row_column, flat=True)
+            if not self.sub_paths and not deleted_m2m_row_ids:
+                return connected_row_ids
+            row_ids.update(connected_row_ids)
+
+        return sorted(row_ids)
 
-            qs = qs.filter(filter_for_rows_connected_to_starting_row)
+    def _execute_pending_update_statements(
+        self,
+        field_cache: FieldCache,
+        starting_row_ids: StartingRowIdsType,
+        row_ids: Union[List[int], QuerySet, None],
+    ) -> int:
         if starting_row_ids is None:
             # We aren't updating individual rows but instead entire columns, so don't
             # set this per row attribute.
             self.update_statements.pop(ROW_NEEDS_BACKGROUND_UPDATE_COLUMN_NAME, None)
 
-        updated_rows = 0
-        if self.update_statements:
-            updated_rows = qs.exclude(**self.update_statements).update(
-                **self.update_statements
-            )
-        return updated_rows
+        if not self.update_statements or (isinstance(row_ids, list) and not row_ids):
+            return 0
 
-    def _include_rows_connected_to_deleted_m2m_relationships(
+        model = field_cache.get_model(self.table)
+        qs = model.objects_and_trash
+        if row_ids is not None:
+            qs = qs.filter(id__in=row_ids)
+
+        return qs.exclude(**self.update_statements).update(**self.update_statements)
+
+    def _get_rows_connected_to_deleted_m2m_relationships(
         self,
-        deleted_m2m_rels_per_link_field: Dict[int, Set[int]],
+        deleted_m2m_rels_per_link_field: Optional[Dict[int, Set[int]]],
         path_to_starting_table: List[LinkRowField],
-    ):
+    ) -> Set[int]:
         """
         If a row or batch of rows have been updated breaking their link row connections
         with other rows, we need to ensure that those other rows are still updated.
-        We can't just join back to the starting row id as that m2m relation has been
-        deleted by now. Instead the provided dict contains per link field which rows
-        have had their connections deleted. This method then constructs a Q filter that
-        ensures this UPDATE statement will also update those rows as they need to
-        change their values because a connection has been removed for them.
-
-        :return: A filter including any rows which previously were connected to the
-            starting row.
+        We can't just follow the connections of the starting rows as that m2m relation
+        has been deleted by now. Instead the provided dict contains per link field
+        which rows have had their connections deleted. This method returns those rows
+        if this collector's table is the one directly after the starting table. The
+        rows of the next hops are connected to them, so they're updated as well.
+
+        :return: The ids of the rows which previously were connected to the
+            starting rows.
         """
 
-        if deleted_m2m_rels_per_link_field is None or not path_to_starting_table:
-            return Q()
+        if deleted_m2m_rels_per_link_field is None or len(path_to_starting_table) != 1:
+            return set()
 
-        # The first link row field in the path will be a link row field not in the
-        # starting table, but which leads to the starting table. However the
-        # deleted_m2m_rels_per_link_field is a dictionary per link field of rows in
-        # the table it links to which have had their connections removed. Hence we
-        # need to use the link row field in the starting table to lookup the deleted
-        # row ids in the table after the starting table.
+        # The link row field connecting this table to the starting table is not in
+        # the starting table. However the deleted_m2m_rels_per_link_field is a
+        # dictionary per link field of rows in the table it links to which have had
+        # their connections removed. Hence we need to use the link row field in the
+        # starting table to lookup the deleted row ids in this table.
         link_row_field_in_starting_table: int = cast(
-            int, path_to_starting_table[-1].link_row_related_field_id
+            int, path_to_starting_table[0].link_row_related_field_id
         )
-        filters = Q()
-        if link_row_field_in_starting_table in deleted_m2m_rels_per_link_field:
-            path_to_table_after_starting_table = "".join(
-                [p.db_column + "__" for p in path_to_starting_table[:-1]]
-            )
+        return set(
+            deleted_m2m_rels_per_link_field.get(link_row_field_in_starting_table, ())
+        )
+
+
+class HopRowCount(NamedTuple):
+    """
+    The number of rows touched in a table reached via a path of link row fields
+    from the starting table of a FieldUpdateCollector.
+    """
 
-            row_ids = deleted_m2m_rels_per_link_field[link_row_field_in_starting_table]
-            filter_kwargs_forcing_update_for_row_with_deleted_rels = {
-                f"{path_to_table_after_starting_table}id__in": row_ids
-            }
-            filters |= Q(**filter_kwargs_forcing_update_for_row_with_deleted_rels)
-        return filters
+    table_id: int
+    # The ids of the link row fields leading from the table to the starting table.
+    path_to_starting_table: Tuple[int, ...]
+    # The number of rows connected to the starting rows, None if all the rows of
+    # the table are affected.
+    affected_rows: Optional[int]
+    # The number of rows whose values have actually been changed.
+    updated_rows: int
 
 
 class UpdatedField(NamedTuple):
@@ -247,6 +351,7 @@ class FieldUpdateCollector:
         starting_table: Table,
         starting_row_ids: StartingRowIdsType = None,
         deleted_m2m_rels_per_link_field: Optional[Dict[int, Set[int]]] = None,
+        mark_starting_rows_as_needing_background_update: bool = True,
     ):
         """
 
@@ -254,6 +359,10 @@ class FieldUpdateCollector:
         :param starting_row_ids: If the update starts from specific rows in the
             starting table set this and all update statements executed by this collector
             will only update rows which join back to these starting rows.
+        :param mark_starting_rows_as_needing_background_update: Set this to False if
+            the caller takes care of updating the search data of the updated fields
+            of the starting rows itself. The rows in other tables, or connected via
+            link row fields, are still marked with `needs_background_update`.
         """
 
         self._updated_fields_per_table: Dict[
@@ -263,9 +372,16 @@ class FieldUpdateCollector:
         self._starting_row_ids = starting_row_ids
         self._starting_table = starting_table
         self._deleted_m2m_rels_per_link_field = deleted_m2m_rels_per_link_field
+        # The number of rows touched per table and path by the last `apply_updates`.
+        self.row_counts_per_hop: List[HopRowCount] = []
 
         self._update_statement_collector = PathBasedUpdateStatementCollector(
-            self._starting_table, connection_here=None, connection_is_broken=False
+            self._starting_table,
+            connection_here=None,
+            connection_is_broken=False,
+            mark_rows_as_needing_background_update=(
+                mark_starting_rows_as_needing_background_update
+            ),
         )
 
     def add_field_with_pending_update_statement(
@@ -332,14 +448,23 @@ class FieldUpdateCollector:
     def apply_updates(self, field_cache: FieldCache) -> int:
         """
         Triggers all update statements to be executed in the correct order in as few
-        update queries as possible and return the number of updated rows.
+        update queries as possible and return the number of updated rows. The number
+        of rows touched in every table reached from the starting table is available
+        in `row_counts_per_hop` afterwards.
         """
 
-        return self._update_statement_collector.execute_all(
+        # Generate the models of all involved tables up front, so that their versions
+        # and cached field attrs are fetched in bulk instead of per table.
+        field_cache.get_models(self._update_statement_collector.get_tables().values())
+
+        self.row_counts_per_hop = []
+        updated_rows = self._update_statement_collector.execute_all(
             field_cache,
             self._starting_row_ids,
             deleted_m2m_rels_per_link_field=self._deleted_m2m_rels_per_link_field,
+            row_counts_per_hop=self.row_counts_per_hop,
         )
+        return updated_rows
 
     def apply_updates_and_get_updated_fields(
         self, field_cache: FieldCache, skip_search_updates=False
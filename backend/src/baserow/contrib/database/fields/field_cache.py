@@ -1,5 +1,5 @@
 from collections import defaultdict
-from typing import Optional, Type
+from typing import Dict, Iterable, Optional, Type
 
 from django.core.exceptions import ObjectDoesNotExist
 from django.db.models import Model
@@ -48,6 +48,21 @@ class FieldCache:
             self._model_cache[table_id] = table.get_model()
         return self._model_cache[table_id]
 
+    def get_models(self, tables: Iterable) -> Dict[int, Type[Model]]:
+        """
+        Returns the models of all the provided tables. The ones that aren't cached
+        yet are generated together with `Table.get_models`, so only one query is
+        needed to check the versions of all of them.
+        """
+
+        from baserow.contrib.database.table.models import Table
+
+        tables = list(tables)
+        missing_tables = [t for t in tables if t.id not in self._model_cache]
+        if missing_tables:
+            self._model_cache.update(Table.get_models(missing_tables))
+        return {table.id: self._model_cache[table.id] for table in tables}
+
     def uncache_field(self, field):
         return self._cached_field_by_name_per_table[field.table_id].pop(
             field.name, None
@@ -0,0 +1,32 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, List, Optional
+
+
+class TypedExportColumnTypes(str, Enum):
+    INTEGER = "integer"
+    # A decimal number with `max_digits` and `decimal_places`.
+    DECIMAL = "decimal"
+    BOOLEAN = "boolean"
+    DATE = "date"
+    # A date and time in UTC.
+    TIMESTAMP = "timestamp"
+    # A string of which there are only a few distinct values, like the value of a
+    # select option, which can be dictionary encoded.
+    CATEGORY = "category"
+
+
+@dataclass
+class TypedExportColumn:
+    """
+    Describes how the values of a field are exported to a typed column by the
+    exporters of file formats that support typed columns, like Parquet, as returned
+    by the `get_typed_export_column` method of field types.
+    """
+
+    type: TypedExportColumnTypes
+    # Converts a list of internal values of the field to values of the type of the
+    # column, where empty values must stay `None`.
+    convert: Callable[[List[Any]], List[Any]]
+    max_digits: Optional[int] = None
+    decimal_places: Optional[int] = None
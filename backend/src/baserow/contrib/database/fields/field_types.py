@@ -90,6 +90,7 @@ from baserow.contrib.database.types import SerializedRowHistoryFieldMetadata
 from baserow.contrib.database.validators import UnicodeRegexValidator
 from baserow.core.db import (
     CombinedForeignKeyAndManyToManyMultipleFieldPrefetch,
+    LimitedManyToManyPrefetch,
     collate_expression,
 )
 from baserow.core.expressions import DateTrunc
@@ -136,6 +137,7 @@ from .exceptions import (
 )
 from .expressions import extract_jsonb_array_values_to_single_string
 from .field_cache import FieldCache
+from .field_export_columns import TypedExportColumn, TypedExportColumnTypes
 from .field_filters import (
     AnnotatedQ,
     contains_filter,
@@ -353,8 +355,9 @@ class ManyToManyFieldTypeSerializeToInputValueMixin:
 class TextFieldType(CollationSortMixin, FieldType):
     type = "text"
     model_class = TextField
-    allowed_fields = ["text_default"]
-    serializer_field_names = ["text_default"]
+    allowed_fields = ["text_default", "db_trigram_index"]
+    serializer_field_names = ["text_default", "db_trigram_index"]
+    can_have_trigram_index = True
     _can_group_by = True
 
     def get_serializer_field(self, instance, **kwargs):
@@ -399,6 +402,9 @@ class TextFieldType(CollationSortMixin, FieldType):
 class LongTextFieldType(CollationSortMixin, FieldType):
     type = "long_text"
     model_class = LongTextField
+    allowed_fields = ["db_trigram_index"]
+    serializer_field_names = ["db_trigram_index"]
+    can_have_trigram_index = True
     _can_group_by = True
 
     def get_serializer_field(self, instance, **kwargs):
@@ -440,6 +446,9 @@ class LongTextFieldType(CollationSortMixin, FieldType):
 class URLFieldType(CollationSortMixin, TextFieldMatchingRegexFieldType):
     type = "url"
     model_class = URLField
+    allowed_fields = ["db_trigram_index"]
+    serializer_field_names = ["db_trigram_index"]
+    can_have_trigram_index = True
     _can_group_by = True
 
     @property
@@ -503,19 +512,39 @@ class NumberFieldType(FieldType):
         )
 
     def get_export_value(self, value, field_object, rich_value=False):
-        if value is None:
-            return value if rich_value else ""
+        return self.get_export_value_formatter(field_object, rich_value)(value)
+
+    def get_export_value_formatter(self, field_object, rich_value=False):
+        empty_value = None if rich_value else ""
 
         # If the number is an integer we want it to be a literal json number and so
         # don't convert it to a string. However if a decimal to preserve any precision
         # we keep it as a string.
         instance = field_object["field"]
         if instance.number_decimal_places == 0:
-            return int(value)
+            return lambda value: empty_value if value is None else int(value)
 
         # DRF's Decimal Serializer knows how to quantize and format the decimal
         # correctly so lets use it instead of trying to do it ourselves.
-        return self.get_serializer_field(instance).to_representation(value)
+        to_representation = self.get_serializer_field(instance).to_representation
+        return lambda value: empty_value if value is None else to_representation(value)
+
+    def get_typed_export_column(self, field_object):
+        instance = field_object["field"]
+        if instance.number_decimal_places == 0:
+            return TypedExportColumn(
+                TypedExportColumnTypes.INTEGER,
+                lambda values: [
+                    None if value is None else int(value) for value in values
+                ],
+            )
+
+        return TypedExportColumn(
+            TypedExportColumnTypes.DECIMAL,
+            lambda values: values,
+            max_digits=self.MAX_DIGITS + instance.number_decimal_places,
+            decimal_places=instance.number_decimal_places,
+        )
 
     def get_model_field(self, instance, **kwargs):
         kwargs["decimal_places"] = instance.number_decimal_places
@@ -616,6 +645,9 @@ class RatingFieldType(FieldType):
     serializer_field_names = ["max_value", "color", "style"]
     _can_group_by = True
 
+    def get_typed_export_column(self, field_object):
+        return TypedExportColumn(TypedExportColumnTypes.INTEGER, lambda values: values)
+
     def prepare_value_for_db(self, instance, value):
         if not value:
             return 0
@@ -735,6 +767,12 @@ class BooleanFieldType(FieldType):
     model_class = BooleanField
     _can_group_by = True
 
+    def get_export_value_formatter(self, field_object, rich_value=False):
+        return lambda value: value
+
+    def get_typed_export_column(self, field_object):
+        return TypedExportColumn(TypedExportColumnTypes.BOOLEAN, lambda values: values)
+
     def get_alter_column_prepare_new_value(self, connection, from_field, to_field):
         """
         Prepare value for Boolean field.
@@ -957,14 +995,47 @@ class DateFieldType(FieldType):
         )
 
     def get_export_value(self, value, field_object, rich_value=False):
-        if value is None:
-            return value if rich_value else ""
+        return self.get_export_value_formatter(field_object, rich_value)(value)
+
+    def get_export_value_formatter(self, field_object, rich_value=False):
+        empty_value = None if rich_value else ""
+        field = field_object["field"]
+        python_format = field.get_python_format()
+        force_timezone = (
+            pytz.timezone(field.date_force_timezone)
+            if field.date_force_timezone is not None
+            else None
+        )
 
+        def format_value(value):
+            if value is None:
+                return empty_value
+            if force_timezone is not None and isinstance(value, datetime):
+                value = value.astimezone(force_timezone)
+            return value.strftime(python_format)
+
+        return format_value
+
+    def get_typed_export_column(self, field_object):
         field = field_object["field"]
-        if isinstance(value, datetime) and field.date_force_timezone is not None:
-            value = value.astimezone(pytz.timezone(field.date_force_timezone))
+        if field.date_include_time:
+            return TypedExportColumn(
+                TypedExportColumnTypes.TIMESTAMP, lambda values: values
+            )
 
-        return value.strftime(field.get_python_format())
+        # Fields without a time can still contain a datetime, which is converted to
+        # a date in the timezone that's used to display it.
+        timezone = pytz.timezone(field.date_force_timezone or "UTC")
+
+        def convert(values):
+            return [
+                value.astimezone(timezone).date()
+                if isinstance(value, datetime)
+                else value
+                for value in values
+            ]
+
+        return TypedExportColumn(TypedExportColumnTypes.DATE, convert)
 
     def get_serializer_field(self, instance, **kwargs):
         required = kwargs.get("required", False)
@@ -1947,6 +2018,31 @@ class LinkRowFieldType(ManyToManyFieldTypeSerializeToInputValueMixin, FieldType)
         prefetched in order to prevent many queries.
         """
 
+        return queryset.prefetch_related(
+            models.Prefetch(name, queryset=self.get_related_queryset(queryset, name))
+        )
+
+    def enhance_queryset_with_limit(self, queryset, name, limit):
+        """
+        Like `enhance_queryset`, but only prefetches the first `limit` related rows of
+        every cell. The total number of related rows is stored in the
+        `_prefetched_objects_counts` dict of every row. This keeps the memory usage
+        bounded if the cells are related to a lot of rows.
+        """
+
+        return queryset.multi_field_prefetch(
+            LimitedManyToManyPrefetch(
+                name, limit, self.get_related_queryset(queryset, name)
+            )
+        )
+
+    def get_related_queryset(self, queryset, name):
+        """
+        Returns the queryset that's used to prefetch the related rows. Only the
+        primary field is selected and enhanced because that's the only one needed
+        for serialization.
+        """
+
         remote_model = queryset.model._meta.get_field(name).remote_field.model
         related_queryset = remote_model.objects.all()
 
@@ -1970,9 +2066,7 @@ class LinkRowFieldType(ManyToManyFieldTypeSerializeToInputValueMixin, FieldType)
             # need to enhance the queryset.
             pass
 
-        return queryset.prefetch_related(
-            models.Prefetch(name, queryset=related_queryset)
-        )
+        return related_queryset
 
     def prepare_value_for_db(self, instance, value):
         return self.prepare_value_for_db_in_bulk(
@@ -2929,6 +3023,9 @@ class LinkRowFieldType(ManyToManyFieldTypeSerializeToInputValueMixin, FieldType)
 class EmailFieldType(CollationSortMixin, CharFieldMatchingRegexFieldType):
     type = "email"
     model_class = EmailField
+    allowed_fields = ["db_trigram_index"]
+    serializer_field_names = ["db_trigram_index"]
+    can_have_trigram_index = True
 
     @property
     def regex(self):
@@ -3500,9 +3597,19 @@ class SingleSelectFieldType(SelectOptionBaseFieldType):
         )
 
     def get_export_value(self, value, field_object, rich_value=False):
-        if value is None:
-            return None if rich_value else ""
-        return value.value
+        return self.get_export_value_formatter(field_object, rich_value)(value)
+
+    def get_export_value_formatter(self, field_object, rich_value=False):
+        empty_value = None if rich_value else ""
+        # The select options are already selected together with the rows, so the
+        # label can be read from the option without looking it up.
+        return lambda value: empty_value if value is None else value.value
+
+    def get_typed_export_column(self, field_object):
+        return TypedExportColumn(
+            TypedExportColumnTypes.CATEGORY,
+            lambda values: [None if value is None else value.value for value in values],
+        )
 
     def get_model_field(self, instance, **kwargs):
         return SingleSelectForeignKey(
@@ -4108,6 +4215,9 @@ class PhoneNumberFieldType(CharFieldMatchingRegexFieldType):
 
     type = "phone_number"
     model_class = PhoneNumberField
+    allowed_fields = ["db_trigram_index"]
+    serializer_field_names = ["db_trigram_index"]
+    can_have_trigram_index = True
 
     MAX_PHONE_NUMBER_LENGTH = 100
 
@@ -4289,13 +4399,16 @@ class FormulaFieldType(ReadOnlyFieldType):
     def get_export_value(
         self, value, field_object, rich_value=False
     ) -> BaserowFormulaType:
-        instance = field_object["field"]
+        return self.get_export_value_formatter(field_object, rich_value)(value)
+
+    def get_export_value_formatter(self, field_object, rich_value=False):
+        # The formula type is resolved only once, and the value formatter of the
+        # type is used for all the values.
         (
             field_instance,
             field_type,
-        ) = self._get_field_instance_and_type_from_formula_field(instance)
-        return field_type.get_export_value(
-            value,
+        ) = self._get_field_instance_and_type_from_formula_field(field_object["field"])
+        return field_type.get_export_value_formatter(
             {"field": field_instance, "type": field_type, "name": field_object["name"]},
             rich_value=rich_value,
         )
@@ -4676,6 +4789,9 @@ class CountFieldType(FormulaFieldType):
         "nullable": serializers.BooleanField(required=False, read_only=True),
     }
 
+    def get_typed_export_column(self, field_object):
+        return TypedExportColumn(TypedExportColumnTypes.INTEGER, lambda values: values)
+
     def before_create(
         self, table, primary, allowed_field_values, order, user, field_kwargs
     ):
@@ -5506,6 +5622,13 @@ class MultipleCollaboratorsFieldType(
         return value
 
 
+def generate_uuid4() -> uuid.UUID:
+    # Looks `uuid.uuid4` up on every call, instead of binding it as the default when
+    # the model field is created, so that patching `uuid.uuid4` also applies to the
+    # model classes that were generated and cached before it was patched.
+    return uuid.uuid4()
+
+
 class UUIDFieldType(ReadOnlyFieldType):
     """
     The UUIDFieldType is ReadOnly, but does not extend the `ReadOnlyFieldType` class
@@ -5526,7 +5649,7 @@ class UUIDFieldType(ReadOnlyFieldType):
 
     def get_model_field(self, instance, **kwargs):
         return models.UUIDField(
-            default=uuid.uuid4,
+            default=generate_uuid4,
             null=True,
             **kwargs,
         )
@@ -5617,6 +5740,9 @@ class AutonumberFieldType(ReadOnlyFieldType):
             "Contains a unique and persistent incremental integer number for every row."
         )
 
+    def get_typed_export_column(self, field_object):
+        return TypedExportColumn(TypedExportColumnTypes.INTEGER, lambda values: values)
+
     def get_model_field(self, instance, **kwargs):
         return IntegerFieldWithSequence(null=True, **kwargs)
 
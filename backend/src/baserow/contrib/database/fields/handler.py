@@ -16,7 +16,7 @@ from typing import (
 
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
-from django.db import connection
+from django.db import connection, transaction
 from django.db.models import QuerySet
 from django.db.utils import DatabaseError, DataError, ProgrammingError
 
@@ -149,6 +149,114 @@ def _validate_field_name(
 T = TypeVar("T", bound="Field")
 
 
+class FieldIndexingHandler(metaclass=baserow_trace_methods(tracer)):
+    """
+    Manages the optional `pg_trgm` GIN indexes of fields which have the
+    `db_trigram_index` property enabled. The index contains the plain column, which
+    can be used by the case-insensitive regex of the contains word filter, and the
+    upper cased column, which is exactly the expression that Django compares in the
+    `icontains` lookup of the contains filter and the compat search.
+    """
+
+    @classmethod
+    def does_index_exist(cls, index_name: str) -> bool:
+        """
+        Returns whether or not the given index exists in the database.
+
+        :param index_name: The name of the index to check for.
+        :return: Whether or not the given index exists in the database.
+        """
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT indexname FROM pg_indexes WHERE indexname = %s",
+                [index_name],
+            )
+            return cursor.fetchone() is not None
+
+    @classmethod
+    def needs_trigram_index(cls, field: Field) -> bool:
+        """
+        Returns whether the provided field must have a trigram index.
+
+        :param field: The specific field instance to check.
+        """
+
+        field_type = field_type_registry.get_by_model(field)
+        return field.db_trigram_index and field_type.can_have_trigram_index
+
+    @classmethod
+    def schedule_index_update(cls, field: Field):
+        """
+        Schedules a celery task which creates or removes the trigram index of the
+        provided field after the current transaction has been committed, because
+        creating the index can take a while for large tables.
+
+        :param field: The field of which the trigram index must be updated.
+        """
+
+        from baserow.contrib.database.fields.tasks import update_field_trigram_index
+
+        transaction.on_commit(lambda: update_field_trigram_index.delay(field.id))
+
+    @classmethod
+    def update_index(cls, field: Field):
+        """
+        Creates the trigram index of the provided field if the field needs one and
+        it doesn't exist yet, or removes it if the field doesn't need it anymore.
+        The `pg_trgm` extension is created if it isn't installed yet.
+
+        :param field: The specific field instance of which the index must be
+            updated.
+        """
+
+        needs_index = cls.needs_trigram_index(field)
+        if needs_index == cls.does_index_exist(field.trigram_index_name):
+            return
+
+        if not needs_index:
+            cls.remove_index(field)
+            return
+
+        column = sql.Identifier(field.db_column)
+        with connection.cursor() as cursor:
+            cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+            cursor.execute(
+                sql.SQL(
+                    "CREATE INDEX IF NOT EXISTS {index_name} ON {table} USING gin "
+                    "({column} gin_trgm_ops, (UPPER({column}::text)) gin_trgm_ops)"
+                ).format(
+                    index_name=sql.Identifier(field.trigram_index_name),
+                    table=sql.Identifier(field.table.get_database_table_name()),
+                    column=column,
+                )
+            )
+        logger.info(
+            "Created trigram index {index_name} for field {field_id} of table "
+            "{table_id}",
+            index_name=field.trigram_index_name,
+            field_id=field.id,
+            table_id=field.table_id,
+        )
+
+    @classmethod
+    def remove_index(cls, field: Field):
+        """
+        Removes the trigram index of the provided field if it exists. This is done
+        right away before the type of the field changes, because the `gin_trgm_ops`
+        operator class is not compatible with every column type.
+
+        :param field: The field of which the trigram index must be removed.
+        """
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                sql.SQL("DROP INDEX IF EXISTS {index_name}").format(
+                    index_name=sql.Identifier(field.trigram_index_name)
+                )
+            )
+
+
 class FieldHandler(metaclass=baserow_trace_methods(tracer)):
     def get_field(
         self,
@@ -394,6 +502,9 @@ class FieldHandler(metaclass=baserow_trace_methods(tracer)):
             kwargs,
         )
 
+        if instance.db_trigram_index:
+            FieldIndexingHandler.schedule_index_update(instance)
+
         field_cache.cache_model_fields(to_model)
         update_collector = FieldUpdateCollector(table)
         for (
@@ -521,6 +632,8 @@ class FieldHandler(metaclass=baserow_trace_methods(tracer)):
         before = to_field_type.before_update(old_field, field_values, user, kwargs)
 
         field = set_allowed_attrs(field_values, allowed_fields, field)
+        if not to_field_type.can_have_trigram_index:
+            field.db_trigram_index = False
 
         field.save(field_cache=field_cache, raise_if_invalid=True)
         FieldDependencyHandler.rebuild_or_raise_if_user_doesnt_have_permissions_after(
@@ -560,6 +673,15 @@ class FieldHandler(metaclass=baserow_trace_methods(tracer)):
             kwargs,
         )
 
+        # The trigram index is removed before the type changes because its operator
+        # class is not compatible with every column type. It's created again after
+        # the schema change if the new field type still needs it.
+        trigram_index_removed = (
+            baserow_field_type_changed and old_field.db_trigram_index
+        )
+        if trigram_index_removed:
+            FieldIndexingHandler.remove_index(old_field)
+
         # Try to find a data converter that can be applied.
         converter = field_converter_registry.find_applicable_converter(
             from_model, old_field, field
@@ -640,6 +762,11 @@ class FieldHandler(metaclass=baserow_trace_methods(tracer)):
             kwargs,
         )
 
+        if trigram_index_removed or (
+            field.db_trigram_index != old_field.db_trigram_index
+        ):
+            FieldIndexingHandler.schedule_index_update(field)
+
         if after_schema_change_callback:
             after_schema_change_callback(field)
 
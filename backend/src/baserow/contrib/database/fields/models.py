@@ -120,6 +120,12 @@ class Field(
         "search release which haven't been lazily migrated yet. Or for "
         "users who have turned off full text search entirely.",
     )
+    db_trigram_index = models.BooleanField(
+        default=False,
+        help_text="Indicates whether a `pg_trgm` index must be created for this "
+        "field, so that the contains filters and the compat search can use it "
+        "instead of scanning the whole table. Only supported by text like fields.",
+    )
 
     class Meta:
         ordering = (
@@ -151,6 +157,10 @@ class Field(
     def tsv_index_name(self):
         return f"tbl_tsv_{self.id}_idx"
 
+    @property
+    def trigram_index_name(self):
+        return f"tbl_trgm_{self.id}_idx"
+
     @property
     def model_attribute_name(self):
         """
@@ -1,4 +1,14 @@
-from typing import TYPE_CHECKING, Any, Dict, List, NoReturn, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    NoReturn,
+    Optional,
+    Tuple,
+    Union,
+)
 from zipfile import ZipFile
 
 from django.contrib.auth.models import AbstractUser
@@ -28,6 +38,7 @@ from django.db.models.functions import Cast, Coalesce
 from rest_framework import serializers
 
 from baserow.contrib.database.fields.constants import UPSERT_OPTION_DICT_KEY
+from baserow.contrib.database.fields.field_export_columns import TypedExportColumn
 from baserow.contrib.database.fields.field_sortings import OptionallyAnnotatedOrderBy
 from baserow.contrib.database.types import SerializedRowHistoryFieldMetadata
 from baserow.core.registries import ImportExportConfig
@@ -112,6 +123,13 @@ class FieldType(
     can_have_select_options = False
     """Indicates whether the field can have select options."""
 
+    can_have_trigram_index = False
+    """
+    Indicates whether a `pg_trgm` index can be created for the field with the
+    `db_trigram_index` property. The field type must then also add
+    `db_trigram_index` to its `allowed_fields` and `serializer_field_names`.
+    """
+
     can_be_in_form_view = True
     """Indicates whether the field is compatible with the form view."""
 
@@ -922,6 +940,13 @@ class FieldType(
 
         id_mapping["database_fields"][field_id] = field.id
 
+        if field.db_trigram_index:
+            from baserow.contrib.database.fields.handler import FieldIndexingHandler
+
+            # The column doesn't exist yet, so the index can only be created after
+            # the import has been committed.
+            FieldIndexingHandler.schedule_index_update(field)
+
         if self.can_have_select_options:
             for select_option in select_options:
                 select_option_copy = select_option.copy()
@@ -1077,6 +1102,70 @@ class FieldType(
 
         return value
 
+    def get_export_value_formatter(
+        self, field_object: "FieldObject", rich_value: bool = False
+    ) -> Callable[[Any], Any]:
+        """
+        Returns a function which converts a single internal baserow value of this
+        field type to the same export value as `get_export_value` does. Field types
+        can override this to prepare everything that doesn't depend on the value only
+        once, in which case `get_export_value` should delegate to the returned
+        function so that there is a single implementation of the conversion.
+
+        :param field_object: The field object for the field to extract
+        :param rich_value: whether a rich value can be exported.
+        :return: A function which takes an internal value and returns the export
+            value.
+        """
+
+        get_export_value = self.get_export_value
+
+        def format_value(value):
+            return get_export_value(value, field_object, rich_value=rich_value)
+
+        return format_value
+
+    def get_export_column_serializer(
+        self, field_object: "FieldObject", rich_value: bool = False
+    ) -> Callable[[List[Any]], List[Any]]:
+        """
+        Returns a function which converts a list of this field type's internal
+        baserow values, typically all the values of a chunk of exported rows, to the
+        same export values as `get_export_value` does. Empty values are converted
+        to an empty string. The value formatter returned by
+        `get_export_value_formatter` is only created once for the whole column.
+
+        :param field_object: The field object for the field to extract
+        :param rich_value: whether a rich value can be exported.
+        :return: A function which takes a list of internal values and returns a list
+            of the export values in the same order.
+        """
+
+        format_value = self.get_export_value_formatter(
+            field_object, rich_value=rich_value
+        )
+
+        def serialize_column(values):
+            return ["" if value is None else format_value(value) for value in values]
+
+        return serialize_column
+
+    def get_typed_export_column(
+        self, field_object: "FieldObject"
+    ) -> Optional[TypedExportColumn]:
+        """
+        Returns how the values of this field type are exported to a typed column by
+        the exporters of file formats that support typed columns, like Parquet. If
+        `None` is returned, the values are exported as strings containing the same
+        values as `get_export_value` returns.
+
+        :param field_object: The field object for the field to export.
+        :return: The typed column, or `None` if the values must be exported as
+            strings.
+        """
+
+        return None
+
     def get_human_readable_value(self, value: Any, field_object: "FieldObject") -> str:
         """
         Should convert the value of the provided field to a human readable string for
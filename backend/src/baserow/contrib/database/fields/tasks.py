@@ -99,8 +99,63 @@ def _run_periodic_field_update(field, field_type_instance):
         field_type_instance.run_periodic_update(field)
 
 
+@app.task(queue="export")
+def update_field_trigram_index(field_id: int):
+    """
+    Creates or removes the trigram index of the provided field, depending on
+    whether the field still needs one.
+
+    :param field_id: The id of the field of which the index must be updated.
+    """
+
+    from baserow.contrib.database.fields.handler import FieldIndexingHandler
+    from baserow.contrib.database.fields.models import Field
+
+    with transaction.atomic():
+        try:
+            field = Field.objects_and_trash.select_related("table").get(id=field_id)
+        except Field.DoesNotExist:
+            return
+        FieldIndexingHandler.update_index(field.specific)
+
+
+@app.task(queue="export")
+def apply_pending_dependency_updates(table_id: int):
+    """
+    Updates the fields depending on the rows of the provided table that have been
+    updated while the table has the eventual dependency updates enabled.
+
+    :param table_id: The id of the table of which the pending updates must be
+        applied.
+    """
+
+    from baserow.contrib.database.fields.dependencies.pending_updates import (
+        PendingDependencyUpdateHandler,
+    )
+
+    PendingDependencyUpdateHandler.apply_pending_updates(table_id)
+
+
+@app.task(queue="export")
+def schedule_stale_pending_dependency_updates():
+    """
+    Schedules the tasks applying the pending dependency updates that have not been
+    applied in time, for example because the task applying them has failed.
+    """
+
+    from baserow.contrib.database.fields.dependencies.pending_updates import (
+        PendingDependencyUpdateHandler,
+    )
+
+    PendingDependencyUpdateHandler.schedule_stale_pending_updates()
+
+
 @app.on_after_finalize.connect
 def setup_periodic_tasks(sender, **kwargs):
     sender.add_periodic_task(
         settings.PERIODIC_FIELD_UPDATE_CRONTAB, run_periodic_fields_updates.s()
     )
+    sender.add_periodic_task(
+        settings.BASEROW_PENDING_DEPENDENCY_UPDATES_SWEEP_CRONTAB,
+        schedule_stale_pending_dependency_updates.s(),
+    )
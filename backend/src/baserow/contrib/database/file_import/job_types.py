@@ -1,5 +1,7 @@
 import json
+from contextlib import nullcontext
 
+from django.conf import settings
 from django.core.files.base import ContentFile
 from django.db import transaction
 
@@ -24,20 +26,31 @@ from baserow.contrib.database.fields.exceptions import (
     ReservedBaserowFieldNameException,
 )
 from baserow.contrib.database.rows.actions import ImportRowsActionType
+from baserow.contrib.database.rows.constants import ROW_IMPORT_CREATION
+from baserow.contrib.database.rows.error_report import StreamedRowErrorReport
 from baserow.contrib.database.rows.exceptions import ReportMaxErrorCountExceeded
+from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.search.handler import SearchHandler
 from baserow.contrib.database.table.actions import CreateTableActionType
 from baserow.contrib.database.table.exceptions import (
     InitialTableDataDuplicateName,
     InitialTableDataLimitExceeded,
     InvalidInitialTableData,
 )
+from baserow.contrib.database.table.signals import table_updated
 from baserow.core.action.registries import action_type_registry
+from baserow.core.jobs.handler import JobHandler
 from baserow.core.jobs.registries import JobType
+from baserow.core.utils import add_ids_to_ranges, grouper
 
 from .models import FileImportJob
 from .serializers import ReportSerializer
+from .utils import count_data_file_rows, dump_data_file_rows, read_data_file_rows
 
 BATCH_SIZE = 1024
+# The number of rows that are imported and committed together by a resumable file
+# import. A restarted job continues after the last committed chunk.
+RESUMABLE_CHECKPOINT_SIZE = 10 * BATCH_SIZE
 
 
 class FileImportJobType(JobType):
@@ -94,12 +107,20 @@ class FileImportJobType(JobType):
 
     def after_job_creation(self, job, values):
         """
-        Save the data file for the newly created job.
+        Save the data file for the newly created job. Big imports in an existing
+        table are made resumable if enabled.
         """
 
-        data_file = ContentFile(
-            json.dumps(values["data"], ensure_ascii=False).encode("utf8")
+        data = values["data"]
+        row_count_threshold = settings.BASEROW_FILE_IMPORT_STREAMING_ROW_THRESHOLD
+        job.resumable = (
+            settings.BASEROW_FILE_IMPORT_RESUMABLE
+            and job.table_id is not None
+            and row_count_threshold > 0
+            and len(data) >= row_count_threshold
         )
+
+        data_file = ContentFile(dump_data_file_rows(data))
         job.data_file.save(None, data_file)
 
     def before_delete(self, job):
@@ -117,14 +138,54 @@ class FileImportJobType(JobType):
         if isinstance(error, ReportMaxErrorCountExceeded):
             job.data_file.delete(save=False)
             job.report = {"failing_rows": error.report}
-            job.save(update_fields=("report", "data_file"))
+            # The chunks committed by a resumable import before it failed are kept
+            # and can be undone, which the user must know about.
+            imported_row_count = sum(
+                last - first + 1 for first, last in job.imported_row_id_ranges
+            )
+            if imported_row_count:
+                job.report["imported_row_count"] = imported_row_count
+                job.human_readable_error += (
+                    f" The {imported_row_count} rows that were imported before "
+                    "have been kept, the import can be undone to remove them."
+                )
+            job.save(update_fields=("report", "data_file", "human_readable_error"))
+        elif self._can_resume(job, error):
+            self._resume(job)
+
+    def on_interrupted(self, job):
+        if not self._can_resume(job):
+            return False
+
+        self._resume(job)
+        return True
+
+    def _can_resume(self, job, error=None):
+        """
+        A resumable import that has failed or has been interrupted is run again a
+        limited number of times, unless it failed because of the imported data.
+        """
+
+        if not job.resumable or isinstance(error, tuple(self.job_exceptions_map)):
+            return False
+
+        return job.resume_count < settings.BASEROW_FILE_IMPORT_MAX_RESUMES
+
+    def _resume(self, job):
+        job.resume_count += 1
+        job.save(update_fields=("resume_count",))
+        JobHandler().resume_job(job)
 
     def transaction_atomic_context(self, job: FileImportJob):
         """
         Protects the table and the fields from modifications while import is in
-        progress.
+        progress. A resumable import commits every chunk in its own transaction
+        instead, see `_import_rows_resumable`.
         """
 
+        if job.resumable:
+            return nullcontext()
+
         return read_committed_single_table_transaction(job.table_id)
 
     def run(self, job, progress):
@@ -133,10 +194,10 @@ class FileImportJobType(JobType):
         creation of the table.
         """
 
-        with job.data_file.open("r") as fin:
-            data = json.load(fin)
-
         if job.table is None:
+            with job.data_file.open("r") as fin:
+                data = json.load(fin)
+
             new_table, error_report = action_type_registry.get_by_type(
                 CreateTableActionType
             ).do(
@@ -150,13 +211,10 @@ class FileImportJobType(JobType):
 
             job.table = new_table
             job.save(update_fields=("table",))
+        elif job.resumable:
+            error_report = self._import_rows_resumable(job, progress)
         else:
-            _, error_report = action_type_registry.get_by_type(ImportRowsActionType).do(
-                job.user,
-                table=job.table,
-                data=data,
-                progress=progress,
-            )
+            error_report = self._import_rows(job, progress)
 
         def after_commit():
             """
@@ -169,3 +227,113 @@ class FileImportJobType(JobType):
             job.save(update_fields=("report", "data_file"))
 
         transaction.on_commit(after_commit)
+
+    def _import_rows(self, job, progress):
+        """
+        Imports the data in the existing table of the job. If the data contains
+        enough rows, the data file is streamed and imported chunk by chunk instead
+        of being loaded in memory.
+        """
+
+        import_rows_action_type = action_type_registry.get_by_type(ImportRowsActionType)
+        row_count_threshold = settings.BASEROW_FILE_IMPORT_STREAMING_ROW_THRESHOLD
+
+        with job.data_file.open("r") as fin:
+            row_count = count_data_file_rows(fin) if row_count_threshold else 0
+
+            if row_count_threshold and row_count >= row_count_threshold:
+                _, error_report = import_rows_action_type.do(
+                    job.user,
+                    table=job.table,
+                    data=read_data_file_rows(fin),
+                    progress=progress,
+                    row_count=row_count,
+                )
+            else:
+                fin.seek(0)
+                _, error_report = import_rows_action_type.do(
+                    job.user,
+                    table=job.table,
+                    data=json.load(fin),
+                    progress=progress,
+                )
+
+        return error_report
+
+    def _import_rows_resumable(self, job, progress):
+        """
+        Imports the data in the existing table of the job in chunks that are
+        committed one by one. Together with every chunk, the number of imported
+        rows of the data file, the ids of the created rows and the error report are
+        saved in the job, so that running the job again after a failure continues
+        the import after the last committed chunk. Once all the rows are imported,
+        they're registered as a single action, so that the whole import can be
+        undone at once.
+        """
+
+        error_report = StreamedRowErrorReport(
+            errors={
+                int(index): error
+                for index, error in job.report.get("failing_rows", {}).items()
+            }
+        )
+
+        with job.data_file.open("r") as fin:
+            row_count = count_data_file_rows(fin)
+            sub_progress = progress.create_child(100, row_count)
+            sub_progress.increment(job.data_file_offset, state=ROW_IMPORT_CREATION)
+
+            data = read_data_file_rows(fin, offset=job.data_file_offset)
+            try:
+                for chunk in grouper(RESUMABLE_CHECKPOINT_SIZE, data):
+                    with read_committed_single_table_transaction(job.table_id):
+                        row_ids, _ = RowHandler().import_rows_in_chunks(
+                            job.user,
+                            job.table,
+                            chunk,
+                            len(chunk),
+                            send_realtime_update=False,
+                            start_index=job.data_file_offset,
+                            error_report=error_report,
+                            skip_search_update=True,
+                        )
+                        job.data_file_offset += len(chunk)
+                        job.imported_row_id_ranges = add_ids_to_ranges(
+                            job.imported_row_id_ranges, row_ids
+                        )
+                        job.report = {"failing_rows": error_report.to_dict()}
+                        job.save(
+                            update_fields=(
+                                "data_file_offset",
+                                "imported_row_id_ranges",
+                                "report",
+                                "updated_on",
+                            )
+                        )
+                    sub_progress.increment(len(chunk))
+            except ReportMaxErrorCountExceeded:
+                # The import can't be continued, but the rows of the chunks that
+                # have already been committed must still be undoable.
+                self._finish_resumable_import(job)
+                raise
+
+        self._finish_resumable_import(job)
+        return error_report.to_dict()
+
+    def _finish_resumable_import(self, job):
+        """
+        Registers the rows imported by a resumable import as a single action and
+        updates the table accordingly.
+        """
+
+        if not job.imported_row_id_ranges:
+            return
+
+        with transaction.atomic():
+            action_type_registry.get_by_type(
+                ImportRowsActionType
+            ).register_imported_rows(job.user, job.table, job.imported_row_id_ranges)
+            SearchHandler.field_value_updated_or_created(job.table)
+            table_updated.send(
+                self, table=job.table, user=job.user, force_table_refresh=True
+            )
@@ -55,3 +55,23 @@ class FileImportJob(JobWithUserIpAddress, JobWithWebsocketId, JobWithUndoRedoIds
         default=default_report,
         help_text="The import error report.",
     )
+    resumable = models.BooleanField(
+        default=False,
+        help_text="Indicates whether the rows are imported in chunks that are "
+        "committed one by one, so that a restarted job continues where it stopped.",
+    )
+    data_file_offset = models.PositiveIntegerField(
+        default=0,
+        help_text="The number of rows of the data file that have already been "
+        "imported and committed by a resumable job.",
+    )
+    imported_row_id_ranges = models.JSONField(
+        default=list,
+        help_text="The inclusive [first, last] id ranges of the rows that have "
+        "already been imported and committed by a resumable job.",
+    )
+    resume_count = models.PositiveIntegerField(
+        default=0,
+        help_text="The number of times a resumable job has been run again after it "
+        "has failed or has been interrupted.",
+    )
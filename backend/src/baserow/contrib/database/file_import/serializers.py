@@ -21,3 +21,8 @@ class ReportSerializer(serializers.Serializer):
             "of errors by fields."
         ),
     )
+    imported_row_count = serializers.IntegerField(
+        required=False,
+        help_text="The number of rows that have been imported and kept by a "
+        "resumable import that has failed because of too many errors.",
+    )
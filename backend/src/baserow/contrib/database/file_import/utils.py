@@ -0,0 +1,84 @@
+import json
+from itertools import islice
+from typing import IO, Any, Iterator, List, Optional
+
+
+def dump_data_file_rows(data: Optional[List[List[Any]]]) -> bytes:
+    """
+    Serializes the rows of a file import as a JSON array with one row per line, so
+    that the data file can be loaded as a whole with `json.load`, but can also be
+    read row by row with `read_data_file_rows`. The JSON encoding of a row never
+    contains a newline, because the newlines in strings are escaped.
+
+    :param data: The rows that must be serialized, or None if a table is created
+        without data.
+    :return: The encoded content of the data file.
+    """
+
+    if data is None:
+        return json.dumps(data).encode("utf8")
+
+    lines = ",\n".join(json.dumps(row, ensure_ascii=False) for row in data)
+    return f"[\n{lines}\n]".encode("utf8")
+
+
+def _iterate_data_file_lines(file: IO) -> Iterator[str]:
+    """
+    Yields the lines containing a row of a data file created using
+    `dump_data_file_rows`, or nothing if the data file has an older format where
+    all the rows are on a single line.
+    """
+
+    # Contrary to iterating over a Django file, `readline` doesn't split the lines
+    # on unicode line separators, which are not escaped in the JSON.
+    lines = iter(file.readline, "")
+    if next(lines, "").strip() != "[":
+        return
+
+    for line in lines:
+        line = line.strip()
+        if line == "]":
+            return
+        if line:
+            yield line.rstrip(",")
+
+
+def read_data_file_rows(file: IO, offset: int = 0) -> Iterator[List[Any]]:
+    """
+    Reads the rows of a file import data file one by one, so that the data file
+    doesn't have to be loaded in memory. Data files that are not written by
+    `dump_data_file_rows` are loaded as a whole.
+
+    :param file: The data file opened in text mode.
+    :param offset: The number of rows to skip at the start of the data file. The
+        skipped rows are not decoded.
+    :return: An iterator over the rows of the data file.
+    """
+
+    file.seek(0)
+    found_rows = False
+    for index, line in enumerate(_iterate_data_file_lines(file)):
+        found_rows = True
+        if index >= offset:
+            yield json.loads(line)
+
+    if not found_rows:
+        file.seek(0)
+        yield from islice(json.load(file), offset, None)
+
+
+def count_data_file_rows(file: IO) -> int:
+    """
+    Counts the rows in a file import data file without decoding them, if the data
+    file is written by `dump_data_file_rows`.
+
+    :param file: The data file opened in text mode.
+    :return: The number of rows in the data file.
+    """
+
+    file.seek(0)
+    row_count = sum(1 for _ in _iterate_data_file_lines(file))
+    if row_count == 0:
+        file.seek(0)
+        row_count = len(json.load(file))
+    return row_count
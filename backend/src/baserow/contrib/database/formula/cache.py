@@ -0,0 +1,135 @@
+"""
+Parsing a formula with the ANTLR parser is slow in Python, while the same formulas are
+parsed over and over again. For example when the dependencies of the fields of a table
+are rebuilt, or when the typed internal expression of every formula field is needed to
+update its cells. Every worker process therefore keeps a bounded in-memory LRU of the
+untyped expressions of the recently parsed formulas.
+
+An untyped expression only depends on the formula string, because no field is looked
+up while parsing. This is also true for the internal formula of a formula field, which
+already contains the references to the database columns of the fields it depends on
+and all the transformations made while typing it, so the typed internal expression is
+built from the cached expression of the internal formula and the formula type stored
+on the field.
+
+The expressions are mutated while they're typed, so the cached expressions are never
+returned. A copy sharing the function definitions of the registry is returned instead,
+which is about an order of magnitude faster than parsing the formula again.
+"""
+import threading
+from collections import OrderedDict
+from copy import deepcopy
+from dataclasses import dataclass
+from typing import Dict, Optional, Set
+
+from django.conf import settings
+
+from baserow.contrib.database.formula.ast.tree import (
+    BaserowExpression,
+    BaserowFunctionDefinition,
+)
+from baserow.contrib.database.formula.parser.ast_mapper import (
+    raw_formula_to_untyped_expression,
+)
+from baserow.contrib.database.formula.types.formula_type import UnTyped
+from baserow.contrib.database.formula.types.visitors import FunctionsUsedVisitor
+
+
+@dataclass
+class FormulaExpressionCacheEntry:
+    expression: BaserowExpression[UnTyped]
+    # The function definitions used by the expression. They are registry instances
+    # which must be shared by all the copies of the expression.
+    function_defs: Set[BaserowFunctionDefinition]
+
+    def copy_expression(self) -> BaserowExpression[UnTyped]:
+        memo = {id(function_def): function_def for function_def in self.function_defs}
+        return deepcopy(self.expression, memo)
+
+
+class FormulaExpressionCache:
+    """
+    A thread safe, size bounded, in process LRU cache of untyped formula expressions
+    keyed by the formula string.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, FormulaExpressionCacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, formula: str) -> Optional[FormulaExpressionCacheEntry]:
+        with self._lock:
+            entry = self._entries.get(formula)
+            if entry is not None:
+                self._entries.move_to_end(formula)
+                self.hits += 1
+            else:
+                self.misses += 1
+            return entry
+
+    def set(self, formula: str, entry: FormulaExpressionCacheEntry):
+        if self.max_size <= 0:
+            return
+
+        with self._lock:
+            self._entries[formula] = entry
+            self._entries.move_to_end(formula)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+            }
+
+
+formula_expressions_cache = FormulaExpressionCache(
+    settings.BASEROW_FORMULA_EXPRESSION_CACHE_SIZE
+)
+
+
+def get_cached_untyped_expression(formula: str) -> BaserowExpression[UnTyped]:
+    """
+    Returns the untyped expression of the provided formula string, which is only
+    parsed if it's not in the in process cache yet. The returned expression is a copy
+    that can safely be typed or otherwise modified by the caller.
+
+    :param formula: A raw string possibly in the format of a Baserow Formula.
+    :return: An untyped BaserowExpression which represents the provided formula.
+    :raises BaserowFormulaSyntaxError: If the supplied formula is not in the syntax
+        of the Baserow Formula language.
+    """
+
+    if formula_expressions_cache.max_size <= 0:
+        return raw_formula_to_untyped_expression(formula)
+
+    entry = formula_expressions_cache.get(formula)
+    try:
+        if entry is None:
+            expression = raw_formula_to_untyped_expression(formula)
+            function_defs = {
+                function_def
+                for function_def in expression.accept(FunctionsUsedVisitor())
+                if isinstance(function_def, BaserowFunctionDefinition)
+            }
+            entry = FormulaExpressionCacheEntry(expression, function_defs)
+            formula_expressions_cache.set(formula, entry)
+
+        return entry.copy_expression()
+    except RecursionError:
+        # Visiting or copying a formula nested close to the recursion limit of the
+        # parser can exceed the limit, in which case it's parsed without the cache.
+        return raw_formula_to_untyped_expression(formula)
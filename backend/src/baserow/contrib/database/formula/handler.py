@@ -12,6 +12,7 @@ from baserow.contrib.database.formula.ast.tree import (
     BaserowFieldReference,
     BaserowFunctionDefinition,
 )
+from baserow.contrib.database.formula.cache import get_cached_untyped_expression
 from baserow.contrib.database.formula.expression_generator.generator import (
     baserow_expression_to_insert_django_expression,
     baserow_expression_to_single_row_update_django_expression,
@@ -20,9 +21,6 @@ from baserow.contrib.database.formula.expression_generator.generator import (
 from baserow.contrib.database.formula.migrations.migrations import (
     BASEROW_FORMULA_VERSION,
 )
-from baserow.contrib.database.formula.parser.ast_mapper import (
-    raw_formula_to_untyped_expression,
-)
 from baserow.contrib.database.formula.parser.update_field_names import (
     update_field_names,
 )
@@ -260,11 +258,15 @@ class FormulaHandler(metaclass=baserow_trace_methods(tracer)):
         objects. This form is much easier to inspect, transform and perform calculations
         on compared to the raw string.
 
+        The expressions of the recently converted formulas are cached, so the formula
+        is only parsed again if it's not in the cache anymore. A new copy of the
+        expression is returned every time, which can safely be modified.
+
         :param formula_string: A string containing a formula in the Baserow Formula
             expression language.
         """
 
-        return raw_formula_to_untyped_expression(formula_string)
+        return get_cached_untyped_expression(formula_string)
 
     @classmethod
     def get_formula_type_from_field(cls, formula_field) -> BaserowFormulaType:
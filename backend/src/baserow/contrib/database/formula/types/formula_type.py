@@ -1,5 +1,5 @@
 import abc
-from typing import TYPE_CHECKING, List, Type, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, List, Type, TypeVar
 
 from django.db.models import Expression, F, Value
 from django.utils.functional import classproperty
@@ -324,6 +324,27 @@ class BaserowFormulaType(abc.ABC):
         field_instance = baserow_field_type.from_baserow_formula_type(self)
         return field_instance, baserow_field_type
 
+    def get_export_value_formatter(
+        self, field_object, rich_value: bool = False
+    ) -> Callable[[Any], Any]:
+        """
+        Returns a function which converts a single value of this formula type to its
+        export value, in the same way as the `get_export_value_formatter` of field
+        types. This is used for the formula types which are their own baserow field
+        type.
+
+        :param field_object: The field object for the field to extract.
+        :param rich_value: whether a rich value can be exported.
+        :return: A function which takes a value and returns the export value.
+        """
+
+        get_export_value = self.get_export_value
+
+        def format_value(value):
+            return get_export_value(value, field_object, rich_value=rich_value)
+
+        return format_value
+
     def should_recreate_when_old_type_was(self, old_type: "BaserowFormulaType") -> bool:
         """
         :param old_type: The previous type of a formula field.
@@ -0,0 +1,52 @@
+import sys
+
+from django.core.management.base import BaseCommand
+
+from baserow.contrib.database.fields.dependencies.pending_updates import (
+    PendingDependencyUpdateHandler,
+)
+from baserow.contrib.database.table.models import Table
+
+
+class Command(BaseCommand):
+    help = (
+        "Enables the eventual dependency updates of a table. When enabled, the fields "
+        "of other tables depending on the updated rows of the table are recomputed in "
+        "the background instead of while the rows are updated."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "table_id",
+            type=int,
+            help="The table of which the eventual dependency updates must be enabled.",
+        )
+        parser.add_argument(
+            "--disable",
+            action="store_true",
+            help="Disables the eventual dependency updates of the table instead, "
+            "after applying the pending updates.",
+        )
+
+    def handle(self, *args, **options):
+        table_id = options["table_id"]
+        enabled = not options["disable"]
+
+        try:
+            table = Table.objects.get(id=table_id)
+        except Table.DoesNotExist:
+            self.stdout.write(self.style.ERROR(f"The table {table_id} does not exist."))
+            sys.exit(1)
+
+        table.eventual_dependency_updates = enabled
+        table.save(update_fields=("eventual_dependency_updates",))
+
+        if not enabled:
+            PendingDependencyUpdateHandler.apply_pending_updates(table_id)
+
+        state = "enabled" if enabled else "disabled"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"The eventual dependency updates of the table {table_id} are {state}."
+            )
+        )
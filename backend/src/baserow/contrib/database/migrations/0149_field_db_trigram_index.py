@@ -0,0 +1,20 @@
+# Generated by Django 3.2.23 on 2026-10-18 23:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("database", "0148_pendingsearchvalueupdate"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="field",
+            name="db_trigram_index",
+            field=models.BooleanField(
+                default=False,
+                help_text="Indicates whether a `pg_trgm` index must be created for this field, so that the contains filters and the compat search can use it instead of scanning the whole table. Only supported by text like fields.",
+            ),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 3.2.23 on 2026-10-19 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("database", "0149_field_db_trigram_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="fileimportjob",
+            name="data_file_offset",
+            field=models.PositiveIntegerField(
+                default=0,
+                help_text="The number of rows of the data file that have already been imported and committed by a resumable job.",
+            ),
+        ),
+        migrations.AddField(
+            model_name="fileimportjob",
+            name="imported_row_id_ranges",
+            field=models.JSONField(
+                default=list,
+                help_text="The inclusive [first, last] id ranges of the rows that have already been imported and committed by a resumable job.",
+            ),
+        ),
+        migrations.AddField(
+            model_name="fileimportjob",
+            name="resumable",
+            field=models.BooleanField(
+                default=False,
+                help_text="Indicates whether the rows are imported in chunks that are committed one by one, so that a restarted job continues where it stopped.",
+            ),
+        ),
+    ]
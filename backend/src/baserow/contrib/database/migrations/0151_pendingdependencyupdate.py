@@ -0,0 +1,66 @@
+# Generated by Django 3.2.23 on 2026-10-19 11:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("database", "0150_fileimportjob_resumable"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="table",
+            name="eventual_dependency_updates",
+            field=models.BooleanField(
+                default=False,
+                help_text="Indicates whether the fields of other tables depending on the updated rows of this table are recomputed in the background, instead of while the rows are updated.",
+            ),
+        ),
+        migrations.CreateModel(
+            name="PendingDependencyUpdate",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("row_id", models.PositiveIntegerField()),
+                (
+                    "connection_removed",
+                    models.BooleanField(
+                        default=False,
+                        help_text="Indicates whether the row is a row of the table linked by the link row field that has lost its connection with an updated row.",
+                    ),
+                ),
+                ("created_on", models.DateTimeField(auto_now_add=True)),
+                (
+                    "field",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="database.field",
+                    ),
+                ),
+                (
+                    "table",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="database.table",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="pendingdependencyupdate",
+            index=models.Index(
+                fields=["table", "row_id"], name="database_pe_table_i_827f2b_idx"
+            ),
+        ),
+    ]
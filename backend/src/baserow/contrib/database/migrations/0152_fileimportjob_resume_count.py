@@ -0,0 +1,20 @@
+# Generated by Django 3.2.23 on 2026-10-19 16:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("database", "0151_pendingdependencyupdate"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="fileimportjob",
+            name="resume_count",
+            field=models.PositiveIntegerField(
+                default=0,
+                help_text="The number of times a resumable job has been run again after it has failed or has been interrupted.",
+            ),
+        ),
+    ]
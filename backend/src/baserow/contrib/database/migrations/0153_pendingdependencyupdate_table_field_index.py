@@ -0,0 +1,19 @@
+# Generated by Django 3.2.23 on 2026-10-19 03:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("database", "0152_fileimportjob_resume_count"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="pendingdependencyupdate",
+            index=models.Index(
+                fields=["table", "field", "row_id"],
+                name="database_pe_table_i_f7cbbb_idx",
+            ),
+        ),
+    ]
@@ -1,4 +1,7 @@
-from baserow.contrib.database.fields.dependencies.models import FieldDependency
+from baserow.contrib.database.fields.dependencies.models import (
+    FieldDependency,
+    PendingDependencyUpdate,
+)
 from baserow.core.models import Application
 
 from .fields.models import (
@@ -14,6 +17,7 @@ from .fields.models import (
     TextField,
     URLField,
 )
+from .search.models import PendingSearchValueUpdate
 from .table.models import Table
 from .tokens.models import Token, TokenPermission
 from .views.models import (
@@ -62,6 +66,8 @@ __all__ = [
     "TableWebhookHeader",
     "TableWebhookCall",
     "FieldDependency",
+    "PendingDependencyUpdate",
+    "PendingSearchValueUpdate",
 ]
 
 
@@ -1,7 +1,7 @@
 import dataclasses
 from copy import deepcopy
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Tuple, Type
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
 
 from django.contrib.auth.models import AbstractUser
 from django.utils.translation import gettext_lazy as _
@@ -23,7 +23,7 @@ from baserow.core.action.registries import (
     UndoableActionType,
 )
 from baserow.core.trash.handler import TrashHandler
-from baserow.core.utils import Progress
+from baserow.core.utils import Progress, iterate_id_ranges
 
 
 class CreateRowActionType(UndoableActionType):
@@ -201,6 +201,7 @@ class ImportRowsActionType(UndoableActionType):
         database_name: str
         row_ids: List[int]
         trashed_rows_entry_id: Optional[int] = None
+        row_id_ranges: List[List[int]] = dataclasses.field(default_factory=list)
 
     @classmethod
     def do(
@@ -209,7 +210,8 @@ class ImportRowsActionType(UndoableActionType):
         table: Table,
         data=List[List[Any]],
         progress: Optional[Progress] = None,
-    ) -> Tuple[List[GeneratedTableModel], Dict[str, Any]]:
+        row_count: Optional[int] = None,
+    ) -> Tuple[Union[List[GeneratedTableModel], List[int]], Dict[str, Any]]:
         """
         Creates rows for a given table with the provided values if the user
         belongs to the related workspace. It also calls the table_updated signal.
@@ -224,12 +226,24 @@ class ImportRowsActionType(UndoableActionType):
         :param table: The table for which the rows should be imported.
         :param data: List of rows values for rows that need to be created.
         :param progress: An optional progress object to track the task progress.
+        :param row_count: If provided, the data can be any iterable of rows
+            containing this many rows and it's imported chunk by chunk. See the
+            baserow.contrib.database.rows.handler.RowHandler.import_rows_in_chunks
+            for more information. The ids of the created rows are then returned
+            instead of the instances.
         :return: The created list of rows instances and the error report.
         """
 
-        created_rows, error_report = RowHandler().import_rows(
-            user, table, data, progress=progress
-        )
+        if row_count is None:
+            created_rows, error_report = RowHandler().import_rows(
+                user, table, data, progress=progress
+            )
+            row_ids = [row.id for row in created_rows]
+        else:
+            row_ids, error_report = RowHandler().import_rows_in_chunks(
+                user, table, data, row_count, progress=progress
+            )
+            created_rows = row_ids
 
         workspace = table.database.workspace
         params = cls.Params(
@@ -237,7 +251,7 @@ class ImportRowsActionType(UndoableActionType):
             table.name,
             table.database.id,
             table.database.name,
-            [row.id for row in created_rows],
+            row_ids,
         )
         cls.register_action(
             user, params, scope=cls.scope(table.id), workspace=workspace
@@ -245,14 +259,58 @@ class ImportRowsActionType(UndoableActionType):
 
         return created_rows, error_report
 
+    @classmethod
+    def register_imported_rows(
+        cls, user: AbstractUser, table: Table, row_id_ranges: List[List[int]]
+    ):
+        """
+        Registers the import of rows that have already been created in several
+        transactions, like a resumable file import does, so that they can be undone
+        and redone together. The ids are stored as ranges because there can be a
+        lot of them.
+
+        :param user: The user of whose behalf the rows have been created.
+        :param table: The table in which the rows have been imported.
+        :param row_id_ranges: The inclusive [first, last] id ranges of the
+            imported rows. See baserow.core.utils.add_ids_to_ranges.
+        """
+
+        params = cls.Params(
+            table.id,
+            table.name,
+            table.database.id,
+            table.database.name,
+            [],
+            row_id_ranges=row_id_ranges,
+        )
+        cls.register_action(
+            user,
+            params,
+            scope=cls.scope(table.id),
+            workspace=table.database.workspace,
+        )
+
+    @classmethod
+    def get_long_description(cls, params_dict: Dict[str, Any], *args, **kwargs) -> str:
+        if params_dict.get("row_id_ranges"):
+            params_dict = {
+                **params_dict,
+                "row_ids": ", ".join(
+                    f"{first}-{last}" for first, last in params_dict["row_id_ranges"]
+                ),
+            }
+
+        return super().get_long_description(params_dict, *args, **kwargs)
+
     @classmethod
     def scope(cls, table_id) -> ActionScopeStr:
         return TableActionScopeType.value(table_id)
 
     @classmethod
     def undo(cls, user: AbstractUser, params: Params, action_being_undone: Action):
+        row_ids = [*params.row_ids, *iterate_id_ranges(params.row_id_ranges)]
         trashed_rows_trash_entry = RowHandler().delete_rows(
-            user, TableHandler().get_table(params.table_id), params.row_ids
+            user, TableHandler().get_table(params.table_id), row_ids
         )
         params.trashed_rows_entry_id = trashed_rows_trash_entry.id
         action_being_undone.params = params
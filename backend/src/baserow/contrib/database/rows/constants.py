@@ -1,2 +1,19 @@
+from enum import Enum
+
 ROW_IMPORT_VALIDATION = "row-import-validation"
 ROW_IMPORT_CREATION = "row-import-creation"
+
+
+class RowCountModes(str, Enum):
+    # Count the rows with an exact `COUNT` query every time.
+    MODE_EXACT = "exact"
+
+    # Use the planner estimate when a large table isn't filtered, otherwise cache
+    # the exact count for a short time. The count can therefore be slightly off.
+    MODE_APPROXIMATE = "approximate"
+
+    # Don't count the rows at all.
+    MODE_NONE = "none"
+
+
+ALL_ROW_COUNT_MODES = [getattr(mode, "value") for mode in RowCountModes]
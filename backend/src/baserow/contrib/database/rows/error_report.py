@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Tuple, TypeVar
+from typing import Any, Dict, List, Optional, Tuple, TypeVar
 
 from django.conf import settings
 
@@ -73,3 +73,46 @@ class RowErrorReport:
             if self._indexed_rows[index]["error"]:
                 report[index] = self._indexed_rows[index]["error"]
         return report
+
+
+class StreamedRowErrorReport:
+    def __init__(
+        self,
+        error_limit: int = settings.BASEROW_MAX_ROW_REPORT_ERROR_COUNT,
+        errors: Optional[Dict[RowIndex, Dict[str, Any]]] = None,
+    ):
+        """
+        Tracks the errors of rows that are imported chunk by chunk. Contrary to the
+        RowErrorReport, only the errors are kept in memory and not the rows.
+
+        :param error_limit: if the error limit is exceeded, an exception is raised.
+        :param errors: the errors that have already been reported, for example by
+            a previous run of a resumed import.
+        """
+
+        self._errors = dict(errors or {})
+        self.error_count = len(self._errors)
+        self.error_limit = error_limit
+
+    def add_error(self, row_index: RowIndex, error: Dict[str, Any]):
+        """
+        Adds an error to the report if the error is truthy.
+
+        :raise ReportMaxErrorCountExceeded: if the maximum error limit is exceeded.
+        """
+
+        if not error:
+            return
+
+        self.error_count += 1
+        if self.error_count > self.error_limit:
+            raise ReportMaxErrorCountExceeded(self.to_dict())
+
+        self._errors[row_index] = error
+
+    def to_dict(self) -> Dict[RowIndex, Dict[str, Any]]:
+        """
+        Generates the report as a dict.
+        """
+
+        return dict(sorted(self._errors.items()))
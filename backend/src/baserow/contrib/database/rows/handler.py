@@ -1,3 +1,4 @@
+import hashlib
 from collections import defaultdict
 from copy import copy, deepcopy
 from decimal import Decimal
@@ -17,9 +18,11 @@ from typing import (
     cast,
 )
 
+from django.conf import settings
 from django.contrib.auth.models import AbstractUser
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
-from django.db import transaction
+from django.db import connection, transaction
 from django.db.models import Model, Q, QuerySet
 from django.db.models.fields.related import ForeignKey, ManyToManyField
 from django.utils.encoding import force_str
@@ -27,7 +30,11 @@ from django.utils.encoding import force_str
 from opentelemetry import metrics, trace
 
 from baserow.contrib.database.api.rows.serializers import serialize_rows_for_response
+from baserow.contrib.database.db.copy_from import bulk_insert_with_copy
 from baserow.contrib.database.fields.dependencies.handler import FieldDependencyHandler
+from baserow.contrib.database.fields.dependencies.pending_updates import (
+    PendingDependencyUpdateHandler,
+)
 from baserow.contrib.database.fields.dependencies.update_collector import (
     FieldUpdateCollector,
 )
@@ -63,8 +70,8 @@ from ..table.constants import (
     LAST_MODIFIED_BY_COLUMN_NAME,
     ROW_NEEDS_BACKGROUND_UPDATE_COLUMN_NAME,
 )
-from .constants import ROW_IMPORT_CREATION, ROW_IMPORT_VALIDATION
-from .error_report import RowErrorReport
+from .constants import ROW_IMPORT_CREATION, ROW_IMPORT_VALIDATION, RowCountModes
+from .error_report import RowErrorReport, StreamedRowErrorReport
 from .exceptions import RowDoesNotExist, RowIdsNotUnique
 from .operations import (
     DeleteDatabaseRowOperationType,
@@ -425,6 +432,83 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             # add one to it.
             return get_highest_order_of_queryset(queryset, amount=amount)
 
+    def count_rows(
+        self,
+        queryset: QuerySet,
+        count_mode: RowCountModes = RowCountModes.MODE_EXACT,
+    ) -> Optional[int]:
+        """
+        Counts the rows of the provided queryset using the provided count mode.
+
+        :param queryset: The filtered queryset of which the rows must be counted.
+        :param count_mode: `exact` always runs a `COUNT` query. `approximate` uses
+            the planner estimate if the queryset isn't filtered and the table is
+            large, and otherwise caches the exact count for a short time. `none`
+            doesn't count at all.
+        :return: The (approximate) number of rows or `None` if the rows must not be
+            counted.
+        """
+
+        if count_mode == RowCountModes.MODE_NONE:
+            return None
+
+        if count_mode == RowCountModes.MODE_EXACT:
+            return queryset.count()
+
+        model = queryset.model
+        if queryset.query.where == model.objects.all().query.where:
+            estimate = self._get_estimated_row_count(model)
+            if (
+                estimate is not None
+                and estimate >= settings.BASEROW_APPROXIMATE_ROW_COUNT_THRESHOLD
+            ):
+                return estimate
+
+        cache_key = self._get_row_count_cache_key(queryset)
+        count = cache.get(cache_key)
+        if count is None:
+            count = queryset.count()
+            cache.set(
+                cache_key,
+                count,
+                timeout=settings.BASEROW_APPROXIMATE_ROW_COUNT_CACHE_TIMEOUT,
+            )
+        return count
+
+    def _get_estimated_row_count(
+        self, model: Type[GeneratedTableModel]
+    ) -> Optional[int]:
+        """
+        Returns the number of rows the planner estimates the table has. Falls back
+        on the periodically stored `Table.row_count` if the table hasn't been
+        analyzed yet. Note that both also include the trashed rows.
+        """
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples FROM pg_class WHERE oid = %s::regclass",
+                [model._meta.db_table],
+            )
+            row = cursor.fetchone()
+
+        # Depending on the Postgres version, a table that hasn't been analyzed yet
+        # has an estimate of either -1 or 0.
+        if row is not None and row[0] > 0:
+            return int(row[0])
+
+        return model.baserow_table.row_count
+
+    def _get_row_count_cache_key(self, queryset: QuerySet) -> str:
+        """
+        Returns the cache key of the exact count of the provided queryset. It
+        contains a hash of the query, so that every combination of filters gets its
+        own key.
+        """
+
+        sql, params = queryset.order_by().values("id").query.sql_with_params()
+        query_hash = hashlib.sha256(f"{sql}{params}".encode()).hexdigest()
+        return f"row_count_{queryset.model._meta.db_table}_{query_hash}"
+
     def get_row(
         self,
         user: AbstractUser,
@@ -986,17 +1070,35 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         if getattr(model, LAST_MODIFIED_BY_COLUMN_NAME, None):
             setattr(row, LAST_MODIFIED_BY_COLUMN_NAME, user if user.id else None)
 
-        row.save()
+        # Only the search data of the updated fields has to be updated, so the row
+        # doesn't have to be marked as needing a background update.
+        update_search_per_field = table.tsvectors_are_supported
+        if update_search_per_field:
+            row.save(
+                update_fields=[
+                    model_field.name
+                    for model_field in model._meta.concrete_fields
+                    if not model_field.primary_key
+                    and model_field.name != ROW_NEEDS_BACKGROUND_UPDATE_COLUMN_NAME
+                ]
+            )
+        else:
+            row.save()
         rows_updated_counter.add(1)
 
+        deleted_m2m_rels_per_link_field = (
+            m2m_change_tracker.get_deleted_link_row_rels_for_update_collector()
+        )
         update_collector = FieldUpdateCollector(
             table,
             starting_row_ids=[row.id],
-            deleted_m2m_rels_per_link_field=m2m_change_tracker.get_deleted_link_row_rels_for_update_collector(),
+            deleted_m2m_rels_per_link_field=deleted_m2m_rels_per_link_field,
+            mark_starting_rows_as_needing_background_update=not update_search_per_field,
         )
         field_cache = FieldCache()
         field_cache.cache_model(model)
         dependant_fields = []
+        has_pending_dependant_fields = False
         for (
             dependant_field,
             dependant_field_type,
@@ -1007,6 +1109,11 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             field_cache,
             associated_relations_changed=True,
         ):
+            if table.eventual_dependency_updates and path_to_starting_table:
+                # The dependant fields in other tables are updated in the background.
+                has_pending_dependant_fields = True
+                continue
+
             dependant_fields.append(dependant_field)
             dependant_field_type.row_of_dependency_updated(
                 dependant_field,
@@ -1016,6 +1123,11 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
                 path_to_starting_table,
             )
         update_collector.apply_updates_and_get_updated_fields(field_cache)
+
+        if has_pending_dependant_fields:
+            PendingDependencyUpdateHandler.add_pending_updates(
+                table, updated_field_ids, [row.id], deleted_m2m_rels_per_link_field
+            )
         # We need to refresh here as ExpressionFields might have had their values
         # updated. Django does not support UPDATE .... RETURNING and so we need to
         # query for the rows updated values instead.
@@ -1024,7 +1136,16 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         from baserow.contrib.database.views.handler import ViewHandler
 
         ViewHandler().field_value_updated(updated_fields + dependant_fields)
-        SearchHandler.field_value_updated_or_created(table)
+        if update_search_per_field:
+            SearchHandler.field_values_of_rows_updated(
+                table,
+                [row.id],
+                self._get_fields_to_update_search_data_for(
+                    table, model, updated_fields, dependant_fields
+                ),
+            )
+        else:
+            SearchHandler.field_value_updated_or_created(table)
 
         rows_updated.send(
             self,
@@ -1051,6 +1172,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         send_webhook_events: bool = True,
         generate_error_report: bool = False,
         skip_search_update: bool = False,
+        insert_with_copy: bool = False,
     ) -> List[GeneratedTableModel]:
         """
         Creates new rows for a given table if the user
@@ -1069,6 +1191,9 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         :param skip_search_update: If you want to to instead
             trigger the search handler cells update later on after many create_rows
             calls then set this to True but make sure you trigger it eventually.
+        :param insert_with_copy: If True, the rows are inserted using the COPY
+            command if all their values are plain values, which is faster when
+            inserting many rows.
         :return: The created row instances.
         """
 
@@ -1123,9 +1248,9 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             # saved.
             instance._m2m_values = relations
 
-        inserted_rows = model.objects.bulk_create(
-            [row for (row, _) in rows_relationships]
-        )
+        inserted_rows = [row for (row, _) in rows_relationships]
+        if not insert_with_copy or not bulk_insert_with_copy(model, inserted_rows):
+            inserted_rows = model.objects.bulk_create(inserted_rows)
         rows_created_counter.add(len(rows_relationships))
 
         many_to_many = defaultdict(list)
@@ -1279,6 +1404,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         table: Table,
         rows: List[Dict[str, Any]],
         progress: Optional[Progress] = None,
+        model: Optional[Type[GeneratedTableModel]] = None,
     ) -> Dict[str, Dict[str, Any]]:
         """
         Validates rows by batch and generates an error report.
@@ -1287,6 +1413,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         :param table: The table for which the rows should be created.
         :param rows: List of rows values for rows that need to be created.
         :param progress: Give a progress instance to track the progress of the import.
+        :param model: Optional model to prevent recomputing table model.
         :return: The error report.
         """
 
@@ -1302,7 +1429,9 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         if progress:
             progress.increment(state=ROW_IMPORT_VALIDATION)
 
-        model = table.get_model()
+        if model is None:
+            model = table.get_model()
+
         # Use serializer to validate incoming data
         validation_serializer = get_row_serializer_class(model)
         report = {}
@@ -1419,15 +1548,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         error_report = RowErrorReport(data)
 
         model = table.get_model()
-
-        fields = [
-            field_object["field"]
-            for field_object in model._field_objects.values()
-            if not field_object["type"].read_only
-        ]
-
-        # Sort by order then by id
-        fields.sort(key=lambda f: (f.order, f.id))
+        fields = self._get_import_fields(model)
 
         for index, row in enumerate(data):
             # Check row length
@@ -1437,18 +1558,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
                     {"non_field_errors": ["Too many values in this line."]},
                 )
             else:
-                new_row = list(row)
-                # Fill incomplete rows with empty values
-                new_row.extend([None] * (len(fields) - len(row)))
-
-                # Reshape data by field as expected by the import
-                error_report.update_row(
-                    index,
-                    {
-                        f"field_{fields[index].id}": value
-                        for index, value in enumerate(new_row)
-                    },
-                )
+                error_report.update_row(index, self._reshape_import_row(row, fields))
 
         # STEP 1: pre-validate data with serializer
         if validate:
@@ -1498,6 +1608,151 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
 
         return created_rows, error_report.to_dict()
 
+    def import_rows_in_chunks(
+        self,
+        user: AbstractUser,
+        table: Table,
+        data: Iterable[List[Any]],
+        row_count: int,
+        validate: bool = True,
+        progress: Optional[Progress] = None,
+        send_realtime_update: bool = True,
+        start_index: int = 0,
+        error_report: Optional[StreamedRowErrorReport] = None,
+        skip_search_update: bool = False,
+    ) -> Tuple[List[int], Dict[str, Dict[str, Any]]]:
+        """
+        Works like `import_rows`, except that the data is consumed chunk by chunk
+        so that it can be streamed from a file. Every chunk is validated and
+        created before the next one is read, and only the errors and the ids of the
+        created rows are kept in memory. The rows are inserted using the COPY
+        command if possible, the relations of the rows are created afterward.
+
+        :param user: The user of whose behalf the rows are created.
+        :param table: The table for which the rows should be created.
+        :param data: Iterable of rows values for rows that need to be created.
+        :param row_count: The number of rows in the data, used to track the
+            progress.
+        :param validate: If True the data are validated before the import.
+        :param progress: Give a progress instance to track the progress of the
+            import.
+        :param send_realtime_update: The parameter passed to the rows_created
+            signal indicating if a realtime update should be send.
+        :param start_index: The index of the first row of the data in the whole
+            import, used in the error report when the data is only a part of it.
+        :param error_report: An optional error report to add the errors to, so
+            that the error limit applies to all the parts of an import.
+        :param skip_search_update: If True the search data of the created rows is
+            not updated, so that it can be done once all the parts are imported.
+        :return: The ids of the created rows and the error report.
+        """
+
+        workspace = table.database.workspace
+        CoreHandler().check_permissions(
+            user,
+            ImportRowsDatabaseTableOperationType.type,
+            workspace=workspace,
+            context=table,
+        )
+
+        if error_report is None:
+            error_report = StreamedRowErrorReport()
+        model = table.get_model()
+        fields = self._get_import_fields(model)
+
+        sub_progress = progress.create_child(100, row_count) if progress else None
+        if sub_progress:
+            sub_progress.increment(state=ROW_IMPORT_CREATION)
+
+        created_row_ids = []
+        for count, chunk in enumerate(grouper(BATCH_SIZE, data)):
+            # The valid rows of the chunk together with their index in the data.
+            indexed_rows = []
+            chunk_start_index = start_index + count * BATCH_SIZE
+            for index, row in enumerate(chunk, start=chunk_start_index):
+                if len(row) > len(fields):
+                    error_report.add_error(
+                        index,
+                        {"non_field_errors": ["Too many values in this line."]},
+                    )
+                else:
+                    indexed_rows.append((index, self._reshape_import_row(row, fields)))
+
+            if validate:
+                validation_report = self.validate_rows(
+                    table, [row for _, row in indexed_rows], model=model
+                )
+                for valid_index, error in sorted(validation_report.items()):
+                    error_report.add_error(indexed_rows[valid_index][0], error)
+                indexed_rows = [
+                    indexed_row
+                    for valid_index, indexed_row in enumerate(indexed_rows)
+                    if not validation_report.get(valid_index)
+                ]
+
+            if indexed_rows:
+                created_rows, creation_report = self.create_rows(
+                    user=user,
+                    table=table,
+                    model=model,
+                    rows_values=[row for _, row in indexed_rows],
+                    generate_error_report=True,
+                    send_realtime_update=False,
+                    send_webhook_events=False,
+                    skip_search_update=True,
+                    insert_with_copy=True,
+                )
+                created_row_ids.extend(row.id for row in created_rows)
+
+                for valid_index, field_errors in creation_report.items():
+                    error_report.add_error(
+                        indexed_rows[int(valid_index)][0],
+                        prepare_field_errors(field_errors),
+                    )
+
+            if sub_progress:
+                sub_progress.increment(len(chunk))
+
+        if not skip_search_update:
+            SearchHandler.field_value_updated_or_created(table)
+
+        if send_realtime_update:
+            # Just send a single table_updated here as realtime update instead
+            # of rows_created because we might import a lot of rows.
+            table_updated.send(self, table=table, user=user, force_table_refresh=True)
+
+        return created_row_ids, error_report.to_dict()
+
+    def _get_import_fields(self, model: Type[GeneratedTableModel]) -> List["Field"]:
+        """
+        Returns the fields of the model in which the values of the imported rows
+        must be set, in the same order as the values.
+        """
+
+        fields = [
+            field_object["field"]
+            for field_object in model._field_objects.values()
+            if not field_object["type"].read_only
+        ]
+
+        # Sort by order then by id
+        fields.sort(key=lambda f: (f.order, f.id))
+        return fields
+
+    def _reshape_import_row(
+        self, row: List[Any], fields: List["Field"]
+    ) -> Dict[str, Any]:
+        """
+        Reshapes the values of an imported row by field as expected by the import.
+        Incomplete rows are filled with empty values.
+        """
+
+        new_row = list(row)
+        new_row.extend([None] * (len(fields) - len(row)))
+        return {
+            f"field_{fields[index].id}": value for index, value in enumerate(new_row)
+        }
+
     def get_fields_metadata_for_row_history(
         self,
         row: GeneratedTableModelForUpdate,
@@ -1549,6 +1804,30 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
 
         return fields_metadata_by_row_id
 
+    def _get_fields_to_update_search_data_for(
+        self,
+        table: Table,
+        model: Type[GeneratedTableModel],
+        updated_fields: List["Field"],
+        dependant_fields: List["Field"],
+    ) -> List["Field"]:
+        """
+        Returns the fields of the table of which the search data must be updated
+        after the provided fields have been updated in some rows. This includes the
+        fields that are always updated, like the last modified field, and the
+        dependant fields in the same table. The dependant fields in other tables are
+        updated by the update collector.
+        """
+
+        fields = updated_fields + [
+            field for field in dependant_fields if field.table_id == table.id
+        ]
+        fields += [
+            field_object["field"]
+            for field_object in model.get_field_objects_to_always_update()
+        ]
+        return list({field.id: field for field in fields}.values())
+
     def update_rows(
         self,
         user: AbstractUser,
@@ -1639,6 +1918,9 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         )
 
         field_objects_to_always_update = model.get_field_objects_to_always_update()
+        # Only the search data of the updated fields has to be updated, so the rows
+        # don't have to be marked as needing a background update.
+        update_search_per_field = table.tsvectors_are_supported
         rows_relationships = []
         for obj in rows_to_update:
             # The `updated_on` field is not updated with `bulk_update`,
@@ -1652,7 +1934,9 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             for field_object in field_objects_to_always_update:
                 updated_field_ids.add(field_object["field"].id)
 
-            if table.needs_background_update_column_added:
+            if table.needs_background_update_column_added and not (
+                update_search_per_field
+            ):
                 setattr(obj, ROW_NEEDS_BACKGROUND_UPDATE_COLUMN_NAME, True)
 
             prepared_values = prepared_rows_values_by_id[obj.id]
@@ -1743,7 +2027,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         if getattr(model, LAST_MODIFIED_BY_COLUMN_NAME, None):
             bulk_update_fields.append(LAST_MODIFIED_BY_COLUMN_NAME)
 
-        if table.needs_background_update_column_added:
+        if table.needs_background_update_column_added and not update_search_per_field:
             bulk_update_fields.append(ROW_NEEDS_BACKGROUND_UPDATE_COLUMN_NAME)
         for field in model._field_objects.values():
             field_name = field["name"]
@@ -1760,15 +2044,20 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             model.objects.bulk_update(rows_to_update, bulk_update_fields)
             rows_updated_counter.add(len(rows_to_update))
 
+        deleted_m2m_rels_per_link_field = (
+            m2m_change_tracker.get_deleted_link_row_rels_for_update_collector()
+        )
         update_collector = FieldUpdateCollector(
             table,
             starting_row_ids=row_ids,
-            deleted_m2m_rels_per_link_field=m2m_change_tracker.get_deleted_link_row_rels_for_update_collector(),
+            deleted_m2m_rels_per_link_field=deleted_m2m_rels_per_link_field,
+            mark_starting_rows_as_needing_background_update=not update_search_per_field,
         )
         field_cache = FieldCache()
         field_cache.cache_model(model)
 
         dependant_fields = []
+        has_pending_dependant_fields = False
         for (
             dependant_field,
             dependant_field_type,
@@ -1779,6 +2068,11 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             field_cache,
             associated_relations_changed=True,
         ):
+            if table.eventual_dependency_updates and path_to_starting_table:
+                # The dependant fields in other tables are updated in the background.
+                has_pending_dependant_fields = True
+                continue
+
             dependant_fields.append(dependant_field)
             dependant_field_type.row_of_dependency_updated(
                 dependant_field,
@@ -1789,10 +2083,27 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             )
         update_collector.apply_updates_and_get_updated_fields(field_cache)
 
+        if has_pending_dependant_fields:
+            PendingDependencyUpdateHandler.add_pending_updates(
+                table, updated_field_ids, row_ids, deleted_m2m_rels_per_link_field
+            )
+
         from baserow.contrib.database.views.handler import ViewHandler
 
         ViewHandler().field_value_updated(updated_fields + dependant_fields)
-        SearchHandler.field_value_updated_or_created(table)
+        if update_search_per_field:
+            SearchHandler.field_values_of_rows_updated(
+                table,
+                row_ids,
+                self._get_fields_to_update_search_data_for(
+                    table,
+                    model,
+                    [model._field_objects[i]["field"] for i in updated_field_ids],
+                    dependant_fields,
+                ),
+            )
+        else:
+            SearchHandler.field_value_updated_or_created(table)
 
         updated_rows_to_return = list(
             model.objects.all().enhance_by_fields().filter(id__in=row_ids)
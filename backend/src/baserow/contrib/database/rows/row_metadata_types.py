@@ -0,0 +1,31 @@
+from typing import Any, Dict, List
+
+from rest_framework import serializers
+from rest_framework.fields import Field
+
+from baserow.contrib.database.fields.dependencies.pending_updates import (
+    PendingDependencyUpdateHandler,
+)
+from baserow.contrib.database.rows.registries import RowMetadataType
+
+
+class PendingDependencyUpdatesMetadataType(RowMetadataType):
+    type = "pending_dependency_updates"
+
+    def generate_metadata_for_rows(
+        self, user, table, row_ids: List[int]
+    ) -> Dict[int, Any]:
+        stale_row_ids = (
+            PendingDependencyUpdateHandler.get_row_ids_with_stale_dependant_fields(
+                table, row_ids
+            )
+        )
+        return {row_id: True for row_id in stale_row_ids}
+
+    def get_example_serializer_field(self) -> Field:
+        return serializers.BooleanField(
+            help_text="Present and true if a field of this row depends on a row "
+            "of a linked table with the eventual dependency updates enabled, and "
+            "has not been updated yet.",
+            required=False,
+        )
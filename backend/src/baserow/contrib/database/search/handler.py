@@ -1,7 +1,10 @@
 import math
+import time
 import traceback
+import uuid
+from collections import defaultdict
 from enum import Enum
-from typing import TYPE_CHECKING, List, NamedTuple, Optional, Type
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Tuple, Type
 
 from django.conf import settings
 from django.contrib.postgres.indexes import GinIndex
@@ -21,6 +24,7 @@ from baserow.contrib.database.search.exceptions import (
     PostgresFullTextSearchDisabledException,
 )
 from baserow.contrib.database.search.expressions import LocalisedSearchVector
+from baserow.contrib.database.search.models import PendingSearchValueUpdate
 from baserow.contrib.database.search.regexes import (
     RE_ONE_OR_MORE_WHITESPACE,
     RE_REMOVE_ALL_PUNCTUATION_ALREADY_REMOVED_FROM_TSVS_FOR_QUERY,
@@ -52,9 +56,22 @@ class SearchModes(str, Enum):
     # method is much faster as tables grow in size.
     MODE_FT_WITH_COUNT = "full-text-with-count"
 
+    # Use this mode to search rows using Postgres full-text search, ordered by how
+    # well they match the search term instead of by the view sorting. The rows are
+    # not counted, so that only the best matching page of rows has to be found.
+    # This is meant for search-as-you-type on large tables.
+    MODE_FT_RANKED = "full-text-ranked"
+
 
 ALL_SEARCH_MODES = [getattr(mode, "value") for mode in SearchModes]
 
+# The `(start_id, end_id)` of a range of rows, where the start is inclusive, the end
+# exclusive and `None` means unbounded.
+IdRange = Tuple[Optional[int], Optional[int]]
+
+PARALLEL_TSV_UPDATE_CACHE_TIMEOUT = 60 * 60 * 24
+PARALLEL_TSV_UPDATE_POLL_INTERVAL_SECONDS = 1
+
 
 class FieldWithSearchVector(NamedTuple):
     field: "Field"
@@ -465,6 +482,36 @@ class SearchHandler(
             progress_builder, child_total=1000 if must_vacuum else 800
         )
 
+        id_ranges = (
+            cls.get_parallel_tsvector_update_id_ranges(qs)
+            if was_full_column_update and collected_vectors
+            else []
+        )
+        if len(id_ranges) > 1:
+            # The ranges are updated by multiple workers, the last one to finish
+            # vacuums the table.
+            update_id = cls.start_parallel_tsvector_update(
+                table, id_ranges, field_ids_to_restrict_update_to
+            )
+            if progress_builder is not None:
+                # The caller reports the progress of the update, so it must only
+                # return once all the rows have been updated.
+                cls.wait_for_parallel_tsvector_update(
+                    table,
+                    update_id,
+                    id_ranges,
+                    field_ids_to_restrict_update_to,
+                    progress.create_child_builder(
+                        represents_progress=1000 if must_vacuum else 800
+                    ),
+                )
+            else:
+                progress.increment(1000 if must_vacuum else 800)
+            return
+
+        if update_tsvectors_for_changed_rows_only:
+            cls.run_pending_search_value_updates(table, model)
+
         rows_updated_count = cls.run_tsvector_update_statement(
             collected_vectors,
             qs,
@@ -475,6 +522,10 @@ class SearchHandler(
             progress_builder=progress.create_child_builder(represents_progress=800),
         )
 
+        if update_tsvectors_for_changed_rows_only:
+            # Batches could have been added while the marked rows were updated.
+            cls.run_pending_search_value_updates(table, model)
+
         if must_vacuum:
             progress.increment(state="Vacuuming")
             cls.vacuum_table(table)
@@ -494,6 +545,300 @@ class SearchHandler(
                 table_id=table.id,
             )
 
+    @classmethod
+    def get_parallel_tsvector_update_id_ranges(cls, qs: QuerySet) -> List[IdRange]:
+        """
+        Splits the rows of the queryset into at most
+        `TSV_UPDATE_MAX_PARALLEL_RANGES` ranges of ids containing roughly the same
+        number of rows, so that they can be updated in parallel. An empty list is
+        returned if the table is too small to be worth splitting, meaning it must be
+        updated by a single worker.
+
+        :param qs: The queryset containing the rows that must be updated.
+        :return: The `(start_id, end_id)` ranges, ordered by id.
+        """
+
+        max_ranges = settings.TSV_UPDATE_MAX_PARALLEL_RANGES
+        if max_ranges < 2:
+            return []
+
+        total_count = qs.count()
+        range_count = min(
+            max_ranges, total_count // settings.TSV_UPDATE_MIN_ROWS_PER_RANGE
+        )
+        if range_count < 2:
+            return []
+
+        rows_per_range = math.ceil(total_count / range_count)
+        ids = qs.order_by("id").values_list("id", flat=True)
+        starts = [None] + [
+            ids[index * rows_per_range] for index in range(1, range_count)
+        ]
+        return list(zip(starts, starts[1:] + [None]))
+
+    @classmethod
+    def get_parallel_tsvector_update_cache_key(cls, table: "Table") -> str:
+        return f"parallel_tsvector_update_{table.id}"
+
+    @classmethod
+    def start_parallel_tsvector_update(
+        cls,
+        table: "Table",
+        id_ranges: List[IdRange],
+        field_ids_to_restrict_update_to: Optional[List[int]] = None,
+    ) -> str:
+        """
+        Dispatches a task per id range that updates the tsvector columns of the rows
+        in that range. The number of remaining ranges and updated rows are kept in
+        the cache, so that the progress of all the workers can be followed using
+        `get_parallel_tsvector_update_progress`, and the last worker to finish knows
+        it must vacuum the table.
+
+        :param table: The table which we're going to update.
+        :param id_ranges: The id ranges that must be updated in parallel.
+        :param field_ids_to_restrict_update_to: If provided only the fields matching
+            the provided ids will have their tsv columns updated.
+        :return: The id of the parallel update.
+        """
+
+        from baserow.contrib.database.search.tasks import (
+            async_update_tsvector_columns_range,
+        )
+
+        update_id = uuid.uuid4().hex
+        cache_key = cls.get_parallel_tsvector_update_cache_key(table)
+        cache.set_many(
+            {
+                cache_key: update_id,
+                f"{cache_key}_{update_id}_ranges": len(id_ranges),
+                f"{cache_key}_{update_id}_remaining": len(id_ranges),
+                f"{cache_key}_{update_id}_rows_updated": 0,
+            },
+            timeout=PARALLEL_TSV_UPDATE_CACHE_TIMEOUT,
+        )
+
+        logger.info(
+            "Updating table {table_id}'s tsvs in {range_count} parallel ranges.",
+            table_id=table.id,
+            range_count=len(id_ranges),
+        )
+
+        for range_index, (start_id, end_id) in enumerate(id_ranges):
+            async_update_tsvector_columns_range.delay(
+                table.id,
+                update_id,
+                range_index,
+                start_id,
+                end_id,
+                field_ids_to_restrict_update_to=field_ids_to_restrict_update_to,
+            )
+        return update_id
+
+    @classmethod
+    def wait_for_parallel_tsvector_update(
+        cls,
+        table: "Table",
+        update_id: str,
+        id_ranges: List[IdRange],
+        field_ids_to_restrict_update_to: Optional[List[int]] = None,
+        progress_builder: Optional[ChildProgressBuilder] = None,
+    ):
+        """
+        Waits until all the ranges of a parallel update dispatched by
+        `start_parallel_tsvector_update` are done. The ranges that aren't being
+        updated by a worker are updated by the caller itself, so that it doesn't
+        wait on ranges that no worker is free to update, or that were being updated
+        by a worker that was lost.
+
+        :param table: The table which is being updated.
+        :param update_id: The id of the parallel update.
+        :param id_ranges: The id ranges of the parallel update.
+        :param field_ids_to_restrict_update_to: If provided only the fields matching
+            the provided ids will have their tsv columns updated.
+        :param progress_builder: If provided will be used to build a child progress bar
+            and report on this methods progress to the parent of the progress_builder.
+        """
+
+        progress = ChildProgressBuilder.build(
+            progress_builder, child_total=len(id_ranges)
+        )
+        pending_range_indexes = list(range(len(id_ranges)))
+        while True:
+            for range_index in list(pending_range_indexes):
+                if cls.update_tsvector_columns_range(
+                    table,
+                    update_id,
+                    range_index,
+                    *id_ranges[range_index],
+                    field_ids_to_restrict_update_to=field_ids_to_restrict_update_to,
+                ):
+                    pending_range_indexes.remove(range_index)
+                    progress.increment()
+
+            if not pending_range_indexes:
+                return
+            time.sleep(PARALLEL_TSV_UPDATE_POLL_INTERVAL_SECONDS)
+
+    @classmethod
+    def update_tsvector_columns_range(
+        cls,
+        table: "Table",
+        update_id: str,
+        range_index: int,
+        start_id: Optional[int],
+        end_id: Optional[int],
+        field_ids_to_restrict_update_to: Optional[List[int]] = None,
+    ) -> bool:
+        """
+        Updates the tsvector columns of the rows in one of the id ranges dispatched
+        by `start_parallel_tsvector_update`. A postgres advisory lock is held on the
+        range of the update while it's being updated, and the range is skipped if the
+        lock is already held, so that a redelivered task doesn't update the same
+        range concurrently. A range is only marked as done once it has been updated
+        successfully, and only once, so the table is vacuumed when all the ranges of
+        the update are really done.
+
+        :param table: The table which we're going to update.
+        :param update_id: The id of the parallel update the range belongs to.
+        :param range_index: The index of the range in the parallel update.
+        :param start_id: The inclusive start id of the range, or `None` if it's the
+            first range.
+        :param end_id: The exclusive end id of the range, or `None` if it's the last
+            range.
+        :param field_ids_to_restrict_update_to: If provided only the fields matching
+            the provided ids will have their tsv columns updated.
+        :return: Whether the range is done, which is not the case if it's still
+            being updated by another worker.
+        """
+
+        if not SearchHandler.full_text_enabled():
+            raise PostgresFullTextSearchDisabledException()
+
+        cache_key = f"{cls.get_parallel_tsvector_update_cache_key(table)}_{update_id}"
+        range_done_cache_key = f"{cache_key}_range_{range_index}_done"
+        if cache.get(range_done_cache_key):
+            return True
+
+        # The ranges of concurrent updates of the same table have different lock
+        # keys, so that a range of a newer update is never skipped because the same
+        # range of an older update is still being updated.
+        lock_key = [table.id, f"{update_id}_{range_index}"]
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_try_advisory_lock(%s, hashtext(%s))", lock_key)
+            locked = cursor.fetchone()[0]
+        if not locked:
+            logger.info(
+                "Skipping range {range_index} of table {table_id}'s parallel tsvs "
+                "update because it's already being updated.",
+                range_index=range_index,
+                table_id=table.id,
+            )
+            return False
+
+        try:
+            model = table.get_model()
+            qs = model.objects.all()
+            if start_id is not None:
+                qs = qs.filter(id__gte=start_id)
+            if end_id is not None:
+                qs = qs.filter(id__lt=end_id)
+
+            rows_updated_count = 0
+            collected_vectors = cls._collect_search_vectors(
+                model, qs, field_ids_to_restrict_update_to
+            )
+            if collected_vectors:
+                rows_updated_count = cls.run_tsvector_update_statement(
+                    collected_vectors,
+                    qs,
+                    set_background_updated_false=(
+                        field_ids_to_restrict_update_to is None
+                    ),
+                    update_tsvectors_for_changed_rows_only=False,
+                )
+        finally:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT pg_advisory_unlock(%s, hashtext(%s))", lock_key)
+
+        cls._finish_parallel_tsvector_update_range(
+            table, update_id, range_index, rows_updated_count or 0
+        )
+        return True
+
+    @classmethod
+    def _finish_parallel_tsvector_update_range(
+        cls,
+        table: "Table",
+        update_id: str,
+        range_index: int,
+        rows_updated_count: int,
+    ):
+        cache_key = f"{cls.get_parallel_tsvector_update_cache_key(table)}_{update_id}"
+        # A range can be updated again if its task is redelivered, but it must only
+        # be counted once.
+        if not cache.add(
+            f"{cache_key}_range_{range_index}_done",
+            True,
+            timeout=PARALLEL_TSV_UPDATE_CACHE_TIMEOUT,
+        ):
+            return
+
+        try:
+            cache.incr(f"{cache_key}_rows_updated", rows_updated_count)
+            remaining = cache.decr(f"{cache_key}_remaining")
+        except ValueError:
+            # The progress expired from the cache, so we can't know whether this
+            # was the last range.
+            return
+
+        if remaining != 0:
+            return
+
+        if settings.AUTO_VACUUM_AFTER_SEARCH_UPDATE and not settings.TESTS:
+            cls.vacuum_table(table)
+        logger.info(
+            "Updated {rows_updated_count} rows in table {table_id}'s tsvs in parallel "
+            "ranges.",
+            rows_updated_count=cache.get(f"{cache_key}_rows_updated"),
+            table_id=table.id,
+        )
+
+    @classmethod
+    def get_parallel_tsvector_update_progress(
+        cls, table: "Table"
+    ) -> Optional[Dict[str, int]]:
+        """
+        Returns the aggregated progress of the last parallel tsvector update of the
+        table, or `None` if there isn't one.
+
+        :param table: The table to get the progress for.
+        :return: A dict containing the total number of `ranges`, the number of
+            `ranges_done` and the number of `rows_updated` by all the workers.
+        """
+
+        cache_key = cls.get_parallel_tsvector_update_cache_key(table)
+        update_id = cache.get(cache_key)
+        if update_id is None:
+            return None
+
+        cache_key = f"{cache_key}_{update_id}"
+        values = cache.get_many(
+            [
+                f"{cache_key}_ranges",
+                f"{cache_key}_remaining",
+                f"{cache_key}_rows_updated",
+            ]
+        )
+        if len(values) != 3:
+            return None
+
+        ranges = values[f"{cache_key}_ranges"]
+        return {
+            "ranges": ranges,
+            "ranges_done": ranges - max(values[f"{cache_key}_remaining"], 0),
+            "rows_updated": values[f"{cache_key}_rows_updated"],
+        }
+
     @classmethod
     def vacuum_table(cls, table):
         with connection.cursor() as cursor:
@@ -706,6 +1051,114 @@ class SearchHandler(
         else:
             progress.increment(1000)
 
+    @classmethod
+    def run_pending_search_value_updates(
+        cls, table: "Table", model: Type["GeneratedTableModel"]
+    ) -> int:
+        """
+        Updates the tsvector columns of the changed fields of the rows in the pending
+        batches created by `field_values_of_rows_updated`. Batches changing the same
+        fields are combined into a single update. The batches are locked while
+        they're being processed, so they can safely be processed by multiple workers
+        at the same time. If the tsvectors of a batch can't be updated, then its rows
+        are marked with `needs_background_update` instead, so that the more forgiving
+        update of all the fields takes care of them.
+
+        :param table: The table of which the pending batches must be processed.
+        :param model: The model of the table.
+        :return: The number of batches that have been processed.
+        """
+
+        processed_count = 0
+        while True:
+            with transaction.atomic():
+                batches = list(
+                    PendingSearchValueUpdate.objects.filter(table=table)
+                    .select_for_update(skip_locked=True)
+                    .values_list("id", "field_ids", "row_ids")[
+                        : settings.TSV_UPDATE_CHUNK_SIZE
+                    ]
+                )
+                if not batches:
+                    return processed_count
+
+                row_ids_per_field_ids = defaultdict(set)
+                for _, field_ids, row_ids in batches:
+                    row_ids_per_field_ids[frozenset(field_ids)].update(row_ids)
+
+                for field_ids, row_ids in row_ids_per_field_ids.items():
+                    cls._update_tsvector_columns_of_rows(
+                        model, list(row_ids), list(field_ids)
+                    )
+
+                PendingSearchValueUpdate.objects.filter(
+                    id__in=[batch_id for batch_id, _, _ in batches]
+                ).delete()
+                processed_count += len(batches)
+
+    @classmethod
+    def _update_tsvector_columns_of_rows(
+        cls,
+        model: Type["GeneratedTableModel"],
+        row_ids: List[int],
+        field_ids: List[int],
+    ):
+        qs = model.objects.filter(id__in=row_ids)
+        collected_vectors = cls._collect_search_vectors(model, qs, field_ids)
+        if not collected_vectors:
+            return
+
+        try:
+            with transaction.atomic():
+                qs.update(
+                    **{
+                        cv.field_tsv_db_column: cv.search_vector
+                        for cv in collected_vectors
+                    }
+                )
+        except Exception as e:
+            logger.error(
+                "Failed to update the search vectors of fields {field_ids} because "
+                "of {e}. Marking the rows as needing a background update instead.",
+                field_ids=field_ids,
+                e=str(e),
+            )
+            exception_capturer(e)
+            qs.update(**{ROW_NEEDS_BACKGROUND_UPDATE_COLUMN_NAME: Value(True)})
+
+    @classmethod
+    def field_values_of_rows_updated(
+        cls,
+        table: "Table",
+        row_ids: List[int],
+        updated_fields: List["Field"],
+    ):
+        """
+        Called when only the values of the provided fields of the provided rows have
+        changed. Instead of relying on the `needs_background_update` column, which
+        the caller must not have set, a pending batch is created so that the
+        background task only updates the tsvector columns of the changed fields.
+        Must be called in the same transaction as the one updating the rows.
+
+        :param table: The table the rows belong to.
+        :param row_ids: The ids of the rows that have been updated.
+        :param updated_fields: The fields of the table of which the values changed.
+            This must include the dependant fields in the same table.
+        """
+
+        if not table.tsvectors_are_supported:
+            return
+
+        field_ids = sorted({field.id for field in updated_fields})
+        if field_ids and row_ids:
+            PendingSearchValueUpdate.objects.create(
+                table=table, field_ids=field_ids, row_ids=row_ids
+            )
+
+        # The task also updates the rows of this table that have been marked with
+        # `needs_background_update` because they depend on the updated rows.
+        cls.field_value_updated_or_created(table)
+
     @classmethod
     def field_value_updated_or_created(
         cls,
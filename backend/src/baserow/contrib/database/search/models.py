@@ -0,0 +1,28 @@
+from django.contrib.postgres.fields import ArrayField
+from django.db import models
+
+
+class PendingSearchValueUpdate(models.Model):
+    """
+    A batch of rows of which only the values of some fields have changed. Instead of
+    marking these rows with `needs_background_update`, which results in the tsvector
+    columns of all the fields being updated, only the tsvector columns of the
+    changed fields are updated by the background task.
+    """
+
+    table = models.ForeignKey(
+        "database.Table",
+        on_delete=models.CASCADE,
+        help_text="The table that the rows belong to.",
+    )
+    field_ids = ArrayField(
+        models.PositiveIntegerField(),
+        help_text="The ids of the fields of which the values have changed.",
+    )
+    row_ids = ArrayField(
+        models.PositiveIntegerField(),
+        help_text="The ids of the rows of which the values have changed.",
+    )
+
+    class Meta:
+        ordering = ("id",)
@@ -40,3 +40,45 @@ def async_update_tsvector_columns(
         )
     except PostgresFullTextSearchDisabledException:
         logger.debug(f"Postgres full-text search is disabled.")
+
+
+@app.task(
+    queue="export",
+    time_limit=settings.CELERY_SEARCH_UPDATE_HARD_TIME_LIMIT,
+)
+def async_update_tsvector_columns_range(
+    table_id: int,
+    update_id: str,
+    range_index: int,
+    start_id: Optional[int],
+    end_id: Optional[int],
+    field_ids_to_restrict_update_to: Optional[List[int]] = None,
+):
+    """
+    Responsible for asynchronously updating the `tsvector` columns of one range of
+    rows of a table, as part of an update that's split over multiple workers.
+
+    :param table_id: The ID of the table we'd like to update the tsvectors for.
+    :param update_id: The id of the parallel update the range belongs to.
+    :param range_index: The index of the range in the parallel update.
+    :param start_id: The inclusive start id of the range, or `None` if unbounded.
+    :param end_id: The exclusive end id of the range, or `None` if unbounded.
+    :param field_ids_to_restrict_update_to: If provided only the fields matching the
+        provided ids will have their tsv columns updated.
+    """
+
+    from baserow.contrib.database.search.handler import SearchHandler
+    from baserow.contrib.database.table.handler import TableHandler
+
+    table = TableHandler().get_table(table_id)
+    try:
+        SearchHandler.update_tsvector_columns_range(
+            table,
+            update_id,
+            range_index,
+            start_id,
+            end_id,
+            field_ids_to_restrict_update_to,
+        )
+    except PostgresFullTextSearchDisabledException:
+        logger.debug(f"Postgres full-text search is disabled.")
@@ -12,30 +12,369 @@ When we construct a model we:
 3. Check if the version in the cache matches the latest table version in the db.
 4. If they differ, re-query for all the fields and save them in the cache.
 5. If they are the same use the cached field attrs.
+
+On top of that every worker process keeps a bounded in-memory LRU of the finished
+generated model classes. An entry is only reused when the versions of the table and of
+every table it is connected to via link row fields still match the versions in the
+database, so constructing the same model class over and over again for repeated
+requests is avoided.
+
+When the models of multiple tables are needed at once, `prefetched_table_models` can
+be used to fetch the versions of all the involved tables in one query and all their
+cached field attrs with one `get_many`.
 """
+import threading
 import typing
 import uuid
-from typing import Any, Dict, Optional
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from copy import copy
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Optional, Tuple, Type
 
 from django.conf import settings
 from django.core.cache import caches
 from django.core.exceptions import ImproperlyConfigured
+from django.db.models import Q
 
 from baserow.version import VERSION as BASEROW_VERSION
 
 if typing.TYPE_CHECKING:
-    from baserow.contrib.database.table.models import Table
+    from baserow.contrib.database.table.models import GeneratedTableModel, Table
 
 generated_models_cache = caches[settings.GENERATED_MODEL_CACHE_NAME]
 
 
+@dataclass
+class GeneratedModelClassCacheEntry:
+    model: Type["GeneratedTableModel"]
+    # The version of the table at the time the model was created.
+    version: str
+    # The table attributes, other than the fields, that influence the model class.
+    column_flags: Tuple[bool, bool, bool]
+
+    def get_expected_table_versions(self) -> Dict[int, str]:
+        """
+        Returns the versions of all the tables in the model graph. Related models can
+        be lazily added to the graph after the entry has been created, so the
+        versions are collected from the models that are currently in it.
+        """
+
+        versions = {
+            table_id: get_shared_model_attribute(related_model, "baserow_table").version
+            for table_id, related_model in list(self.model.baserow_m2m_models.items())
+        }
+        versions[self.model.baserow_table_id] = self.version
+        return versions
+
+
+class GeneratedModelClassCache:
+    """
+    A thread safe, size bounded, in process LRU cache of generated model classes keyed
+    by the table id. It's up to the caller to check if an entry still matches the
+    latest table versions.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[int, GeneratedModelClassCacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, table_id: int) -> Optional[GeneratedModelClassCacheEntry]:
+        with self._lock:
+            entry = self._entries.get(table_id)
+            if entry is not None:
+                self._entries.move_to_end(table_id)
+            return entry
+
+    def set(self, table_id: int, entry: GeneratedModelClassCacheEntry):
+        if self.max_size <= 0:
+            return
+
+        with self._lock:
+            self._entries[table_id] = entry
+            self._entries.move_to_end(table_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, table_id: int):
+        with self._lock:
+            self._entries.pop(table_id, None)
+
+    def record(self, hit: bool):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+            }
+
+
+generated_model_classes_cache = GeneratedModelClassCache(
+    settings.BASEROW_GENERATED_MODEL_CLASS_CACHE_SIZE
+)
+
+
+@dataclass
+class PrefetchedTableModelsState:
+    # Freshly fetched table instances by id.
+    tables: Dict[int, "Table"]
+    # The raw field attrs cache entries by table id. Every entry can only be used
+    # once because the model fields in it can't be shared between model classes.
+    field_attrs_cache_entries: Dict[int, Optional[Dict[str, Any]]] = field(
+        default_factory=dict
+    )
+
+
+_prefetched_table_models_state: ContextVar[
+    Optional[PrefetchedTableModelsState]
+] = ContextVar("prefetched_table_models_state", default=None)
+
+
+def get_table_model_column_flags(table: "Table") -> Tuple[bool, bool, bool]:
+    return (
+        bool(table.needs_background_update_column_added),
+        bool(table.created_by_column_added),
+        bool(table.last_modified_by_column_added),
+    )
+
+
+def get_cached_model_class(table: "Table") -> Optional[Type["GeneratedTableModel"]]:
+    """
+    Refreshes the `version` of the provided table from the database and returns the
+    in process cached generated model class if it's still valid. All the tables in the
+    cached model graph are fetched in the same query, so a cache hit costs exactly as
+    many queries as refreshing the version of the table. In the current context, the
+    freshly fetched table instances and copies of the field instances replace the ones
+    of every model in the graph, so no table or field state leaks from one request
+    into another.
+
+    :param table: The table to get the cached model class for.
+    :return: The cached model class or None if there is no valid entry.
+    """
+
+    entry = generated_model_classes_cache.get(table.id)
+
+    if entry is None:
+        refresh_table_version(table)
+        generated_model_classes_cache.record(hit=False)
+        return None
+
+    fresh_tables = _get_fresh_tables(entry.get_expected_table_versions().keys())
+
+    if table.id not in fresh_tables:
+        # Let Django raise the appropriate `DoesNotExist` error.
+        table.refresh_from_db(fields=["version"])
+
+    table.version = fresh_tables[table.id].version
+
+    if not _entry_is_valid(entry, table, fresh_tables):
+        generated_model_classes_cache.invalidate(table.id)
+        generated_model_classes_cache.record(hit=False)
+        return None
+
+    _attach_fresh_tables(entry.model, table)
+    for table_id, related_model in list(entry.model.baserow_m2m_models.items()):
+        _attach_fresh_tables(
+            related_model, table if table_id == table.id else fresh_tables[table_id]
+        )
+
+    generated_model_classes_cache.record(hit=True)
+    return entry.model
+
+
+def _entry_is_valid(
+    entry: GeneratedModelClassCacheEntry,
+    table: "Table",
+    fresh_tables: Dict[int, "Table"],
+) -> bool:
+    versions = {table_id: t.version for table_id, t in fresh_tables.items()}
+    return (
+        versions == entry.get_expected_table_versions()
+        and get_table_model_column_flags(table) == entry.column_flags
+    )
+
+
+def _get_fresh_tables(table_ids: Iterable[int]) -> Dict[int, "Table"]:
+    table_ids = list(table_ids)
+    state = _prefetched_table_models_state.get()
+    if state is not None and all(table_id in state.tables for table_id in table_ids):
+        return {table_id: state.tables[table_id] for table_id in table_ids}
+
+    from baserow.contrib.database.table.models import Table
+
+    return Table.objects_and_trash.in_bulk(table_ids)
+
+
+def refresh_table_version(table: "Table"):
+    """
+    Refreshes the `version` of the provided table from the database, unless it has
+    already been fetched by `prefetched_table_models`.
+    """
+
+    state = _prefetched_table_models_state.get()
+    if state is not None and table.id in state.tables:
+        table.version = state.tables[table.id].version
+    else:
+        table.refresh_from_db(fields=["version"])
+
+
+@dataclass
+class ModelClassContextState:
+    # A weak reference, so that the model classes evicted from the cache are not kept
+    # alive by the contexts of long living threads.
+    model: "weakref.ref[Type[GeneratedTableModel]]"
+    table: "Table"
+    # The copies of the field objects of the model, which are lazily made the first
+    # time they're accessed.
+    field_objects: Dict[str, Optional[Dict[int, Dict[str, Any]]]] = field(
+        default_factory=dict
+    )
+
+
+_model_class_context_states: ContextVar[
+    Optional[Dict[int, ModelClassContextState]]
+] = ContextVar("model_class_context_states", default=None)
+_model_class_context_attributes_lock = threading.Lock()
+
+MODEL_CLASS_CONTEXT_ATTRIBUTES = (
+    "baserow_table",
+    "_field_objects",
+    "_trashed_field_objects",
+)
+
+
+class ContextLocalModelAttribute:
+    """
+    Replaces the table and field objects attributes of a cached generated model class,
+    which is shared by all the threads of the worker process. Every context that gets
+    the model class from the cache sees its own fresh table instance and its own
+    copies of the field instances pointing to it, so no table or field state leaks
+    from one request into another and concurrent callers don't overwrite each other's
+    instances. Contexts that didn't get the model class from the cache see the shared
+    instances the model class has been generated with.
+    """
+
+    def __init__(self, name: str, shared_value: Any):
+        self.name = name
+        self.shared_value = shared_value
+
+    def __get__(self, instance, owner):
+        states = _model_class_context_states.get()
+        state = states.get(owner.baserow_table_id) if states else None
+        if state is None or state.model() is not owner:
+            return self.shared_value
+
+        if self.name == "baserow_table":
+            return state.table
+
+        field_objects = state.field_objects.get(self.name)
+        if field_objects is None:
+            field_objects = _copy_field_objects(self.shared_value, state.table)
+            state.field_objects[self.name] = field_objects
+        return field_objects
+
+
+def _copy_field_objects(
+    field_objects: Dict[int, Dict[str, Any]], table: "Table"
+) -> Dict[int, Dict[str, Any]]:
+    copied_field_objects = {}
+    for field_id, field_object in field_objects.items():
+        field_copy = copy(field_object["field"])
+        field_copy.table = table
+        copied_field_objects[field_id] = {**field_object, "field": field_copy}
+    return copied_field_objects
+
+
+def get_shared_model_attribute(model: Type["GeneratedTableModel"], name: str) -> Any:
+    """
+    Returns the value of the attribute that's shared by all the contexts, even if the
+    current context has its own copy of it.
+    """
+
+    value = model.__dict__.get(name)
+    if isinstance(value, ContextLocalModelAttribute):
+        return value.shared_value
+    return getattr(model, name)
+
+
+def _install_context_local_attributes(model: Type["GeneratedTableModel"]):
+    with _model_class_context_attributes_lock:
+        for name in MODEL_CLASS_CONTEXT_ATTRIBUTES:
+            if not isinstance(model.__dict__.get(name), ContextLocalModelAttribute):
+                setattr(
+                    model, name, ContextLocalModelAttribute(name, model.__dict__[name])
+                )
+
+
+def _attach_fresh_tables(model: Type["GeneratedTableModel"], table: "Table"):
+    """
+    Makes the model and all its field instances point to the provided table instance
+    in the current context only, so that related objects cached on the table
+    instances of other contexts aren't reused. The state of the current context is
+    replaced instead of modified, because contexts copied from it share the same dict.
+    """
+
+    _install_context_local_attributes(model)
+    states = dict(_model_class_context_states.get() or {})
+    states[model.baserow_table_id] = ModelClassContextState(
+        model=weakref.ref(model), table=table
+    )
+    _model_class_context_states.set(states)
+
+
+def set_cached_model_class(table: "Table", model: Type["GeneratedTableModel"]):
+    """
+    Stores the generated model class in the in process LRU cache together with the
+    version of the table it has been generated for.
+
+    :param table: The table that the model class has been generated for.
+    :param model: The generated model class.
+    """
+
+    _install_context_local_attributes(model)
+    generated_model_classes_cache.set(
+        table.id,
+        GeneratedModelClassCacheEntry(
+            model=model,
+            version=table.version,
+            column_flags=get_table_model_column_flags(table),
+        ),
+    )
+
+
 def table_model_cache_entry_key(table_id: int) -> str:
     return f"full_table_model_{table_id}_{BASEROW_VERSION}"
 
 
 def get_cached_model_field_attrs(table: "Table") -> Optional[Dict[str, Any]]:
-    cache_key = table_model_cache_entry_key(table.id)
-    cache_entry = generated_models_cache.get(cache_key)
+    state = _prefetched_table_models_state.get()
+    if state is not None and table.id in state.field_attrs_cache_entries:
+        cache_entry = state.field_attrs_cache_entries.pop(table.id)
+    else:
+        cache_key = table_model_cache_entry_key(table.id)
+        cache_entry = generated_models_cache.get(cache_key)
+
+    if state is not None and cache_entry:
+        _attach_prefetched_link_row_tables(cache_entry["field_attrs"], state)
 
     if cache_entry and cache_entry["version"] == table.version:
         return cache_entry["field_attrs"]
@@ -43,6 +382,27 @@ def get_cached_model_field_attrs(table: "Table") -> Optional[Dict[str, Any]]:
         return None
 
 
+def _attach_prefetched_link_row_tables(
+    field_attrs: Dict[str, Any], state: PrefetchedTableModelsState
+):
+    """
+    Sets the already fetched tables as the `link_row_table` of the link row fields,
+    so that generating their related models doesn't query each table separately.
+    """
+
+    from baserow.contrib.database.fields.models import LinkRowField
+
+    for field_objects_key in ("_field_objects", "_trashed_field_objects"):
+        for field_object in field_attrs[field_objects_key].values():
+            field = field_object["field"]
+            if (
+                isinstance(field, LinkRowField)
+                and field.link_row_table_id in state.tables
+                and not LinkRowField.link_row_table.is_cached(field)
+            ):
+                field.link_row_table = state.tables[field.link_row_table_id]
+
+
 def set_cached_model_field_attrs(table: "Table", field_attrs: Dict[str, Any]):
     cache_key = table_model_cache_entry_key(table.id)
     generated_models_cache.set(
@@ -52,8 +412,77 @@ def set_cached_model_field_attrs(table: "Table", field_attrs: Dict[str, Any]):
     )
 
 
+@contextmanager
+def prefetched_table_models(tables: Iterable["Table"]):
+    """
+    Within this context generating the models of the provided tables, and of the
+    tables directly linked to them, doesn't refresh the version and get the cached
+    field attrs per table anymore. Instead the tables are fetched in one query and the
+    cached field attrs of all the tables without a valid cached model class with one
+    `get_many`.
+
+    :param tables: The tables of which the models are going to be generated.
+    """
+
+    tables = list(tables)
+    if settings.BASEROW_DISABLE_MODEL_CACHE or not tables:
+        yield
+        return
+
+    from baserow.contrib.database.table.models import Table
+
+    table_ids = {table.id for table in tables}
+    entries = {
+        table_id: generated_model_classes_cache.get(table_id) for table_id in table_ids
+    }
+    ids_to_fetch = set(table_ids)
+    for entry in entries.values():
+        if entry is not None:
+            ids_to_fetch.update(entry.get_expected_table_versions().keys())
+
+    fresh_tables = {
+        t.id: t
+        for t in Table.objects_and_trash.filter(
+            Q(id__in=ids_to_fetch) | Q(linkrowfield__table_id__in=table_ids)
+        ).distinct()
+    }
+    state = PrefetchedTableModelsState(tables=fresh_tables)
+
+    table_ids_with_valid_entry = set()
+    for table in tables:
+        entry = entries[table.id]
+        if table.id in fresh_tables:
+            table.version = fresh_tables[table.id].version
+        if entry is None:
+            continue
+        entry_tables = {
+            table_id: fresh_tables[table_id]
+            for table_id in entry.get_expected_table_versions().keys()
+            if table_id in fresh_tables
+        }
+        if _entry_is_valid(entry, table, entry_tables):
+            table_ids_with_valid_entry.add(table.id)
+
+    if table_ids_with_valid_entry != table_ids:
+        keys = {
+            table_model_cache_entry_key(table_id): table_id
+            for table_id in fresh_tables.keys() - table_ids_with_valid_entry
+        }
+        cache_entries = generated_models_cache.get_many(keys.keys())
+        state.field_attrs_cache_entries = {
+            table_id: cache_entries.get(key) for key, table_id in keys.items()
+        }
+
+    token = _prefetched_table_models_state.set(state)
+    try:
+        yield
+    finally:
+        _prefetched_table_models_state.reset(token)
+
+
 def clear_generated_model_cache():
     print("Clearing Baserow's internal generated model cache...")
+    generated_model_classes_cache.clear()
     if hasattr(generated_models_cache, "delete_pattern"):
         generated_models_cache.delete_pattern("full_table_model_*")
     elif settings.TESTS:
@@ -70,6 +499,8 @@ def invalidate_table_in_model_cache(table_id: int):
     if settings.BASEROW_DISABLE_MODEL_CACHE:
         return None
 
+    generated_model_classes_cache.invalidate(table_id)
+
     new_version = str(uuid.uuid4())
     # Make sure to invalidate ourselves and any directly connected tables.
     from baserow.contrib.database.table.models import Table
@@ -1,18 +1,24 @@
 import itertools
+import operator
 import re
 from collections import defaultdict
+from functools import reduce
 from types import MethodType
-from typing import Generator, Iterable, List, Optional, Type, TypedDict
+from typing import Dict, Generator, Iterable, List, Optional, Type, TypedDict
 
 from django.apps import apps
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.postgres.indexes import GinIndex
-from django.contrib.postgres.search import SearchQuery, SearchVectorField
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVectorField
 from django.core.exceptions import FieldDoesNotExist as DjangoFieldDoesNotExist
 from django.db import models
+from django.db.models import Case, F
 from django.db.models import Field as DjangoModelFieldClass
-from django.db.models import JSONField, Q, QuerySet, Value
+from django.db.models import FloatField, JSONField, Q, QuerySet, Value, When
+from django.db.models.expressions import Expression, OrderBy
+from django.db.models.functions import Coalesce
+from django.db.models.sql.query import LOOKUP_SEP
 
 from loguru import logger
 from opentelemetry import trace
@@ -33,12 +39,17 @@ from baserow.contrib.database.fields.models import (
     CreatedOnField,
     Field,
     LastModifiedField,
+    LinkRowField,
 )
 from baserow.contrib.database.fields.registries import FieldType, field_type_registry
 from baserow.contrib.database.fields.utils import get_field_id_from_field_key
 from baserow.contrib.database.search.handler import SearchHandler, SearchModes
 from baserow.contrib.database.table.cache import (
+    get_cached_model_class,
     get_cached_model_field_attrs,
+    prefetched_table_models,
+    refresh_table_version,
+    set_cached_model_class,
     set_cached_model_field_attrs,
 )
 from baserow.contrib.database.table.constants import (
@@ -113,10 +124,17 @@ class TableModelQuerySet(MultiFieldPrefetchQuerysetMixin, models.QuerySet):
         self,
         input_search: str,
         only_search_by_field_ids: Optional[Iterable[int]] = None,
+        rank: bool = False,
     ) -> QuerySet:
         """
         Responsible for narrowing the queryset down using Postgres
         full-text search.
+
+        :param input_search: The search term.
+        :param only_search_by_field_ids: Only the fields with these ids are searched.
+        :param rank: If true, the rows are annotated with their `search_rank`, which
+            is the sum of the `ts_rank` of every searched field, and they are ordered
+            by it, best match first. This replaces any existing ordering.
         """
 
         if not input_search or not input_search.strip():
@@ -140,25 +158,91 @@ class TableModelQuerySet(MultiFieldPrefetchQuerysetMixin, models.QuerySet):
 
         self._add_exact_id_search(filter_builder, input_search)
 
-        for field in self.model.get_searchable_fields():
-            if only_search_by_field_ids is None or field.id in only_search_by_field_ids:
-                filter_builder.filter(Q(**{field.tsv_db_column: search_query}))
-        return filter_builder.apply_to_queryset(self)
+        tsv_db_columns = [
+            field.tsv_db_column
+            for field in self.model.get_searchable_fields()
+            if only_search_by_field_ids is None or field.id in only_search_by_field_ids
+        ]
+        for tsv_db_column in tsv_db_columns:
+            filter_builder.filter(Q(**{tsv_db_column: search_query}))
+        queryset = filter_builder.apply_to_queryset(self)
+
+        if rank:
+            queryset = queryset.annotate(
+                search_rank=self._get_search_rank_expression(
+                    input_search, tsv_db_columns, search_query
+                )
+            ).order_by("-search_rank", "id")
+
+        return queryset
+
+    def _get_search_rank_expression(
+        self, input_search: str, tsv_db_columns: List[str], search_query: SearchQuery
+    ) -> Expression:
+        """
+        Returns the expression which sums up the `ts_rank` of the provided tsvector
+        columns. A row of which the id exactly matches the search term is ranked
+        above all the other rows.
+        """
+
+        ranks = [
+            Coalesce(SearchRank(F(tsv_db_column), search_query), 0.0)
+            for tsv_db_column in tsv_db_columns
+        ]
+        row_id = self._get_exact_id_search(input_search)
+        if row_id is not None:
+            ranks.append(
+                Case(
+                    When(id=row_id, then=Value(len(ranks) + 1.0)),
+                    default=Value(0.0),
+                )
+            )
+        if not ranks:
+            return Value(0.0, output_field=FloatField())
+        return reduce(operator.add, ranks)
 
     def _add_exact_id_search(self, filter_builder, input_search):
+        row_id = self._get_exact_id_search(input_search)
+        if row_id is not None:
+            filter_builder.filter(Q(id=row_id))
+
+    def _get_exact_id_search(self, input_search: str) -> Optional[int]:
         try:
             # Search for the row ID if the `input_search` can be cast to an integer.
             stripped_input = input_search.strip()
             # int('0006') will produce 6 but we don't want 0006 to match row 6!
             if not stripped_input.startswith("0"):
-                filter_builder.filter(Q(id=int(stripped_input)))
+                return int(stripped_input)
         except ValueError:
             pass
+        return None
 
     def count(self):
         with cachalot_enabled():
             return super().count()
 
+    def has_default_order(self) -> bool:
+        """
+        Indicates whether the rows are only ordered by their default `order` and
+        `id`, which means that they can be paginated or split up using the
+        `(order, id)` keyset.
+        """
+
+        field_names = []
+        for order_by in self.query.order_by:
+            if isinstance(order_by, str) and not order_by.startswith("-"):
+                field_names.append(order_by)
+            elif (
+                isinstance(order_by, OrderBy)
+                and isinstance(order_by.expression, F)
+                and not order_by.descending
+            ):
+                field_names.append(order_by.expression.name)
+            else:
+                return False
+
+        return field_names in ([], ["order", "id"])
+
     def enhance_by_fields(self):
         """
         Enhances the queryset based on the `enhance_queryset_in_bulk` for each unique
@@ -179,6 +263,44 @@ class TableModelQuerySet(MultiFieldPrefetchQuerysetMixin, models.QuerySet):
             self = field_type.enhance_queryset_in_bulk(self, field_objects)
         return self
 
+    def limit_link_row_prefetches(self, limit: int):
+        """
+        Replaces the prefetches of the link row fields added by `enhance_by_fields`
+        with prefetches that only fetch the first `limit` related rows of every cell,
+        together with the total number of related rows. This should be used when the
+        rows can be related to a lot of rows, and only a preview of the relations has
+        to be loaded.
+
+        :param limit: The maximum number of related rows that must be prefetched per
+            cell.
+        :return: The queryset with the limited link row prefetches.
+        :rtype: QuerySet
+        """
+
+        link_row_field_objects = [
+            field_object
+            for field_object in self.model._field_objects.values()
+            if isinstance(field_object["field"], LinkRowField)
+        ]
+        if not link_row_field_objects:
+            return self
+
+        link_row_names = {
+            field_object["name"] for field_object in link_row_field_objects
+        }
+        lookups = [
+            lookup
+            for lookup in self._prefetch_related_lookups
+            if getattr(lookup, "prefetch_through", lookup).split(LOOKUP_SEP)[0]
+            not in link_row_names
+        ]
+        queryset = self.prefetch_related(None).prefetch_related(*lookups)
+        for field_object in link_row_field_objects:
+            queryset = field_object["type"].enhance_queryset_with_limit(
+                queryset, field_object["name"], limit
+            )
+        return queryset
+
     def search_all_fields(
         self,
         search: str,
@@ -197,7 +319,8 @@ class TableModelQuerySet(MultiFieldPrefetchQuerysetMixin, models.QuerySet):
             ignored and not be filtered.
         :param search_mode: In `MODE_COMPAT` we will use the old search method, using
             the LIKE operator on each column. In `MODE_FT_WITH_COUNT`  we will switch
-            to using Postgres full-text search.
+            to using Postgres full-text search. `MODE_FT_RANKED` also uses full-text
+            search, but orders the rows by how well they match.
         :return: The queryset containing the search queries.
         :rtype: QuerySet
         """
@@ -207,11 +330,15 @@ class TableModelQuerySet(MultiFieldPrefetchQuerysetMixin, models.QuerySet):
 
         # If we are searching with Postgres full text search (whether with
         # or without a COUNT)...
-        if search_mode == SearchModes.MODE_FT_WITH_COUNT:
+        if search_mode in [SearchModes.MODE_FT_WITH_COUNT, SearchModes.MODE_FT_RANKED]:
             # If `USE_PG_FULLTEXT_SEARCH` is enabled, then use
             # the Postgres full-text search functionality instead.
             if self.model.baserow_table.tsvectors_are_supported:
-                return self.pg_search(search, only_search_by_field_ids)
+                return self.pg_search(
+                    search,
+                    only_search_by_field_ids,
+                    rank=search_mode == SearchModes.MODE_FT_RANKED,
+                )
             else:
                 # Otherwise we'll fall back to compat search.
                 return self.compat_search(search, only_search_by_field_ids)
@@ -744,6 +871,12 @@ class Table(
         null=True,
         help_text="Indicates whether the table has had the created_by column added.",
     )
+    eventual_dependency_updates = models.BooleanField(
+        default=False,
+        help_text="Indicates whether the fields of other tables depending on the "
+        "updated rows of this table are recomputed in the background, instead of "
+        "while the rows are updated.",
+    )
 
     class Meta:
         ordering = ("order",)
@@ -770,6 +903,25 @@ class Table(
     def get_database_table_name(self):
         return f"{USER_TABLE_DATABASE_NAME_PREFIX}{self.id}"
 
+    @classmethod
+    def get_models(
+        cls, tables: Iterable["Table"]
+    ) -> Dict[int, Type[GeneratedTableModel]]:
+        """
+        Generates the models of all the provided tables like `get_model` does without
+        any arguments. Instead of refreshing the version and fetching the cached field
+        attrs separately for every table and every directly linked table, the tables
+        are fetched in one query and the cached field attrs with one cache
+        `get_many`.
+
+        :param tables: The tables to generate the models for.
+        :return: The generated models keyed by table id.
+        """
+
+        tables = list({table.id: table for table in tables}.values())
+        with prefetched_table_models(tables):
+            return {table.id: table.get_model() for table in tables}
+
     @baserow_trace(tracer)
     def get_model(
         self,
@@ -813,7 +965,10 @@ class Table(
             Only in very specific limited situations should this be enabled as
             generally Baserow itself manages most aspects of returned generated models.
         :type managed: bool
-        :param use_cache: Indicates whether a cached model can be used.
+        :param use_cache: Indicates whether a cached model can be used. Besides the
+            cached field attributes, this also allows returning a previously generated
+            model class from the in process LRU cache if none of the tables in its
+            model graph have changed.
         :type use_cache: bool
         :param force_add_tsvectors: gtIndicates that we want to forcibly add the table's
             `tsvector` columns.
@@ -893,8 +1048,25 @@ class Table(
             and not settings.BASEROW_DISABLE_MODEL_CACHE
         )
 
+        # The finished model class can only be reused if it's not going to be
+        # connected to an existing graph of models passed in by the caller. Managed
+        # models are only generated to change the schema and are never reused.
+        use_model_class_cache = (
+            use_cache
+            and not managed
+            and manytomany_models is None
+            and field_names is None
+            and not force_add_tsvectors
+        )
+
+        if use_model_class_cache:
+            model = get_cached_model_class(self)
+            if model is not None:
+                return model
+        elif use_cache:
+            refresh_table_version(self)
+
         if use_cache:
-            self.refresh_from_db(fields=["version"])
             field_attrs = get_cached_model_field_attrs(self)
         else:
             field_attrs = None
@@ -974,6 +1146,9 @@ class Table(
         if not model.baserow_m2m_models:
             self._after_model_generation(attrs, model)
 
+        if use_model_class_cache:
+            set_cached_model_class(self, model)
+
         return model
 
     def _add_search_tsvector_fields_to_model(self, field_attrs, indexes, force_add):
@@ -3,6 +3,7 @@ from typing import Any, Dict, List, Optional
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AbstractUser
 from django.db import connection
+from django.utils import timezone
 
 from baserow.contrib.database.db.schema import safe_django_schema_editor
 from baserow.contrib.database.fields.dependencies.handler import FieldDependencyHandler
@@ -415,7 +416,9 @@ class RowsTrashableItemType(TrashableItemType):
         rows_to_restore_queryset = table_model.objects_and_trash.filter(
             id__in=trashed_item.row_ids
         )
-        rows_to_restore_queryset.update(trashed=False)
+        # The rows are marked as updated, like a single restored row, so that they
+        # are for example included again in the exports of the changed rows.
+        rows_to_restore_queryset.update(trashed=False, updated_on=timezone.now())
         rows_to_restore = rows_to_restore_queryset.enhance_by_fields()
         trashed_item.delete()
 
@@ -113,6 +113,13 @@ class FieldAggregationNotSupported(Exception):
     """Raised when the view type does not support field aggregation."""
 
 
+class AggregationCannotBeUpdatedIncrementally(Exception):
+    """
+    Raised when a cached aggregation value can't safely be updated with the
+    aggregated values of the changed rows and must be recomputed instead.
+    """
+
+
 class AggregationTypeDoesNotExist(InstanceTypeDoesNotExist):
     """Raised when trying to get an aggregation type that does not exist."""
 
@@ -1,5 +1,6 @@
 import dataclasses
 import re
+import time
 import traceback
 from collections import defaultdict, namedtuple
 from copy import deepcopy
@@ -14,7 +15,8 @@ from django.core.cache import cache
 from django.core.exceptions import FieldDoesNotExist, ValidationError
 from django.db import connection
 from django.db import models as django_models
-from django.db.models import Count, Q
+from django.db import transaction
+from django.db.models import Count, Exists, ExpressionWrapper, OuterRef, Q, Value
 from django.db.models.expressions import F, OrderBy
 from django.db.models.query import QuerySet
 
@@ -25,14 +27,16 @@ from redis.exceptions import LockNotOwnedError
 
 from baserow.contrib.database.api.utils import get_include_exclude_field_ids
 from baserow.contrib.database.db.schema import safe_django_schema_editor
+from baserow.contrib.database.fields.dependencies.handler import FieldDependencyHandler
 from baserow.contrib.database.fields.exceptions import FieldNotInTable
+from baserow.contrib.database.fields.field_cache import FieldCache
 from baserow.contrib.database.fields.field_filters import (
     FILTER_TYPE_AND,
     AdvancedFilterBuilder,
     FilterBuilder,
 )
 from baserow.contrib.database.fields.field_sortings import OptionallyAnnotatedOrderBy
-from baserow.contrib.database.fields.models import Field
+from baserow.contrib.database.fields.models import Field, LinkRowField
 from baserow.contrib.database.fields.operations import ReadFieldOperationType
 from baserow.contrib.database.fields.registries import field_type_registry
 from baserow.contrib.database.rows.handler import RowHandler
@@ -105,6 +109,7 @@ from baserow.core.utils import (
 )
 
 from .exceptions import (
+    AggregationCannotBeUpdatedIncrementally,
     CannotShareViewTypeError,
     DecoratorValueProviderTypeNotCompatible,
     FieldAggregationNotSupported,
@@ -130,6 +135,7 @@ from .exceptions import (
 )
 from .models import (
     OWNERSHIP_TYPE_COLLABORATIVE,
+    GridViewFieldOptions,
     View,
     ViewDecoration,
     ViewFilter,
@@ -1335,6 +1341,32 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         adapter = ViewGroupedFiltersAdapter(view, model)
         return AdvancedFilterBuilder(adapter).construct_filter_builder()
 
+    def get_batchable_view_filter(
+        self, view: View, model: GeneratedTableModel
+    ) -> Optional[Q]:
+        """
+        Returns the filters of the view as a single Q object that can be combined
+        with the filters of other views in the same query over the table, for
+        example as the filter of an aggregate or as a boolean column. None is
+        returned if that's not possible because the filters need annotations or
+        joins, which would change the rows of the query for the other views.
+
+        :param view: The view to get the filters for.
+        :param model: The generated model of the table of the view.
+        :return: The filters of the view, an empty Q object if the view doesn't
+            filter any rows, or None if the filters can't be combined.
+        """
+
+        if view.filters_disabled:
+            return Q()
+
+        q_filters, annotations = self.get_filter_builder(
+            view, model
+        ).get_filters_and_annotations()
+        if annotations or len(model.objects.filter(q_filters).query.alias_map) > 1:
+            return None
+        return q_filters
+
     def apply_filters(self, view: View, queryset: QuerySet) -> QuerySet:
         """
         Applies the view's filter to the given queryset.
@@ -2592,6 +2624,14 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
 
         return f"_aggregation__{view.pk}_lock"
 
+    def _get_table_aggregation_lock_cache_key(self, table_id: int):
+        """
+        Returns the aggregation lock cache key shared by the views of the specified
+        table of which the aggregations can be computed together.
+        """
+
+        return f"_aggregation__table_{table_id}_lock"
+
     def _get_aggregation_value_cache_key(self, view: View, name: str):
         """
         Returns the aggregation value cache key for the specified view and name.
@@ -2599,6 +2639,67 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
 
         return f"aggregation_value__{view.pk}_{name}"
 
+    def _get_aggregation_requested_cache_key(self, view_id: int):
+        """
+        Returns the cache key indicating that the aggregations of the specified view
+        have been requested and need to be computed.
+        """
+
+        return f"aggregation_requested__{view_id}"
+
+    def _get_table_aggregation_requested_cache_key(self, table_id: int):
+        """
+        Returns the cache key containing the ids of the views of the specified table
+        of which the aggregations might have been requested.
+        """
+
+        return f"aggregation_requested__table_{table_id}"
+
+    def _get_requested_aggregations_view_ids(self, table_id: int) -> Set[int]:
+        """
+        Returns the ids of the views of the specified table of which the
+        aggregations have been requested and still need to be computed.
+        """
+
+        view_ids = cache.get(self._get_table_aggregation_requested_cache_key(table_id))
+        if not view_ids:
+            return set()
+
+        requested = cache.get_many(
+            [self._get_aggregation_requested_cache_key(view_id) for view_id in view_ids]
+        )
+        return {
+            view_id
+            for view_id in view_ids
+            if self._get_aggregation_requested_cache_key(view_id) in requested
+        }
+
+    def _flag_view_aggregations_requested(self, view: View) -> bool:
+        """
+        Flags the aggregations of the view as requested, so that the requests for
+        the other views of the table can compute them together with theirs.
+
+        :return: Whether the aggregations of other views of the table have been
+            requested as well.
+        """
+
+        other_view_ids = self._get_requested_aggregations_view_ids(view.table_id)
+        other_view_ids.discard(view.id)
+        # Setting the ids isn't atomic, so the view of a concurrent request can be
+        # left out. That view is then not computed together with the others, but
+        # by its own request.
+        cache.set_many(
+            {
+                self._get_aggregation_requested_cache_key(view.id): True,
+                self._get_table_aggregation_requested_cache_key(view.table_id): {
+                    view.id,
+                    *other_view_ids,
+                },
+            },
+            timeout=10,
+        )
+        return bool(other_view_ids)
+
     def _get_aggregation_version_cache_key(self, view: View, name: str):
         """
         Returns the aggregation version cache key for the specified view and name.
@@ -2606,6 +2707,14 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
 
         return f"aggregation_version__{view.pk}_{name}"
 
+    def _get_aggregation_cached_cache_key(self, table_id: int):
+        """
+        Returns the cache key indicating that aggregation values of views of the
+        specified table have been cached.
+        """
+
+        return f"aggregation_cached__table_{table_id}"
+
     def clear_full_aggregation_cache(self, view: View):
         """
         Clears the cache key for the specified view.
@@ -2625,12 +2734,21 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
             names = [names]
 
         for name in names:
-            cache_key = self._get_aggregation_version_cache_key(view, name)
-            try:
-                cache.incr(cache_key, 1)
-            except ValueError:
-                # No cache key, we create one
-                cache.set(cache_key, 2)
+            self._increment_aggregation_version(view, name)
+
+    def _increment_aggregation_version(self, view: View, name: str) -> int:
+        """
+        Increments the version in cache for the specified view/name and returns the
+        new version.
+        """
+
+        cache_key = self._get_aggregation_version_cache_key(view, name)
+        try:
+            return cache.incr(cache_key, 1)
+        except ValueError:
+            # No cache key, we create one
+            cache.set(cache_key, 2)
+            return 2
 
     def _get_aggregations_to_compute(
         self,
@@ -2744,14 +2862,38 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         ) = self._get_aggregations_to_compute(view, aggregations, no_cache=search)
 
         use_lock = hasattr(cache, "lock")
+        view_filter = None
+        if not search and need_computation:
+            if model is None:
+                model = view.table.get_model()
+            view_filter = self.get_batchable_view_filter(view, model)
+
+        if view_filter is not None:
+            # Let the requests for the other views of the table know that the
+            # aggregations of this view must be computed, so that they can be
+            # computed together.
+            other_views_requested = self._flag_view_aggregations_requested(view)
+
+            coalescing_window = settings.BASEROW_VIEW_AGGREGATIONS_COALESCING_WINDOW_MS
+            if use_lock and other_views_requested and coalescing_window:
+                # Give the requests for the other views of the table that arrive
+                # at the same time the chance to be computed together. This is
+                # done before acquiring the lock shared by the views of the table,
+                # so that it doesn't delay the requests of other views.
+                time.sleep(coalescing_window / 1000)
+
         used_lock = False
         if not search and use_lock and (need_computation or with_total):
             # Lock the cache to avoid many updates when many queries arrive at same
             # times which happens when multiple users are on the same view.
             # This lock is optional. It avoid processing but doesn't break anything
-            # if it fails so the timeout is low.
+            # if it fails so the timeout is low. The views that can be computed
+            # together share a lock, so that their aggregations are computed once.
             cache_lock = cache.lock(
-                self._get_aggregation_lock_cache_key(view), timeout=10
+                self._get_aggregation_lock_cache_key(view)
+                if view_filter is None
+                else self._get_table_aggregation_lock_cache_key(view.table_id),
+                timeout=10,
             )
 
             cache_lock.acquire()
@@ -2761,8 +2903,19 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
             )
             used_lock = True
 
+        if view_filter is not None and need_computation:
+            values.update(
+                self._compute_batched_view_aggregations(
+                    user,
+                    view,
+                    need_computation,
+                    model,
+                    view_filter,
+                    with_total=with_total,
+                )
+            )
         # Do we need to compute some aggregations?
-        if need_computation or with_total:
+        elif need_computation or with_total:
             db_result = self.get_field_aggregations(
                 user,
                 view,
@@ -2777,17 +2930,7 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
             )
 
             if not search:
-                to_cache = {}
-                for key, value in db_result.items():
-                    # We don't cache total value
-                    if key != "total":
-                        to_cache[self._get_aggregation_value_cache_key(view, key)] = {
-                            "value": value,
-                            "version": need_computation[key]["version"],
-                        }
-
-                # Let's cache the newly computed values
-                cache.set_many(to_cache)
+                self._cache_computed_aggregations(view, need_computation, db_result)
 
             # Merged cached values and computed one
             values.update(db_result)
@@ -2861,25 +3004,32 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         if search is not None:
             queryset = queryset.search_all_fields(search, search_mode=search_mode)
 
-        aggregation_dict = {}
-
-        for field_instance, aggregation_type_name in aggregations:
-            field_name = field_instance.db_column
+        return self._aggregate_queryset(
+            view, model, queryset, aggregations, with_total=with_total
+        )
 
-            # Check whether the field belongs to the table.
-            if field_instance.table_id != view.table_id:
-                raise FieldNotInTable(
-                    f"The field {field_instance.pk} does not belong to table "
-                    f"{view.table.id}."
-                )
+    def _aggregate_queryset(
+        self,
+        view: View,
+        model: GeneratedTableModel,
+        queryset: QuerySet,
+        aggregations: Iterable[Tuple[django_models.Field, str]],
+        with_total: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Computes the given (field, aggregation_type) aggregations over the provided
+        queryset of the view's table.
 
-            field = model._field_objects[field_instance.id]["field"]
-            model_field = model._meta.get_field(field_name)
+        :raises FieldNotInTable: When one of the field doesn't belong to the specified
+            view.
+        :return: A dict of aggregation values keyed by field db column.
+        """
 
-            aggregation_type = view_aggregation_type_registry.get(aggregation_type_name)
+        aggregation_dict = {}
 
-            aggregation_dict[field_name] = aggregation_type.get_aggregation(
-                field_name, model_field, field
+        for field_instance, aggregation_type_name in aggregations:
+            aggregation_dict[field_instance.db_column] = self._get_field_aggregation(
+                view, model, field_instance, aggregation_type_name, view.table.row_count
             )
 
         # Check if the returned aggregations contain a `AnnotatedAggregation`,
@@ -2897,6 +3047,448 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
 
         return queryset.aggregate(**aggregation_dict)
 
+    def _get_field_aggregation(
+        self,
+        view: View,
+        model: GeneratedTableModel,
+        field_instance: Field,
+        aggregation_type_name: str,
+        row_count: Optional[int],
+    ) -> Union[django_models.Aggregate, AnnotatedAggregation]:
+        """
+        Returns the aggregation expression of the aggregation type for the field. The
+        row count of the table is used to decide if the aggregation is approximated.
+
+        :raises FieldNotInTable: When the field doesn't belong to the specified view.
+        """
+
+        field_name = field_instance.db_column
+
+        # Check whether the field belongs to the table.
+        if field_instance.table_id != view.table_id:
+            raise FieldNotInTable(
+                f"The field {field_instance.pk} does not belong to table "
+                f"{view.table.id}."
+            )
+
+        field = model._field_objects[field_instance.id]["field"]
+        model_field = model._meta.get_field(field_name)
+
+        aggregation_type = view_aggregation_type_registry.get(aggregation_type_name)
+
+        return aggregation_type.get_aggregation_for_row_count(
+            field_name, model_field, field, row_count
+        )
+
+    def _get_requested_views_aggregations_to_compute(
+        self, view: View, model: GeneratedTableModel
+    ) -> List[Tuple[View, Q, Dict[str, Dict[str, Any]]]]:
+        """
+        Returns the other views of the table of which the aggregations have been
+        requested and still need to be computed, with their batchable filter and the
+        aggregations that need to be computed.
+        """
+
+        other_view_ids = self._get_requested_aggregations_view_ids(view.table_id)
+        other_view_ids.discard(view.id)
+        if not other_view_ids:
+            return []
+
+        other_views = view.specific_class.objects.filter(
+            table_id=view.table_id, id__in=other_view_ids
+        )
+
+        view_type = view_type_registry.get_by_model(view.specific_class)
+        views_to_compute = []
+        for other_view in other_views:
+            _, need_computation = self._get_aggregations_to_compute(
+                other_view, view_type.get_aggregations(other_view)
+            )
+            view_filter = self.get_batchable_view_filter(other_view, model)
+            if need_computation and view_filter is not None:
+                views_to_compute.append((other_view, view_filter, need_computation))
+        return views_to_compute
+
+    def _compute_batched_view_aggregations(
+        self,
+        user: AbstractUser,
+        view: View,
+        need_computation: Dict[str, Dict[str, Any]],
+        model: GeneratedTableModel,
+        view_filter: Q,
+        with_total: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Computes and caches the aggregations of the view that need computation
+        together with the ones of the other views of the same table that have been
+        requested at the same time. They are all computed in a single pass over the
+        table, where every aggregate only includes the rows matching the filters of
+        its view using a `FILTER (WHERE ...)` clause.
+
+        :param user: The user on whose behalf we are requesting the aggregations.
+        :param view: The view to compute the aggregations for.
+        :param need_computation: The aggregations of the view that need to be
+            computed, as returned by `_get_aggregations_to_compute`.
+        :param model: The model for this view table to generate the aggregation
+            query from.
+        :param view_filter: The filters of the view, as returned by
+            `get_batchable_view_filter`.
+        :param with_total: Whether the total row count of the view should be returned
+            in the result.
+        :return: A dict of the computed aggregation values of the view.
+        """
+
+        views_to_compute = self._get_requested_views_aggregations_to_compute(
+            view, model
+        )
+
+        if not views_to_compute:
+            db_result = self.get_field_aggregations(
+                user,
+                view,
+                [
+                    (n["instance"], n["aggregation_type"])
+                    for n in need_computation.values()
+                ],
+                model,
+                with_total=with_total,
+            )
+            self._cache_computed_aggregations(view, need_computation, db_result)
+            cache.delete(self._get_aggregation_requested_cache_key(view.id))
+            return db_result
+
+        CoreHandler().check_permissions(
+            user,
+            ReadAggregationsViewOperationType.type,
+            workspace=view.table.database.workspace,
+            context=view,
+            allow_if_template=True,
+        )
+
+        views_to_compute.insert(0, (view, view_filter, need_computation))
+        annotations = {}
+        aggregation_dict = {}
+        for batched_view, batched_view_filter, to_compute in views_to_compute:
+            for name, computation in to_compute.items():
+                # All the views belong to the same table, so the row count of the
+                # table of the requested view, which is already loaded, is used.
+                aggregation = self._get_field_aggregation(
+                    batched_view,
+                    model,
+                    computation["instance"],
+                    computation["aggregation_type"],
+                    view.table.row_count,
+                )
+                if isinstance(aggregation, AnnotatedAggregation):
+                    annotations.update(aggregation.annotations)
+                    aggregation = aggregation.aggregation
+                aggregation_dict[
+                    f"view_{batched_view.id}_{name}"
+                ] = self._add_filter_to_aggregates(aggregation, batched_view_filter)
+
+        if with_total:
+            aggregation_dict[f"view_{view.id}_total"] = Count(
+                "id", distinct=True, filter=view_filter or None
+            )
+
+        db_result = model.objects.annotate(**annotations).aggregate(**aggregation_dict)
+
+        for batched_view, _, to_compute in views_to_compute:
+            self._cache_computed_aggregations(
+                batched_view,
+                to_compute,
+                {
+                    name: db_result[f"view_{batched_view.id}_{name}"]
+                    for name in to_compute.keys()
+                },
+            )
+        cache.delete_many(
+            [
+                self._get_aggregation_requested_cache_key(batched_view.id)
+                for batched_view, _, _ in views_to_compute
+            ]
+        )
+
+        result = {
+            name: db_result[f"view_{view.id}_{name}"] for name in need_computation
+        }
+        if with_total:
+            result["total"] = db_result[f"view_{view.id}_total"]
+        return result
+
+    def _add_filter_to_aggregates(
+        self, expression: django_models.Expression, q_filter: Q
+    ) -> django_models.Expression:
+        """
+        Returns a copy of the expression where the filter is added to the filter of
+        every aggregate that it contains.
+        """
+
+        if not q_filter or not getattr(expression, "contains_aggregate", False):
+            return expression
+
+        expression = expression.copy()
+        if isinstance(expression, django_models.Aggregate):
+            expression.filter = (
+                q_filter if expression.filter is None else expression.filter & q_filter
+            )
+        else:
+            expression.set_source_expressions(
+                [
+                    self._add_filter_to_aggregates(source, q_filter)
+                    for source in expression.get_source_expressions()
+                ]
+            )
+        return expression
+
+    def _cache_computed_aggregations(
+        self,
+        view: View,
+        need_computation: Dict[str, Dict[str, Any]],
+        values: Dict[str, Any],
+    ):
+        """
+        Caches the computed aggregation values of the view with the version that
+        they have been computed for.
+        """
+
+        cache.set_many(
+            {
+                self._get_aggregation_value_cache_key(view, name): {
+                    "value": value,
+                    "version": need_computation[name]["version"],
+                }
+                for name, value in values.items()
+                # We don't cache total value
+                if name != "total"
+            }
+        )
+        cache.set(self._get_aggregation_cached_cache_key(view.table_id), True)
+
+    def get_incrementally_updatable_aggregations(
+        self,
+        table: Table,
+        model: GeneratedTableModel,
+        field_ids: Iterable[int],
+    ) -> List[Tuple[View, List[Tuple[Field, str]]]]:
+        """
+        Returns, per view of the table, the aggregations of the provided fields and
+        their same row dependants that can be kept up to date with the aggregated
+        values of the changed rows. Nothing is returned if no aggregation of the
+        table has been cached, or if changing the fields can also change the values
+        of other rows of the table, because the cached aggregations must then be
+        recomputed.
+
+        :param table: The table where the rows are changed.
+        :param model: The model of the table.
+        :param field_ids: The ids of the fields of which the values are changed.
+        :return: A list of views with their (field, aggregation_type) list.
+        """
+
+        field_ids = set(field_ids)
+        incremental_types = [
+            aggregation_type.type
+            for aggregation_type in view_aggregation_type_registry.get_all()
+            if aggregation_type.can_be_updated_incrementally
+        ]
+        if not field_ids or not incremental_types:
+            return []
+
+        # Nothing can be updated if no aggregation has been cached, in which case
+        # the row write doesn't have to make any additional query.
+        if not cache.get(self._get_aggregation_cached_cache_key(table.id)):
+            return []
+
+        for field_id in field_ids:
+            field = model._field_objects[field_id]["field"]
+            if isinstance(field, LinkRowField) and field.link_row_table_id == table.id:
+                return []
+
+        field_options = list(
+            GridViewFieldOptions.objects.filter(
+                grid_view__table=table,
+                aggregation_raw_type__in=incremental_types,
+            ).select_related("grid_view", "field")
+        )
+        if not field_options:
+            return []
+
+        field_cache = FieldCache()
+        field_cache.cache_model(model)
+        for (
+            dependant_field,
+            _,
+            path_to_starting_table,
+        ) in FieldDependencyHandler.get_all_dependent_fields_with_type(
+            table.id, field_ids, field_cache, associated_relations_changed=True
+        ):
+            if dependant_field.table_id != table.id:
+                continue
+            if path_to_starting_table:
+                return []
+            field_ids.add(dependant_field.id)
+
+        aggregations_per_view = {}
+        for options in field_options:
+            if options.field_id in field_ids:
+                _, aggregations = aggregations_per_view.setdefault(
+                    options.grid_view_id, (options.grid_view, [])
+                )
+                aggregations.append((options.field, options.aggregation_raw_type))
+        return list(aggregations_per_view.values())
+
+    def get_aggregations_of_rows(
+        self,
+        views_aggregations: List[Tuple[View, List[Tuple[Field, str]]]],
+        model: GeneratedTableModel,
+        row_ids: List[int],
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Computes the aggregations of only the provided rows that are visible in the
+        view, for each view.
+
+        :param views_aggregations: The views with their (field, aggregation_type)
+            list, as returned by `get_incrementally_updatable_aggregations`.
+        :param model: The model of the table.
+        :param row_ids: The ids of the rows to aggregate.
+        :return: A dict of aggregation values keyed by view id.
+        """
+
+        values = {}
+        for view, aggregations in views_aggregations:
+            queryset = self.apply_filters(view, model.objects.filter(id__in=row_ids))
+            values[view.id] = self._aggregate_queryset(
+                view, model, queryset, aggregations
+            )
+        return values
+
+    def update_aggregations_incrementally(
+        self,
+        views_aggregations: List[Tuple[View, List[Tuple[Field, str]]]],
+        removed_values: Optional[Dict[int, Dict[str, Any]]],
+        added_values: Optional[Dict[int, Dict[str, Any]]],
+    ):
+        """
+        Updates the cached aggregations with the aggregated values of the changed
+        rows after the transaction commits. This must be called right after the
+        aggregation cache has been invalidated for the change.
+
+        Because the values cached by other requests while the transaction was still
+        running can't include the change, the versions are incremented again after
+        the commit. A cached value is then only updated to the new version if it has
+        been computed for the version right before the invalidation, and if no other
+        change incremented the version in the meantime, which means that this change
+        of the rows is the only one that it misses. All the other cached values are
+        left invalidated and will be recomputed when needed.
+
+        :param views_aggregations: The views with their (field, aggregation_type)
+            list, as returned by `get_incrementally_updatable_aggregations`.
+        :param removed_values: The aggregations of the rows before they were updated
+            or deleted, as returned by `get_aggregations_of_rows`.
+        :param added_values: The aggregations of the rows after they were created or
+            updated, as returned by `get_aggregations_of_rows`.
+        """
+
+        removed_values = removed_values or {}
+        added_values = added_values or {}
+
+        version_cache_keys = [
+            self._get_aggregation_version_cache_key(view, field.db_column)
+            for view, aggregations in views_aggregations
+            for field, _ in aggregations
+        ]
+        versions = cache.get_many(version_cache_keys)
+
+        def update_cached_aggregations():
+            for view, aggregations in views_aggregations:
+                self._update_view_aggregations_incrementally(
+                    view,
+                    aggregations,
+                    versions,
+                    removed_values.get(view.id, {}),
+                    added_values.get(view.id, {}),
+                )
+
+        transaction.on_commit(update_cached_aggregations)
+
+    def _update_view_aggregations_incrementally(
+        self,
+        view: View,
+        aggregations: List[Tuple[Field, str]],
+        versions: Dict[str, int],
+        removed_values: Dict[str, Any],
+        added_values: Dict[str, Any],
+    ):
+        names = [field.db_column for field, _ in aggregations]
+
+        cache_locks = []
+        if hasattr(cache, "lock"):
+            # The aggregations of the view are computed while holding either the lock
+            # of the view, or the lock of the table if they're computed together with
+            # the ones of other views.
+            for lock_cache_key in [
+                self._get_aggregation_lock_cache_key(view),
+                self._get_table_aggregation_lock_cache_key(view.table_id),
+            ]:
+                cache_lock = cache.lock(lock_cache_key, timeout=10)
+                # The aggregations are being computed by another request, which
+                # could cache a value that already includes this change, so they're
+                # only invalidated.
+                if not cache_lock.acquire(blocking=False):
+                    self._release_aggregation_locks(cache_locks)
+                    self.clear_aggregation_cache(view, names)
+                    return
+                cache_locks.append(cache_lock)
+
+        try:
+            value_cache_keys = {
+                name: self._get_aggregation_value_cache_key(view, name)
+                for name in names
+            }
+            cached_values = cache.get_many(value_cache_keys.values())
+
+            to_cache = {}
+            for field, aggregation_type_name in aggregations:
+                name = field.db_column
+                version = versions.get(
+                    self._get_aggregation_version_cache_key(view, name), 1
+                )
+                new_version = self._increment_aggregation_version(view, name)
+                cached_value = cached_values.get(value_cache_keys[name])
+                if (
+                    cached_value is None
+                    or cached_value["version"] != version - 1
+                    or new_version != version + 1
+                ):
+                    continue
+
+                aggregation_type = view_aggregation_type_registry.get(
+                    aggregation_type_name
+                )
+                try:
+                    value = aggregation_type.get_incrementally_updated_value(
+                        cached_value["value"],
+                        removed_values.get(name),
+                        added_values.get(name),
+                    )
+                except AggregationCannotBeUpdatedIncrementally:
+                    continue
+                to_cache[value_cache_keys[name]] = {
+                    "value": value,
+                    "version": new_version,
+                }
+
+            cache.set_many(to_cache)
+        finally:
+            self._release_aggregation_locks(cache_locks)
+
+    def _release_aggregation_locks(self, cache_locks: List[Any]):
+        for cache_lock in cache_locks:
+            try:
+                cache_lock.release()
+            except LockNotOwnedError:
+                pass
+
     def rotate_view_slug(self, user: AbstractUser, view: View) -> View:
         """
         Rotates the slug of the provided view.
@@ -3324,10 +3916,11 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         fields: List[Field],
         rows: List["GeneratedTableModel"],
         base_queryset: QuerySet,
-    ) -> Dict[Field, QuerySet]:
+    ) -> Dict[Field, List[Dict[str, Any]]]:
         """
         This method calculates the count of each unique value within the provided rows,
-        grouped accordingly.
+        grouped accordingly. The counts of all the group by levels are calculated in a
+        single query using grouping sets.
 
         :param fields: A list of the fields of the group bys in the right order.
         :param rows: The rows of the paginated query set. The unique values will be
@@ -3336,7 +3929,7 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
             This is needed because the rows that must be counted can be outside of
             the paginated range.
         :return: A dictionary where the key is the grouped by field, and the value a
-            queryset containing the count per field.
+            list containing the count per unique value.
         :raises ValueError: if a field is provided that cannot be grouped by.
         """
 
@@ -3375,31 +3968,94 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
                     qs_per_level[level] |= Q(**all_filters)
                     unique_value_per_level[level].add(all_values)
 
-        by_level = {}
-        for level, q in qs_per_level.items():
-            field_names = []
-
-            for field in fields[: level + 1]:
-                field_name = field.db_column
-                field_names.append(field_name)
-
-            # Wrap the queryset to avoid conflicts with annotations, orders, joins,
-            # etc that can have an impact on the count.
-            queryset = base_queryset.model.objects.filter(
-                id__in=base_queryset.clear_multi_field_prefetch().values("id")
-            ).values()
-
-            if len(annotations) > 0:
-                queryset = queryset.annotate(**annotations)
-
-            queryset = (
-                queryset.filter(q)
-                .values(*field_names)
-                .annotate(count=Count("id"))
-                .order_by()
+        if len(qs_per_level) == 0:
+            return {}
+
+        levels = len(qs_per_level)
+        field_names = [field.db_column for field in fields[:levels]]
+
+        # Wrap the queryset to avoid conflicts with annotations, orders, joins,
+        # etc that can have an impact on the count.
+        queryset = base_queryset.model.objects.filter(
+            id__in=base_queryset.clear_multi_field_prefetch().values("id")
+        ).values()
+
+        if len(annotations) > 0:
+            queryset = queryset.annotate(**annotations)
+
+        # Every group of a deeper level is part of a group of the first level, so
+        # only the rows matching the first level must be counted. A deeper level
+        # can contain groups that are not in the provided rows, those are
+        # recognized by whether the rows match the filter of that level.
+        queryset = (
+            queryset.filter(qs_per_level[0])
+            .values(
+                *field_names,
+                **{
+                    f"in_level_{level}": ExpressionWrapper(
+                        qs_per_level[level],
+                        output_field=django_models.BooleanField(),
+                    )
+                    for level in range(1, levels)
+                },
             )
+            .order_by()
+        )
+        compiler = queryset.query.get_compiler(using=queryset.db)
+        sql, params = compiler.as_sql()
+
+        # The select of the compiler doesn't necessarily have the same order as the
+        # fields, so the columns of the fields are looked up to be able to convert
+        # the values using the converters of the fields.
+        group_by_columns = []
+        for expression, _, alias in compiler.select:
+            # Selected model fields don't have an alias, but annotations do.
+            column_name = alias or expression.target.column
+            if column_name in field_names:
+                group_by_columns.append((expression, column_name))
+        converters = compiler.get_converters(
+            [expression for expression, _ in group_by_columns]
+        )
+        column_names = [column_name for _, column_name in group_by_columns]
 
-            by_level[fields[level]] = queryset
+        qn = connection.ops.quote_name
+        select_columns = ", ".join(qn(column_name) for column_name in column_names)
+        grouping_sets = ", ".join(
+            f"({', '.join(qn(field_name) for field_name in field_names[:level + 1])})"
+            for level in range(levels)
+        )
+        in_level_columns = "".join(
+            f", BOOL_OR({qn(f'in_level_{level}')})" for level in range(1, levels)
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                SELECT {select_columns}, COUNT(*),
+                    GROUPING({', '.join(qn(name) for name in field_names)})
+                    {in_level_columns}
+                FROM ({sql}) AS grouped_rows
+                GROUP BY GROUPING SETS ({grouping_sets})
+                """,  # nosec B608
+                params,
+            )
+            results = list(cursor.fetchall())
+
+        by_level = {field: [] for field in fields[:levels]}
+        for result in compiler.apply_converters(results, converters):
+            values = dict(zip(column_names, result))
+            count, grouping, *in_levels = result[len(column_names) :]
+            # The grouping bits of the fields that are not part of the grouping set
+            # are set, so the number of unset bits is the number of grouped fields.
+            level = levels - grouping.bit_length() - 1
+            if level > 0 and not in_levels[level - 1]:
+                continue
+
+            entry = {
+                field_name: values[field_name]
+                for field_name in field_names[: level + 1]
+            }
+            entry["count"] = count
+            by_level[fields[level]].append(entry)
 
         return by_level
 
@@ -3438,8 +4094,9 @@ class CachingPublicViewRowChecker:
     """
     A helper class to check which public views a row is visible in. Will pre-calculate
     upfront for a specific table which public views are always visible, which public
-    views can have row check results cached for and finally will pre-construct and
-    reuse querysets for performance reasons.
+    views can have row check results cached for and finally will pre-construct the
+    visibility expressions of the views, so that the visibility of rows in all the
+    views can be checked with a single query.
     """
 
     def __init__(
@@ -3454,6 +4111,7 @@ class CachingPublicViewRowChecker:
             .prefetch_related("viewfilter_set", "filter_groups")
             .all()
         )
+        self._model = model
         self._updated_field_ids = updated_field_ids
         self._views_with_filters = []
         self._always_visible_views = []
@@ -3477,11 +4135,10 @@ class CachingPublicViewRowChecker:
                 # be visible in this view
                 self._always_visible_views.append(view)
             else:
-                filter_qs = handler.apply_filters(view, model.objects)
                 self._views_with_filters.append(
                     (
                         view,
-                        filter_qs,
+                        self._get_row_visible_expression(handler, view),
                         self._view_row_checks_can_be_cached(view),
                     )
                 )
@@ -3501,19 +4158,10 @@ class CachingPublicViewRowChecker:
         :return: A list of views where the row is visible for this checkers table.
         """
 
-        views = []
-        for view, filter_qs, can_use_cache in self._views_with_filters:
-            if can_use_cache:
-                if row.id not in self._view_row_check_cache[view.id]:
-                    self._view_row_check_cache[view.id][
-                        row.id
-                    ] = self._check_row_visible(filter_qs, row)
-                if self._view_row_check_cache[view.id][row.id]:
-                    views.append(view)
-            elif self._check_row_visible(filter_qs, row):
-                views.append(view)
-
-        return views + self._always_visible_views
+        return [
+            public_view_rows.view
+            for public_view_rows in self.get_public_views_where_rows_are_visible([row])
+        ]
 
     def get_public_views_where_rows_are_visible(self, rows) -> List[PublicViewRows]:
         """
@@ -3531,26 +4179,34 @@ class CachingPublicViewRowChecker:
             are visible for this checkers table.
         """
 
-        visible_views_rows = []
         row_ids = {row.id for row in rows}
-        for view, filter_qs, can_use_cache in self._views_with_filters:
-            if can_use_cache:
-                for id in row_ids:
-                    if id not in self._view_row_check_cache[view.id]:
-                        visible_ids = set(self._check_rows_visible(filter_qs, rows))
-                        for visible_id in visible_ids:
-                            self._view_row_check_cache[view.id][visible_id] = True
-                        break
-                else:
-                    visible_ids = row_ids
-
-                if len(visible_ids) > 0:
-                    visible_views_rows.append(PublicViewRows(view, visible_ids))
+        checked_visible_ids = self._check_rows_visible(
+            [
+                (view, row_visible_expression)
+                for view, row_visible_expression, can_use_cache in (
+                    self._views_with_filters
+                )
+                if not can_use_cache
+                or not row_ids.issubset(self._view_row_check_cache[view.id].keys())
+            ],
+            row_ids,
+        )
 
+        visible_views_rows = []
+        for view, _, can_use_cache in self._views_with_filters:
+            view_row_check_cache = self._view_row_check_cache[view.id]
+            if view.id in checked_visible_ids:
+                visible_ids = checked_visible_ids[view.id]
+                if can_use_cache:
+                    for row_id in row_ids:
+                        view_row_check_cache[row_id] = row_id in visible_ids
             else:
-                visible_ids = set(self._check_rows_visible(filter_qs, rows))
-                if len(visible_ids) > 0:
-                    visible_views_rows.append(PublicViewRows(view, visible_ids))
+                visible_ids = {
+                    row_id for row_id in row_ids if view_row_check_cache[row_id]
+                }
+
+            if len(visible_ids) > 0:
+                visible_views_rows.append(PublicViewRows(view, visible_ids))
 
         for visible_view in self._always_visible_views:
             visible_views_rows.append(
@@ -3559,15 +4215,51 @@ class CachingPublicViewRowChecker:
 
         return visible_views_rows
 
-    # noinspection PyMethodMayBeStatic
-    def _check_row_visible(self, filter_qs, row):
-        return filter_qs.filter(id=row.id).exists()
+    def _get_row_visible_expression(
+        self, handler: ViewHandler, view: View
+    ) -> django_models.Expression:
+        """
+        Returns a boolean expression indicating whether a row of the table is visible
+        in the view. The filters of the view are used directly if possible, otherwise
+        the row is looked up in the filtered rows of the view.
+        """
 
-    # noinspection PyMethodMayBeStatic
-    def _check_rows_visible(self, filter_qs, rows):
-        return filter_qs.filter(id__in=[row.id for row in rows]).values_list(
-            "id", flat=True
-        )
+        view_filter = handler.get_batchable_view_filter(view, self._model)
+        if view_filter is None:
+            filter_qs = handler.apply_filters(view, self._model.objects)
+            return Exists(filter_qs.filter(id=OuterRef("id")))
+        if not view_filter:
+            return Value(True, output_field=django_models.BooleanField())
+        return ExpressionWrapper(view_filter, output_field=django_models.BooleanField())
+
+    def _check_rows_visible(
+        self, views: List[Tuple[View, django_models.Expression]], row_ids: Set[int]
+    ) -> Dict[int, Set[int]]:
+        """
+        Checks in a single query in which of the provided views the rows are visible,
+        by selecting a visibility column per view.
+
+        :return: A dict containing the ids of the visible rows keyed by view id for
+            each of the provided views.
+        """
+
+        if not views:
+            return {}
+
+        annotations = {
+            f"visible_in_view_{view.id}": row_visible_expression
+            for view, row_visible_expression in views
+        }
+        visible_ids = {view.id: set() for view, _ in views}
+        for row_id, *visible_in_views in (
+            self._model.objects.filter(id__in=row_ids)
+            .annotate(**annotations)
+            .values_list("id", *annotations.keys())
+        ):
+            for (view, _), visible in zip(views, visible_in_views):
+                if visible:
+                    visible_ids[view.id].add(row_id)
+        return visible_ids
 
     def _view_row_checks_can_be_cached(self, view):
         if self._updated_field_ids is None:
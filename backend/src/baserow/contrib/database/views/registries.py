@@ -947,6 +947,13 @@ class ViewAggregationType(Instance):
     aggregation. For example you can compute a sum of all values of a field in a table.
     """
 
+    can_be_updated_incrementally = False
+    """
+    Indicates whether a cached value of this aggregation can be updated with the
+    aggregated values of the rows that have been created, updated or deleted, instead
+    of recomputing the aggregation over all the rows of the view.
+    """
+
     def get_aggregation(
         self,
         field_name: str,
@@ -970,6 +977,51 @@ class ViewAggregationType(Instance):
             "Each aggregation type must have his own get_aggregation method."
         )
 
+    def get_aggregation_for_row_count(
+        self,
+        field_name: str,
+        model_field: django_models.Field,
+        field: "Field",
+        row_count: Optional[int],
+    ) -> django_models.Aggregate:
+        """
+        Returns the django aggregation object like `get_aggregation` does, for a
+        table with the provided number of rows. Can be overridden to replace the
+        aggregation by a cheaper variant for large tables.
+
+        :param field_name: The name of the field that needs to be aggregated.
+        :param model_field: The field extracted from the model.
+        :param field: The instance of the underlying baserow field.
+        :param row_count: The last known number of rows of the table of the field, or
+            None if it's unknown.
+        :return: A django aggregation object for this specific field.
+        """
+
+        return self.get_aggregation(field_name, model_field, field)
+
+    def get_incrementally_updated_value(
+        self, value: Any, removed_value: Any, added_value: Any
+    ) -> Any:
+        """
+        Should return the new aggregation value based on the cached value and the
+        aggregation of the changed rows before and after the change. This is only
+        called if `can_be_updated_incrementally` is True.
+
+        :param value: The cached aggregation value of all the rows in the view.
+        :param removed_value: The aggregation of the rows before they were updated or
+            deleted. None if no rows were removed from the aggregation.
+        :param added_value: The aggregation of the rows after they were created or
+            updated. None if no rows were added to the aggregation.
+        :raises AggregationCannotBeUpdatedIncrementally: When the new value can't be
+            computed from the provided values and must be recomputed instead.
+        :return: The new aggregation value.
+        """
+
+        raise NotImplementedError(
+            "Each aggregation type that can be updated incrementally must have his "
+            "own get_incrementally_updated_value method."
+        )
+
     def field_is_compatible(self, field: "Field") -> bool:
         """
         Given a particular instance of a field returns whether the field is supported
@@ -2,6 +2,7 @@ from django.dispatch import Signal, receiver
 
 from baserow.contrib.database.fields import signals as field_signals
 from baserow.contrib.database.fields.models import FileField
+from baserow.contrib.database.rows import signals as row_signals
 
 from .models import GalleryView
 
@@ -89,3 +90,82 @@ def view_loaded_create_indexes_and_columns(sender, view, table_model, **kwargs):
     table = view.table
     if not table.last_modified_by_column_added or not table.created_by_column_added:
         setup_created_by_and_last_modified_by_column.delay(table_id=view.table.id)
+
+
+@receiver(row_signals.rows_created)
+def update_aggregations_after_rows_created(sender, rows, table, model, **kwargs):
+    from baserow.contrib.database.views.handler import ViewHandler
+
+    handler = ViewHandler()
+    views_aggregations = handler.get_incrementally_updatable_aggregations(
+        table, model, model._field_objects.keys()
+    )
+    if views_aggregations:
+        added_values = handler.get_aggregations_of_rows(
+            views_aggregations, model, [row.id for row in rows]
+        )
+        handler.update_aggregations_incrementally(
+            views_aggregations, None, added_values
+        )
+
+
+@receiver(row_signals.before_rows_update)
+def get_aggregations_before_rows_update(
+    sender, rows, table, model, updated_field_ids, **kwargs
+):
+    from baserow.contrib.database.views.handler import ViewHandler
+
+    handler = ViewHandler()
+    views_aggregations = handler.get_incrementally_updatable_aggregations(
+        table, model, updated_field_ids
+    )
+    return {
+        "views_aggregations": views_aggregations,
+        "removed_values": handler.get_aggregations_of_rows(
+            views_aggregations, model, [row.id for row in rows]
+        ),
+    }
+
+
+@receiver(row_signals.rows_updated)
+def update_aggregations_after_rows_updated(
+    sender, rows, model, before_return, **kwargs
+):
+    from baserow.contrib.database.views.handler import ViewHandler
+
+    before = dict(before_return).get(get_aggregations_before_rows_update)
+    if before and before["views_aggregations"]:
+        handler = ViewHandler()
+        added_values = handler.get_aggregations_of_rows(
+            before["views_aggregations"], model, [row.id for row in rows]
+        )
+        handler.update_aggregations_incrementally(
+            before["views_aggregations"], before["removed_values"], added_values
+        )
+
+
+@receiver(row_signals.before_rows_delete)
+def get_aggregations_before_rows_delete(sender, rows, table, model, **kwargs):
+    from baserow.contrib.database.views.handler import ViewHandler
+
+    handler = ViewHandler()
+    views_aggregations = handler.get_incrementally_updatable_aggregations(
+        table, model, model._field_objects.keys()
+    )
+    return {
+        "views_aggregations": views_aggregations,
+        "removed_values": handler.get_aggregations_of_rows(
+            views_aggregations, model, [row.id for row in rows]
+        ),
+    }
+
+
+@receiver(row_signals.rows_deleted)
+def update_aggregations_after_rows_deleted(sender, before_return, **kwargs):
+    from baserow.contrib.database.views.handler import ViewHandler
+
+    before = dict(before_return).get(get_aggregations_before_rows_delete)
+    if before and before["views_aggregations"]:
+        ViewHandler().update_aggregations_incrementally(
+            before["views_aggregations"], before["removed_values"], None
+        )
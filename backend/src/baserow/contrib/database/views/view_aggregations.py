@@ -1,22 +1,29 @@
-from typing import Dict
+from typing import Dict, List, Optional, Union
 
+from django.conf import settings
 from django.db.models import (
     Avg,
     Case,
     Count,
     Exists,
+    F,
     Field,
+    Func,
+    IntegerField,
     ManyToManyField,
     Max,
     Min,
     OuterRef,
+    Q,
     StdDev,
     Sum,
+    TextField,
     Variance,
     When,
 )
+from django.db.models.functions import Cast, Mod
 
-from baserow.contrib.database.db.aggregations import Percentile
+from baserow.contrib.database.db.aggregations import DistinctCountEstimate, Percentile
 from baserow.contrib.database.fields.field_types import (
     AutonumberFieldType,
     BooleanFieldType,
@@ -49,6 +56,7 @@ from baserow.contrib.database.formula.types.formula_types import (
     BaserowFormulaSingleFileType,
 )
 
+from .exceptions import AggregationCannotBeUpdatedIncrementally
 from .registries import ViewAggregationType
 from .utils import AnnotatedAggregation
 
@@ -68,6 +76,86 @@ def get_has_relations_annotation(field_name: str, model_field: Field) -> Dict:
     return {f"has_relations_{field_name}": Exists(subquery)}
 
 
+# One out of this number of rows or values is sampled to compute the approximate
+# aggregations.
+APPROXIMATE_AGGREGATION_SAMPLING_FACTOR = 16
+APPROXIMATE_UNIQUE_COUNT_MIN_VALUE_SAMPLE_COUNT = 100
+APPROXIMATE_AGGREGATION_ROW_SAMPLE = "approximate_aggregation_row_sample"
+
+
+def should_use_approximate_aggregation(row_count: Optional[int]) -> bool:
+    """
+    Returns whether the exact aggregations, which must sort or hash all the values
+    of the field, should be replaced by their approximate variant because the table
+    has more rows than the configured threshold.
+
+    :param row_count: The last known number of rows of the table, or None if it's
+        unknown.
+    """
+
+    threshold = settings.BASEROW_APPROXIMATE_AGGREGATIONS_ROW_COUNT_THRESHOLD
+    return threshold > 0 and (row_count or 0) >= threshold
+
+
+def get_row_sample_annotation() -> Dict:
+    """
+    Generates an annotation dict containing a value which is 0 for a pseudo-random,
+    but deterministic, one out of `APPROXIMATE_AGGREGATION_SAMPLING_FACTOR` rows.
+    """
+
+    row_hash = Func(F("id"), function="hashint4", output_field=IntegerField())
+    return {
+        APPROXIMATE_AGGREGATION_ROW_SAMPLE: Mod(
+            row_hash, APPROXIMATE_AGGREGATION_SAMPLING_FACTOR
+        )
+    }
+
+
+def get_approximate_unique_count_aggregation(field_name: str) -> AnnotatedAggregation:
+    """
+    Returns an aggregation estimating the number of distinct values of the field
+    without having to sort all of them. See `DistinctCountEstimate` for the error
+    bounds and the fallback to the exact count.
+    """
+
+    value_sample = f"{field_name}_value_sample"
+    value_hash = Func(
+        Cast(field_name, TextField()), function="hashtext", output_field=IntegerField()
+    )
+    return AnnotatedAggregation(
+        annotations={
+            value_sample: Mod(value_hash, APPROXIMATE_AGGREGATION_SAMPLING_FACTOR),
+        },
+        aggregation=DistinctCountEstimate(
+            Count(field_name, distinct=True, filter=Q(**{value_sample: 0})),
+            Count(field_name, distinct=True),
+            APPROXIMATE_AGGREGATION_SAMPLING_FACTOR,
+            APPROXIMATE_UNIQUE_COUNT_MIN_VALUE_SAMPLE_COUNT,
+        ),
+    )
+
+
+def get_approximate_percentile_aggregation(
+    field_name: str, percentiles: Union[float, List[float]]
+) -> AnnotatedAggregation:
+    """
+    Returns an aggregation estimating the percentiles of the field based on a sample
+    of one out of `APPROXIMATE_AGGREGATION_SAMPLING_FACTOR` rows, so that only the
+    values of that sample have to be sorted. For a sample of n values, the rank of
+    the estimated p percentile has a standard error of about `sqrt(p * (1 - p) / n)`,
+    which is less than 0.2% of the values for a table of 1M rows.
+    """
+
+    return AnnotatedAggregation(
+        annotations=get_row_sample_annotation(),
+        aggregation=Percentile(
+            field_name,
+            percentiles,
+            filter=Q(**{APPROXIMATE_AGGREGATION_ROW_SAMPLE: 0}),
+        ),
+    )
+
+
 class EmptyCountViewAggregationType(ViewAggregationType):
     """
     The empty count aggregation counts how many values are considered empty for
@@ -75,6 +163,7 @@ class EmptyCountViewAggregationType(ViewAggregationType):
     """
 
     type = "empty_count"
+    can_be_updated_incrementally = True
 
     compatible_field_types = [
         TextFieldType.type,
@@ -123,6 +212,9 @@ class EmptyCountViewAggregationType(ViewAggregationType):
                 filter=field_type.empty_query(field_name, model_field, field),
             )
 
+    def get_incrementally_updated_value(self, value, removed_value, added_value):
+        return value - (removed_value or 0) + (added_value or 0)
+
 
 class NotEmptyCountViewAggregationType(EmptyCountViewAggregationType):
     """
@@ -187,6 +279,26 @@ class UniqueCountViewAggregationType(ViewAggregationType):
             distinct=True,
         )
 
+    def get_aggregation_for_row_count(self, field_name, model_field, field, row_count):
+        if should_use_approximate_aggregation(row_count):
+            return get_approximate_unique_count_aggregation(field_name)
+
+        return super().get_aggregation_for_row_count(
+            field_name, model_field, field, row_count
+        )
+
+
+class ApproximateUniqueCountViewAggregationType(UniqueCountViewAggregationType):
+    """
+    Estimates the count of distinct values for the given field based on samples of
+    the values, which is much faster than the exact count for large tables.
+    """
+
+    type = "approximate_unique_count"
+
+    def get_aggregation(self, field_name, model_field, field):
+        return get_approximate_unique_count_aggregation(field_name)
+
 
 class MinViewAggregationType(ViewAggregationType):
     """
@@ -194,6 +306,7 @@ class MinViewAggregationType(ViewAggregationType):
     """
 
     type = "min"
+    can_be_updated_incrementally = True
 
     compatible_field_types = [
         DateFieldType.type,
@@ -212,6 +325,18 @@ class MinViewAggregationType(ViewAggregationType):
     def get_aggregation(self, field_name, model_field, field):
         return Min(field_name)
 
+    def get_incrementally_updated_value(self, value, removed_value, added_value):
+        # The removed values are only irrelevant if none of them was the minimum
+        # because otherwise the new minimum could be in any of the other rows.
+        if removed_value is not None and (value is None or not removed_value > value):
+            raise AggregationCannotBeUpdatedIncrementally()
+
+        if added_value is None:
+            return value
+        if value is None:
+            return added_value
+        return min(value, added_value)
+
 
 class MaxViewAggregationType(ViewAggregationType):
     """
@@ -219,6 +344,7 @@ class MaxViewAggregationType(ViewAggregationType):
     """
 
     type = "max"
+    can_be_updated_incrementally = True
 
     compatible_field_types = [
         DateFieldType.type,
@@ -238,6 +364,18 @@ class MaxViewAggregationType(ViewAggregationType):
     def get_aggregation(self, field_name, model_field, field):
         return Max(field_name)
 
+    def get_incrementally_updated_value(self, value, removed_value, added_value):
+        # The removed values are only irrelevant if none of them was the maximum
+        # because otherwise the new maximum could be in any of the other rows.
+        if removed_value is not None and (value is None or not removed_value < value):
+            raise AggregationCannotBeUpdatedIncrementally()
+
+        if added_value is None:
+            return value
+        if value is None:
+            return added_value
+        return max(value, added_value)
+
 
 class SumViewAggregationType(ViewAggregationType):
     """
@@ -245,6 +383,7 @@ class SumViewAggregationType(ViewAggregationType):
     """
 
     type = "sum"
+    can_be_updated_incrementally = True
 
     compatible_field_types = [
         NumberFieldType.type,
@@ -258,6 +397,22 @@ class SumViewAggregationType(ViewAggregationType):
     def get_aggregation(self, field_name, model_field, field):
         return Sum(field_name)
 
+    def get_incrementally_updated_value(self, value, removed_value, added_value):
+        if removed_value is not None:
+            if value is None:
+                raise AggregationCannotBeUpdatedIncrementally()
+            value -= removed_value
+            # A sum of zero can't be distinguished from a sum without any values
+            # left, which must be None.
+            if not value and added_value is None:
+                raise AggregationCannotBeUpdatedIncrementally()
+
+        if added_value is None:
+            return value
+        if value is None:
+            return added_value
+        return value + added_value
+
 
 class AverageViewAggregationType(ViewAggregationType):
     """
@@ -339,6 +494,26 @@ class MedianViewAggregationType(ViewAggregationType):
     def get_aggregation(self, field_name, model_field, field):
         return Percentile(field_name, 0.5)
 
+    def get_aggregation_for_row_count(self, field_name, model_field, field, row_count):
+        if should_use_approximate_aggregation(row_count):
+            return get_approximate_percentile_aggregation(field_name, 0.5)
+
+        return super().get_aggregation_for_row_count(
+            field_name, model_field, field, row_count
+        )
+
+
+class ApproximateMedianViewAggregationType(MedianViewAggregationType):
+    """
+    Estimates the median of the values of the given field based on a sample of the
+    rows.
+    """
+
+    type = "approximate_median"
+
+    def get_aggregation(self, field_name, model_field, field):
+        return get_approximate_percentile_aggregation(field_name, 0.5)
+
 
 class DecileViewAggregationType(ViewAggregationType):
     """
@@ -358,6 +533,30 @@ class DecileViewAggregationType(ViewAggregationType):
     def get_aggregation(self, field_name, model_field, field):
         return Percentile(field_name, [x / 10 for x in range(1, 10)])
 
+    def get_aggregation_for_row_count(self, field_name, model_field, field, row_count):
+        if should_use_approximate_aggregation(row_count):
+            return get_approximate_percentile_aggregation(
+                field_name, [x / 10 for x in range(1, 10)]
+            )
+
+        return super().get_aggregation_for_row_count(
+            field_name, model_field, field, row_count
+        )
+
+
+class ApproximateDecileViewAggregationType(DecileViewAggregationType):
+    """
+    Estimates the deciles of the values of the given field based on a sample of the
+    rows.
+    """
+
+    type = "approximate_decile"
+
+    def get_aggregation(self, field_name, model_field, field):
+        return get_approximate_percentile_aggregation(
+            field_name, [x / 10 for x in range(1, 10)]
+        )
+
 
 class RangeViewAggregationType(ViewAggregationType):
     """
@@ -797,3 +797,135 @@ class CombinedForeignKeyAndManyToManyMultipleFieldPrefetch:
                 row_id_to_field_name_to_target_ids[result[0]][result[1]] = result[2]
 
         return row_id_to_field_name_to_target_ids
+
+
+class LimitedManyToManyPrefetch:
+    """
+    This prefetch class can be used as argument of the `multi_field_prefetch` method.
+    It prefetches at most `limit` related instances of a many to many field for every
+    row, ordered by the `order` and `id` of the target model, and counts the total
+    number of related instances per row. This keeps the memory usage bounded when
+    rows are related to a very large number of instances.
+
+    Example:
+
+    results = list(
+        model
+        .objects.all()
+        .multi_field_prefetch(LimitedManyToManyPrefetch("field_1", 10))
+    )
+
+    results[0].field_1.all()  # contains at most 10 prefetched instances
+    results[0]._prefetched_objects_counts["field_1"]  # the total number of instances
+    """
+
+    def __init__(
+        self,
+        field_name: str,
+        limit: int,
+        target_queryset: Optional[QuerySet] = None,
+    ):
+        """
+        :param field_name: The name of the many to many field that must be
+            prefetched.
+        :param limit: The maximum number of related instances that must be fetched
+            per row.
+        :param target_queryset: An optional queryset of the target model that is
+            used to fetch the related instances. This can for example be used to only
+            select and enhance the columns that are needed.
+        """
+
+        self.field_name = field_name
+        self.limit = limit
+        self.target_queryset = target_queryset
+
+    def __call__(self, queryset: QuerySet, result_set: List[ModelInstance]):
+        """
+        This method is called when the queryset resolved. It fetches the limited
+        related ids and total counts of all the rows in one query, and the related
+        instances in another one.
+
+        :param queryset: The queryset that is being resolved.
+        :param result_set: The fetched `result_set` where the prefetched results must
+            be added to.
+        """
+
+        if len(result_set) == 0:
+            return
+
+        model_field = queryset.model._meta.get_field(self.field_name)
+        target_model = model_field.remote_field.model
+        target_queryset = self.target_queryset
+        if target_queryset is None:
+            target_queryset = target_model.objects.all()
+
+        # Filtering on the result of a window function can only be done in a
+        # subquery, which is why this query is written by hand.
+        limited_sql = sql.SQL(
+            """
+            SELECT row_id, target_id, total
+            FROM (
+                SELECT
+                    m2m.{row_id_column} AS row_id,
+                    m2m.{target_id_column} AS target_id,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY m2m.{row_id_column}
+                        ORDER BY target."order", target.id
+                    ) AS row_position,
+                    COUNT(*) OVER (PARTITION BY m2m.{row_id_column}) AS total
+                FROM {m2m_table} AS m2m
+                INNER JOIN {target_table} AS target
+                    ON target.id = m2m.{target_id_column}
+                WHERE m2m.{row_id_column} = ANY(%s) AND NOT target.trashed
+            ) limited
+            WHERE row_position <= %s
+            ORDER BY row_id, row_position
+            """
+        ).format(
+            m2m_table=sql.Identifier(model_field.remote_field.through._meta.db_table),
+            target_table=sql.Identifier(target_model._meta.db_table),
+            row_id_column=sql.Identifier(model_field.m2m_column_name()),
+            target_id_column=sql.Identifier(model_field.m2m_reverse_name()),
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                limited_sql, [[result.id for result in result_set], self.limit]
+            )
+            results = cursor.fetchall()
+
+        row_id_to_target_ids = defaultdict(list)
+        row_id_to_total = {}
+        for row_id, target_id, total in results:
+            row_id_to_target_ids[row_id].append(target_id)
+            row_id_to_total[row_id] = total
+
+        target_instances = {
+            instance.id: instance
+            for instance in target_queryset.filter(
+                id__in={
+                    target_id
+                    for target_ids in row_id_to_target_ids.values()
+                    for target_id in target_ids
+                }
+            )
+        }
+
+        for result in result_set:
+            qs = getattr(result, self.field_name).get_queryset()
+            qs._result_cache = [
+                target_instances[target_id]
+                for target_id in row_id_to_target_ids[result.id]
+                if target_id in target_instances
+            ]
+            qs._prefetch_done = True
+            result._prefetched_objects_cache = getattr(
+                result, "_prefetched_objects_cache", {}
+            )
+            result._prefetched_objects_cache[self.field_name] = qs
+            result._prefetched_objects_counts = getattr(
+                result, "_prefetched_objects_counts", {}
+            )
+            result._prefetched_objects_counts[self.field_name] = row_id_to_total.get(
+                result.id, 0
+            )
@@ -2,6 +2,7 @@ from typing import List, Optional, Type
 
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
+from django.contrib.contenttypes.models import ContentType
 from django.core.cache import cache
 from django.db import transaction
 from django.db.models import Q, QuerySet
@@ -13,7 +14,7 @@ from .cache import job_progress_key
 from .constants import JOB_FAILED, JOB_PENDING
 from .exceptions import JobDoesNotExist, MaxJobCountExceeded
 from .models import Job
-from .registries import job_type_registry
+from .registries import JobType, job_type_registry
 from .tasks import run_async_job
 from .types import AnyJob
 
@@ -193,6 +194,20 @@ class JobHandler:
 
         return job
 
+    def resume_job(self, job: AnyJob):
+        """
+        Schedules a job that has failed or has been interrupted to run again. The
+        job type is responsible for continuing where the job has stopped.
+
+        :param job: The job that must run again.
+        """
+
+        job.state = JOB_PENDING
+        job.error = ""
+        job.human_readable_error = ""
+        job.save(update_fields=("state", "error", "human_readable_error", "updated_on"))
+        transaction.on_commit(lambda: run_async_job.delay(job.id))
+
     def clean_up_jobs(self):
         """
         Terminate running jobs after the soft limit and delete expired jobs.
@@ -209,15 +224,30 @@ class JobHandler:
             job_type.before_delete(job_to_delete.specific)
             job_to_delete.delete()
 
-        # Expire non expired jobs
+        # Expire non expired jobs. Jobs that can be resumed are updated when they're
+        # scheduled again, so the last update is used instead of the creation date
+        # for them.
         limit_date = timezone.now() - timezone.timedelta(
             seconds=(settings.BASEROW_JOB_SOFT_TIME_LIMIT + 1)
         )
+        resumable_content_types = [
+            ContentType.objects.get_for_model(job_type.model_class)
+            for job_type in job_type_registry.get_all()
+            if type(job_type).on_interrupted is not JobType.on_interrupted
+        ]
+        is_resumable = Q(content_type__in=resumable_content_types)
+        stale_jobs = Job.objects.filter(
+            (~is_resumable & Q(created_on__lte=limit_date))
+            | (is_resumable & Q(updated_on__lte=limit_date))
+        ).is_pending_or_running()
+        resumed_job_ids = []
+        for stale_job in stale_jobs:
+            stale_job = stale_job.specific
+            if job_type_registry.get_by_model(stale_job).on_interrupted(stale_job):
+                resumed_job_ids.append(stale_job.id)
 
         (
-            Job.objects.filter(created_on__lte=limit_date)
-            .is_pending_or_running()
-            .update(
+            stale_jobs.exclude(id__in=resumed_job_ids).update(
                 state=JOB_FAILED,
                 human_readable_error=(
                     "Something went wrong during the file_import job execution."
@@ -105,6 +105,19 @@ class JobType(
         :param error: the exception raised.
         """
 
+    def on_interrupted(self, job: AnyJob) -> bool:
+        """
+        This method is called by the job clean up for a pending or running job that
+        hasn't been updated for longer than the soft time limit, because the worker
+        running it has been killed for example. The job is marked as failed, unless
+        True is returned, for example because the job has been resumed.
+
+        :param job: the specific instance of the related job instance
+        :return: Whether the job must not be marked as failed.
+        """
+
+        return False
+
 
 class JobTypeRegistry(
     CustomFieldsRegistryMixin,
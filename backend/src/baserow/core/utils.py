@@ -617,6 +617,41 @@ def grouper(n: int, iterable: Iterable):
         yield chunk
 
 
+def add_ids_to_ranges(ranges: List[List[int]], ids: Iterable[int]) -> List[List[int]]:
+    """
+    Adds the provided ids to a list of inclusive `[first, last]` id ranges. This
+    is a compact way to store a lot of ids that are mostly consecutive, like the
+    ids of imported rows.
+
+    :param ranges: The existing sorted ranges.
+    :param ids: The ids that must be added to the ranges.
+    :return: The new sorted and merged list of ranges.
+    """
+
+    new_ranges = [list(id_range) for id_range in ranges]
+    new_ranges.extend([id_, id_] for id_ in ids)
+    new_ranges.sort()
+
+    merged_ranges = []
+    for first, last in new_ranges:
+        if merged_ranges and first <= merged_ranges[-1][1] + 1:
+            merged_ranges[-1][1] = max(merged_ranges[-1][1], last)
+        else:
+            merged_ranges.append([first, last])
+    return merged_ranges
+
+
+def iterate_id_ranges(ranges: List[List[int]]) -> Iterable[int]:
+    """
+    Yields all the ids of the provided inclusive `[first, last]` id ranges.
+
+    :param ranges: The ranges created by `add_ids_to_ranges`.
+    """
+
+    for first, last in ranges:
+        yield from range(first, last + 1)
+
+
 def unique_dicts_in_list(
     list_of_dicts: List[Dict[str, any]], unique_fields: List["str"] = None
 ) -> Tuple[List[Dict[str, any]], List[Dict[str, any]]]:
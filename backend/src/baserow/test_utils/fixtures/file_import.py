@@ -1,8 +1,7 @@
-import json
-
 from django.core.files.base import ContentFile
 
 from baserow.contrib.database.file_import.models import FileImportJob
+from baserow.contrib.database.file_import.utils import dump_data_file_rows
 
 data = [["test-1"]]
 
@@ -36,7 +35,7 @@ class FileImportFixtures:
         else:
             data = kwargs.pop("data")
 
-        data_file = kwargs.get("data_file", ContentFile(json.dumps(data)))
+        data_file = kwargs.get("data_file", ContentFile(dump_data_file_rows(data)))
 
         job = FileImportJob.objects.create(**kwargs)
 
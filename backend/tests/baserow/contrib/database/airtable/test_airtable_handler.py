@@ -221,6 +221,7 @@ def test_to_baserow_database_export():
         "order": 0,
         "primary": True,
         "text_default": "",
+        "db_trigram_index": False,
     }
     assert baserow_database_export["tables"][0]["fields"][1] == {
         "type": "email",
@@ -228,6 +229,7 @@ def test_to_baserow_database_export():
         "name": "Email",
         "order": 1,
         "primary": False,
+        "db_trigram_index": False,
     }
     assert len(baserow_database_export["tables"][0]["rows"]) == 3
     assert baserow_database_export["tables"][0]["rows"][0] == {
@@ -330,6 +332,7 @@ def test_to_baserow_database_export_without_primary_value():
             "order": 32767,
             "primary": True,
             "text_default": "",
+            "db_trigram_index": False,
         }
     ]
 
@@ -37,6 +37,37 @@ def test_unknown_export_type_for_table_returns_error(data_fixture, api_client, t
     assert response.json()["error"] == "ERROR_REQUEST_BODY_VALIDATION"
 
 
+@pytest.mark.django_db
+def test_exporting_changes_since_invalid_options_returns_error(
+    data_fixture, api_client
+):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    url = reverse("api:database:export:export_table", kwargs={"table_id": table.id})
+
+    response = api_client.post(
+        url,
+        data={
+            "exporter_type": "csv",
+            "export_changes_since": "2020-01-01T00:00:00Z",
+            "export_changes_since_job_id": 1,
+        },
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_REQUEST_BODY_VALIDATION"
+
+    response = api_client.post(
+        url,
+        data={"exporter_type": "csv", "export_changes_since_job_id": 999999},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+    assert response.status_code == HTTP_404_NOT_FOUND
+    assert response.json()["error"] == "ERROR_EXPORT_JOB_DOES_NOT_EXIST"
+
+
 @pytest.mark.django_db
 def test_exporting_table_without_permissions_returns_error(
     data_fixture, api_client, tmpdir
@@ -17,6 +17,7 @@ from rest_framework.status import (
 
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.fields.models import SelectOption
+from baserow.contrib.database.search.models import PendingSearchValueUpdate
 from baserow.contrib.database.tokens.handler import TokenHandler
 from baserow.test_utils.helpers import is_dict_subset
 
@@ -1098,8 +1099,13 @@ def test_batch_update_rows(api_client, data_fixture):
     row_2.refresh_from_db()
     assert getattr(row_1, f"field_{text_field.id}") == "green"
     assert getattr(row_2, f"field_{text_field.id}") == "yellow"
-    assert row_1.needs_background_update
-    assert row_2.needs_background_update
+    # Only the search data of the updated field has to be updated, so the rows are
+    # recorded as a pending search value update instead of being flagged.
+    assert not row_1.needs_background_update
+    assert not row_2.needs_background_update
+    pending_update = PendingSearchValueUpdate.objects.get(table=table)
+    assert text_field.id in pending_update.field_ids
+    assert sorted(pending_update.row_ids) == [row_1.id, row_2.id]
 
 
 @pytest.mark.django_db
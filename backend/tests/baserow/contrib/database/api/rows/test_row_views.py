@@ -1863,6 +1863,166 @@ def test_list_rows_returns_https_next_url(api_client, data_fixture, settings):
     )
 
 
+@pytest.mark.django_db
+def test_list_rows_with_count_mode(api_client, data_fixture):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(name="Name", table=table, primary=True)
+    model = table.get_model()
+    rows = [model.objects.create(**{f"field_{field.id}": str(i)}) for i in range(3)]
+    url = reverse("api:database:rows:list", kwargs={"table_id": table.id})
+
+    response = api_client.get(
+        f"{url}?count_mode=none&size=2",
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    response_json = response.json()
+    assert response.status_code == HTTP_200_OK
+    assert response_json["count"] is None
+    assert [r["id"] for r in response_json["results"]] == [rows[0].id, rows[1].id]
+    assert "page=2" in response_json["next"]
+
+    response = api_client.get(
+        response_json["next"], format="json", HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+    )
+    response_json = response.json()
+    assert response.status_code == HTTP_200_OK
+    assert [r["id"] for r in response_json["results"]] == [rows[2].id]
+    assert response_json["next"] is None
+
+    response = api_client.get(
+        f"{url}?count_mode=none&size=2&page=3",
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_INVALID_PAGE"
+
+    response = api_client.get(
+        f"{url}?count_mode=approximate&filter__field_{field.id}__equal=1",
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    response_json = response.json()
+    assert response.status_code == HTTP_200_OK
+    assert response_json["count"] == 1
+    assert [r["id"] for r in response_json["results"]] == [rows[1].id]
+
+    response = api_client.get(
+        f"{url}?count_mode=invalid",
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_QUERY_PARAMETER_VALIDATION"
+
+
+@pytest.mark.django_db
+def test_list_rows_with_cursor_pagination(api_client, data_fixture):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(name="Name", table=table, primary=True)
+
+    model = table.get_model()
+    rows = [
+        model.objects.create(**{f"field_{field.id}": "a", "order": Decimal("1")}),
+        model.objects.create(**{f"field_{field.id}": "b", "order": Decimal("3")}),
+        model.objects.create(**{f"field_{field.id}": "c", "order": Decimal("2")}),
+        model.objects.create(**{f"field_{field.id}": "d", "order": Decimal("2")}),
+        model.objects.create(**{f"field_{field.id}": "e", "order": Decimal("2")}),
+    ]
+
+    url = reverse("api:database:rows:list", kwargs={"table_id": table.id})
+    response = api_client.get(
+        f"{url}?cursor=&size=2",
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    response_json = response.json()
+    assert response.status_code == HTTP_200_OK
+    assert "count" not in response_json
+    assert [r["id"] for r in response_json["results"]] == [rows[0].id, rows[2].id]
+
+    # Rows sharing the same order must be split over pages by their id.
+    response = api_client.get(
+        response_json["next"], format="json", HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+    )
+    response_json = response.json()
+    assert response.status_code == HTTP_200_OK
+    assert [r["id"] for r in response_json["results"]] == [rows[3].id, rows[4].id]
+
+    response = api_client.get(
+        response_json["next"], format="json", HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+    )
+    response_json = response.json()
+    assert response.status_code == HTTP_200_OK
+    assert [r["id"] for r in response_json["results"]] == [rows[1].id]
+    assert response_json["next"] is None
+
+    response = api_client.get(
+        f"{url}?cursor=&size=5&filter__field_{field.id}__equal=d",
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    response_json = response.json()
+    assert response.status_code == HTTP_200_OK
+    assert [r["id"] for r in response_json["results"]] == [rows[3].id]
+    assert response_json["next"] is None
+
+
+@pytest.mark.django_db
+def test_list_rows_with_cursor_pagination_invalid_requests(
+    api_client, data_fixture, settings
+):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(name="Name", table=table, primary=True)
+    url = reverse("api:database:rows:list", kwargs={"table_id": table.id})
+
+    response = api_client.get(
+        f"{url}?cursor=invalid",
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_INVALID_CURSOR"
+
+    response = api_client.get(
+        f"{url}?cursor=&size={settings.ROW_PAGE_SIZE_LIMIT + 1}",
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_PAGE_SIZE_LIMIT"
+
+    response = api_client.get(
+        f"{url}?cursor=&order_by=field_{field.id}",
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_CURSOR_PAGINATION_ORDER_NOT_SUPPORTED"
+
+    grid = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_sort(view=grid, field=field, order="DESC")
+    response = api_client.get(
+        f"{url}?cursor=&view_id={grid.id}",
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_CURSOR_PAGINATION_ORDER_NOT_SUPPORTED"
+
+    unsorted_grid = data_fixture.create_grid_view(table=table)
+    response = api_client.get(
+        f"{url}?cursor=&view_id={unsorted_grid.id}",
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_200_OK
+
+
 @pytest.mark.django_db
 def test_list_row_names(api_client, data_fixture):
     user, jwt_token = data_fixture.create_user_and_token(
@@ -3108,3 +3268,58 @@ def test_list_row_history_endpoint_is_paginated(data_fixture, api_client):
             },
         ],
     }
+
+
+@pytest.mark.django_db
+def test_list_rows_with_link_row_limit(api_client, data_fixture):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    related_table = data_fixture.create_database_table(
+        user=user, database=table.database
+    )
+    data_fixture.create_text_field(name="Name", table=table, primary=True)
+    related_primary = data_fixture.create_text_field(
+        name="Name", table=related_table, primary=True
+    )
+    link_field = FieldHandler().create_field(
+        user, table, "link_row", name="Link", link_row_table=related_table
+    )
+
+    related_model = related_table.get_model()
+    related_rows = [
+        related_model.objects.create(**{f"field_{related_primary.id}": name})
+        for name in ["a", "b", "c"]
+    ]
+    model = table.get_model()
+    row_1 = model.objects.create()
+    model.objects.create()
+    getattr(row_1, f"field_{link_field.id}").set([r.id for r in related_rows])
+
+    url = reverse("api:database:rows:list", kwargs={"table_id": table.id})
+    response = api_client.get(
+        f"{url}?link_row_limit=2&user_field_names=true",
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    response_json = response.json()
+    assert response.status_code == HTTP_200_OK
+    assert response_json["results"][0]["Link"] == [
+        {"id": related_rows[0].id, "value": "a"},
+        {"id": related_rows[1].id, "value": "b"},
+    ]
+    assert response_json["results"][0]["link_row_counts"] == {"Link": 3}
+    assert response_json["results"][1]["Link"] == []
+    assert response_json["results"][1]["link_row_counts"] == {"Link": 0}
+
+    response = api_client.get(url, format="json", HTTP_AUTHORIZATION=f"JWT {jwt_token}")
+    response_json = response.json()
+    assert len(response_json["results"][0][f"field_{link_field.id}"]) == 3
+    assert "link_row_counts" not in response_json["results"][0]
+
+    response = api_client.get(
+        f"{url}?link_row_limit=0",
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_QUERY_PARAMETER_VALIDATION"
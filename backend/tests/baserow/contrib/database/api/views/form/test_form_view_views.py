@@ -324,7 +324,12 @@ def test_meta_submit_form_view(api_client, data_fixture):
         "conditions": [],
         "condition_groups": [],
         "show_when_matching_conditions": False,
-        "field": {"id": text_field.id, "type": "text", "text_default": ""},
+        "field": {
+            "id": text_field.id,
+            "type": "text",
+            "text_default": "",
+            "db_trigram_index": False,
+        },
         "field_component": "default",
     }
     assert response_json["fields"][1] == {
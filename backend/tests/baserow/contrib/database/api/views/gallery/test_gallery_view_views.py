@@ -369,6 +369,7 @@ def test_get_public_gallery_view(api_client, data_fixture):
                 "order": 0,
                 "primary": False,
                 "text_default": "",
+                "db_trigram_index": False,
                 "type": "text",
                 "read_only": False,
             }
@@ -23,7 +23,11 @@ from baserow.contrib.database.rows.registries import (
     RowMetadataType,
     row_metadata_registry,
 )
-from baserow.contrib.database.search.handler import ALL_SEARCH_MODES, SearchHandler
+from baserow.contrib.database.search.handler import (
+    ALL_SEARCH_MODES,
+    SearchHandler,
+    SearchModes,
+)
 from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.models import GridView
 from baserow.contrib.database.views.registries import view_aggregation_type_registry
@@ -207,6 +211,107 @@ def test_list_rows(api_client, data_fixture):
     assert response.status_code == HTTP_200_OK
 
 
+@pytest.mark.django_db
+def test_list_rows_with_count_mode(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    grid = data_fixture.create_grid_view(table=table)
+    model = table.get_model()
+    rows = [
+        model.objects.create(**{f"field_{text_field.id}": str(i)}) for i in range(3)
+    ]
+    cache.clear()
+
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid.id})
+    response = api_client.get(
+        url,
+        data={"count_mode": "none", "limit": 2},
+        **{"HTTP_AUTHORIZATION": f"JWT {token}"},
+    )
+    response_json = response.json()
+    assert response.status_code == HTTP_200_OK
+    assert response_json["count"] is None
+    assert [r["id"] for r in response_json["results"]] == [rows[0].id, rows[1].id]
+    assert "offset=2" in response_json["next"]
+
+    response = api_client.get(
+        url,
+        data={"count_mode": "none", "limit": 2, "offset": 2},
+        **{"HTTP_AUTHORIZATION": f"JWT {token}"},
+    )
+    response_json = response.json()
+    assert response.status_code == HTTP_200_OK
+    assert [r["id"] for r in response_json["results"]] == [rows[2].id]
+    assert response_json["next"] is None
+
+    response = api_client.get(
+        url,
+        data={"count_mode": "approximate", "size": 2, "page": 2},
+        **{"HTTP_AUTHORIZATION": f"JWT {token}"},
+    )
+    response_json = response.json()
+    assert response.status_code == HTTP_200_OK
+    assert response_json["count"] == 3
+    assert [r["id"] for r in response_json["results"]] == [rows[2].id]
+    assert response_json["next"] is None
+
+    response = api_client.get(
+        url,
+        data={"count_mode": "approximate", "count": ""},
+        **{"HTTP_AUTHORIZATION": f"JWT {token}"},
+    )
+    assert response.status_code == HTTP_200_OK
+    assert response.json() == {"count": 3}
+
+    response = api_client.get(
+        url,
+        data={"count_mode": "invalid"},
+        **{"HTTP_AUTHORIZATION": f"JWT {token}"},
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_QUERY_PARAMETER_VALIDATION"
+
+
+@pytest.mark.django_db
+def test_list_rows_with_link_row_limit(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    related_table = data_fixture.create_database_table(
+        user=user, database=table.database
+    )
+    related_primary = data_fixture.create_text_field(table=related_table, primary=True)
+    link_field = FieldHandler().create_field(
+        user, table, "link_row", name="Link", link_row_table=related_table
+    )
+    grid = data_fixture.create_grid_view(table=table)
+
+    related_model = related_table.get_model()
+    related_rows = [
+        related_model.objects.create(
+            **{f"field_{related_primary.id}": str(i)}, order=Decimal(3 - i)
+        )
+        for i in range(3)
+    ]
+    row = table.get_model().objects.create()
+    getattr(row, f"field_{link_field.id}").set([r.id for r in related_rows])
+
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid.id})
+    response = api_client.get(
+        url,
+        data={"link_row_limit": 1},
+        **{"HTTP_AUTHORIZATION": f"JWT {token}"},
+    )
+    response_json = response.json()
+    assert response.status_code == HTTP_200_OK
+    assert response_json["results"][0][f"field_{link_field.id}"] == [
+        {"id": related_rows[2].id, "value": "2"}
+    ]
+    assert response_json["results"][0]["link_row_counts"] == {
+        f"field_{link_field.id}": 3
+    }
+
+
 @pytest.mark.django_db
 def test_list_rows_with_group_by(api_client, data_fixture):
     user, token = data_fixture.create_user_and_token(
@@ -2079,6 +2184,7 @@ def test_get_public_grid_view(api_client, data_fixture):
                 "order": 0,
                 "primary": False,
                 "text_default": "",
+                "db_trigram_index": False,
                 "type": "text",
                 "read_only": False,
             }
@@ -2730,7 +2836,9 @@ def test_list_rows_public_only_searches_by_visible_columns(
     response_json = response.json()
     assert response.status_code == HTTP_200_OK, response_json
     assert len(response_json["results"]) == 1
-    assert response_json["count"] == 1
+    # The rows of a ranked search are not counted.
+    expected_count = None if search_mode == SearchModes.MODE_FT_RANKED else 1
+    assert response_json["count"] == expected_count
     assert response_json["results"][0]["id"] == visible_row.id
 
 
@@ -0,0 +1,90 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from pytz import UTC
+
+from baserow.contrib.database.db.copy_from import (
+    CopyValueNotSupported,
+    bulk_insert_with_copy,
+    to_copy_text_value,
+)
+
+
+def test_to_copy_text_value():
+    assert to_copy_text_value(None) == "\\N"
+    assert to_copy_text_value(True) == "t"
+    assert to_copy_text_value(False) == "f"
+    assert to_copy_text_value(10) == "10"
+    assert to_copy_text_value(Decimal("-1.50")) == "-1.50"
+    assert to_copy_text_value("a\tb\nc\r\\d") == "a\\tb\\nc\\r\\\\d"
+    assert (
+        to_copy_text_value(timedelta(days=-1, seconds=5))
+        == "-1 days 5 seconds 0 microseconds"
+    )
+
+    with pytest.raises(CopyValueNotSupported):
+        to_copy_text_value([1])
+
+
+@pytest.mark.django_db
+def test_bulk_insert_with_copy(data_fixture):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table)
+    number_field = data_fixture.create_number_field(
+        table=table, number_decimal_places=2
+    )
+    boolean_field = data_fixture.create_boolean_field(table=table)
+    date_field = data_fixture.create_date_field(table=table, date_include_time=True)
+    duration_field = data_fixture.create_duration_field(
+        table=table, duration_format="h:mm:ss"
+    )
+    model = table.get_model()
+    model.objects.create()
+
+    instances = [
+        model(
+            order=Decimal("2"),
+            **{
+                f"field_{text_field.id}": "tab\tnew line\n\\N",
+                f"field_{number_field.id}": Decimal("1.25"),
+                f"field_{boolean_field.id}": True,
+                f"field_{date_field.id}": datetime(2020, 1, 1, 12, 30, tzinfo=UTC),
+                f"field_{duration_field.id}": timedelta(hours=1, seconds=5),
+            },
+        ),
+        model(order=Decimal("3")),
+    ]
+
+    assert bulk_insert_with_copy(model, instances) is True
+
+    rows = list(model.objects.order_by("id"))
+    assert [row.id for row in rows[1:]] == [instance.id for instance in instances]
+    assert rows[0].id < instances[0].id < instances[1].id
+
+    row = rows[1]
+    assert getattr(row, f"field_{text_field.id}") == "tab\tnew line\n\\N"
+    assert getattr(row, f"field_{number_field.id}") == Decimal("1.25")
+    assert getattr(row, f"field_{boolean_field.id}") is True
+    assert getattr(row, f"field_{date_field.id}") == datetime(
+        2020, 1, 1, 12, 30, tzinfo=UTC
+    )
+    assert getattr(row, f"field_{duration_field.id}") == timedelta(hours=1, seconds=5)
+    assert row.created_on is not None
+
+    row = rows[2]
+    assert getattr(row, f"field_{text_field.id}") is None
+    assert getattr(row, f"field_{boolean_field.id}") is False
+
+
+@pytest.mark.django_db
+def test_bulk_insert_with_copy_does_not_insert_values_computed_by_the_database(
+    data_fixture,
+):
+    table = data_fixture.create_database_table()
+    data_fixture.create_text_field(table=table)
+    data_fixture.create_formula_field(table=table, formula="'a'", formula_type="text")
+    model = table.get_model()
+
+    assert bulk_insert_with_copy(model, [model(order=Decimal("1"))]) is False
+    assert model.objects.count() == 0
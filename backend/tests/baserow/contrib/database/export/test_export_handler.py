@@ -1,3 +1,4 @@
+import gzip
 from io import BytesIO
 from typing import List
 from unittest.mock import patch
@@ -16,11 +17,21 @@ from baserow.contrib.database.api.export.serializers import (
     SUPPORTED_EXPORT_CHARSETS,
     BaseExporterOptionsSerializer,
 )
+from baserow.contrib.database.export.compression import (
+    get_supported_export_compressions,
+    open_compressed_stream,
+)
 from baserow.contrib.database.export.exceptions import (
     ExportJobCanceledException,
+    ExportJobDoesNotExistException,
     TableOnlyExportUnsupported,
     ViewUnsupportedForExporterType,
 )
+from baserow.contrib.database.export.file_writer import (
+    ExportShard,
+    ShardedExportJobFileWriter,
+    StreamingExportJobFileWriter,
+)
 from baserow.contrib.database.export.handler import ExportHandler
 from baserow.contrib.database.export.models import (
     EXPORT_JOB_CANCELLED_STATUS,
@@ -35,10 +46,19 @@ from baserow.contrib.database.export.registries import (
     TableExporter,
     table_exporter_registry,
 )
+from baserow.contrib.database.export.table_exporters.csv_table_exporter import (
+    CsvQuerysetSerializer,
+)
+from baserow.contrib.database.fields.field_types import (
+    DateFieldType,
+    FormulaFieldType,
+)
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.trash.models import TrashedRows
 from baserow.contrib.database.views.exceptions import ViewNotInTable
 from baserow.contrib.database.views.models import GridView, GridViewFieldOptions
+from baserow.core.trash.handler import TrashHandler
 from baserow.test_utils.helpers import setup_interesting_test_table
 
 
@@ -256,6 +276,68 @@ def test_can_export_every_interesting_different_field_to_csv(
     assert contents == expected
 
 
+@pytest.mark.django_db
+@pytest.mark.parametrize("can_handle_rich_value", [False, True])
+def test_column_serializers_match_field_serializers(
+    data_fixture, can_handle_rich_value
+):
+    table, _, _, _, _ = setup_interesting_test_table(data_fixture)
+
+    class QuerysetSerializerUnderTest(CsvQuerysetSerializer):
+        pass
+
+    QuerysetSerializerUnderTest.can_handle_rich_value = can_handle_rich_value
+    serializer = QuerysetSerializerUnderTest.for_table(table)
+    rows = list(serializer.queryset)
+
+    expected = [
+        {
+            field_database_name: value
+            for field_database_name, _, value in (
+                field_serializer(row)
+                for field_serializer in serializer.field_serializers
+            )
+        }
+        for row in rows
+    ]
+    assert serializer.serialize_chunk(rows) == expected
+
+
+@pytest.mark.django_db
+def test_formula_column_serializer_prepares_the_formula_type_once(data_fixture):
+    table = data_fixture.create_database_table()
+    data_fixture.create_text_field(table=table, name="text", primary=True)
+    formula_field = data_fixture.create_formula_field(
+        table=table,
+        formula="todate('20210101', 'YYYYMMDD')",
+        formula_type="date",
+        date_format="EU",
+    )
+    model = table.get_model()
+    model.objects.create()
+    model.objects.create()
+    field_object = model._field_objects[formula_field.id]
+    values = [getattr(row, field_object["name"]) for row in model.objects.all()]
+
+    with patch.object(
+        FormulaFieldType,
+        "_get_field_instance_and_type_from_formula_field",
+        wraps=field_object["type"]._get_field_instance_and_type_from_formula_field,
+    ) as resolve_formula_type, patch.object(
+        DateFieldType, "get_export_value"
+    ) as get_export_value:
+        serialize_column = field_object["type"].get_export_column_serializer(
+            field_object
+        )
+        assert serialize_column(values) == ["01/01/2021", "01/01/2021"]
+
+    assert resolve_formula_type.call_count == 1
+    get_export_value.assert_not_called()
+    assert field_object["type"].get_export_value(values[0], field_object) == (
+        "01/01/2021"
+    )
+
+
 def run_export_job_over_interesting_table(data_fixture, storage_mock, options):
     table, user, _, _, context = setup_interesting_test_table(
         data_fixture, user_kwargs={"email": "user@example.com"}
@@ -700,6 +782,357 @@ def test_adding_more_rows_doesnt_increase_number_of_queries_run(
         run_export_job_with_mock_storage(table, grid_view, storage_mock, user)
 
 
+@pytest.mark.django_db
+@patch("baserow.contrib.database.export.handler.default_storage")
+def test_export_streams_rows_in_chunks_without_offset_queries(
+    storage_mock, data_fixture
+):
+    add_row, add_linked_row, user, table, grid_view = setup_testing_table(data_fixture)
+    linked_row_1 = add_linked_row("linked_row_1")
+    linked_row_2 = add_linked_row("linked_row_2")
+    add_row("c", "2020-02-01 01:23", "B", 1, [], [linked_row_1.id])
+    add_row("a", "2020-02-01 01:23", "A", 2, [], [linked_row_2.id])
+    add_row("b", "2020-02-01 01:23", "A", 3, [], [linked_row_1.id, linked_row_2.id])
+
+    with patch.object(StreamingExportJobFileWriter, "CHUNK_SIZE", 2):
+        with CaptureQueriesContext(connection) as captured:
+            job, contents = run_export_job_with_mock_storage(
+                table, grid_view, storage_mock, user
+            )
+
+    assert not any("OFFSET" in query["sql"] for query in captured.captured_queries)
+    assert job.progress_percentage == 100
+    expected = (
+        "\ufeffid,text_field,option_field,date_field,File,Price,Customer\r\n"
+        "2,a,A,02/01/2020 01:23,,2.00,linked_row_2\r\n"
+        '3,b,A,02/01/2020 01:23,,3.00,"linked_row_1,linked_row_2"\r\n'
+        "1,c,B,02/01/2020 01:23,,1.00,linked_row_1\r\n"
+    )
+    assert contents == expected
+
+
+@pytest.mark.django_db(transaction=True)
+@patch("baserow.contrib.database.export.handler.default_storage")
+def test_export_in_parallel_shards(storage_mock, data_fixture, settings):
+    add_row, add_linked_row, user, table, grid_view = setup_testing_table(data_fixture)
+    grid_view.viewsort_set.all().delete()
+    linked_row_1 = add_linked_row("linked_row_1")
+    linked_row_2 = add_linked_row("linked_row_2")
+    for i in range(1, 6):
+        add_row(f"row_{i}", "2020-02-01 01:23", "A", i, [], [linked_row_1.id])
+    # All the other rows have the same order, so the shards are split on the id.
+    table.get_model().objects.filter(id=4).update(order=2)
+    add_row("sorted", "2020-02-01 01:23", "B", 6, [], [linked_row_2.id])
+
+    _, unsharded_contents = run_export_job_with_mock_storage(
+        table, grid_view, storage_mock, user
+    )
+
+    settings.BASEROW_EXPORT_MAX_SHARDS = 3
+    settings.BASEROW_EXPORT_MIN_ROWS_PER_SHARD = 1
+    with patch.object(
+        ShardedExportJobFileWriter,
+        "_write_shard",
+        side_effect=ShardedExportJobFileWriter._write_shard,
+        autospec=True,
+    ) as write_shard_mock, CaptureQueriesContext(connection) as captured:
+        job, contents = run_export_job_with_mock_storage(
+            table, grid_view, storage_mock, user
+        )
+
+    assert write_shard_mock.call_count == 3
+    # The first rows of the shards are found without offsets.
+    assert not any("OFFSET" in query["sql"] for query in captured.captured_queries)
+    assert job.progress_percentage == 100
+    assert contents == unsharded_contents
+    assert contents == (
+        "\ufeffid,text_field,option_field,date_field,File,Price,Customer\r\n"
+        "1,row_1,A,02/01/2020 01:23,,1.00,linked_row_1\r\n"
+        "2,row_2,A,02/01/2020 01:23,,2.00,linked_row_1\r\n"
+        "3,row_3,A,02/01/2020 01:23,,3.00,linked_row_1\r\n"
+        "5,row_5,A,02/01/2020 01:23,,5.00,linked_row_1\r\n"
+        "6,sorted,B,02/01/2020 01:23,,6.00,linked_row_2\r\n"
+        "4,row_4,A,02/01/2020 01:23,,4.00,linked_row_1\r\n"
+    )
+
+    # Sorted views can't be split on the `(order, id)` index, so they are exported
+    # in a single shard.
+    data_fixture.create_view_sort(
+        view=grid_view, field=table.field_set.get(name="text_field"), order="DESC"
+    )
+    write_shard_mock.reset_mock()
+    with patch.object(
+        ShardedExportJobFileWriter,
+        "_write_shard",
+        side_effect=ShardedExportJobFileWriter._write_shard,
+        autospec=True,
+    ) as write_shard_mock:
+        _, contents = run_export_job_with_mock_storage(
+            table, grid_view, storage_mock, user
+        )
+
+    assert write_shard_mock.call_count == 0
+    assert contents.splitlines()[1].startswith("6,sorted")
+
+
+@pytest.mark.django_db(transaction=True)
+@patch("baserow.contrib.database.export.handler.default_storage")
+def test_export_job_writes_unclaimed_shards_from_the_same_snapshot(
+    storage_mock, data_fixture, settings
+):
+    add_row, add_linked_row, user, table, grid_view = setup_testing_table(data_fixture)
+    grid_view.viewsort_set.all().delete()
+    linked_row = add_linked_row("linked_row")
+    for i in range(1, 4):
+        add_row(f"row_{i}", "2020-02-01 01:23", "A", i, [], [linked_row.id])
+
+    settings.BASEROW_EXPORT_MAX_SHARDS = 3
+    settings.BASEROW_EXPORT_MIN_ROWS_PER_SHARD = 1
+    write_shard = ShardedExportJobFileWriter._write_shard
+    snapshot_ids = set()
+
+    def write_shard_after_row_created(self, queryset, shard, snapshot_id, *args):
+        # The row is committed after the snapshot is exported, so none of the
+        # shards must see it.
+        if not snapshot_ids:
+            add_row("created", "2020-02-01 01:23", "B", 4, [], [linked_row.id])
+        snapshot_ids.add(snapshot_id)
+        return write_shard(self, queryset, shard, snapshot_id, *args)
+
+    # No worker picks up the shard tasks, so the export job writes all the shards.
+    with patch(
+        "baserow.contrib.database.export.tasks.run_export_shard.delay"
+    ) as delay_mock, patch.object(
+        ShardedExportJobFileWriter,
+        "_write_shard",
+        side_effect=write_shard_after_row_created,
+        autospec=True,
+    ) as write_shard_mock:
+        job, contents = run_export_job_with_mock_storage(
+            table, grid_view, storage_mock, user
+        )
+
+    # The shard tasks are chained, so only one task is queued.
+    assert delay_mock.call_count == 1
+    assert write_shard_mock.call_count == 3
+    assert len(snapshot_ids) == 1
+    assert job.progress_percentage == 100
+    assert table.get_model().objects.count() == 4
+    assert contents == (
+        "\ufeffid,text_field,option_field,date_field,File,Price,Customer\r\n"
+        "1,row_1,A,02/01/2020 01:23,,1.00,linked_row\r\n"
+        "2,row_2,A,02/01/2020 01:23,,2.00,linked_row\r\n"
+        "3,row_3,A,02/01/2020 01:23,,3.00,linked_row\r\n"
+    )
+
+
+@pytest.mark.django_db(transaction=True)
+@patch("baserow.contrib.database.export.handler.default_storage")
+def test_export_job_writes_shards_of_which_the_task_was_lost(
+    storage_mock, data_fixture, settings
+):
+    add_row, add_linked_row, user, table, grid_view = setup_testing_table(data_fixture)
+    grid_view.viewsort_set.all().delete()
+    linked_row = add_linked_row("linked_row")
+    for i in range(1, 4):
+        add_row(f"row_{i}", "2020-02-01 01:23", "A", i, [], [linked_row.id])
+
+    settings.BASEROW_EXPORT_MAX_SHARDS = 3
+    settings.BASEROW_EXPORT_MIN_ROWS_PER_SHARD = 1
+
+    def claim_shards_and_get_lost(job_id, shards, snapshot_id):
+        for shard in shards:
+            assert ExportShard.from_task_argument(shard).claim(snapshot_id)
+
+    # The worker claiming the shards is lost, so the claims are not renewed and
+    # expire, after which the export job writes the shards itself.
+    with patch(
+        "baserow.contrib.database.export.tasks.run_export_shard.delay",
+        side_effect=claim_shards_and_get_lost,
+    ), patch(
+        "baserow.contrib.database.export.file_writer"
+        ".EXPORT_SHARD_CLAIM_TIMEOUT_SECONDS",
+        0.2,
+    ), patch.object(
+        ShardedExportJobFileWriter, "SHARD_POLL_INTERVAL_SECONDS", 0.1
+    ), patch.object(
+        ShardedExportJobFileWriter,
+        "_write_shard",
+        side_effect=ShardedExportJobFileWriter._write_shard,
+        autospec=True,
+    ) as write_shard_mock:
+        job, contents = run_export_job_with_mock_storage(
+            table, grid_view, storage_mock, user
+        )
+
+    assert write_shard_mock.call_count == 3
+    assert job.progress_percentage == 100
+    assert contents == (
+        "\ufeffid,text_field,option_field,date_field,File,Price,Customer\r\n"
+        "1,row_1,A,02/01/2020 01:23,,1.00,linked_row\r\n"
+        "2,row_2,A,02/01/2020 01:23,,2.00,linked_row\r\n"
+        "3,row_3,A,02/01/2020 01:23,,3.00,linked_row\r\n"
+    )
+
+
+@pytest.mark.django_db
+@patch("baserow.contrib.database.export.handler.default_storage")
+def test_export_only_changes_since(storage_mock, data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="text", primary=True)
+    grid_view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_filter(
+        view=grid_view, field=text_field, type="not_equal", value="hidden"
+    )
+    row_handler = RowHandler()
+
+    with freeze_time("2020-01-01 12:00"):
+        rows = row_handler.create_rows(
+            user,
+            table,
+            [{f"field_{text_field.id}": f"row_{i}"} for i in range(1, 7)],
+        )
+
+    with freeze_time("2020-01-01 13:00"):
+        previous_job, _ = run_export_job_with_mock_storage(
+            table, grid_view, storage_mock, user
+        )
+
+    with freeze_time("2020-01-02 12:00"):
+        row_handler.update_rows(
+            user,
+            table,
+            [
+                {"id": rows[1].id, f"field_{text_field.id}": "updated"},
+                {"id": rows[2].id, f"field_{text_field.id}": "hidden"},
+            ],
+        )
+        row_handler.create_row(user, table, {f"field_{text_field.id}": "created"})
+        row_handler.delete_row(user, table, rows[3])
+        row_handler.delete_rows(user, table, [rows[4].id, rows[5].id])
+
+    # The row that doesn't match the filters of the view anymore must be removed,
+    # without exporting its values.
+    expected = (
+        "\ufeffid,text,deleted\r\n"
+        "2,updated,False\r\n"
+        "3,,True\r\n"
+        "4,,True\r\n"
+        "5,,True\r\n"
+        "6,,True\r\n"
+        "7,created,False\r\n"
+    )
+    _, contents = run_export_job_with_mock_storage(
+        table,
+        grid_view,
+        storage_mock,
+        user,
+        {
+            "exporter_type": "csv",
+            "export_changes_since": parse_datetime("2020-01-02T00:00:00Z"),
+        },
+    )
+    assert contents == expected
+
+    job, contents = run_export_job_with_mock_storage(
+        table,
+        grid_view,
+        storage_mock,
+        user,
+        {"exporter_type": "csv", "export_changes_since_job_id": previous_job.id},
+    )
+    assert job.export_options["export_changes_since"] == "2020-01-01T13:00:00+00:00"
+    assert contents == expected
+
+    with pytest.raises(ExportJobDoesNotExistException):
+        run_export_job_with_mock_storage(
+            table,
+            grid_view,
+            storage_mock,
+            data_fixture.create_user(),
+            {"exporter_type": "csv", "export_changes_since_job_id": previous_job.id},
+        )
+
+
+@pytest.mark.django_db
+@patch("baserow.contrib.database.export.handler.default_storage")
+def test_export_only_changes_since_includes_restored_rows(storage_mock, data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="text", primary=True)
+    grid_view = data_fixture.create_grid_view(table=table)
+    row_handler = RowHandler()
+
+    with freeze_time("2020-01-01 12:00"):
+        rows = row_handler.create_rows(
+            user,
+            table,
+            [{f"field_{text_field.id}": f"row_{i}"} for i in range(1, 5)],
+        )
+        row_handler.delete_row(user, table, rows[0])
+        row_handler.delete_rows(user, table, [rows[1].id, rows[2].id])
+
+    with freeze_time("2020-01-02 12:00"):
+        TrashHandler.restore_item(
+            user, "row", rows[0].id, parent_trash_item_id=table.id
+        )
+        trashed_rows = TrashedRows.objects.get(table=table)
+        TrashHandler.restore_item(
+            user, "rows", trashed_rows.id, parent_trash_item_id=table.id
+        )
+
+    _, contents = run_export_job_with_mock_storage(
+        table,
+        grid_view,
+        storage_mock,
+        user,
+        {
+            "exporter_type": "csv",
+            "export_changes_since": parse_datetime("2020-01-02T00:00:00Z"),
+        },
+    )
+    assert contents == (
+        "\ufeffid,text,deleted\r\n"
+        "1,row_1,False\r\n"
+        "2,row_2,False\r\n"
+        "3,row_3,False\r\n"
+    )
+
+
+@pytest.mark.django_db
+@patch("baserow.contrib.database.export.handler.default_storage")
+def test_export_compressed_with_gzip(storage_mock, data_fixture):
+    add_row, add_linked_row, user, table, grid_view = setup_testing_table(data_fixture)
+    add_row("a", "2020-02-01 01:23", "A", 1, [], [])
+    _, expected = run_export_job_with_mock_storage(table, grid_view, storage_mock, user)
+
+    stub_file = BytesIO()
+    storage_mock.open.return_value = stub_file
+    stub_file.close = lambda: None
+    handler = ExportHandler()
+    job = handler.create_pending_export_job(
+        user,
+        table,
+        grid_view,
+        {"exporter_type": "csv", "export_compression": "gzip"},
+    )
+    handler.run_export_job(job)
+
+    assert job.exported_file_name.endswith(".csv.gz")
+    assert gzip.decompress(stub_file.getvalue()).decode("utf-8") == expected
+
+
+@patch("baserow.contrib.database.export.compression._import_zstandard")
+def test_export_compressions_without_zstandard(import_zstandard_mock):
+    import_zstandard_mock.return_value = None
+    assert get_supported_export_compressions() == ["gzip"]
+
+    with pytest.raises(ValueError):
+        with open_compressed_stream(BytesIO(), "zstd"):
+            pass
+
+
 @pytest.mark.django_db
 def test_creating_job_with_view_that_is_not_in_the_table(
     data_fixture,
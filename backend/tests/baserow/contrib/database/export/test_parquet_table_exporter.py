@@ -0,0 +1,162 @@
+from datetime import date, datetime
+from decimal import Decimal
+from io import BytesIO
+from unittest.mock import patch
+
+from django.utils.dateparse import parse_datetime
+
+import pytest
+from freezegun import freeze_time
+from pytz import UTC
+
+from baserow.contrib.database.export.handler import ExportHandler
+from baserow.contrib.database.export.table_exporters.parquet_table_exporter import (
+    ParquetQuerysetSerializer,
+)
+from baserow.contrib.database.rows.handler import RowHandler
+from baserow.test_utils.helpers import setup_interesting_test_table
+
+# pyarrow is an optional dependency, see `backend/requirements/README.md`.
+pa = pytest.importorskip("pyarrow", reason="The optional pyarrow is not installed.")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+def run_parquet_export_job_with_mock_storage(table, view, storage_mock, user):
+    stub_file = BytesIO()
+    storage_mock.open.return_value = stub_file
+    stub_file.close = lambda: None
+    handler = ExportHandler()
+    job = handler.create_pending_export_job(
+        user, table, view, {"exporter_type": "parquet"}
+    )
+    handler.run_export_job(job)
+    return job, pq.read_table(BytesIO(stub_file.getvalue()))
+
+
+@pytest.mark.django_db
+@patch("baserow.contrib.database.export.handler.default_storage")
+def test_can_export_every_interesting_different_field_to_parquet(
+    storage_mock, data_fixture
+):
+    table, user, _, _, _ = setup_interesting_test_table(
+        data_fixture, user_kwargs={"email": "user@example.com"}
+    )
+    grid_view = data_fixture.create_grid_view(table=table)
+
+    with patch.object(ParquetQuerysetSerializer, "ROW_GROUP_SIZE", 1):
+        job, parquet_table = run_parquet_export_job_with_mock_storage(
+            table, grid_view, storage_mock, user
+        )
+
+    assert job.exported_file_name.endswith(".parquet")
+    assert parquet_table.num_rows == 2
+    schema = parquet_table.schema
+    assert schema.field("id").type == pa.int64()
+    assert schema.field("positive_int").type == pa.int64()
+    assert schema.field("positive_decimal").type == pa.decimal256(51, 1)
+    assert schema.field("boolean").type == pa.bool_()
+    assert schema.field("datetime_us").type == pa.timestamp("us", tz="UTC")
+    assert schema.field("date_us").type == pa.date32()
+    assert schema.field("single_select").type == pa.dictionary(pa.int32(), pa.string())
+    assert schema.field("text").type == pa.string()
+
+    rows = parquet_table.to_pylist()
+    assert [row["id"] for row in rows] == [1, 2]
+    assert rows[0]["text"] is None
+    assert rows[0]["single_select"] is None
+    assert rows[1]["text"] == "text"
+    assert rows[1]["positive_int"] == 1
+    assert rows[1]["negative_decimal"] == Decimal("-1.2")
+    assert rows[1]["boolean"] is True
+    assert rows[1]["datetime_us"] == datetime(2020, 2, 1, 1, 23, tzinfo=UTC)
+    assert rows[1]["date_us"] == date(2020, 2, 1)
+    assert rows[1]["single_select"] == "A"
+    assert rows[1]["multiple_select"] == "D,C,E"
+    assert rows[1]["formula_bool"] == "True"
+
+
+@pytest.mark.django_db
+@patch("baserow.contrib.database.export.handler.default_storage")
+def test_can_export_empty_table_to_parquet(storage_mock, data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_text_field(table=table, name="text")
+
+    _, parquet_table = run_parquet_export_job_with_mock_storage(
+        table, None, storage_mock, user
+    )
+
+    assert parquet_table.num_rows == 0
+    assert parquet_table.schema.names == ["id", "text"]
+
+
+@pytest.mark.django_db
+@patch("baserow.contrib.database.export.handler.default_storage")
+def test_parquet_generated_columns_dont_collide_with_field_names(
+    storage_mock, data_fixture
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_text_field(table=table, name="id", primary=True)
+    data_fixture.create_number_field(table=table, name="id_2")
+    model = table.get_model()
+    model.objects.create()
+
+    _, parquet_table = run_parquet_export_job_with_mock_storage(
+        table, None, storage_mock, user
+    )
+
+    assert parquet_table.schema.names == ["id_3", "id", "id_2"]
+    assert parquet_table.schema.field("id_3").type == pa.int64()
+    assert parquet_table.schema.field("id").type == pa.string()
+
+
+@pytest.mark.django_db
+@patch("baserow.contrib.database.export.handler.default_storage")
+def test_can_export_changes_since_to_parquet(storage_mock, data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="text", primary=True)
+    grid_view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_filter(
+        view=grid_view, field=text_field, type="not_equal", value="hidden"
+    )
+    row_handler = RowHandler()
+
+    with freeze_time("2020-01-01 12:00"):
+        rows = row_handler.create_rows(
+            user, table, [{text_field.db_column: f"row_{i}"} for i in range(1, 4)]
+        )
+
+    with freeze_time("2020-01-02 12:00"):
+        row_handler.update_rows(
+            user,
+            table,
+            [
+                {"id": rows[0].id, text_field.db_column: "updated"},
+                {"id": rows[1].id, text_field.db_column: "hidden"},
+            ],
+        )
+        row_handler.delete_row(user, table, rows[2])
+
+    stub_file = BytesIO()
+    storage_mock.open.return_value = stub_file
+    stub_file.close = lambda: None
+    handler = ExportHandler()
+    job = handler.create_pending_export_job(
+        user,
+        table,
+        grid_view,
+        {
+            "exporter_type": "parquet",
+            "export_changes_since": parse_datetime("2020-01-02T00:00:00Z"),
+        },
+    )
+    handler.run_export_job(job)
+    parquet_table = pq.read_table(BytesIO(stub_file.getvalue()))
+
+    assert parquet_table.to_pylist() == [
+        {"id": 1, "text": "updated", "deleted": False},
+        {"id": 2, "text": None, "deleted": True},
+        {"id": 3, "text": None, "deleted": True},
+    ]
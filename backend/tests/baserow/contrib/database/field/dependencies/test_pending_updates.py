@@ -0,0 +1,447 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+
+import pytest
+
+from baserow.contrib.database.fields.dependencies.models import (
+    PendingDependencyUpdate,
+)
+from baserow.contrib.database.fields.dependencies.pending_updates import (
+    PendingDependencyUpdateHandler,
+)
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.rows.registries import row_metadata_registry
+
+
+def setup_hub_table_with_dependant_table(data_fixture):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    hub_table = data_fixture.create_database_table(
+        database=database, eventual_dependency_updates=True
+    )
+    other_table = data_fixture.create_database_table(database=database)
+    text_field = data_fixture.create_text_field(
+        table=hub_table, name="text", primary=True
+    )
+    data_fixture.create_text_field(table=other_table, name="name", primary=True)
+    link_field = FieldHandler().create_field(
+        user,
+        other_table,
+        "link_row",
+        name="link",
+        link_row_table=hub_table,
+    )
+    hub_formula_field = FieldHandler().create_field(
+        user, hub_table, "formula", name="upper", formula="upper(field('text'))"
+    )
+    other_formula_field = FieldHandler().create_field(
+        user,
+        other_table,
+        "formula",
+        name="joined",
+        formula="join(lookup('link', 'text'), ',')",
+    )
+    return (
+        user,
+        hub_table,
+        other_table,
+        text_field,
+        link_field,
+        hub_formula_field,
+        other_formula_field,
+    )
+
+
+@pytest.mark.django_db
+def test_eventual_dependency_updates_are_applied_in_the_background(data_fixture):
+    (
+        user,
+        hub_table,
+        other_table,
+        text_field,
+        link_field,
+        hub_formula_field,
+        other_formula_field,
+    ) = setup_hub_table_with_dependant_table(data_fixture)
+
+    row_handler = RowHandler()
+    hub_row_1, hub_row_2 = row_handler.create_rows(
+        user,
+        hub_table,
+        [{text_field.db_column: "a"}, {text_field.db_column: "b"}],
+    )
+    other_row = row_handler.create_row(
+        user, other_table, {link_field.db_column: [hub_row_1.id, hub_row_2.id]}
+    )
+    other_model = other_table.get_model()
+    other_row.refresh_from_db()
+    assert getattr(other_row, other_formula_field.db_column) == "a,b"
+
+    updated_rows = row_handler.update_rows(
+        user,
+        hub_table,
+        [
+            {"id": hub_row_1.id, text_field.db_column: "c"},
+            {"id": hub_row_2.id, text_field.db_column: "d"},
+        ],
+    ).updated_rows
+    row_handler.update_rows(
+        user, hub_table, [{"id": hub_row_1.id, text_field.db_column: "e"}]
+    )
+
+    # The dependant fields in the same table are updated right away.
+    assert [getattr(row, hub_formula_field.db_column) for row in updated_rows] == [
+        "C",
+        "D",
+    ]
+    other_row = other_model.objects.get(id=other_row.id)
+    assert getattr(other_row, other_formula_field.db_column) == "a,b"
+    assert PendingDependencyUpdate.objects.filter(table=hub_table).count() == 3
+
+    # Only the rows depending on the updated rows are stale, not the updated rows.
+    metadata_type = row_metadata_registry.get("pending_dependency_updates")
+    assert (
+        metadata_type.generate_metadata_for_rows(
+            user, hub_table, [hub_row_1.id, hub_row_2.id]
+        )
+        == {}
+    )
+    assert metadata_type.generate_metadata_for_rows(
+        user, other_table, [other_row.id]
+    ) == {other_row.id: True}
+
+    # The pending updates of both updates are applied together.
+    assert PendingDependencyUpdateHandler.apply_pending_updates(hub_table.id) == [
+        hub_row_1.id,
+        hub_row_2.id,
+    ]
+    other_row = other_model.objects.get(id=other_row.id)
+    assert getattr(other_row, other_formula_field.db_column) == "e,d"
+    assert PendingDependencyUpdate.objects.filter(table=hub_table).count() == 0
+    assert (
+        metadata_type.generate_metadata_for_rows(user, other_table, [other_row.id])
+        == {}
+    )
+
+
+@pytest.mark.django_db
+def test_eventual_dependency_updates_of_rows_which_lost_their_connection(
+    data_fixture,
+):
+    (
+        user,
+        hub_table,
+        other_table,
+        text_field,
+        link_field,
+        _,
+        other_formula_field,
+    ) = setup_hub_table_with_dependant_table(data_fixture)
+
+    row_handler = RowHandler()
+    hub_row, other_hub_row = row_handler.create_rows(
+        user, hub_table, [{text_field.db_column: "a"}, {text_field.db_column: "b"}]
+    )
+    other_row = row_handler.create_row(
+        user, other_table, {link_field.db_column: [hub_row.id, other_hub_row.id]}
+    )
+
+    related_link_field = link_field.link_row_related_field
+    row_handler.update_rows(
+        user, hub_table, [{"id": hub_row.id, related_link_field.db_column: []}]
+    )
+
+    assert set(
+        PendingDependencyUpdate.objects.filter(table=hub_table).values_list(
+            "field_id", "row_id", "connection_removed"
+        )
+    ) == {
+        (related_link_field.id, hub_row.id, False),
+        (related_link_field.id, other_row.id, True),
+    }
+    other_row = other_table.get_model().objects.get(id=other_row.id)
+    assert getattr(other_row, other_formula_field.db_column) == "a,b"
+    metadata_type = row_metadata_registry.get("pending_dependency_updates")
+    assert metadata_type.generate_metadata_for_rows(
+        user, other_table, [other_row.id]
+    ) == {other_row.id: True}
+
+    assert PendingDependencyUpdateHandler.apply_pending_updates(hub_table.id) == [
+        hub_row.id
+    ]
+
+    other_row = other_table.get_model().objects.get(id=other_row.id)
+    assert getattr(other_row, other_formula_field.db_column) == "b"
+
+
+@pytest.mark.django_db
+@patch(
+    "baserow.contrib.database.fields.tasks.apply_pending_dependency_updates"
+    ".apply_async"
+)
+def test_pending_dependency_updates_are_scheduled_once(
+    mock_apply_async, data_fixture, django_capture_on_commit_callbacks, settings
+):
+    settings.BASEROW_PENDING_DEPENDENCY_UPDATES_DELAY = 3
+    (
+        user,
+        hub_table,
+        _,
+        text_field,
+        _,
+        _,
+        _,
+    ) = setup_hub_table_with_dependant_table(data_fixture)
+    cache.clear()
+
+    row_handler = RowHandler()
+    hub_row = row_handler.create_row(user, hub_table, {text_field.db_column: "a"})
+    with django_capture_on_commit_callbacks(execute=True):
+        row_handler.update_rows(
+            user, hub_table, [{"id": hub_row.id, text_field.db_column: "b"}]
+        )
+    with django_capture_on_commit_callbacks(execute=True):
+        row_handler.update_rows(
+            user, hub_table, [{"id": hub_row.id, text_field.db_column: "c"}]
+        )
+
+    mock_apply_async.assert_called_once_with((hub_table.id,), countdown=3)
+
+    PendingDependencyUpdateHandler.apply_pending_updates(hub_table.id)
+    with django_capture_on_commit_callbacks(execute=True):
+        row_handler.update_rows(
+            user, hub_table, [{"id": hub_row.id, text_field.db_column: "d"}]
+        )
+
+    assert mock_apply_async.call_count == 2
+
+
+@pytest.mark.django_db
+@patch(
+    "baserow.contrib.database.fields.tasks.apply_pending_dependency_updates"
+    ".apply_async"
+)
+def test_failed_pending_dependency_updates_are_scheduled_again(
+    mock_apply_async, data_fixture, django_capture_on_commit_callbacks, settings
+):
+    settings.BASEROW_PENDING_DEPENDENCY_UPDATES_DELAY = 0
+    (
+        user,
+        hub_table,
+        other_table,
+        text_field,
+        _,
+        _,
+        _,
+    ) = setup_hub_table_with_dependant_table(data_fixture)
+    cache.clear()
+
+    row_handler = RowHandler()
+    hub_row = row_handler.create_row(user, hub_table, {text_field.db_column: "a"})
+    with django_capture_on_commit_callbacks(execute=True):
+        row_handler.update_rows(
+            user, hub_table, [{"id": hub_row.id, text_field.db_column: "b"}]
+        )
+    assert mock_apply_async.call_count == 1
+
+    with patch.object(
+        PendingDependencyUpdateHandler,
+        "_apply_pending_updates",
+        side_effect=Exception("failed"),
+    ):
+        with pytest.raises(Exception):
+            PendingDependencyUpdateHandler.apply_pending_updates(hub_table.id)
+
+    # The key is kept until it expires, so the task isn't scheduled again right
+    # away.
+    assert PendingDependencyUpdateHandler.schedule_stale_pending_updates() == [
+        hub_table.id
+    ]
+    assert mock_apply_async.call_count == 1
+
+    cache.clear()
+    assert PendingDependencyUpdateHandler.schedule_stale_pending_updates() == [
+        hub_table.id
+    ]
+    mock_apply_async.assert_called_with((hub_table.id,), countdown=0)
+    assert mock_apply_async.call_count == 2
+
+
+@pytest.mark.django_db
+@patch(
+    "baserow.contrib.database.fields.tasks.apply_pending_dependency_updates"
+    ".apply_async"
+)
+def test_pending_dependency_updates_added_while_applying_are_scheduled(
+    mock_apply_async, data_fixture, django_capture_on_commit_callbacks
+):
+    (
+        user,
+        hub_table,
+        _,
+        text_field,
+        _,
+        _,
+        _,
+    ) = setup_hub_table_with_dependant_table(data_fixture)
+    cache.clear()
+
+    row_handler = RowHandler()
+    hub_row = row_handler.create_row(user, hub_table, {text_field.db_column: "a"})
+
+    def apply_while_the_row_is_updated_again(table_id):
+        with django_capture_on_commit_callbacks(execute=True):
+            row_handler.update_rows(
+                user, hub_table, [{"id": hub_row.id, text_field.db_column: "c"}]
+            )
+        return []
+
+    with django_capture_on_commit_callbacks(execute=True):
+        row_handler.update_rows(
+            user, hub_table, [{"id": hub_row.id, text_field.db_column: "b"}]
+        )
+    assert mock_apply_async.call_count == 1
+
+    with patch.object(
+        PendingDependencyUpdateHandler,
+        "_apply_pending_updates",
+        side_effect=apply_while_the_row_is_updated_again,
+    ):
+        PendingDependencyUpdateHandler.apply_pending_updates(hub_table.id)
+
+    # The update made while the task was running couldn't schedule a task itself.
+    assert mock_apply_async.call_count == 2
+
+
+@pytest.mark.django_db
+def test_pending_dependency_updates_metadata_of_rows_multiple_hops_away(
+    data_fixture,
+):
+    (
+        user,
+        hub_table,
+        other_table,
+        text_field,
+        link_field,
+        _,
+        _,
+    ) = setup_hub_table_with_dependant_table(data_fixture)
+    far_table = data_fixture.create_database_table(database=hub_table.database)
+    data_fixture.create_text_field(table=far_table, name="name", primary=True)
+    far_link_field = FieldHandler().create_field(
+        user, far_table, "link_row", name="link", link_row_table=other_table
+    )
+    FieldHandler().create_field(
+        user,
+        far_table,
+        "formula",
+        name="joined",
+        formula="join(lookup('link', 'joined'), ',')",
+    )
+
+    row_handler = RowHandler()
+    hub_row = row_handler.create_row(user, hub_table, {text_field.db_column: "a"})
+    other_row, unrelated_other_row = row_handler.create_rows(
+        user,
+        other_table,
+        [{link_field.db_column: [hub_row.id]}, {link_field.db_column: []}],
+    )
+    far_row, unrelated_far_row = row_handler.create_rows(
+        user,
+        far_table,
+        [
+            {far_link_field.db_column: [other_row.id]},
+            {far_link_field.db_column: [unrelated_other_row.id]},
+        ],
+    )
+
+    row_handler.update_rows(
+        user, hub_table, [{"id": hub_row.id, text_field.db_column: "c"}]
+    )
+
+    metadata_type = row_metadata_registry.get("pending_dependency_updates")
+    assert metadata_type.generate_metadata_for_rows(
+        user, other_table, [other_row.id, unrelated_other_row.id]
+    ) == {other_row.id: True}
+    assert metadata_type.generate_metadata_for_rows(
+        user, far_table, [far_row.id, unrelated_far_row.id]
+    ) == {far_row.id: True}
+
+
+@pytest.mark.django_db
+def test_eventual_dependency_updates_of_a_single_updated_row(data_fixture):
+    (
+        user,
+        hub_table,
+        other_table,
+        text_field,
+        link_field,
+        hub_formula_field,
+        other_formula_field,
+    ) = setup_hub_table_with_dependant_table(data_fixture)
+
+    row_handler = RowHandler()
+    hub_row = row_handler.create_row(user, hub_table, {text_field.db_column: "a"})
+    other_row = row_handler.create_row(
+        user, other_table, {link_field.db_column: [hub_row.id]}
+    )
+
+    hub_row = row_handler.update_row(
+        user, hub_table, hub_row, {text_field.db_column: "b"}
+    )
+
+    assert getattr(hub_row, hub_formula_field.db_column) == "B"
+    other_model = other_table.get_model()
+    other_row = other_model.objects.get(id=other_row.id)
+    assert getattr(other_row, other_formula_field.db_column) == "a"
+    assert list(
+        PendingDependencyUpdate.objects.filter(table=hub_table).values_list(
+            "field_id", "row_id"
+        )
+    ) == [(text_field.id, hub_row.id)]
+
+    PendingDependencyUpdateHandler.apply_pending_updates(hub_table.id)
+    other_row = other_model.objects.get(id=other_row.id)
+    assert getattr(other_row, other_formula_field.db_column) == "b"
+
+
+@pytest.mark.django_db
+def test_pending_dependency_updates_of_unrelated_tables_are_not_checked(
+    data_fixture,
+):
+    (
+        user,
+        hub_table,
+        other_table,
+        text_field,
+        link_field,
+        hub_formula_field,
+        other_formula_field,
+    ) = setup_hub_table_with_dependant_table(data_fixture)
+    unrelated_table = data_fixture.create_database_table(user=user)
+    data_fixture.create_text_field(table=unrelated_table, primary=True)
+
+    row_handler = RowHandler()
+    hub_row = row_handler.create_row(user, hub_table, {text_field.db_column: "a"})
+    other_row = row_handler.create_row(
+        user, other_table, {link_field.db_column: [hub_row.id]}
+    )
+    unrelated_row = row_handler.create_row(user, unrelated_table, {})
+    row_handler.update_row(user, hub_table, hub_row, {text_field.db_column: "b"})
+
+    assert PendingDependencyUpdateHandler.get_row_ids_with_stale_dependant_fields(
+        other_table, [other_row.id]
+    ) == {other_row.id}
+    with patch(
+        "baserow.contrib.database.fields.dependencies.pending_updates"
+        ".FieldDependencyHandler.get_all_dependent_fields_with_type"
+    ) as get_all_dependent_fields_with_type:
+        assert (
+            PendingDependencyUpdateHandler.get_row_ids_with_stale_dependant_fields(
+                unrelated_table, [unrelated_row.id]
+            )
+            == set()
+        )
+    get_all_dependent_fields_with_type.assert_not_called()
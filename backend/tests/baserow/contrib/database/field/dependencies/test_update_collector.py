@@ -227,8 +227,9 @@ def test_can_trigger_update_for_rows_joined_to_a_starting_row_across_a_m2m_and_b
         # Cache the models so we are only asserting about the update queries
         field_cache.cache_model(first_table.get_model())
         field_cache.cache_model(second_table.get_model())
-        # Two fields were updated with an update statement for each table
-        with django_assert_num_queries(2):
+        # Two fields were updated with an update statement for each table, and the
+        # ids of the rows in the first table are fetched once for the next hop.
+        with django_assert_num_queries(3):
             updated_fields = update_collector.apply_updates_and_get_updated_fields(
                 field_cache
             )
@@ -324,8 +325,9 @@ def test_update_statements_at_the_same_path_node_are_grouped_into_one(
         field_cache.cache_model(first_table.get_model())
         field_cache.cache_model(second_table.get_model())
         # Three fields were updated but two are in the same path node (same table) and
-        # so only one update per table expected
-        with django_assert_num_queries(2):
+        # so only one update per table expected, plus one query fetching the ids of
+        # the rows in the first table for the next hop.
+        with django_assert_num_queries(3):
             updated_fields = update_collector.apply_updates_and_get_updated_fields(
                 field_cache
             )
@@ -402,3 +404,93 @@ def test_update_statements_only_update_rows_where_values_change(data_fixture):
     # Only row_4 and row_5 should be updated, the others already have the value "a"
     assert execute_update_statement(func_update_statement) == 2
     assert_all_rows_have_value("a")
+
+
+@pytest.mark.django_db
+def test_updates_across_multiple_hops_are_keyed_on_the_connected_row_ids(
+    data_fixture, django_assert_num_queries
+):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    first_table = data_fixture.create_database_table(database=database)
+    second_table = data_fixture.create_database_table(database=database)
+    third_table = data_fixture.create_database_table(database=database)
+    data_fixture.create_text_field(name="primary", primary=True, table=first_table)
+    second_table_field = data_fixture.create_text_field(
+        name="primary", primary=True, table=second_table
+    )
+    third_table_field = data_fixture.create_text_field(
+        name="primary", primary=True, table=third_table
+    )
+    # noinspection PyTypeChecker
+    second_to_first: LinkRowField = FieldHandler().create_field(
+        user=user,
+        table=second_table,
+        type_name="link_row",
+        link_row_table=first_table,
+        name="first",
+    )
+    # noinspection PyTypeChecker
+    third_to_second: LinkRowField = FieldHandler().create_field(
+        user=user,
+        table=third_table,
+        type_name="link_row",
+        link_row_table=second_table,
+        name="second",
+    )
+    first_table_model = first_table.get_model(attribute_names=True)
+    second_table_model = second_table.get_model(attribute_names=True)
+    third_table_model = third_table.get_model(attribute_names=True)
+
+    first_a, first_b = first_table_model.objects.bulk_create(
+        [first_table_model(primary="a"), first_table_model(primary="b")]
+    )
+    second_x = second_table_model.objects.create(primary="x")
+    second_y = second_table_model.objects.create(primary="y")
+    second_z = second_table_model.objects.create(primary="z")
+    second_x.first.add(first_a.id)
+    second_y.first.add(first_b.id)
+    second_z.first.add(first_a.id)
+    third_p = third_table_model.objects.create(primary="p")
+    third_q = third_table_model.objects.create(primary="q")
+    third_s = third_table_model.objects.create(primary="s")
+    third_u = third_table_model.objects.create(primary="u")
+    third_p.second.add(second_x.id)
+    third_q.second.add(second_y.id)
+    third_s.second.add(second_z.id)
+
+    field_cache = FieldCache()
+    update_collector = FieldUpdateCollector(first_table, starting_row_ids=[first_a.id])
+    update_collector.add_field_with_pending_update_statement(
+        second_table_field,
+        Value("updated"),
+        via_path_to_starting_table=[second_to_first],
+    )
+    update_collector.add_field_with_pending_update_statement(
+        third_table_field,
+        Value("updated"),
+        via_path_to_starting_table=[second_to_first, third_to_second],
+    )
+    for table in [first_table, second_table, third_table]:
+        field_cache.cache_model(table.get_model())
+
+    # One query to fetch the ids of the second table rows connected to the starting
+    # row and one update per table.
+    with django_assert_num_queries(3):
+        assert update_collector.apply_updates(field_cache) == 4
+
+    assert update_collector.row_counts_per_hop == [
+        (first_table.id, (), 1, 0),
+        (second_table.id, (second_to_first.id,), 2, 2),
+        (third_table.id, (third_to_second.id, second_to_first.id), None, 2),
+    ]
+    assert sorted(
+        second_table_model.objects.filter(primary="updated").values_list(
+            "id", flat=True
+        )
+    ) == [second_x.id, second_z.id]
+    assert sorted(
+        third_table_model.objects.filter(primary="updated").values_list("id", flat=True)
+    ) == [third_p.id, third_s.id]
+    assert third_table_model.objects.get(id=third_u.id).primary == "u"
+    assert third_table_model.objects.get(id=third_q.id).primary == "q"
@@ -51,7 +51,7 @@ from baserow.contrib.database.fields.field_types import (
     URLFieldType,
     UUIDFieldType,
 )
-from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.fields.handler import FieldHandler, FieldIndexingHandler
 from baserow.contrib.database.fields.models import (
     BooleanField,
     Field,
@@ -1725,3 +1725,67 @@ def test_duplicating_link_row_field_properly_resets_pk_sequence_of_new_table(
     )
     assert table_b_row_1.id in linked_vals
     assert table_b_row_2.id in linked_vals
+
+
+@pytest.mark.django_db
+@patch("baserow.contrib.database.fields.handler.FieldIndexingHandler.remove_index")
+@patch(
+    "baserow.contrib.database.fields.handler.FieldIndexingHandler"
+    ".schedule_index_update"
+)
+def test_field_trigram_index_is_updated_when_enabled_or_disabled(
+    schedule_index_update, remove_index, data_fixture
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    handler = FieldHandler()
+
+    field = handler.create_field(
+        user, table, "text", name="Text", db_trigram_index=True
+    )
+    assert field.db_trigram_index is True
+    schedule_index_update.assert_called_once_with(field)
+
+    schedule_index_update.reset_mock()
+    field = handler.update_field(user, field, name="Renamed")
+    schedule_index_update.assert_not_called()
+
+    # The index is kept when the new field type supports it, but it must be removed
+    # before the column type changes and is created again afterwards.
+    field = handler.update_field(user, field, new_type_name="long_text")
+    assert field.db_trigram_index is True
+    remove_index.assert_called_once()
+    schedule_index_update.assert_called_once_with(field)
+
+    remove_index.reset_mock()
+    schedule_index_update.reset_mock()
+    field = handler.update_field(user, field, new_type_name="number")
+    assert field.db_trigram_index is False
+    remove_index.assert_called_once()
+    schedule_index_update.assert_called_once_with(field)
+
+    # Field types that don't support the index ignore the property.
+    field = handler.create_field(
+        user, table, "number", name="Number", db_trigram_index=True
+    )
+    assert field.db_trigram_index is False
+
+
+@pytest.mark.django_db
+def test_field_indexing_handler_creates_and_removes_trigram_index(data_fixture):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'",
+        )
+        if cursor.fetchone() is None:
+            pytest.skip("The pg_trgm extension is not available.")
+
+    field = data_fixture.create_text_field(db_trigram_index=True)
+
+    FieldIndexingHandler.update_index(field)
+    assert FieldIndexingHandler.does_index_exist(field.trigram_index_name)
+
+    field.db_trigram_index = False
+    field.save()
+    FieldIndexingHandler.update_index(field)
+    assert not FieldIndexingHandler.does_index_exist(field.trigram_index_name)
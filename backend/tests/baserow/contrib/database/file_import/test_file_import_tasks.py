@@ -1,4 +1,7 @@
+from unittest.mock import patch
+
 from django.conf import settings
+from django.db import OperationalError, transaction
 from django.test.utils import override_settings
 from django.utils import timezone
 
@@ -6,6 +9,7 @@ import pytest
 from freezegun import freeze_time
 from pyinstrument import Profiler
 
+from baserow.contrib.database.action.scopes import TableActionScopeType
 from baserow.contrib.database.fields.dependencies.handler import FieldDependencyHandler
 from baserow.contrib.database.fields.exceptions import (
     InvalidBaserowFieldName,
@@ -15,12 +19,16 @@ from baserow.contrib.database.fields.exceptions import (
 )
 from baserow.contrib.database.fields.field_cache import FieldCache
 from baserow.contrib.database.fields.models import SelectOption, TextField
+from baserow.contrib.database.file_import.job_types import FileImportJobType
+from baserow.contrib.database.rows.actions import ImportRowsActionType
 from baserow.contrib.database.rows.exceptions import ReportMaxErrorCountExceeded
+from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.table.exceptions import (
     InitialTableDataDuplicateName,
     InitialTableDataLimitExceeded,
     InvalidInitialTableData,
 )
+from baserow.core.action.handler import ActionHandler
 from baserow.core.exceptions import UserNotInWorkspace
 from baserow.core.jobs.constants import (
     JOB_FAILED,
@@ -30,6 +38,8 @@ from baserow.core.jobs.constants import (
 )
 from baserow.core.jobs.models import Job
 from baserow.core.jobs.tasks import clean_up_jobs, run_async_job
+from baserow.core.utils import add_ids_to_ranges
+from baserow.test_utils.helpers import assert_undo_redo_actions_are_valid
 
 
 @pytest.mark.django_db(transaction=True)
@@ -499,6 +509,260 @@ def test_run_file_import_test_chunk(data_fixture, patch_filefield_storage):
     assert job.progress_percentage == 100
 
 
+@pytest.mark.django_db(transaction=True)
+def test_run_file_import_task_streaming(
+    data_fixture, patch_filefield_storage, settings
+):
+    settings.BASEROW_FILE_IMPORT_STREAMING_ROW_THRESHOLD = 1000
+    row_count = 1024 + 5
+
+    user = data_fixture.create_user()
+    table, table_b, link_field = data_fixture.create_two_linked_tables(user=user)
+    number_field = data_fixture.create_number_field(
+        table=table_b, order=10, name="Number"
+    )
+    single_select_field = data_fixture.create_single_select_field(
+        table=table_b, order=11
+    )
+    select_option = SelectOption.objects.create(
+        field=single_select_field, order=1, value="Option 1", color="blue"
+    )
+    file_field = data_fixture.create_file_field(table=table_b, order=12)
+    user_file = data_fixture.create_user_file(original_name="test.txt")
+
+    model = table.get_model()
+    row_1 = model.objects.create()
+
+    data = [["text", [], 1, None, []]] * row_count
+    data[0] = [
+        "first\ttab\nnewline\\backslash",
+        [row_1.id],
+        2,
+        select_option.id,
+        [{"name": user_file.name, "visible_name": "new name"}],
+    ]
+    data[5] = ["text", [], "bad", None, []]
+    data[1024] = ["text", [], 1, 99999, []]
+    data[1028] = ["text", [], 1, None, [], "too many"]
+
+    with patch_filefield_storage():
+        job = data_fixture.create_file_import_job(
+            user=user, database=table.database, table=table_b, data=data
+        )
+        run_async_job(job.id)
+
+    job.refresh_from_db()
+
+    assert job.state == JOB_FINISHED
+    assert job.progress_percentage == 100
+    assert sorted(job.report["failing_rows"].keys()) == sorted(["5", "1024", "1028"])
+
+    model_b = table_b.get_model()
+    assert model_b.objects.count() == row_count - 3
+
+    first_row = model_b.objects.order_by("id").first()
+    primary_field = table_b.field_set.get(primary=True)
+    assert getattr(first_row, f"field_{primary_field.id}") == (
+        "first\ttab\nnewline\\backslash"
+    )
+    assert getattr(first_row, f"field_{number_field.id}") == 2
+    assert getattr(first_row, f"field_{single_select_field.id}_id") == select_option.id
+    assert [
+        row.id for row in getattr(first_row, f"field_{link_field.id + 1}").all()
+    ] == [row_1.id]
+    assert getattr(first_row, f"field_{file_field.id}")[0]["visible_name"] == (
+        "new name"
+    )
+    # The link to the imported row is also visible from the related table.
+    assert [row.id for row in getattr(row_1, f"field_{link_field.id}").all()] == [
+        first_row.id
+    ]
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.undo_redo
+def test_run_file_import_task_resumable(
+    data_fixture, patch_filefield_storage, settings
+):
+    settings.BASEROW_FILE_IMPORT_STREAMING_ROW_THRESHOLD = 1000
+    settings.BASEROW_FILE_IMPORT_RESUMABLE = True
+    # The failed job is run again manually.
+    settings.BASEROW_FILE_IMPORT_MAX_RESUMES = 0
+    row_count = 2 * 1024 + 10
+
+    session_id = "session-id"
+    user = data_fixture.create_user(session_id=session_id)
+    table, _, _ = data_fixture.build_table(
+        columns=[("text", "text"), ("number", "number")], rows=[], user=user
+    )
+
+    data = [[f"row {index}", index] for index in range(row_count)]
+    data[5] = ["bad", "bad"]
+    data[1030] = ["bad", "bad"]
+
+    original_import_rows_in_chunks = RowHandler.import_rows_in_chunks
+    call_count = 0
+
+    def fail_after_second_chunk(self, *args, **kwargs):
+        nonlocal call_count
+        call_count += 1
+        result = original_import_rows_in_chunks(self, *args, **kwargs)
+        if call_count == 2:
+            raise OperationalError("The connection has been lost.")
+        return result
+
+    with patch_filefield_storage(), patch(
+        "baserow.contrib.database.file_import.job_types.RESUMABLE_CHECKPOINT_SIZE",
+        1024,
+    ):
+        job = data_fixture.create_file_import_job(
+            user=user,
+            database=table.database,
+            table=table,
+            data=data,
+            user_session_id=session_id,
+        )
+        FileImportJobType().after_job_creation(job, {"data": data})
+        assert job.resumable is True
+
+        with patch.object(
+            RowHandler, "import_rows_in_chunks", fail_after_second_chunk
+        ), pytest.raises(OperationalError):
+            run_async_job(job.id)
+
+        job.refresh_from_db()
+        model = table.get_model()
+
+        # Only the first chunk has been committed.
+        assert job.state == JOB_FAILED
+        assert job.data_file_offset == 1024
+        assert list(job.report["failing_rows"].keys()) == ["5"]
+        assert model.objects.count() == 1023
+        assert job.data_file
+
+        run_async_job(job.id)
+
+    job.refresh_from_db()
+
+    assert job.state == JOB_FINISHED
+    assert job.progress_percentage == 100
+    assert job.data_file_offset == row_count
+    assert list(job.report["failing_rows"].keys()) == ["5", "1030"]
+    assert model.objects.count() == row_count - 2
+    assert job.imported_row_id_ranges == add_ids_to_ranges(
+        [], model.objects.values_list("id", flat=True)
+    )
+
+    with transaction.atomic():
+        action_undone = ActionHandler.undo(
+            user, [TableActionScopeType.value(table_id=table.id)], session_id
+        )
+
+    assert_undo_redo_actions_are_valid(action_undone, [ImportRowsActionType])
+    assert model.objects.count() == 0
+
+
+@pytest.mark.django_db(transaction=True)
+def test_run_file_import_task_resumable_is_resumed_after_a_failure(
+    data_fixture, patch_filefield_storage, settings
+):
+    settings.BASEROW_FILE_IMPORT_STREAMING_ROW_THRESHOLD = 1000
+    settings.BASEROW_FILE_IMPORT_RESUMABLE = True
+    settings.BASEROW_FILE_IMPORT_MAX_RESUMES = 1
+    row_count = 2 * 1024 + 10
+
+    user = data_fixture.create_user()
+    table, _, _ = data_fixture.build_table(
+        columns=[("text", "text")], rows=[], user=user
+    )
+    data = [[f"row {index}"] for index in range(row_count)]
+
+    original_import_rows_in_chunks = RowHandler.import_rows_in_chunks
+    call_count = 0
+
+    def fail_on_second_chunk(self, *args, **kwargs):
+        nonlocal call_count
+        call_count += 1
+        if call_count == 2:
+            raise OperationalError("The connection has been lost.")
+        return original_import_rows_in_chunks(self, *args, **kwargs)
+
+    with patch_filefield_storage(), patch(
+        "baserow.contrib.database.file_import.job_types.RESUMABLE_CHECKPOINT_SIZE",
+        1024,
+    ), patch.object(RowHandler, "import_rows_in_chunks", fail_on_second_chunk):
+        job = data_fixture.create_file_import_job(
+            user=user, database=table.database, table=table, data=data
+        )
+        FileImportJobType().after_job_creation(job, {"data": data})
+
+        # The job is run again right away and continues after the first chunk,
+        # while the error is still raised by the failed task.
+        with pytest.raises(OperationalError):
+            run_async_job(job.id)
+
+    job.refresh_from_db()
+    assert job.state == JOB_FINISHED
+    assert job.resume_count == 1
+    assert job.error == ""
+    assert call_count == 4
+    assert table.get_model().objects.count() == row_count
+
+    with patch_filefield_storage(), patch.object(
+        RowHandler,
+        "import_rows_in_chunks",
+        side_effect=OperationalError("The connection has been lost."),
+    ):
+        always_failing = data_fixture.create_file_import_job(
+            user=user, database=table.database, table=table, data=data
+        )
+        FileImportJobType().after_job_creation(always_failing, {"data": data})
+        with pytest.raises(OperationalError):
+            run_async_job(always_failing.id)
+
+    always_failing.refresh_from_db()
+    assert always_failing.state == JOB_FAILED
+    assert always_failing.resume_count == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_run_file_import_task_resumable_reports_the_kept_rows_on_too_many_errors(
+    data_fixture, patch_filefield_storage, settings
+):
+    settings.BASEROW_FILE_IMPORT_STREAMING_ROW_THRESHOLD = 1000
+    settings.BASEROW_FILE_IMPORT_RESUMABLE = True
+    row_count = 2 * 1024 + 10
+
+    user = data_fixture.create_user()
+    table, _, _ = data_fixture.build_table(
+        columns=[("number", "number")], rows=[], user=user
+    )
+    data = [[index] for index in range(row_count)]
+    for index in range(1024, 1024 + 100):
+        data[index] = ["bad"]
+
+    with patch_filefield_storage(), patch(
+        "baserow.contrib.database.file_import.job_types.RESUMABLE_CHECKPOINT_SIZE",
+        1024,
+    ):
+        job = data_fixture.create_file_import_job(
+            user=user, database=table.database, table=table, data=data
+        )
+        FileImportJobType().after_job_creation(job, {"data": data})
+
+        with pytest.raises(ReportMaxErrorCountExceeded):
+            run_async_job(job.id)
+
+    job.refresh_from_db()
+    assert job.state == JOB_FAILED
+    assert job.resume_count == 0
+    assert job.report["imported_row_count"] == 1024
+    assert "The 1024 rows that were imported before have been kept" in (
+        job.human_readable_error
+    )
+    assert table.get_model().objects.count() == 1024
+
+
 @pytest.mark.django_db()
 def test_run_file_import_limit(data_fixture, patch_filefield_storage):
     row_count = 2000
@@ -645,3 +909,44 @@ def test_cleanup_file_import_job(data_fixture, settings, patch_filefield_storage
     job3.refresh_from_db()
     assert job3.state == JOB_FINISHED
     assert job3.updated_on == time_before_soft_limit
+
+
+@pytest.mark.django_db
+@patch("baserow.core.jobs.handler.run_async_job")
+def test_cleanup_resumes_interrupted_resumable_file_import_job(
+    mock_run_async_job,
+    data_fixture,
+    settings,
+    patch_filefield_storage,
+    django_capture_on_commit_callbacks,
+):
+    settings.BASEROW_FILE_IMPORT_MAX_RESUMES = 1
+    now = timezone.now()
+    soft_time_limit = timezone.timedelta(
+        seconds=settings.BASEROW_JOB_SOFT_TIME_LIMIT + 2
+    )
+
+    with patch_filefield_storage():
+        with freeze_time(now - soft_time_limit):
+            job = data_fixture.create_file_import_job(state=JOB_STARTED, resumable=True)
+            other_job = data_fixture.create_file_import_job(state=JOB_STARTED)
+
+        with freeze_time(now), django_capture_on_commit_callbacks(execute=True):
+            clean_up_jobs()
+
+    job.refresh_from_db()
+    assert job.state == JOB_PENDING
+    assert job.resume_count == 1
+    assert job.updated_on == now
+    mock_run_async_job.delay.assert_called_once_with(job.id)
+
+    other_job.refresh_from_db()
+    assert other_job.state == JOB_FAILED
+
+    # A job that keeps being interrupted is marked as failed eventually.
+    with freeze_time(now + soft_time_limit):
+        clean_up_jobs()
+
+    job.refresh_from_db()
+    assert job.state == JOB_FAILED
+    assert mock_run_async_job.delay.call_count == 1
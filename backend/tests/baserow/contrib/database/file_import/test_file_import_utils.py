@@ -0,0 +1,47 @@
+import json
+from io import StringIO
+
+from django.core.files import File
+
+from baserow.contrib.database.file_import.utils import (
+    count_data_file_rows,
+    dump_data_file_rows,
+    read_data_file_rows,
+)
+
+
+def test_dump_and_read_data_file_rows():
+    data = [["a\nb", 1], ["c,", None, [1, 2]], [], ["\u2028"]]
+
+    content = dump_data_file_rows(data).decode("utf8")
+
+    assert json.loads(content) == data
+    assert list(read_data_file_rows(File(StringIO(content)))) == data
+    assert count_data_file_rows(File(StringIO(content))) == 4
+
+    content = dump_data_file_rows([]).decode("utf8")
+
+    assert list(read_data_file_rows(File(StringIO(content)))) == []
+    assert count_data_file_rows(File(StringIO(content))) == 0
+
+
+def test_read_data_file_rows_with_all_rows_on_one_line():
+    content = json.dumps([["a"], ["b", 2]])
+
+    assert list(read_data_file_rows(File(StringIO(content)))) == [["a"], ["b", 2]]
+    assert count_data_file_rows(File(StringIO(content))) == 2
+
+
+def test_read_data_file_rows_with_offset():
+    data = [["a"], ["b"], ["c"]]
+    content = dump_data_file_rows(data).decode("utf8")
+
+    assert list(read_data_file_rows(File(StringIO(content)), offset=2)) == [["c"]]
+    assert list(read_data_file_rows(File(StringIO(content)), offset=3)) == []
+
+    content = json.dumps(data)
+
+    assert list(read_data_file_rows(File(StringIO(content)), offset=1)) == [
+        ["b"],
+        ["c"],
+    ]
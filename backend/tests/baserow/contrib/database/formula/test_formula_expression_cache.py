@@ -0,0 +1,75 @@
+import pytest
+
+from baserow.contrib.database.formula import BaserowFormulaTextType
+from baserow.contrib.database.formula.cache import (
+    FormulaExpressionCache,
+    FormulaExpressionCacheEntry,
+    formula_expressions_cache,
+)
+from baserow.contrib.database.formula.handler import FormulaHandler
+
+
+def test_raw_formula_to_untyped_expression_returns_copies_of_cached_expression():
+    formula = "concat(upper(field('a')), 'b')"
+    formula_expressions_cache.clear()
+
+    expression = FormulaHandler.raw_formula_to_untyped_expression(formula)
+    expression.with_valid_type(BaserowFormulaTextType())
+    other_expression = FormulaHandler.raw_formula_to_untyped_expression(formula)
+
+    assert formula_expressions_cache.info()["misses"] == 1
+    assert formula_expressions_cache.info()["hits"] == 1
+    assert other_expression is not expression
+    assert str(other_expression) == str(expression)
+    assert other_expression.expression_type is None
+    assert other_expression.args[0] is not expression.args[0]
+    # The function definitions are registry instances which are never copied.
+    assert other_expression.function_def is expression.function_def
+    assert other_expression.args[0].function_def is expression.args[0].function_def
+
+
+@pytest.mark.django_db
+def test_typed_internal_expression_is_built_from_the_cached_expression(
+    data_fixture,
+):
+    table = data_fixture.create_database_table()
+    data_fixture.create_text_field(table=table, name="text", primary=True)
+    formula_field = data_fixture.create_formula_field(
+        table=table, formula="upper(field('text'))", formula_type="text"
+    )
+    formula_expressions_cache.clear()
+
+    expression = FormulaHandler.get_typed_internal_expression_from_field(formula_field)
+    other_expression = FormulaHandler.get_typed_internal_expression_from_field(
+        formula_field
+    )
+
+    assert formula_expressions_cache.info()["misses"] == 1
+    assert formula_expressions_cache.info()["hits"] == 1
+    assert other_expression is not expression
+    assert str(other_expression) == formula_field.internal_formula
+    assert isinstance(other_expression.expression_type, BaserowFormulaTextType)
+
+
+def test_formula_expression_cache_evicts_least_recently_used_expressions():
+    cache = FormulaExpressionCache(max_size=2)
+    entries = {
+        formula: FormulaExpressionCacheEntry(
+            FormulaHandler.raw_formula_to_untyped_expression(formula), set()
+        )
+        for formula in ["'a'", "'b'", "'c'"]
+    }
+
+    cache.set("'a'", entries["'a'"])
+    cache.set("'b'", entries["'b'"])
+    assert cache.get("'a'") is entries["'a'"]
+    cache.set("'c'", entries["'c'"])
+
+    assert cache.get("'b'") is None
+    assert cache.get("'a'") is entries["'a'"]
+    assert cache.get("'c'") is entries["'c'"]
+    assert cache.info() == {"hits": 3, "misses": 1, "size": 2, "max_size": 2}
+
+    disabled_cache = FormulaExpressionCache(max_size=0)
+    disabled_cache.set("'a'", entries["'a'"])
+    assert disabled_cache.get("'a'") is None
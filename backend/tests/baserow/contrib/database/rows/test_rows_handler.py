@@ -2,8 +2,10 @@ from datetime import datetime
 from decimal import Decimal
 from unittest.mock import patch
 
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.test import override_settings
 
 import pytest
 from freezegun import freeze_time
@@ -14,6 +16,7 @@ from baserow.contrib.database.api.utils import (
     extract_field_ids_from_string,
     get_include_exclude_fields,
 )
+from baserow.contrib.database.rows.constants import RowCountModes
 from baserow.contrib.database.rows.exceptions import RowDoesNotExist
 from baserow.contrib.database.rows.handler import RowHandler
 from baserow.core.exceptions import UserNotInWorkspace
@@ -1373,3 +1376,73 @@ def test_recalculate_row_orders(send_mock, data_fixture):
 
     send_mock.assert_called_once()
     assert send_mock.call_args[1]["table"].id == table.id
+
+
+@pytest.mark.django_db
+def test_count_rows(data_fixture, django_assert_num_queries):
+    table = data_fixture.create_database_table()
+    field = data_fixture.create_text_field(table=table)
+    model = table.get_model()
+    model.objects.create(**{f"field_{field.id}": "a"})
+    model.objects.create(**{f"field_{field.id}": "b"})
+    handler = RowHandler()
+
+    with django_assert_num_queries(0):
+        assert handler.count_rows(model.objects.all(), RowCountModes.MODE_NONE) is None
+
+    assert handler.count_rows(model.objects.all()) == 2
+    assert handler.count_rows(model.objects.all(), RowCountModes.MODE_EXACT) == 2
+
+
+@pytest.mark.django_db
+def test_count_rows_approximate(data_fixture, django_assert_num_queries):
+    table = data_fixture.create_database_table()
+    field = data_fixture.create_text_field(table=table)
+    model = table.get_model()
+    model.objects.create(**{f"field_{field.id}": "a"})
+    model.objects.create(**{f"field_{field.id}": "b"})
+    handler = RowHandler()
+    cache.clear()
+
+    filtered_queryset = model.objects.filter(**{f"field_{field.id}": "a"})
+    assert handler.count_rows(filtered_queryset, RowCountModes.MODE_APPROXIMATE) == 1
+
+    # The exact count of the same filters is cached for a short time.
+    model.objects.create(**{f"field_{field.id}": "a"})
+    with django_assert_num_queries(0):
+        assert (
+            handler.count_rows(filtered_queryset, RowCountModes.MODE_APPROXIMATE) == 1
+        )
+    assert (
+        handler.count_rows(
+            model.objects.filter(**{f"field_{field.id}": "b"}),
+            RowCountModes.MODE_APPROXIMATE,
+        )
+        == 1
+    )
+
+    # Small tables are counted exactly, even if they're not filtered.
+    assert handler.count_rows(model.objects.all(), RowCountModes.MODE_APPROXIMATE) == 3
+
+    # Large unfiltered tables are estimated, falling back on the stored row count
+    # if the table hasn't been analyzed yet.
+    cache.clear()
+    table.row_count = 20000
+    table.save()
+    model = table.get_model()
+    with override_settings(BASEROW_APPROXIMATE_ROW_COUNT_THRESHOLD=10000):
+        assert (
+            handler.count_rows(model.objects.all(), RowCountModes.MODE_APPROXIMATE)
+            == 20000
+        )
+        assert (
+            handler.count_rows(
+                model.objects.filter(**{f"field_{field.id}": "a"}),
+                RowCountModes.MODE_APPROXIMATE,
+            )
+            == 2
+        )
+    with override_settings(BASEROW_APPROXIMATE_ROW_COUNT_THRESHOLD=30000):
+        assert (
+            handler.count_rows(model.objects.all(), RowCountModes.MODE_APPROXIMATE) == 3
+        )
@@ -1,13 +1,17 @@
 from unittest.mock import Mock, patch
 
-from django.db import connection
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connection, connections
 from django.test.utils import override_settings
 
 import pytest
 
 from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.search.handler import SearchHandler, SearchModes
+from baserow.contrib.database.search.models import PendingSearchValueUpdate
 from baserow.core.trash.handler import TrashHandler
+from baserow.core.utils import Progress
 
 
 def test_escape_query():
@@ -384,3 +388,251 @@ def test_split_update_into_chunks_until_all_background_done(data_fixture):
     assert rows[2].needs_background_update is False
     assert getattr(rows[3], field.tsv_db_column) == "'4':2 'test':1"
     assert rows[3].needs_background_update is False
+
+
+@override_settings(
+    TSV_UPDATE_CHUNK_SIZE=2,
+    TSV_UPDATE_MAX_PARALLEL_RANGES=3,
+    TSV_UPDATE_MIN_ROWS_PER_RANGE=2,
+)
+@pytest.mark.django_db
+def test_update_tsvector_columns_in_parallel_ranges(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(user, table=table, primary=True)
+
+    model = table.get_model()
+    rows = [
+        model.objects.create(**{f"field_{field.id}": f"Test {i}"}) for i in range(7)
+    ]
+
+    assert SearchHandler.get_parallel_tsvector_update_id_ranges(
+        model.objects.all()
+    ) == [(None, rows[3].id), (rows[3].id, rows[6].id), (rows[6].id, None)]
+
+    with patch(
+        "baserow.contrib.database.search.handler.SearchHandler"
+        ".update_tsvector_columns_range",
+        wraps=SearchHandler.update_tsvector_columns_range,
+    ) as update_range:
+        SearchHandler().update_tsvector_columns(table, False)
+
+    assert update_range.call_count == 3
+    for i, row in enumerate(model.objects.all()):
+        assert getattr(row, field.tsv_db_column) == f"'{i}':2 'test':1"
+        assert row.needs_background_update is False
+
+    assert SearchHandler.get_parallel_tsvector_update_progress(table) == {
+        "ranges": 3,
+        "ranges_done": 3,
+        "rows_updated": 7,
+    }
+
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT count(*) FROM pg_locks WHERE locktype = 'advisory'")
+        assert cursor.fetchone()[0] == 0
+
+
+@pytest.mark.django_db
+def test_parallel_tsvector_update_ranges_are_only_finished_once_on_success(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(user, table=table, primary=True)
+
+    model = table.get_model()
+    rows = [
+        model.objects.create(**{f"field_{field.id}": f"Test {i}"}) for i in range(4)
+    ]
+    id_ranges = [(None, rows[2].id), (rows[2].id, None)]
+
+    with patch(
+        "baserow.contrib.database.search.tasks.async_update_tsvector_columns_range"
+        ".delay"
+    ):
+        SearchHandler.start_parallel_tsvector_update(table, id_ranges)
+    update_id = cache.get(SearchHandler.get_parallel_tsvector_update_cache_key(table))
+
+    # A failing range isn't marked as done.
+    with patch(
+        "baserow.contrib.database.search.handler.SearchHandler"
+        ".run_tsvector_update_statement",
+        side_effect=DatabaseError,
+    ), pytest.raises(DatabaseError):
+        SearchHandler.update_tsvector_columns_range(table, update_id, 0, *id_ranges[0])
+    assert SearchHandler.get_parallel_tsvector_update_progress(table) == {
+        "ranges": 2,
+        "ranges_done": 0,
+        "rows_updated": 0,
+    }
+
+    # A range locked by another worker is skipped.
+    other_connection = connections.create_connection(DEFAULT_DB_ALIAS)
+    try:
+        with other_connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_advisory_lock(%s, hashtext(%s))",
+                [table.id, f"{update_id}_0"],
+            )
+        assert not SearchHandler.update_tsvector_columns_range(
+            table, update_id, 0, *id_ranges[0]
+        )
+    finally:
+        other_connection.close()
+    assert SearchHandler.get_parallel_tsvector_update_progress(table) == {
+        "ranges": 2,
+        "ranges_done": 0,
+        "rows_updated": 0,
+    }
+
+    # A redelivered range is only counted once.
+    for range_index in [0, 1, 0]:
+        assert SearchHandler.update_tsvector_columns_range(
+            table, update_id, range_index, *id_ranges[range_index]
+        )
+    assert SearchHandler.get_parallel_tsvector_update_progress(table) == {
+        "ranges": 2,
+        "ranges_done": 2,
+        "rows_updated": 4,
+    }
+
+
+@pytest.mark.django_db
+def test_parallel_tsvector_update_ranges_are_not_skipped_for_older_updates(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(user, table=table, primary=True)
+
+    model = table.get_model()
+    rows = [
+        model.objects.create(**{f"field_{field.id}": f"Test {i}"}) for i in range(4)
+    ]
+    id_ranges = [(None, rows[2].id), (rows[2].id, None)]
+
+    with patch(
+        "baserow.contrib.database.search.tasks.async_update_tsvector_columns_range"
+        ".delay"
+    ):
+        older_update_id = SearchHandler.start_parallel_tsvector_update(table, id_ranges)
+        update_id = SearchHandler.start_parallel_tsvector_update(table, id_ranges)
+
+    # The same range of an older update of the table is still being updated.
+    other_connection = connections.create_connection(DEFAULT_DB_ALIAS)
+    try:
+        with other_connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_advisory_lock(%s, hashtext(%s))",
+                [table.id, f"{older_update_id}_0"],
+            )
+        assert SearchHandler.update_tsvector_columns_range(
+            table, update_id, 0, *id_ranges[0]
+        )
+    finally:
+        other_connection.close()
+
+    assert SearchHandler.get_parallel_tsvector_update_progress(table) == {
+        "ranges": 2,
+        "ranges_done": 1,
+        "rows_updated": 2,
+    }
+
+
+@override_settings(
+    TSV_UPDATE_MAX_PARALLEL_RANGES=3,
+    TSV_UPDATE_MIN_ROWS_PER_RANGE=2,
+)
+@pytest.mark.django_db
+def test_update_tsvector_columns_with_progress_waits_for_the_parallel_ranges(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(user, table=table, primary=True)
+
+    model = table.get_model()
+    for i in range(7):
+        model.objects.create(**{f"field_{field.id}": f"Test {i}"})
+
+    progress = Progress(100)
+    # No worker picks up the ranges, so they're all updated by the caller.
+    with patch(
+        "baserow.contrib.database.search.tasks.async_update_tsvector_columns_range"
+        ".delay"
+    ) as delay:
+        SearchHandler.update_tsvector_columns(
+            table,
+            False,
+            progress_builder=progress.create_child_builder(represents_progress=100),
+        )
+
+    assert delay.call_count == 3
+    assert progress.progress == 100
+    for i, row in enumerate(model.objects.all()):
+        assert getattr(row, field.tsv_db_column) == f"'{i}':2 'test':1"
+    assert SearchHandler.get_parallel_tsvector_update_progress(table) == {
+        "ranges": 3,
+        "ranges_done": 3,
+        "rows_updated": 7,
+    }
+
+
+@override_settings(TSV_UPDATE_MAX_PARALLEL_RANGES=3, TSV_UPDATE_MIN_ROWS_PER_RANGE=2)
+@pytest.mark.django_db
+def test_small_tables_are_not_updated_in_parallel_ranges(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(user, table=table, primary=True)
+
+    model = table.get_model()
+    for i in range(3):
+        model.objects.create(**{f"field_{field.id}": f"Test {i}"})
+
+    assert (
+        SearchHandler.get_parallel_tsvector_update_id_ranges(model.objects.all()) == []
+    )
+
+
+@pytest.mark.django_db
+def test_updating_rows_only_updates_the_tsvectors_of_the_changed_fields(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field_a = data_fixture.create_text_field(user, table=table, primary=True)
+    field_b = data_fixture.create_text_field(user, table=table)
+    formula = FieldHandler().create_field(
+        user, table, "formula", name="formula", formula=f"field('{field_b.name}')"
+    )
+
+    model = table.get_model()
+    row = model.objects.create(
+        **{f"field_{field_a.id}": "first", f"field_{field_b.id}": "second"}
+    )
+    SearchHandler.update_tsvector_columns(table, False)
+    # Change the tsvector of field a, so that we can check it's not recomputed.
+    model.objects.update(**{field_a.tsv_db_column: "'other':1"})
+
+    RowHandler().update_row_by_id(
+        user, table, row.id, {f"field_{field_b.id}": "third"}, model=model
+    )
+    RowHandler().update_rows(
+        user, table, [{"id": row.id, f"field_{field_b.id}": "fourth"}], model=model
+    )
+
+    row.refresh_from_db()
+    assert row.needs_background_update is False
+    assert list(
+        PendingSearchValueUpdate.objects.values_list("field_ids", "row_ids")
+    ) == [
+        (sorted([field_b.id, formula.id]), [row.id]),
+        (sorted([field_b.id, formula.id]), [row.id]),
+    ]
+
+    SearchHandler.update_tsvector_columns(table, True)
+
+    row.refresh_from_db()
+    assert getattr(row, field_a.tsv_db_column) == "'other':1"
+    assert getattr(row, field_b.tsv_db_column) == "'fourth':1"
+    assert getattr(row, formula.tsv_db_column) == "'fourth':1"
+    assert PendingSearchValueUpdate.objects.count() == 0
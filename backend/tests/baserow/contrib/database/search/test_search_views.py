@@ -238,6 +238,56 @@ def test_count_grid_with_full_text_with_count_mode(
     assert response_json == {"count": 1}
 
 
+@pytest.mark.django_db
+def test_search_grid_with_full_text_ranked_mode(api_client, data_fixture):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="text_field", order=0)
+    other_field = data_fixture.create_text_field(table=table, name="other", order=1)
+    view = data_fixture.create_grid_view(user=user, table=table)
+    data_fixture.create_view_sort(view=view, field=text_field, order="DESC")
+
+    RowHandler().create_rows(
+        user,
+        table,
+        rows_values=[
+            {text_field.db_column: "economy", other_field.db_column: ""},
+            {text_field.db_column: "economy", other_field.db_column: "economy class"},
+            {text_field.db_column: "business", other_field.db_column: ""},
+        ],
+    )
+    SearchHandler.update_tsvector_columns(
+        table, update_tsvectors_for_changed_rows_only=False
+    )
+
+    response = api_client.get(
+        reverse(
+            "api:database:views:grid:list",
+            kwargs={"view_id": view.id},
+        ),
+        data={"search": "economy", "search_mode": SearchModes.MODE_FT_RANKED},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_200_OK
+    response_json = response.json()
+    # The best match comes first and the rows are not counted.
+    assert response_json["count"] is None
+    assert [row["id"] for row in response_json["results"]] == [2, 1]
+
+    response = api_client.get(
+        reverse(
+            "api:database:views:grid:list",
+            kwargs={"view_id": view.id},
+        ),
+        data={"search": "3", "search_mode": SearchModes.MODE_FT_RANKED},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_200_OK
+    assert [row["id"] for row in response.json()["results"]] == [3]
+
+
 @pytest.mark.django_db(transaction=True)
 def test_can_create_and_index_and_search_interesting_test_table(
     api_client, data_fixture
@@ -1,9 +1,18 @@
+import threading
+
+from django.db import connection
 from django.test.utils import override_settings
 
 import pytest
 
 from baserow.contrib.database.fields.handler import FieldHandler
-from baserow.contrib.database.table.cache import get_cached_model_field_attrs
+from baserow.contrib.database.table.cache import (
+    GeneratedModelClassCache,
+    generated_model_classes_cache,
+    get_cached_model_field_attrs,
+    invalidate_table_in_model_cache,
+)
+from baserow.contrib.database.table.models import Table
 from baserow.core.trash.handler import TrashHandler
 
 
@@ -204,3 +213,151 @@ def test_deleting_field_invalidates_tables_model_cache(data_fixture):
 
     table.refresh_from_db()
     assert get_cached_model_field_attrs(table) is None
+
+
+@pytest.mark.django_db
+def test_get_model_reuses_the_generated_model_class(data_fixture):
+    table = data_fixture.create_database_table()
+    data_fixture.create_text_field(table=table, primary=True)
+
+    generated_model_classes_cache.clear()
+    model = table.get_model()
+    assert table.get_model() is model
+    assert generated_model_classes_cache.info()["hits"] == 1
+    assert generated_model_classes_cache.info()["misses"] == 1
+
+    # Models that are generated for a subset of the fields are never reused.
+    assert table.get_model(field_ids=[]) is not model
+    assert table.get_model(use_cache=False) is not model
+
+    # Managed models are neither served from nor stored in the cache.
+    managed_model = table.get_model(managed=True)
+    assert managed_model is not model
+    assert managed_model._meta.managed
+    assert table.get_model() is model
+
+
+@pytest.mark.django_db(transaction=True)
+def test_cached_model_class_has_table_and_fields_per_context(data_fixture):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+
+    generated_model_classes_cache.clear()
+    table.get_model()
+    model = Table.objects.get(id=table.id).get_model()
+    field = model._field_objects[text_field.id]["field"]
+
+    results = {}
+
+    def get_model_in_thread():
+        thread_model = Table.objects.get(id=table.id).get_model()
+        thread_field = thread_model._field_objects[text_field.id]["field"]
+        results["model"] = thread_model
+        results["table"] = thread_model.baserow_table
+        results["field"] = thread_field
+        thread_field.name = "changed in thread"
+        connection.close()
+
+    thread = threading.Thread(target=get_model_in_thread)
+    thread.start()
+    thread.join()
+
+    assert results["model"] is model
+    assert results["table"] is not model.baserow_table
+    assert results["field"] is not field
+    assert results["field"].table is results["table"]
+    assert field.table is model.baserow_table
+    assert field.name == text_field.name
+    assert model._field_objects[text_field.id]["field"] is field
+
+
+@pytest.mark.django_db
+def test_invalidating_table_regenerates_the_model_class(data_fixture):
+    table = data_fixture.create_database_table()
+    model = table.get_model()
+
+    field = data_fixture.create_text_field(table=table)
+    new_model = table.get_model()
+    assert new_model is not model
+    assert new_model._meta.get_field(field.db_column)
+
+    invalidate_table_in_model_cache(table.id)
+    assert table.get_model() is not new_model
+
+
+@pytest.mark.django_db
+def test_changing_related_table_regenerates_the_model_class(data_fixture):
+    user = data_fixture.create_user()
+    table_a, table_b, link_field = data_fixture.create_two_linked_tables(user=user)
+    model_a = table_a.get_model()
+    assert table_a.get_model() is model_a
+
+    field = data_fixture.create_text_field(table=table_b)
+
+    new_model_a = table_a.get_model()
+    assert new_model_a is not model_a
+    related_model = new_model_a._meta.get_field(link_field.db_column).remote_field.model
+    assert related_model._meta.get_field(field.db_column)
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_DISABLE_MODEL_CACHE=True)
+def test_disabled_model_cache_does_not_reuse_model_class(data_fixture):
+    table = data_fixture.create_database_table()
+
+    assert table.get_model() is not table.get_model()
+
+
+def test_generated_model_class_cache_is_bounded():
+    cache = GeneratedModelClassCache(max_size=2)
+    cache.set(1, "first")
+    cache.set(2, "second")
+    assert cache.get(1) == "first"
+
+    cache.set(3, "third")
+    assert cache.get(2) is None
+    assert cache.get(1) == "first"
+    assert cache.get(3) == "third"
+
+    cache.invalidate(3)
+    assert cache.get(3) is None
+    assert cache.info()["size"] == 1
+
+    disabled_cache = GeneratedModelClassCache(max_size=0)
+    disabled_cache.set(1, "first")
+    assert disabled_cache.get(1) is None
+
+
+@pytest.mark.django_db
+def test_get_models_fetches_all_table_versions_at_once(
+    data_fixture, django_assert_num_queries
+):
+    user = data_fixture.create_user()
+    table_a, table_b, link_a_b = data_fixture.create_two_linked_tables(user=user)
+    table_c = data_fixture.create_database_table(user=user, database=table_a.database)
+    link_a_c = data_fixture.create_link_row_field(table=table_a, link_row_table=table_c)
+    tables = [table_a, table_b, table_c]
+
+    # Make sure the field attrs of all tables are cached.
+    for table in tables:
+        table.get_model()
+    generated_model_classes_cache.clear()
+
+    with django_assert_num_queries(1):
+        models = Table.get_models(tables)
+
+    assert set(models.keys()) == {table_a.id, table_b.id, table_c.id}
+    assert models[table_a.id]._meta.get_field(link_a_b.db_column)
+    assert models[table_a.id]._meta.get_field(link_a_c.db_column)
+
+    # All models are now cached, so only the versions have to be checked.
+    with django_assert_num_queries(1):
+        assert Table.get_models(tables) == models
+
+    data_fixture.create_text_field(table=table_b)
+    new_models = Table.get_models(tables)
+
+    assert new_models[table_a.id] is not models[table_a.id]
+    assert new_models[table_b.id] is not models[table_b.id]
+    # Table C is only linked to table A, so its model is unaffected.
+    assert new_models[table_c.id] is models[table_c.id]
@@ -255,6 +255,19 @@ def test_search_all_fields_full_text_mode_count(compat_search, pg_search, data_f
     assert not compat_search.called
 
 
+@pytest.mark.django_db
+@patch("baserow.contrib.database.table.models.TableModelQuerySet.pg_search")
+@patch("baserow.contrib.database.table.models.TableModelQuerySet.compat_search")
+def test_search_all_fields_full_text_ranked_mode(
+    compat_search, pg_search, data_fixture
+):
+    table = data_fixture.create_database_table(name="Cars")
+    model = table.get_model(attribute_names=True)
+    model.objects.all().search_all_fields("bmw", search_mode=SearchModes.MODE_FT_RANKED)
+    pg_search.assert_called_once_with("bmw", None, rank=True)
+    assert not compat_search.called
+
+
 @pytest.mark.django_db
 @patch("baserow.contrib.database.table.models.TableModelQuerySet.pg_search")
 @patch("baserow.contrib.database.table.models.TableModelQuerySet.compat_search")
@@ -1,13 +1,26 @@
 import random
+from contextlib import ExitStack
 from decimal import Decimal
+from unittest.mock import Mock, call, patch
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 
 import pytest
 
 from baserow.contrib.database.fields.exceptions import FieldNotInTable
 from baserow.contrib.database.fields.handler import FieldHandler
-from baserow.contrib.database.views.exceptions import FieldAggregationNotSupported
+from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.views.exceptions import (
+    AggregationCannotBeUpdatedIncrementally,
+    FieldAggregationNotSupported,
+)
 from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.registries import view_aggregation_type_registry
+from baserow.contrib.database.views.utils import AnnotatedAggregation
+from baserow.contrib.database.views.view_types import GridViewType
 from baserow.core.trash.handler import TrashHandler
 from baserow.test_utils.helpers import setup_interesting_test_table
 
@@ -467,3 +480,591 @@ def test_aggregation_is_updated_when_view_is_trashed(data_fixture):
         user, grid_view_one
     )
     assert field.db_column not in aggregations_restored_view
+
+
+@pytest.mark.django_db
+def test_view_aggregations_are_updated_incrementally(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    number_field = data_fixture.create_number_field(table=table)
+    count_field = data_fixture.create_number_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_filter(
+        view=grid_view, field=text_field, type="not_equal", value="hidden"
+    )
+
+    view_handler = ViewHandler()
+    view_handler.update_field_options(
+        view=grid_view,
+        field_options={
+            number_field.id: {"aggregation_raw_type": "sum"},
+            count_field.id: {"aggregation_raw_type": "empty_count"},
+        },
+    )
+
+    row_handler = RowHandler()
+    model = table.get_model()
+    row_1, row_2 = row_handler.create_rows(
+        user,
+        table,
+        [
+            {number_field.db_column: 1, count_field.db_column: 1},
+            {number_field.db_column: 2},
+        ],
+        model=model,
+    )
+    assert view_handler.get_view_field_aggregations(user, grid_view) == {
+        number_field.db_column: 3,
+        count_field.db_column: 1,
+    }
+
+    with patch.object(
+        ViewHandler, "get_field_aggregations", wraps=view_handler.get_field_aggregations
+    ) as get_field_aggregations:
+        with django_capture_on_commit_callbacks(execute=True):
+            row_3 = row_handler.create_row(
+                user, table, {number_field.db_column: 10}, model=model
+            )
+        with django_capture_on_commit_callbacks(execute=True):
+            row_handler.create_row(
+                user,
+                table,
+                {number_field.db_column: 100, text_field.db_column: "hidden"},
+                model=model,
+            )
+        assert view_handler.get_view_field_aggregations(user, grid_view) == {
+            number_field.db_column: 13,
+            count_field.db_column: 2,
+        }
+
+        with django_capture_on_commit_callbacks(execute=True):
+            row_handler.update_rows(
+                user,
+                table,
+                [
+                    {"id": row_1.id, number_field.db_column: 5},
+                    {"id": row_2.id, text_field.db_column: "hidden"},
+                    {"id": row_3.id, count_field.db_column: 1},
+                ],
+                model=model,
+            )
+        assert view_handler.get_view_field_aggregations(user, grid_view) == {
+            number_field.db_column: 15,
+            count_field.db_column: 0,
+        }
+
+        with django_capture_on_commit_callbacks(execute=True):
+            row_handler.delete_row(user, table, row_3, model=model)
+        assert view_handler.get_view_field_aggregations(user, grid_view) == {
+            number_field.db_column: 5,
+            count_field.db_column: 0,
+        }
+
+        get_field_aggregations.assert_not_called()
+
+    assert view_handler.get_field_aggregations(
+        user, grid_view, [(number_field, "sum"), (count_field, "empty_count")]
+    ) == {number_field.db_column: 5, count_field.db_column: 0}
+
+
+@pytest.mark.django_db
+def test_view_aggregations_are_recomputed_if_they_cant_be_updated_incrementally(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+
+    view_handler = ViewHandler()
+    view_handler.update_field_options(
+        view=grid_view,
+        field_options={number_field.id: {"aggregation_raw_type": "min"}},
+    )
+
+    row_handler = RowHandler()
+    model = table.get_model()
+    row_1, row_2 = row_handler.create_rows(
+        user,
+        table,
+        [{number_field.db_column: 1}, {number_field.db_column: 2}],
+        model=model,
+    )
+    assert view_handler.get_view_field_aggregations(user, grid_view) == {
+        number_field.db_column: 1
+    }
+
+    with patch.object(
+        ViewHandler, "get_field_aggregations", wraps=view_handler.get_field_aggregations
+    ) as get_field_aggregations:
+        # The new minimum can't be known without the other rows.
+        with django_capture_on_commit_callbacks(execute=True):
+            row_handler.update_row_by_id(
+                user, table, row_1.id, {number_field.db_column: 3}, model=model
+            )
+        assert view_handler.get_view_field_aggregations(user, grid_view) == {
+            number_field.db_column: 2
+        }
+        assert get_field_aggregations.call_count == 1
+
+        # The version has changed twice, so the delta of the second update can't
+        # be applied to the cached value.
+        with django_capture_on_commit_callbacks(execute=True):
+            row_handler.update_row_by_id(
+                user, table, row_2.id, {number_field.db_column: 4}, model=model
+            )
+            view_handler.clear_aggregation_cache(grid_view, number_field.db_column)
+        assert view_handler.get_view_field_aggregations(user, grid_view) == {
+            number_field.db_column: 3
+        }
+        assert get_field_aggregations.call_count == 2
+
+
+@pytest.mark.django_db
+def test_view_aggregations_cached_before_the_commit_are_not_updated_incrementally(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+
+    view_handler = ViewHandler()
+    view_handler.update_field_options(
+        view=grid_view,
+        field_options={number_field.id: {"aggregation_raw_type": "sum"}},
+    )
+
+    row_handler = RowHandler()
+    model = table.get_model()
+    row_handler.create_row(user, table, {number_field.db_column: 1}, model=model)
+    assert view_handler.get_view_field_aggregations(user, grid_view) == {
+        number_field.db_column: 1
+    }
+
+    with django_capture_on_commit_callbacks(execute=True):
+        row_handler.create_row(user, table, {number_field.db_column: 2}, model=model)
+        # Simulates a request that caches a value for the invalidated version
+        # without seeing the uncommitted row.
+        version_key = view_handler._get_aggregation_version_cache_key(
+            grid_view, number_field.db_column
+        )
+        cache.set(
+            view_handler._get_aggregation_value_cache_key(
+                grid_view, number_field.db_column
+            ),
+            {"value": 1, "version": cache.get(version_key)},
+        )
+
+    assert view_handler.get_view_field_aggregations(user, grid_view) == {
+        number_field.db_column: 3
+    }
+
+
+@pytest.mark.django_db
+def test_view_aggregations_are_invalidated_if_the_lock_is_not_acquired(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+
+    view_handler = ViewHandler()
+    view_handler.update_field_options(
+        view=grid_view,
+        field_options={number_field.id: {"aggregation_raw_type": "sum"}},
+    )
+
+    row_handler = RowHandler()
+    model = table.get_model()
+    row_handler.create_row(user, table, {number_field.db_column: 1}, model=model)
+    assert view_handler.get_view_field_aggregations(user, grid_view) == {
+        number_field.db_column: 1
+    }
+
+    with patch.object(cache, "lock", create=True) as lock:
+        lock.return_value.acquire.return_value = False
+        with django_capture_on_commit_callbacks(execute=True):
+            row_handler.create_row(
+                user, table, {number_field.db_column: 2}, model=model
+            )
+    lock.return_value.acquire.assert_called_once_with(blocking=False)
+    lock.return_value.release.assert_not_called()
+
+    with patch.object(
+        ViewHandler, "get_field_aggregations", wraps=view_handler.get_field_aggregations
+    ) as get_field_aggregations:
+        assert view_handler.get_view_field_aggregations(user, grid_view) == {
+            number_field.db_column: 3
+        }
+        assert get_field_aggregations.call_count == 1
+
+
+@pytest.mark.django_db
+def test_incrementally_updatable_aggregations_without_cached_aggregations(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+
+    view_handler = ViewHandler()
+    view_handler.update_field_options(
+        view=grid_view,
+        field_options={number_field.id: {"aggregation_raw_type": "sum"}},
+    )
+    model = table.get_model()
+    cache.delete(view_handler._get_aggregation_cached_cache_key(table.id))
+
+    with CaptureQueriesContext(connection) as captured:
+        assert (
+            view_handler.get_incrementally_updatable_aggregations(
+                table, model, [number_field.id]
+            )
+            == []
+        )
+    assert len(captured.captured_queries) == 0
+
+    view_handler.get_view_field_aggregations(user, grid_view)
+    [(view, aggregations)] = view_handler.get_incrementally_updatable_aggregations(
+        table, model, [number_field.id]
+    )
+    assert view.id == grid_view.id
+    assert [(field.id, type_name) for field, type_name in aggregations] == [
+        (number_field.id, "sum")
+    ]
+
+
+def test_incrementally_updated_aggregation_values():
+    empty_count = view_aggregation_type_registry.get("empty_count")
+    assert empty_count.get_incrementally_updated_value(5, 2, None) == 3
+    assert empty_count.get_incrementally_updated_value(5, None, 1) == 6
+
+    sum_type = view_aggregation_type_registry.get("sum")
+    assert sum_type.get_incrementally_updated_value(None, None, Decimal("2")) == 2
+    assert sum_type.get_incrementally_updated_value(Decimal("5"), 2, 1) == 4
+    assert sum_type.get_incrementally_updated_value(Decimal("5"), 5, 0) == 0
+    with pytest.raises(AggregationCannotBeUpdatedIncrementally):
+        sum_type.get_incrementally_updated_value(Decimal("5"), 5, None)
+
+    min_type = view_aggregation_type_registry.get("min")
+    assert min_type.get_incrementally_updated_value(None, None, 3) == 3
+    assert min_type.get_incrementally_updated_value(2, 3, 1) == 1
+    with pytest.raises(AggregationCannotBeUpdatedIncrementally):
+        min_type.get_incrementally_updated_value(2, 2, 5)
+
+    max_type = view_aggregation_type_registry.get("max")
+    assert max_type.get_incrementally_updated_value(5, 3, 4) == 5
+    with pytest.raises(AggregationCannotBeUpdatedIncrementally):
+        max_type.get_incrementally_updated_value(5, 5, 4)
+
+
+@pytest.mark.django_db
+def test_requested_view_aggregations_are_computed_in_one_query(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    number_field = data_fixture.create_number_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_filter(
+        view=grid_view, field=number_field, type="higher_than", value="1"
+    )
+    other_grid_view = data_fixture.create_grid_view(table=table)
+    not_requested_grid_view = data_fixture.create_grid_view(table=table)
+    annotated_filter_grid_view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_filter(
+        view=annotated_filter_grid_view,
+        field=text_field,
+        type="length_is_lower_than",
+        value="2",
+    )
+
+    view_handler = ViewHandler()
+    for view in [
+        grid_view,
+        other_grid_view,
+        not_requested_grid_view,
+        annotated_filter_grid_view,
+    ]:
+        view_handler.update_field_options(
+            view=view,
+            field_options={
+                number_field.id: {"aggregation_raw_type": "sum"},
+                text_field.id: {"aggregation_raw_type": "empty_count"},
+            },
+        )
+
+    RowHandler().create_rows(
+        user,
+        table,
+        [
+            {number_field.db_column: 1, text_field.db_column: "a"},
+            {number_field.db_column: 2},
+            {number_field.db_column: 3, text_field.db_column: "abc"},
+        ],
+    )
+
+    for view in [other_grid_view, annotated_filter_grid_view]:
+        view_handler._flag_view_aggregations_requested(view)
+
+    with CaptureQueriesContext(connection) as captured:
+        result = view_handler.get_view_field_aggregations(
+            user, grid_view, with_total=True
+        )
+
+    assert result == {
+        number_field.db_column: 5,
+        text_field.db_column: 1,
+        "total": 2,
+    }
+    assert len([q for q in captured.captured_queries if "SUM(" in q["sql"]]) == 1
+
+    # The aggregations of the other requested view have been cached by the same
+    # query, the views that haven't been requested or can't be computed in the
+    # same query still need to be computed.
+    def get_cached_names(view):
+        aggregations = GridViewType().get_aggregations(view)
+        values, _ = view_handler._get_aggregations_to_compute(view, aggregations)
+        return set(values.keys())
+
+    assert get_cached_names(other_grid_view) == {
+        number_field.db_column,
+        text_field.db_column,
+    }
+    assert get_cached_names(not_requested_grid_view) == set()
+    assert get_cached_names(annotated_filter_grid_view) == set()
+
+    with patch.object(ViewHandler, "get_field_aggregations") as get_field_aggregations:
+        assert view_handler.get_view_field_aggregations(user, other_grid_view) == {
+            number_field.db_column: 6,
+            text_field.db_column: 1,
+        }
+        get_field_aggregations.assert_not_called()
+
+    assert view_handler.get_view_field_aggregations(
+        user, annotated_filter_grid_view
+    ) == {number_field.db_column: 1, text_field.db_column: 0}
+
+
+@pytest.mark.django_db
+def test_view_approximate_aggregations(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    number_field = data_fixture.create_number_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+
+    model = table.get_model()
+    model.objects.bulk_create(
+        [
+            model(**{text_field.db_column: f"{i}", number_field.db_column: i % 10})
+            for i in range(4000)
+        ]
+    )
+
+    view_handler = ViewHandler()
+    result = view_handler.get_field_aggregations(
+        user,
+        grid_view,
+        [
+            (text_field, "approximate_unique_count"),
+            (number_field, "approximate_unique_count"),
+        ],
+    )
+    # The sample of the 10 distinct numbers is too small, so they're counted exactly,
+    # while the count of the distinct texts is estimated based on a sample of the
+    # values.
+    assert result[number_field.db_column] == 10
+    assert 3000 < result[text_field.db_column] < 5000
+
+    result = view_handler.get_field_aggregations(
+        user, grid_view, [(number_field, "approximate_median")]
+    )
+    assert 3 <= result[number_field.db_column] <= 6
+
+    result = view_handler.get_field_aggregations(
+        user, grid_view, [(number_field, "approximate_decile")]
+    )
+    assert len(result[number_field.db_column]) == 9
+    assert result[number_field.db_column] == sorted(result[number_field.db_column])
+
+
+@pytest.mark.django_db
+def test_view_approximate_unique_count_of_repeated_values_is_exact(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_filter(
+        view=grid_view, field=text_field, type="contains", value="1"
+    )
+
+    model = table.get_model()
+    model.objects.bulk_create(
+        [model(**{text_field.db_column: f"{i % 1000}"}) for i in range(3000)]
+    )
+
+    # Every value appears three times, which would be undercounted by a random
+    # sample of the rows.
+    result = ViewHandler().get_field_aggregations(
+        user, grid_view, [(text_field, "approximate_unique_count")]
+    )
+    assert result[text_field.db_column] == len(
+        [i for i in range(1000) if "1" in str(i)]
+    )
+
+
+@pytest.mark.django_db
+def test_exact_aggregations_are_approximated_for_large_tables(data_fixture, settings):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table)
+    model = table.get_model()
+    model_field = model._meta.get_field(number_field.db_column)
+
+    settings.BASEROW_APPROXIMATE_AGGREGATIONS_ROW_COUNT_THRESHOLD = 0
+    for aggregation_type_name in ["unique_count", "median", "decile"]:
+        aggregation_type = view_aggregation_type_registry.get(aggregation_type_name)
+        aggregation = aggregation_type.get_aggregation_for_row_count(
+            number_field.db_column, model_field, number_field, 1000
+        )
+        assert not isinstance(aggregation, AnnotatedAggregation)
+
+    settings.BASEROW_APPROXIMATE_AGGREGATIONS_ROW_COUNT_THRESHOLD = 1000
+    for aggregation_type_name in ["unique_count", "median", "decile"]:
+        aggregation_type = view_aggregation_type_registry.get(aggregation_type_name)
+        assert isinstance(
+            aggregation_type.get_aggregation_for_row_count(
+                number_field.db_column, model_field, number_field, 1000
+            ),
+            AnnotatedAggregation,
+        )
+        assert not isinstance(
+            aggregation_type.get_aggregation_for_row_count(
+                number_field.db_column, model_field, number_field, 999
+            ),
+            AnnotatedAggregation,
+        )
+        assert not isinstance(
+            aggregation_type.get_aggregation(
+                number_field.db_column, model_field, number_field
+            ),
+            AnnotatedAggregation,
+        )
+
+
+@pytest.mark.django_db
+def test_approximate_aggregations_of_requested_views_are_computed_in_one_query(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    other_grid_view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_filter(
+        view=other_grid_view, field=number_field, type="higher_than", value="4"
+    )
+
+    view_handler = ViewHandler()
+    for view in [grid_view, other_grid_view]:
+        view_handler.update_field_options(
+            view=view,
+            field_options={
+                number_field.id: {"aggregation_raw_type": "approximate_unique_count"}
+            },
+        )
+
+    model = table.get_model()
+    model.objects.bulk_create(
+        [model(**{number_field.db_column: i % 10}) for i in range(1000)]
+    )
+
+    view_handler._flag_view_aggregations_requested(other_grid_view)
+    assert view_handler.get_view_field_aggregations(user, grid_view) == {
+        number_field.db_column: 10
+    }
+    with patch.object(ViewHandler, "get_field_aggregations") as get_field_aggregations:
+        assert view_handler.get_view_field_aggregations(user, other_grid_view) == {
+            number_field.db_column: 5
+        }
+        get_field_aggregations.assert_not_called()
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_VIEW_AGGREGATIONS_COALESCING_WINDOW_MS=50)
+def test_view_aggregations_coalescing_window_is_waited_before_acquiring_the_lock(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    number_field = data_fixture.create_number_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    other_grid_view = data_fixture.create_grid_view(table=table)
+    annotated_filter_grid_view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_filter(
+        view=annotated_filter_grid_view,
+        field=text_field,
+        type="length_is_lower_than",
+        value="2",
+    )
+
+    view_handler = ViewHandler()
+    for view in [grid_view, other_grid_view, annotated_filter_grid_view]:
+        view_handler.update_field_options(
+            view=view,
+            field_options={number_field.id: {"aggregation_raw_type": "sum"}},
+        )
+
+    def get_view_field_aggregations(view, with_lock=True):
+        calls = Mock()
+        with patch(
+            "baserow.contrib.database.views.handler.time.sleep"
+        ) as sleep, ExitStack() as stack:
+            calls.attach_mock(sleep, "sleep")
+            if with_lock:
+                lock = stack.enter_context(patch.object(cache, "lock", create=True))
+                calls.attach_mock(lock, "lock")
+                calls.attach_mock(lock.return_value.acquire, "acquire")
+            view_handler.get_view_field_aggregations(user, view)
+        return [c for c in calls.mock_calls if c[0] in ["lock", "acquire", "sleep"]]
+
+    table_lock_key = view_handler._get_table_aggregation_lock_cache_key(table.id)
+
+    # Nothing is waited for if no other view of the table has been requested.
+    assert get_view_field_aggregations(grid_view) == [
+        call.lock(table_lock_key, timeout=10),
+        call.acquire(),
+    ]
+
+    view_handler.clear_full_aggregation_cache(grid_view)
+    view_handler._flag_view_aggregations_requested(other_grid_view)
+    assert get_view_field_aggregations(grid_view) == [
+        call.sleep(0.05),
+        call.lock(table_lock_key, timeout=10),
+        call.acquire(),
+    ]
+
+    # Nothing is waited for if the aggregations are cached.
+    view_handler._flag_view_aggregations_requested(other_grid_view)
+    assert call.sleep(0.05) not in get_view_field_aggregations(grid_view)
+
+    # The views that can't be computed together with others use their own lock.
+    assert get_view_field_aggregations(annotated_filter_grid_view) == [
+        call.lock(
+            view_handler._get_aggregation_lock_cache_key(annotated_filter_grid_view),
+            timeout=10,
+        ),
+        call.acquire(),
+    ]
+
+    # Nothing is waited for if the cache doesn't support locks.
+    view_handler.clear_full_aggregation_cache(grid_view)
+    view_handler._flag_view_aggregations_requested(other_grid_view)
+    assert get_view_field_aggregations(grid_view, with_lock=False) == []
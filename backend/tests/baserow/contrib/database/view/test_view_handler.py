@@ -3,6 +3,7 @@ from decimal import Decimal
 from unittest.mock import patch
 
 from django.core.exceptions import ValidationError
+from django.db.models import Q
 from django.test import override_settings
 
 import pytest
@@ -974,6 +975,29 @@ def test_get_filter(data_fixture):
     assert view_filter.value == equal_filter.value
 
 
+@pytest.mark.django_db
+def test_get_batchable_view_filter(data_fixture):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    model = table.get_model()
+    row_1 = model.objects.create(**{text_field.db_column: "a"})
+    model.objects.create(**{text_field.db_column: "b"})
+
+    handler = ViewHandler()
+    assert handler.get_batchable_view_filter(grid_view, model) == Q()
+
+    data_fixture.create_view_filter(
+        view=grid_view, field=text_field, type="equal", value="a"
+    )
+    view_filter = handler.get_batchable_view_filter(grid_view, model)
+    assert [row.id for row in model.objects.filter(view_filter)] == [row_1.id]
+
+    grid_view.filters_disabled = True
+    grid_view.save()
+    assert handler.get_batchable_view_filter(grid_view, model) == Q()
+
+
 @pytest.mark.django_db
 @patch("baserow.contrib.database.views.signals.view_filter_created.send")
 def test_create_filter(send_mock, data_fixture):
@@ -2039,13 +2063,13 @@ def test_public_view_row_checker_runs_expected_queries_when_checking_rows(
 
     view_ptr_specific = public_grid_view.view_ptr.specific
     with django_assert_num_queries(1):
-        # Only should run a single exists query to check if the row is in the single
+        # Only should run a single query to check if the row is in the single
         # public view
         assert row_checker.get_public_views_where_row_is_visible(visible_row) == [
             view_ptr_specific
         ]
     with django_assert_num_queries(1):
-        # Only should run a single exists query to check if the row is in the single
+        # Only should run a single query to check if the row is in the single
         # public view
         assert row_checker.get_public_views_where_row_is_visible(invisible_row) == []
 
@@ -2066,17 +2090,81 @@ def test_public_view_row_checker_runs_expected_queries_when_checking_rows(
         updated_field_ids=[filtered_field.id, unfiltered_field.id],
     )
     specific_another_view = another_public_grid_view.view_ptr.specific
-    with django_assert_num_queries(2):
-        # Now should run two queries, one per public view
+    with django_assert_num_queries(1):
+        # Should still run a single query checking all the public views at once
         assert row_checker.get_public_views_where_row_is_visible(visible_row) == [
             view_ptr_specific,
             specific_another_view,
         ]
-    with django_assert_num_queries(2):
-        # Now should run two queries, one per public view
+    with django_assert_num_queries(1):
+        # Should still run a single query checking all the public views at once
         assert row_checker.get_public_views_where_row_is_visible(invisible_row) == []
 
 
+@pytest.mark.django_db
+def test_public_view_row_checker_checks_rows_in_all_views_with_one_query(
+    data_fixture, django_assert_num_queries
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    related_table = data_fixture.create_database_table(
+        user=user, database=table.database
+    )
+    text_field = data_fixture.create_text_field(table=table)
+    link_row_field = FieldHandler().create_field(
+        user, table, "link_row", name="link", link_row_table=related_table
+    )
+    related_model = related_table.get_model()
+    related_row = related_model.objects.create()
+
+    text_view = data_fixture.create_grid_view(user, table=table, public=True, order=0)
+    data_fixture.create_view_filter(
+        view=text_view, field=text_field, type="equal", value="a"
+    )
+    # The link row filter needs a join, so it's checked using a subquery.
+    link_view = data_fixture.create_grid_view(user, table=table, public=True, order=1)
+    data_fixture.create_view_filter(
+        view=link_view, field=link_row_field, type="link_row_has", value=related_row.id
+    )
+    unfiltered_view = data_fixture.create_grid_view(
+        user, table=table, public=True, order=2
+    )
+
+    model = table.get_model()
+    row_1, row_2, row_3 = RowHandler().create_rows(
+        user,
+        table,
+        [
+            {f"field_{text_field.id}": "a"},
+            {f"field_{link_row_field.id}": [related_row.id]},
+            {f"field_{text_field.id}": "a", f"field_{link_row_field.id}": []},
+        ],
+        model=model,
+    )
+
+    row_checker = ViewHandler().get_public_views_row_checker(
+        table, model, only_include_views_which_want_realtime_events=True
+    )
+    with django_assert_num_queries(1):
+        visible_views_rows = row_checker.get_public_views_where_rows_are_visible(
+            [row_1, row_2, row_3]
+        )
+
+    assert {
+        public_view_rows.view.id: public_view_rows.allowed_row_ids
+        for public_view_rows in visible_views_rows
+    } == {
+        text_view.id: {row_1.id, row_3.id},
+        link_view.id: {row_2.id},
+        unfiltered_view.id: PublicViewRows.ALL_ROWS_ALLOWED,
+    }
+
+    # None of the filtered fields are updated, so the results can be cached.
+    with django_assert_num_queries(0):
+        visible_views = row_checker.get_public_views_where_row_is_visible(row_2)
+    assert [view.id for view in visible_views] == [link_view.id, unfiltered_view.id]
+
+
 @pytest.mark.django_db
 def test_cant_get_view_filter_when_view_trashed(data_fixture):
     user = data_fixture.create_user()
@@ -3967,6 +4055,92 @@ def test_get_group_by_metadata_in_rows(data_fixture):
     }
 
 
+@pytest.mark.django_db
+def test_get_group_by_metadata_in_rows_counts_all_levels_in_one_query(
+    data_fixture, django_assert_num_queries
+):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table, order=0)
+    number_field = data_fixture.create_number_field(table=table, order=1)
+    boolean_field = data_fixture.create_boolean_field(table=table, order=2)
+
+    model = table.get_model()
+    for text, number, boolean in [
+        ("Green", 10, False),
+        ("Green", 10, True),
+        ("Green", 10, True),
+        ("Green", 20, True),
+        ("Orange", 10, True),
+        ("Orange", 30, False),
+        ("Red", 10, False),
+    ]:
+        model.objects.create(
+            **{
+                f"field_{text_field.id}": text,
+                f"field_{number_field.id}": number,
+                f"field_{boolean_field.id}": boolean,
+            }
+        )
+
+    queryset = model.objects.all().order_by("id")
+    # Only the first page of rows is provided, so the groups of the rows that are
+    # not in the page, except for the parent groups, must not be counted.
+    rows = list(queryset[:5])
+
+    handler = ViewHandler()
+    with django_assert_num_queries(1):
+        counts = handler.get_group_by_metadata_in_rows(
+            [text_field, number_field, boolean_field], rows, queryset
+        )
+
+    text_name = f"field_{text_field.id}"
+    number_name = f"field_{number_field.id}"
+    boolean_name = f"field_{boolean_field.id}"
+    assert counts == {
+        text_field: unordered(
+            [
+                {text_name: "Green", "count": 4},
+                {text_name: "Orange", "count": 2},
+            ]
+        ),
+        number_field: unordered(
+            [
+                {text_name: "Green", number_name: Decimal("10"), "count": 3},
+                {text_name: "Green", number_name: Decimal("20"), "count": 1},
+                {text_name: "Orange", number_name: Decimal("10"), "count": 1},
+            ]
+        ),
+        boolean_field: unordered(
+            [
+                {
+                    text_name: "Green",
+                    number_name: Decimal("10"),
+                    boolean_name: False,
+                    "count": 1,
+                },
+                {
+                    text_name: "Green",
+                    number_name: Decimal("10"),
+                    boolean_name: True,
+                    "count": 2,
+                },
+                {
+                    text_name: "Green",
+                    number_name: Decimal("20"),
+                    boolean_name: True,
+                    "count": 1,
+                },
+                {
+                    text_name: "Orange",
+                    number_name: Decimal("10"),
+                    boolean_name: True,
+                    "count": 1,
+                },
+            ]
+        ),
+    }
+
+
 @pytest.mark.django_db
 def test_get_group_by_on_all_fields_in_interesting_table(data_fixture):
     table, *_ = setup_interesting_test_table(data_fixture)
@@ -221,6 +221,7 @@ def test_when_field_unhidden_in_public_view_force_refresh_sent(
                             "type": "text",
                             "primary": False,
                             "text_default": "",
+                            "db_trigram_index": False,
                             "read_only": False,
                         }
                     ],
@@ -297,6 +298,7 @@ def test_when_only_field_options_updated_in_public_grid_view_force_refresh_sent(
                             "type": "text",
                             "primary": False,
                             "text_default": "",
+                            "db_trigram_index": False,
                             "read_only": False,
                         }
                     ],
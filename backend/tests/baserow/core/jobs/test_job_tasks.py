@@ -216,3 +216,22 @@ def test_cleanup_file_import_job(storage_mock, data_fixture, settings):
     assert Job.objects.is_running().count() == 2
     assert Job.objects.is_finished().count() == 2
     assert Job.objects.is_pending_or_running().count() == 3
+
+
+@pytest.mark.django_db
+def test_cleanup_expires_recently_updated_non_resumable_job(data_fixture, settings):
+    now = timezone.now()
+    time_before_soft_limit = now - timezone.timedelta(
+        seconds=settings.BASEROW_JOB_SOFT_TIME_LIMIT + 2
+    )
+    with freeze_time(time_before_soft_limit):
+        job = data_fixture.create_fake_job(state=JOB_STARTED)
+
+    # The progress of a job that can't be resumed doesn't postpone its expiration.
+    Job.objects.filter(id=job.id).update(progress_percentage=50, updated_on=now)
+
+    with freeze_time(now):
+        clean_up_jobs()
+
+    job.refresh_from_db()
+    assert job.state == JOB_FAILED
@@ -20,6 +20,7 @@ from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.views.models import GalleryView, GridView, View
 from baserow.core.db import (
     CombinedForeignKeyAndManyToManyMultipleFieldPrefetch,
+    LimitedManyToManyPrefetch,
     LockedAtomicTransaction,
     MultiFieldPrefetchQuerysetMixin,
     QuerySet,
@@ -646,3 +647,42 @@ def test_multiple_field_prefetch__many_to_many_missing_source(data_fixture):
     )
     row = rows[0]
     assert len(row.field.all()) == 1
+
+
+@pytest.mark.django_db
+def test_limited_many_to_many_prefetch(data_fixture, django_assert_num_queries):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(name="Car", user=user)
+    related_table = data_fixture.create_database_table(
+        name="Owner", user=user, database=table.database
+    )
+    data_fixture.create_text_field(table=related_table, name="Name", primary=True)
+    link_field = FieldHandler().create_field(
+        user, table, "link_row", name="Owners", link_row_table=related_table
+    )
+
+    related_model = related_table.get_model()
+    related_rows = [related_model.objects.create(order=order) for order in [3, 1, 2, 4]]
+    related_model.objects.filter(id=related_rows[1].id).update(trashed=True)
+
+    model = table.get_model()
+    row_1 = model.objects.create()
+    row_2 = model.objects.create()
+    getattr(row_1, f"field_{link_field.id}").set([r.id for r in related_rows])
+
+    queryset = model.objects.all().multi_field_prefetch(
+        LimitedManyToManyPrefetch(f"field_{link_field.id}", 2)
+    )
+
+    # We expect three queries. One to fetch the rows, one to fetch the limited
+    # relations with their counts, and one to fetch the related rows.
+    with django_assert_num_queries(3):
+        rows = list(queryset)
+        assert [r.id for r in getattr(rows[0], f"field_{link_field.id}").all()] == [
+            related_rows[2].id,
+            related_rows[0].id,
+        ]
+        assert rows[0]._prefetched_objects_counts == {f"field_{link_field.id}": 3}
+        assert rows[1].id == row_2.id
+        assert list(getattr(rows[1], f"field_{link_field.id}").all()) == []
+        assert rows[1]._prefetched_objects_counts == {f"field_{link_field.id}": 0}
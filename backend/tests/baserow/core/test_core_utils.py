@@ -14,6 +14,7 @@ from baserow.core.utils import (
     ChildProgressBuilder,
     MirrorDict,
     Progress,
+    add_ids_to_ranges,
     atomic_if_not_already,
     dict_to_object,
     escape_csv_cell,
@@ -22,6 +23,7 @@ from baserow.core.utils import (
     find_unused_name,
     get_nested_value_from_dict,
     grouper,
+    iterate_id_ranges,
     random_string,
     remove_invalid_surrogate_characters,
     remove_special_characters,
@@ -220,6 +222,14 @@ def test_grouper():
     assert list(grouper(3, g())) == [(0, 1, 2), (3, 4, 5), (6, 7, 8), (9,)]
 
 
+def test_add_ids_to_ranges():
+    assert add_ids_to_ranges([], []) == []
+    assert add_ids_to_ranges([], [3, 1, 2, 5]) == [[1, 3], [5, 5]]
+    assert add_ids_to_ranges([[1, 3], [5, 5]], [4, 8, 9]) == [[1, 5], [8, 9]]
+    assert add_ids_to_ranges([[1, 3]], [2, 3]) == [[1, 3]]
+    assert list(iterate_id_ranges([[1, 3], [8, 9]])) == [1, 2, 3, 8, 9]
+
+
 def test_progress():
     mock_event = MagicMock()
 
@@ -968,6 +968,7 @@ def test_get_public_calendar_view_with_single_select_and_cover(
                 "order": 1,
                 "primary": False,
                 "text_default": "",
+                "db_trigram_index": False,
                 "type": "text",
                 "read_only": False,
             },
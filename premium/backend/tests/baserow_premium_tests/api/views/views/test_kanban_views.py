@@ -1083,6 +1083,7 @@ def test_get_public_kanban_without_with_single_select_and_cover(
                 "order": 0,
                 "primary": False,
                 "text_default": "",
+                "db_trigram_index": False,
                 "type": "text",
                 "read_only": False,
             },
@@ -1182,6 +1183,7 @@ def test_get_public_kanban_view_with_single_select_and_cover(
                 "order": 2,
                 "primary": False,
                 "text_default": "",
+                "db_trigram_index": False,
                 "type": "text",
                 "read_only": False,
             },